@@ -1,7 +1,8 @@
 __version__ = "1.0.1"
 
 import kagglehub.logger  # configures the library logger.
-from kagglehub import colab_cache_resolver, http_resolver, kaggle_cache_resolver, registry
+from kagglehub import colab_cache_resolver, http_resolver, kaggle_cache_resolver, mirror_resolver, registry
+from kagglehub.archives import open_archive
 from kagglehub.auth import login, whoami
 from kagglehub.competition import competition_download
 from kagglehub.datasets import (
@@ -15,13 +16,20 @@ from kagglehub.datasets import (
 from kagglehub.models import model_download, model_upload
 from kagglehub.notebooks import notebook_output_download
 from kagglehub.packages import get_package_asset_path, package_import
+from kagglehub.readahead import prefetch
+from kagglehub.scrub import cache_scrub
+from kagglehub.snapshot import cache_export, cache_import
+from kagglehub.stats import cache_stats, cache_usage
 from kagglehub.utility_scripts import utility_script_install
+from kagglehub.warmup import cache_warmup
 
 registry.model_resolver.add_implementation(http_resolver.ModelHttpResolver())
+registry.model_resolver.add_implementation(mirror_resolver.ModelMirrorResolver())
 registry.model_resolver.add_implementation(kaggle_cache_resolver.ModelKaggleCacheResolver())
 registry.model_resolver.add_implementation(colab_cache_resolver.ModelColabCacheResolver())
 
 registry.dataset_resolver.add_implementation(http_resolver.DatasetHttpResolver())
+registry.dataset_resolver.add_implementation(mirror_resolver.DatasetMirrorResolver())
 registry.dataset_resolver.add_implementation(kaggle_cache_resolver.DatasetKaggleCacheResolver())
 registry.dataset_resolver.add_implementation(colab_cache_resolver.DatasetColabCacheResolver())
 
@@ -29,4 +37,7 @@ registry.competition_resolver.add_implementation(http_resolver.CompetitionHttpRe
 registry.competition_resolver.add_implementation(kaggle_cache_resolver.CompetitionKaggleCacheResolver())
 
 registry.notebook_output_resolver.add_implementation(http_resolver.NotebookOutputHttpResolver())
+registry.notebook_output_resolver.add_implementation(mirror_resolver.NotebookOutputMirrorResolver())
 registry.notebook_output_resolver.add_implementation(kaggle_cache_resolver.NotebookOutputKaggleCacheResolver())
+
+registry.load_plugins()
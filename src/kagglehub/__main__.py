@@ -0,0 +1,5 @@
+import sys
+
+from kagglehub.cli import main
+
+sys.exit(main())
@@ -0,0 +1,62 @@
+"""Archive-backed cache entries (see `KAGGLEHUB_KEEP_ARCHIVES`).
+
+The zip archive of a resource is kept as the cache entry, next to where it would have been extracted: e.g.
+`datasets/owner/dataset/versions/2.zip` instead of the `datasets/owner/dataset/versions/2` folder. Files are read
+from the archive on demand, without extracting it.
+"""
+
+import os
+import zipfile
+
+from kagglehub import manifest
+
+ARCHIVE_SUFFIX = ".zip"
+
+
+def get_archive_entry_path(path: str) -> str:
+    """Returns the path of the archive kept in place of the folder at `path`."""
+    return path + ARCHIVE_SUFFIX
+
+
+def is_archive_entry(path: str) -> bool:
+    return path.endswith(ARCHIVE_SUFFIX) and os.path.isfile(path)
+
+
+def open_archive(path: str) -> zipfile.Path:
+    """Returns a read-only, pathlib-like view of an archive-backed cache entry.
+
+    Members are read from the archive on demand, e.g.
+    `kagglehub.open_archive(kagglehub.dataset_download(handle)).joinpath("train.csv").read_text()`.
+
+    Args:
+        path: (string) Path of the archive, as returned by `kagglehub.dataset_download` and co.
+
+    Returns:
+        A `zipfile.Path` to the root of the archive.
+    """
+    if not zipfile.is_zipfile(path):
+        msg = f"'{path}' is not an archive-backed cache entry."
+        raise ValueError(msg)
+    return zipfile.Path(path)
+
+
+def extract_member(archive_path: str, member: str, out_path: str) -> bool:
+    """Extracts a single file of the archive to `out_path`.
+
+    Returns:
+        Whether the archive contains the file.
+    """
+    with zipfile.ZipFile(archive_path) as archive:
+        try:
+            info = archive.getinfo(_to_member_name(member))
+        except KeyError:
+            return False
+        os.makedirs(os.path.dirname(out_path), exist_ok=True)
+        with archive.open(info) as src:
+            manifest.write_file(src, out_path)
+    return True
+
+
+def _to_member_name(path: str) -> str:
+    # Zip members always use forward slashes.
+    return path.replace(os.sep, "/").lstrip("/")
@@ -1,22 +1,51 @@
+import hashlib
 import os
 import shutil
 from pathlib import Path
 
-from kagglehub.config import get_cache_folder
+from kagglehub import archives, cache_tiers, compression, manifest
+from kagglehub.config import (
+    CacheTier,
+    get_cache_compression,
+    get_cache_folder,
+    get_cache_lock_timeout,
+    get_cache_tiers,
+    is_cache_manifest_disabled,
+    is_keep_archives_enabled,
+)
 from kagglehub.handle import CompetitionHandle, DatasetHandle, ModelHandle, NotebookHandle, ResourceHandle
+from kagglehub.locks import CacheLock
 
 DATASETS_CACHE_SUBFOLDER = "datasets"
 NOTEBOOKS_CACHE_SUBFOLDER = "notebooks"  # for resources under kaggle.com/code
 COMPETITIONS_CACHE_SUBFOLDER = "competitions"
 MODELS_CACHE_SUBFOLDER = "models"
+PROXY_CACHE_SUBFOLDER = "proxy"  # see `kagglehub.proxy`
 FILE_COMPLETION_MARKER_FOLDER = ".complete"
+# Lock files for output_dir downloads live in the default cache, so they don't pollute the output_dir.
+LOCKS_CACHE_SUBFOLDER = ".locks"
+COMPLETION_MARKER_SUFFIX = ".complete"
+LOCK_SUFFIX = ".lock"
+MANIFEST_SUFFIX = ".manifest.json"
 
 
 class Cache:
-    """Cache helper that optionally overrides the default cache directory."""
+    """Cache helper that optionally overrides the default cache directory.
+
+    Without override, the fast cache tiers set with `KAGGLEHUB_CACHE_TIERS` are checked before the default cache
+    folder. Downloads are always written to the default cache folder (e.g. shared across nodes) and promoted to the
+    fastest tier in the background.
+
+    Without override, text files are stored compressed if `KAGGLEHUB_CACHE_COMPRESSION` is set. The path of a single
+    file entry is then the path of its compressed copy (e.g. `train.csv.gz`). If `KAGGLEHUB_KEEP_ARCHIVES` is set, the
+    zip archive of a resource is kept as its entry instead of being extracted (see `kagglehub.archives`).
+    """
 
     def __init__(self, override_dir: str | None = None) -> None:
         self._override_dir = override_dir
+        self._tiers: list[CacheTier] = [] if override_dir else get_cache_tiers()
+        self._compression = None if override_dir else get_cache_compression()
+        self.keeps_archives = not override_dir and is_keep_archives_enabled()
 
     def get_path(self, handle: ResourceHandle, path: str | None = None) -> str:
         if self._override_dir:
@@ -42,28 +71,174 @@ class Cache:
             return os.path.join(marker_base, f"{safe_path}.complete")
         return os.path.join(marker_base, "bundle.complete")
 
+    def get_completion_marker_path(self, handle: ResourceHandle, path: str | None, stored_path: str) -> str | None:
+        """Returns the completion marker of the entry returned by `load_from_cache` at `stored_path`.
+
+        Returns:
+            The marker's path in the tier or folder holding `stored_path`, or None if `stored_path` isn't in the cache.
+        """
+        cache_folder = get_cache_folder()
+        for tier in self._tiers:
+            if _is_within(stored_path, tier.path):
+                return cache_tiers.rebase(self._get_completion_marker_filepath(handle, path), cache_folder, tier.path)
+        if not _is_within(stored_path, self._override_dir or cache_folder):
+            return None
+        return self._get_completion_marker_filepath(handle, path)
+
+    def get_lock_path(self, handle: ResourceHandle, path: str | None = None) -> str:
+        marker_path = self._get_completion_marker_filepath(handle, path)
+        if self._override_dir:
+            digest = hashlib.sha256(os.path.abspath(marker_path).encode("utf-8")).hexdigest()
+            return os.path.join(get_cache_folder(), LOCKS_CACHE_SUBFOLDER, f"{digest}{LOCK_SUFFIX}")
+        return marker_path.removesuffix(COMPLETION_MARKER_SUFFIX) + LOCK_SUFFIX
+
+    def get_manifest_path(self, handle: ResourceHandle, path: str | None = None) -> str:
+        marker_path = self._get_completion_marker_filepath(handle, path)
+        return marker_path.removesuffix(COMPLETION_MARKER_SUFFIX) + MANIFEST_SUFFIX
+
+    def lock(self, handle: ResourceHandle, path: str | None = None) -> CacheLock:
+        """Returns an advisory lock guarding the download of the requested resource across processes.
+
+        The lock should be held from the cache lookup until the resource is marked as complete. Other processes
+        requesting the same resource block until it's released, then find it in the cache.
+        """
+        description = f"'{handle}/{path}'" if path else f"'{handle}'"
+        watch_path = self.get_path(handle, path) if path else self.get_archive_path(handle)
+        return CacheLock(
+            self.get_lock_path(handle, path),
+            description,
+            timeout=get_cache_lock_timeout(),
+            watch_path=watch_path,
+        )
+
     def load_from_cache(self, handle: ResourceHandle, path: str | None = None) -> str | None:
-        """Return path for the requested resource from the cache or output_dir."""
+        """Return path for the requested resource from the cache or output_dir.
+
+        Lookups aren't counted in `kagglehub.cache_stats`: resolvers count them once they return a cached path.
+        """
         marker_path = self._get_completion_marker_filepath(handle, path)
         full_path = self.get_path(handle, path)
-        return full_path if os.path.exists(marker_path) and os.path.exists(full_path) else None
-
-    def mark_as_complete(self, handle: ResourceHandle, path: str | None = None) -> None:
+        cache_folder = get_cache_folder()
+        for tier in self._tiers:
+            tier_marker_path = cache_tiers.rebase(marker_path, cache_folder, tier.path)
+            tier_path = find_stored_path(cache_tiers.rebase(full_path, cache_folder, tier.path), path)
+            if os.path.exists(tier_marker_path) and tier_path:
+                if tier == self._tiers[0]:
+                    cache_tiers.touch(tier_marker_path)
+                else:
+                    self._promote(tier_path, cache_tiers.rebase(tier_path, tier.path, cache_folder), marker_path)
+                return tier_path
+
+        stored_path = find_stored_path(full_path, path)
+        if os.path.exists(marker_path) and stored_path:
+            # The marker's mtime records the last access (see `kagglehub.cache_usage`).
+            cache_tiers.touch(marker_path)
+            if self._tiers:
+                self._promote(stored_path, stored_path, marker_path)
+            return stored_path
+        return None
+
+    def mark_as_complete(
+        self, handle: ResourceHandle, path: str | None = None, *, records: manifest.FileRecords | None = None
+    ) -> str:
+        """Marks a downloaded entry as complete.
+
+        Args:
+            handle: Resource handle
+            path: Optional path to a file within the bundle.
+            records: Optional manifest records of the entry, if already known (e.g. the entry was copied from another
+                cache). Built from the digests computed while writing the files otherwise (see `manifest.build`).
+
+        Returns:
+            The path the entry is stored at: its compressed copy for a compressed single file, or its archive.
+        """
+        full_path = find_stored_path(self.get_path(handle, path), path) or self.get_path(handle, path)
+        if self._compression and os.path.exists(full_path) and not archives.is_archive_entry(full_path):
+            full_path = compression.compress_entry(full_path, self._compression)
+        if not is_cache_manifest_disabled():
+            if records is None:
+                records = manifest.build(full_path)
+            manifest.write(self.get_manifest_path(handle, path), handle, path, records)
         marker_path = self._get_completion_marker_filepath(handle, path)
         os.makedirs(os.path.dirname(marker_path), exist_ok=True)
         Path(marker_path).touch()
+        if self._tiers and os.path.exists(full_path):
+            self._promote(full_path, full_path, marker_path)
+        return full_path
 
     def mark_as_incomplete(self, handle: ResourceHandle, path: str | None = None) -> None:
         marker_path = self._get_completion_marker_filepath(handle, path)
         self._delete_path(marker_path)
+        self._delete_path(self.get_manifest_path(handle, path))
+        cache_folder = get_cache_folder()
+        for tier in self._tiers:
+            self._delete_path(cache_tiers.rebase(marker_path, cache_folder, tier.path), root=tier.path)
 
     def delete_from_cache(self, handle: ResourceHandle, path: str | None = None) -> str | None:
         """Delete resource from the cache, even if incomplete."""
         self.mark_as_incomplete(handle, path)
-        full_path = self.get_path(handle, path)
+        full_path = find_stored_path(self.get_path(handle, path), path) or self.get_path(handle, path)
+        cache_folder = get_cache_folder()
+        for tier in self._tiers:
+            self._delete_path(cache_tiers.rebase(full_path, cache_folder, tier.path), root=tier.path)
         return self._delete_path(full_path)
 
-    def _delete_path(self, path: str) -> str | None:
+    def verify(
+        self, handle: ResourceHandle, path: str | None = None, *, max_workers: int | None = None
+    ) -> list[str] | None:
+        """Checks the files of a complete cache entry against the manifest captured when it was downloaded.
+
+        Files are hashed in parallel, by up to `max_workers` threads.
+
+        Returns:
+            The relative paths of the missing or corrupted files, or None if the entry isn't complete or has no
+            manifest. Paths are relative to the entry's folder, or to the folder containing the entry for a single file.
+        """
+        if not os.path.exists(self._get_completion_marker_filepath(handle, path)):
+            return None
+        records = self.get_manifest_records(handle, path)
+        if records is None:
+            return None
+        return manifest.verify(self.get_manifest_base_path(handle, path), records, max_workers=max_workers)
+
+    def update_manifest(self, handle: ResourceHandle, path: str | None, rel_paths: list[str]) -> None:
+        """Records the current digest of the given files in the entry's manifest, e.g. after downloading them again."""
+        manifest_path = self.get_manifest_path(handle, path)
+        entry_manifest = manifest.read(manifest_path)
+        if entry_manifest is None:
+            return
+        _, _, records = entry_manifest
+        records = manifest.update(self.get_manifest_base_path(handle, path), records, rel_paths)
+        manifest.write(manifest_path, handle, path, records)
+
+    def get_manifest_records(self, handle: ResourceHandle, path: str | None = None) -> manifest.FileRecords | None:
+        """Returns the manifest records of the entry, or None if it has no manifest."""
+        entry_manifest = manifest.read(self.get_manifest_path(handle, path))
+        if entry_manifest is None:
+            return None
+        _, _, records = entry_manifest
+        return records
+
+    def get_manifest_base_path(self, handle: ResourceHandle, path: str | None = None) -> str:
+        full_path = self.get_path(handle, path)
+        stored_path = find_stored_path(full_path, path)
+        if path or (stored_path and archives.is_archive_entry(stored_path)):
+            # Records of single files (and archives) are relative to the folder containing them.
+            return os.path.dirname(full_path)
+        return full_path
+
+    def _promote(self, src_path: str, full_path: str, marker_path: str) -> None:
+        # `full_path` and `marker_path` are locations in the default cache folder, mirrored in the fastest tier.
+        cache_folder = get_cache_folder()
+        fastest = self._tiers[0]
+        cache_tiers.promote_in_background(
+            src_path,
+            fastest,
+            cache_tiers.rebase(full_path, cache_folder, fastest.path),
+            cache_tiers.rebase(marker_path, cache_folder, fastest.path),
+        )
+
+    def _delete_path(self, path: str, root: str | None = None) -> str | None:
         if not os.path.exists(path):
             return None
         if os.path.isdir(path):
@@ -74,16 +249,30 @@ class Cache:
         if self._override_dir:
             return path
 
-        # Remove empty folders in the given path, up until the cache folder.
+        # Remove empty folders in the given path, up until the cache folder (or tier folder).
         # Avoid using removedirs() because it may remove parents of the cache folder.
+        root = root or get_cache_folder()
         curr_dir = os.path.dirname(path)
-        while len(os.listdir(curr_dir)) == 0 and curr_dir != get_cache_folder():
+        while len(os.listdir(curr_dir)) == 0 and curr_dir != root:
             parent_dir = os.path.dirname(curr_dir)
             os.rmdir(curr_dir)
             curr_dir = parent_dir
         return path
 
 
+def find_stored_path(full_path: str, path: str | None = None) -> str | None:
+    """Returns where the cache entry at `full_path` is stored: as is, compressed, or as an archive (for full resources).
+
+    Returns None if the entry doesn't exist.
+    """
+    if not path:
+        # Checked first: files requested individually may be extracted from the archive next to it.
+        archive_path = archives.get_archive_entry_path(full_path)
+        if archives.is_archive_entry(archive_path):
+            return archive_path
+    return compression.find(full_path)
+
+
 def get_cached_path(handle: ResourceHandle, path: str | None = None) -> str:
     # Can extend to add support for other resources like DatasetHandle.
     if isinstance(handle, ModelHandle):
@@ -132,9 +321,15 @@ def _delete_from_cache_folder(path: str) -> str | None:
     return None
 
 
+def _is_within(path: str, folder: str) -> bool:
+    path, folder = os.path.abspath(path), os.path.abspath(folder)
+    return os.path.commonpath([path, folder]) == folder
+
+
 def mark_as_incomplete(handle: ResourceHandle, path: str | None = None) -> None:
     marker_path = _get_completion_marker_filepath(handle, path)
     _delete_from_cache_folder(marker_path)
+    _delete_from_cache_folder(marker_path.removesuffix(COMPLETION_MARKER_SUFFIX) + MANIFEST_SUFFIX)
 
 
 def delete_from_cache(handle: ResourceHandle, path: str | None = None) -> str | None:
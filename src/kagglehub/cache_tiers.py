@@ -0,0 +1,259 @@
+"""Fast cache tiers in front of the default (possibly shared) cache folder.
+
+Entries found in a slower tier are promoted into the fastest tier in the background, so later lookups hit local
+storage. Promoted entries are tracked by their completion marker in the tier: the marker content is the entry path
+relative to the tier root followed by its size on a second line, and the marker mtime is refreshed on every hit to
+implement least recently used eviction.
+
+Eviction happens while promoting new entries, without coordinating with the callers the evicted paths were returned
+to: an entry is only kept for `KAGGLEHUB_CACHE_TIER_EVICTION_GRACE_PERIOD` seconds after its last use.
+"""
+
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+
+from kagglehub.config import CacheTier, get_cache_tier_eviction_grace_period
+
+# Copies left behind by promotions interrupted for that long are removed when evicting.
+STALE_PROMOTION_AGE = 3600  # seconds
+
+MARKER_SUFFIX = ".complete"
+_PROMOTION_SUFFIX_RE = re.compile(r"\.promote-[0-9a-f]{32}$")
+
+logger = logging.getLogger(__name__)
+
+_promotions_lock = threading.Lock()
+_pending_promotions: set[str] = set()
+
+
+@dataclass
+class TierEntry:
+    data_path: str
+    marker_path: str
+    size: int
+    last_access: float
+
+
+def rebase(path: str, from_root: str, to_root: str) -> str:
+    return os.path.join(to_root, os.path.relpath(path, from_root))
+
+
+def touch(marker_path: str) -> None:
+    try:
+        os.utime(marker_path)
+    except OSError:
+        # The entry may have been evicted by another process in the meantime.
+        pass
+
+
+def promote_in_background(src_path: str, tier: CacheTier, data_path: str, marker_path: str) -> None:
+    """Copies a cache entry into the given tier without blocking the caller.
+
+    Args:
+        src_path: (string) Path of the complete entry in a slower tier.
+        tier: (CacheTier) The tier to promote the entry to.
+        data_path: (string) Destination path of the entry in the tier.
+        marker_path: (string) Destination path of the entry's completion marker in the tier.
+    """
+    with _promotions_lock:
+        if data_path in _pending_promotions:
+            return
+        _pending_promotions.add(data_path)
+
+    def _promote() -> None:
+        try:
+            promote(src_path, tier, data_path, marker_path)
+        except Exception as e:
+            logger.warning(f"Failed to promote '{src_path}' to cache tier '{tier.path}': {e}")
+        finally:
+            with _promotions_lock:
+                _pending_promotions.discard(data_path)
+
+    threading.Thread(target=_promote, name="kagglehub-cache-promotion", daemon=True).start()
+
+
+def promote(src_path: str, tier: CacheTier, data_path: str, marker_path: str) -> None:
+    size = get_size(src_path)
+    if tier.max_size is not None and size > tier.max_size:
+        logger.debug(f"Not promoting '{src_path}' ({size} bytes) larger than cache tier '{tier.path}'.")
+        return
+    if tier.max_size is not None:
+        evict(tier, needed=size)
+
+    # Copy next to the destination first so a partially copied entry is never visible.
+    os.makedirs(os.path.dirname(data_path), exist_ok=True)
+    tmp_path = f"{data_path}.promote-{uuid.uuid4().hex}"
+    try:
+        if os.path.isdir(src_path):
+            shutil.copytree(src_path, tmp_path)
+        else:
+            shutil.copy2(src_path, tmp_path)
+        if os.path.isdir(data_path):
+            # Files of the bundle promoted separately before are now part of it.
+            _remove_nested_markers(tier, data_path)
+            shutil.rmtree(data_path)
+        os.replace(tmp_path, data_path)
+    finally:
+        if os.path.isdir(tmp_path):
+            shutil.rmtree(tmp_path)
+        elif os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    os.makedirs(os.path.dirname(marker_path), exist_ok=True)
+    with open(marker_path, "w") as f:
+        f.write(f"{os.path.relpath(data_path, tier.path)}\n{size}")
+    logger.debug(f"Promoted '{src_path}' to cache tier '{tier.path}'.")
+
+
+def evict(tier: CacheTier, needed: int = 0) -> list[str]:
+    """Evicts least recently used entries until `needed` more bytes fit in the tier.
+
+    Entries used within the grace period (`get_cache_tier_eviction_grace_period`) are kept, as they may still be read
+    by the callers they were returned to. Copies left behind by interrupted promotions are removed too.
+
+    Returns:
+        The list of evicted entry paths.
+    """
+    _remove_stale_promotions(tier)
+    if tier.max_size is None:
+        return []
+
+    entries = list_tier_entries(tier)
+    total_size = sum(e.size for e in entries)
+    evicted = []
+    grace_period = get_cache_tier_eviction_grace_period()
+    for entry in sorted(entries, key=lambda e: e.last_access):
+        if total_size + needed <= tier.max_size:
+            break
+        if _is_recently_used(entry.marker_path, grace_period):
+            continue
+        logger.debug(f"Evicting '{entry.data_path}' ({entry.size} bytes) from cache tier '{tier.path}'.")
+        _remove(entry.marker_path)
+        _remove(entry.data_path)
+        total_size -= entry.size
+        evicted.append(entry.data_path)
+    return evicted
+
+
+def list_tier_entries(tier: CacheTier) -> list[TierEntry]:
+    entries = []
+    for marker_path in _list_markers(tier):
+        try:
+            with open(marker_path) as f:
+                content = f.read(4096)
+            last_access = os.path.getmtime(marker_path)
+        except (OSError, UnicodeDecodeError):
+            continue
+        rel_data_path, _, size = content.strip().partition("\n")
+        if not _is_valid_marker(rel_data_path, size):
+            continue
+        data_path = os.path.join(tier.path, rel_data_path)
+        if not os.path.exists(data_path):
+            continue
+        # Markers written before sizes were recorded don't have one.
+        entry_size = int(size) if size else get_size(data_path)
+        entries.append(TierEntry(data_path, marker_path, entry_size, last_access))
+    # Files of promoted entries may be named like markers too.
+    return [
+        entry
+        for entry in entries
+        if not any(_is_within(entry.marker_path, other.data_path) for other in entries if other is not entry)
+    ]
+
+
+def get_size(path: str) -> int:
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, filename))
+            except OSError:
+                continue
+    return total
+
+
+def _list_markers(tier: CacheTier) -> list[str]:
+    markers: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(tier.path):
+        # Copies of promotions in progress hold no markers.
+        dirnames[:] = [d for d in dirnames if not _PROMOTION_SUFFIX_RE.search(d)]
+        markers.extend(os.path.join(dirpath, filename) for filename in filenames if filename.endswith(MARKER_SUFFIX))
+    return markers
+
+
+def _is_valid_marker(rel_data_path: str, size: str) -> bool:
+    """Whether a marker's content is an entry path within the tier, optionally followed by the entry's size."""
+    if not rel_data_path or (size and not size.isdigit()):
+        return False
+    if os.path.isabs(rel_data_path) or os.path.normpath(rel_data_path).split(os.sep)[0] == os.pardir:
+        return False
+    return not _PROMOTION_SUFFIX_RE.search(rel_data_path)
+
+
+def _is_within(path: str, parent: str) -> bool:
+    return path == parent or os.path.commonpath([parent, path]) == parent
+
+
+def _remove_stale_promotions(tier: CacheTier) -> None:
+    with _promotions_lock:
+        pending = set(_pending_promotions)
+    for dirpath, dirnames, filenames in os.walk(tier.path):
+        for name in [*dirnames, *filenames]:
+            if not _PROMOTION_SUFFIX_RE.search(name):
+                continue
+            path = os.path.join(dirpath, name)
+            if (
+                _PROMOTION_SUFFIX_RE.sub("", path) in pending
+                or _get_last_change(path) > time.time() - STALE_PROMOTION_AGE
+            ):
+                continue
+            logger.debug(f"Removing '{path}' left behind by an interrupted promotion to cache tier '{tier.path}'.")
+            _remove(path)
+        # Don't look for promotions within promotions.
+        dirnames[:] = [d for d in dirnames if not _PROMOTION_SUFFIX_RE.search(d)]
+
+
+def _get_last_change(path: str) -> float:
+    """Returns when a file or directory, or any file within it, was last written to, or 0 if it no longer exists."""
+    # Copies keep the mtime of their source: rely on the ctime that copying updates instead.
+    try:
+        last_change = os.stat(path).st_ctime
+        if os.path.isdir(path):
+            for dirpath, _, filenames in os.walk(path):
+                for name in filenames:
+                    last_change = max(last_change, os.stat(os.path.join(dirpath, name)).st_ctime)
+    except OSError:
+        return 0
+    return last_change
+
+
+def _remove_nested_markers(tier: CacheTier, data_path: str) -> None:
+    """Stops tracking the entries stored within `data_path`, so evicting them doesn't remove files of its entry."""
+    for entry in list_tier_entries(tier):
+        if entry.data_path != data_path and _is_within(entry.data_path, data_path):
+            _remove(entry.marker_path)
+
+
+def _is_recently_used(marker_path: str, grace_period: float) -> bool:
+    try:
+        return os.path.getmtime(marker_path) > time.time() - grace_period
+    except OSError:
+        return False
+
+
+def _remove(path: str) -> None:
+    try:
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,185 @@
+"""Command line interface: `kagglehub <command>` (or `python -m kagglehub <command>`)."""
+
+import argparse
+import sys
+from collections.abc import Sequence
+
+from tqdm import tqdm
+
+from kagglehub import proxy, scrub, snapshot, stats, tracker, warmup
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="kagglehub", description="Access Kaggle resources anywhere.")
+    subparsers = parser.add_subparsers(title="commands", required=True)
+
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run a caching proxy for the Kaggle API.",
+        description=(
+            "Run a caching proxy for the Kaggle API on the local network. Point clients to it by setting "
+            "KAGGLEHUB_PROXY_URL. Each file is downloaded once from Kaggle and served to all clients."
+        ),
+    )
+    serve_parser.add_argument(
+        "--host",
+        default=proxy.DEFAULT_HOST,
+        help="Interface to listen on, e.g. 0.0.0.0 to serve other machines (default: %(default)s).",
+    )
+    serve_parser.add_argument(
+        "--port", type=int, default=proxy.DEFAULT_PORT, help="Port to listen on (default: %(default)s)."
+    )
+    serve_parser.add_argument(
+        "--cache-dir", default=None, help="Folder to store files in (default: a subfolder of the kagglehub cache)."
+    )
+    serve_parser.add_argument(
+        "--metadata-ttl",
+        type=float,
+        default=proxy.DEFAULT_METADATA_TTL,
+        help="Seconds to cache version lookups and file listings for, 0 to disable (default: %(default)s).",
+    )
+    serve_parser.set_defaults(func=_serve)
+
+    warmup_parser = subparsers.add_parser(
+        "warmup",
+        help="Download all the datasources listed in a tracker file.",
+        description=(
+            "Download all the datasources listed in a file written by kagglehub.tracker.write_file, at the recorded "
+            "versions. Use it e.g. when building an image so jobs find everything in the cache."
+        ),
+    )
+    warmup_parser.add_argument("file", help="Path of the yaml file listing the datasources.")
+    warmup_parser.add_argument(
+        "--output-dir", default=None, help="Folder to download the datasources to (default: the kagglehub cache)."
+    )
+    warmup_parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=warmup.DEFAULT_MAX_WORKERS,
+        help="Maximum number of datasources downloaded in parallel (default: %(default)s).",
+    )
+    warmup_parser.add_argument(
+        "--force-download", action="store_true", help="Download the datasources even if they are cached."
+    )
+    warmup_parser.set_defaults(func=_warmup)
+
+    cache_parser = subparsers.add_parser("cache", help="Manage the kagglehub cache.")
+    cache_subparsers = cache_parser.add_subparsers(title="commands", required=True)
+    verify_parser = cache_subparsers.add_parser(
+        "verify",
+        help="Verify cached files against the checksums recorded when they were downloaded.",
+        description=(
+            "Verify cached files against the checksums recorded when they were downloaded. Exits with status 1 if "
+            "missing or corrupted files are left."
+        ),
+    )
+    verify_parser.add_argument("--repair", action="store_true", help="Download missing or corrupted files again.")
+    verify_parser.add_argument(
+        "--max-workers", type=int, default=None, help="Maximum number of files hashed in parallel."
+    )
+    verify_parser.set_defaults(func=_cache_verify)
+
+    stats_parser = cache_subparsers.add_parser(
+        "stats",
+        help="Show the disk usage of the cached resources.",
+        description=(
+            "Show the size, number of files and last access time of each entry of the cache, largest first. Hit / "
+            "miss counters are per process: use kagglehub.cache_stats() to read them from a job."
+        ),
+    )
+    stats_parser.set_defaults(func=_cache_stats)
+
+    export_parser = cache_subparsers.add_parser(
+        "export",
+        help="Write cached resources to a snapshot file.",
+        description=(
+            "Write the cached resources, with their completion state, to a tar snapshot. Import it on other nodes or "
+            "in images with `kagglehub cache import` to skip downloading them again."
+        ),
+    )
+    export_parser.add_argument(
+        "file", help="Path of the snapshot to write, gzipped if it ends with .tar.gz or .tgz, or - for stdout."
+    )
+    export_parser.add_argument(
+        "--tracker-file",
+        default=None,
+        help="Only export the datasources listed in a file written by kagglehub.tracker.write_file.",
+    )
+    export_parser.set_defaults(func=_cache_export)
+
+    import_parser = cache_subparsers.add_parser(
+        "import",
+        help="Unpack a snapshot file into the cache.",
+        description="Unpack a snapshot written by `kagglehub cache export` into the cache. Complete entries are kept.",
+    )
+    import_parser.add_argument("file", help="Path of the snapshot to read, or - for stdin.")
+    import_parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=snapshot.DEFAULT_MAX_WORKERS,
+        help="Maximum number of files written in parallel (default: %(default)s).",
+    )
+    import_parser.set_defaults(func=_cache_import)
+
+    return parser
+
+
+def _serve(args: argparse.Namespace) -> int:
+    proxy.serve(args.host, args.port, cache_dir=args.cache_dir, metadata_ttl=args.metadata_ttl)
+    return 0
+
+
+def _warmup(args: argparse.Namespace) -> int:
+    paths = warmup.cache_warmup(
+        args.file, output_dir=args.output_dir, max_workers=args.max_workers, force_download=args.force_download
+    )
+    for h, path in paths.items():
+        sys.stdout.write(f"{h}\t{path}\n")
+    return 0
+
+
+def _cache_verify(args: argparse.Namespace) -> int:
+    results = scrub.cache_scrub(repair=args.repair, max_workers=args.max_workers)
+    for result in results:
+        entry = f"{result.handle}" + (f" ({result.path})" if result.path else "")
+        if not result.bad_files:
+            sys.stdout.write(f"OK\t{entry}\n")
+            continue
+        for rel_path in result.bad_files:
+            status = "REPAIRED" if rel_path in result.repaired_files else "BAD"
+            sys.stdout.write(f"{status}\t{entry}\t{rel_path}\n")
+    return 0 if all(result.ok for result in results) else 1
+
+
+def _cache_stats(_: argparse.Namespace) -> int:
+    usages = stats.cache_usage()
+    sys.stdout.write("SIZE\tFILES\tLAST ACCESS\tHANDLE\n")
+    for usage in usages:
+        entry = f"{usage.handle}" + (f" ({usage.path})" if usage.path else "")
+        size = tqdm.format_sizeof(usage.size, "B", 1024)
+        last_access = usage.last_access.astimezone().strftime("%Y-%m-%d %H:%M:%S")
+        sys.stdout.write(f"{size}\t{usage.num_files}\t{last_access}\t{entry}\n")
+    total_size = tqdm.format_sizeof(sum(usage.size for usage in usages), "B", 1024)
+    sys.stdout.write(f"{total_size}\t{sum(usage.num_files for usage in usages)}\t\tTotal ({len(usages)} entries)\n")
+    return 0
+
+
+def _cache_export(args: argparse.Namespace) -> int:
+    handles = warmup._get_handles_to_warmup(tracker.read_file(args.tracker_file)) if args.tracker_file else None
+    entries = snapshot.cache_export(args.file, handles)
+    # The snapshot may be written to stdout.
+    for h, path in entries:
+        sys.stderr.write(f"{h}" + (f" ({path})" if path else "") + "\n")
+    return 0
+
+
+def _cache_import(args: argparse.Namespace) -> int:
+    for h, path in snapshot.cache_import(args.file, max_workers=args.max_workers):
+        sys.stdout.write(f"{h}" + (f" ({path})" if path else "") + "\n")
+    return 0
@@ -12,19 +12,21 @@ from urllib.parse import urlparse
 import requests
 import requests.auth
 from kagglesdk.kaggle_client import KaggleClient
-from kagglesdk.kaggle_env import KaggleEnv, get_env, is_in_kaggle_notebook
+from kagglesdk.kaggle_env import KaggleEnv, get_endpoint, get_env, is_in_kaggle_notebook
 from kagglesdk.kaggle_http_client import KaggleHttpClient
 from packaging.version import parse
 from requests.auth import HTTPBasicAuth
 from tqdm import tqdm
 
 import kagglehub
+from kagglehub import manifest, stats
 from kagglehub.cache import delete_from_cache, get_cached_archive_path
-from kagglehub.config import get_kaggle_credentials
+from kagglehub.config import PROXY_URL_ENV_VAR_NAME, get_kaggle_credentials, get_proxy_url
 from kagglehub.datasets_enums import KaggleDatasetAdapter
 from kagglehub.env import (
     KAGGLE_DATA_PROXY_URL_ENV_VAR_NAME,
     is_in_colab_notebook,
+    iter_call_stack,
     read_kaggle_build_date,
     search_lib_in_call_stack,
 )
@@ -39,6 +41,7 @@ from kagglehub.exceptions import (
 )
 from kagglehub.handle import CompetitionHandle, ResourceHandle
 from kagglehub.integrity import get_md5_checksum_from_response, to_b64_digest, update_hash_from_file
+from kagglehub.scheduler import scheduler
 
 CHUNK_SIZE = 1048576
 # The `connect` timeout is the number of seconds `requests` will wait for your client to establish a connection.
@@ -82,16 +85,16 @@ def get_user_agent() -> str:
             break
 
     # Add an appropriate data loader user agent for kagglehub.dataset_load calls
-    for frame_info in inspect.stack():
-        if frame_info.function != "dataset_load":
+    for frame in iter_call_stack():
+        if frame.f_code.co_name != "dataset_load":
             continue
-        module = inspect.getmodule(frame_info.frame)
+        module_name = frame.f_globals.get("__name__")
 
-        if not module or not hasattr(module, "__name__") or not module.__name__.startswith("kagglehub.datasets"):
+        if not isinstance(module_name, str) or not module_name.startswith("kagglehub.datasets"):
             continue
 
         # We've confirmed that this is a call to kagglehub.dataset_load. Now figure out which loader was used.
-        adapter = frame_info.frame.f_locals["adapter"] if "adapter" in frame_info.frame.f_locals else None
+        adapter = frame.f_locals.get("adapter")
         if adapter and adapter in ADAPTER_TO_USER_AGENT_MAP:
             user_agents.append(ADAPTER_TO_USER_AGENT_MAP[adapter])
             break
@@ -135,23 +138,52 @@ def build_kaggle_client() -> KaggleClient:
     credentials = get_kaggle_credentials()
     env = get_env()
     verbose = True if env == KaggleEnv.TEST else False
+    # Route the API calls through a `kagglehub serve` caching proxy, with the endpoint override of kagglesdk if any.
+    proxy_url = get_proxy_url()
+    overrides_endpoint = bool(proxy_url) and "endpoint" in inspect.signature(KaggleClient).parameters
+    endpoint_kwargs = {"endpoint": proxy_url} if overrides_endpoint else {}
     if not credentials:
         # Unauthenticated client
-        return KaggleClient(
+        client = KaggleClient(
             env=env,
             verbose=verbose,
             user_agent=get_user_agent(),
+            **endpoint_kwargs,
+        )
+    else:
+        client = KaggleClient(
+            env=env,
+            verbose=verbose,
+            username=credentials.username,
+            password=credentials.key,
+            api_token=credentials.api_key,
+            user_agent=get_user_agent(),
+            response_processor=get_response_processor(),
+            **endpoint_kwargs,
         )
 
-    return KaggleClient(
-        env=env,
-        verbose=verbose,
-        username=credentials.username,
-        password=credentials.key,
-        api_token=credentials.api_key,
-        user_agent=get_user_agent(),
-        response_processor=get_response_processor(),
-    )
+    # The HTTP client sending all the calls of `client`, from its public accessor.
+    http_client = client.http_client() if callable(getattr(client, "http_client", None)) else None
+    if proxy_url and not overrides_endpoint:
+        # Versions of kagglesdk without an endpoint override only map KAGGLE_API_ENVIRONMENT to a fixed set of
+        # endpoints: set the one of their HTTP client instead, as long as it still has one.
+        if http_client is None or not hasattr(http_client, "_endpoint"):
+            msg = (
+                f"{PROXY_URL_ENV_VAR_NAME} is set but the installed kagglesdk version doesn't support routing API "
+                "calls through a proxy."
+            )
+            raise KaggleEnvironmentError(msg)
+        http_client._endpoint = proxy_url
+
+    # Rate limit, retry and coalesce the calls of all the clients together. kagglesdk has no hook for it: the public
+    # `call` method of the HTTP client is wrapped, if the installed version still sends all the calls there.
+    if http_client is not None and callable(getattr(http_client, "call", None)):
+        endpoint = proxy_url or get_endpoint(env)
+        client_key = (endpoint, credentials.username, credentials.key, credentials.api_key) if credentials else endpoint
+        http_client.call = scheduler.wrap(http_client.call, client_key)
+    else:
+        logger.debug("The installed kagglesdk version doesn't support scheduling API calls, sending them as is.")
+    return client
 
 
 def download_file(
@@ -176,7 +208,8 @@ def download_file(
         return False
 
     expected_md5_hash = get_md5_checksum_from_response(response)
-    hash_object = hashlib.md5() if expected_md5_hash else None
+    # Also hashed without an expected digest: it's recorded in the manifest of the cache entry.
+    hash_object = hashlib.md5()
 
     if _is_resumable(response) and total_size and os.path.isfile(out_file):
         size_read = os.path.getsize(out_file)
@@ -196,16 +229,16 @@ def download_file(
             headers={"Range": f"bytes={size_read}-"},
         ) as resumed_response:
             logger.info(f"Resuming download to {out_file} ({size_read}/{total_size}) bytes left.")
-            _download_file(resumed_response, out_file, size_read, total_size, hash_object)
+            num_bytes = _download_file(resumed_response, out_file, size_read, total_size, hash_object)
     else:
         logger.info(f"Downloading to {out_file}...")
-        _download_file(response, out_file, size_read, total_size, hash_object)
+        num_bytes = _download_file(response, out_file, size_read, total_size, hash_object)
+    stats.record_download(resource_handle, num_bytes)
 
-    if hash_object:
-        actual_md5_hash = to_b64_digest(hash_object)
-        if actual_md5_hash != expected_md5_hash:
-            os.remove(out_file)  # Delete the corrupted file.
-            raise DataCorruptionError(_CHECKSUM_MISMATCH_MSG_TEMPLATE.format(expected_md5_hash, actual_md5_hash))
+    actual_md5_hash = to_b64_digest(hash_object)
+    if expected_md5_hash and actual_md5_hash != expected_md5_hash:
+        os.remove(out_file)  # Delete the corrupted file.
+        raise DataCorruptionError(_CHECKSUM_MISMATCH_MSG_TEMPLATE.format(expected_md5_hash, actual_md5_hash))
 
     # For individual file downloads, the downloaded file may be a zip of the file rather
     # than the file name/type that was requested (e.g. my-big-table.csv.zip and not my-big-table.csv).
@@ -221,10 +254,12 @@ def download_file(
         # Rename the file to match what it really is and make space to write to the expected location
         renamed_auto_compressed_path = f"{out_file}.zip"
         os.rename(out_file, renamed_auto_compressed_path)
-        with zipfile.ZipFile(renamed_auto_compressed_path, "r") as f:
-            f.extract(expected_downloaded_file_name, os.path.dirname(out_file))
+        with zipfile.ZipFile(renamed_auto_compressed_path, "r") as f, f.open(expected_downloaded_file_name) as src:
+            manifest.write_file(src, out_file)
         # We don't need the zipped version anymore
         os.remove(renamed_auto_compressed_path)
+    else:
+        manifest.record_digest(out_file, actual_md5_hash)
     return True
 
 
@@ -238,8 +273,10 @@ def _download_file(
     size_read: int,
     total_size: int | None,
     hash_object,  # noqa: ANN001 - no public type for hashlib hash
-) -> None:
+) -> int:
+    """Writes the response's content to `out_file` and returns the number of bytes written."""
     open_mode = "ab" if size_read > 0 else "wb"
+    num_bytes = 0
     if total_size is not None:
         with tqdm(total=total_size, initial=size_read, unit="B", unit_scale=True, unit_divisor=1024) as progress_bar:
             with open(out_file, open_mode) as f:
@@ -248,6 +285,7 @@ def _download_file(
                     if hash_object:
                         hash_object.update(chunk)
                     size_read = min(total_size, size_read + CHUNK_SIZE)
+                    num_bytes += len(chunk)
                     progress_bar.update(len(chunk))
     else:
         with open(out_file, open_mode) as f:
@@ -255,6 +293,8 @@ def _download_file(
                 f.write(chunk)
                 if hash_object:
                     hash_object.update(chunk)
+                num_bytes += len(chunk)
+    return num_bytes
 
 
 def _download_needed(response: requests.Response, h: ResourceHandle, cached_path: str | None = None) -> bool:
@@ -267,32 +307,7 @@ def _download_needed(response: requests.Response, h: ResourceHandle, cached_path
     if not cached_path:
         return True
 
-    last_modified = response.headers.get("Last-Modified")
-    if last_modified is None:
-        delete_from_cache(h, cached_path)
-
-        archive_path = get_cached_archive_path(h)
-        os.makedirs(os.path.dirname(archive_path), exist_ok=True)
-
-        return True
-    else:
-        remote_date = datetime.strptime(response.headers["Last-Modified"], "%a, %d %b %Y %H:%M:%S %Z").replace(
-            tzinfo=timezone.utc
-        )
-
-    file_exists = os.path.exists(cached_path)
-    if file_exists:
-        local_date = datetime.fromtimestamp(os.path.getmtime(cached_path), tz=timezone.utc)
-
-        download_needed = remote_date >= local_date
-        if download_needed:
-            delete_from_cache(h, cached_path)
-
-            archive_path = get_cached_archive_path(h)
-            os.makedirs(os.path.dirname(archive_path), exist_ok=True)
-
-            return True
-
+    if is_cached_copy_current(response, cached_path):
         return False
 
     delete_from_cache(h, cached_path)
@@ -303,6 +318,19 @@ def _download_needed(response: requests.Response, h: ResourceHandle, cached_path
     return True
 
 
+def is_cached_copy_current(response: requests.Response, cached_path: str) -> bool:
+    """Whether a cached competition file was written after it was last modified, according to its download response.
+
+    Unlike `download_file`, nothing is deleted from the cache: this is safe to call without holding the entry's lock.
+    """
+    last_modified = response.headers.get("Last-Modified")
+    if last_modified is None or not os.path.exists(cached_path):
+        return False
+    remote_date = datetime.strptime(last_modified, "%a, %d %b %Y %H:%M:%S %Z").replace(tzinfo=timezone.utc)
+    local_date = datetime.fromtimestamp(os.path.getmtime(cached_path), tz=timezone.utc)
+    return remote_date < local_date
+
+
 # These environment variables are set by the Kaggle notebook environment.
 KAGGLE_JWT_TOKEN_ENV_VAR_NAME = "KAGGLE_USER_SECRETS_TOKEN"
 KAGGLE_DATA_PROXY_TOKEN_ENV_VAR_NAME = "KAGGLE_DATA_PROXY_TOKEN"
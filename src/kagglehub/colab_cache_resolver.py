@@ -1,14 +1,15 @@
 import logging
 import os
-import time
 
+from kagglehub import staging
 from kagglehub.clients import ColabClient
-from kagglehub.config import is_colab_cache_disabled
-from kagglehub.exceptions import BackendError, NotFoundError
-from kagglehub.handle import DatasetHandle, ModelHandle
+from kagglehub.config import get_mount_timeout, is_colab_cache_disabled, is_colab_speculative_mount_disabled
+from kagglehub.exceptions import BackendError, NotFoundError, UnsupportedResolutionError
+from kagglehub.handle import DatasetHandle, ModelHandle, ResourceHandle
 from kagglehub.logger import EXTRA_CONSOLE_BLOCK
+from kagglehub.mounts import Mount, get_mount, remember_mount, wait_for_mount
 from kagglehub.packages import PackageScope
-from kagglehub.resolver import Resolver
+from kagglehub.resolver import ForceDownload, Resolver
 
 COLAB_CACHE_MOUNT_FOLDER_ENV_VAR_NAME = "COLAB_CACHE_MOUNT_FOLDER"
 DEFAULT_COLAB_CACHE_MOUNT_FOLDER = "/kaggle/input"
@@ -17,9 +18,18 @@ logger = logging.getLogger(__name__)
 
 
 class ModelColabCacheResolver(Resolver[ModelHandle]):
+    def is_supported_in_environment(self) -> bool:
+        return _is_colab_cache_enabled()
+
     def is_supported(self, handle: ModelHandle, *_, **__) -> bool:  # noqa: ANN002, ANN003
-        if ColabClient.TBE_RUNTIME_ADDR_ENV_VAR_NAME not in os.environ or is_colab_cache_disabled():
+        if not _is_colab_cache_enabled():
             return False
+        if get_mount(handle) is not None:
+            # Already mounted by an earlier resolution.
+            return True
+        if not is_colab_speculative_mount_disabled():
+            # The mount request doubles as the support check, see `_post_mount`.
+            return True
 
         api_client = ColabClient()
         data = {
@@ -45,7 +55,7 @@ class ModelColabCacheResolver(Resolver[ModelHandle]):
         h: ModelHandle,
         path: str | None = None,
         *,
-        force_download: bool | None = False,
+        force_download: ForceDownload = False,
         output_dir: str | None = None,
     ) -> tuple[str, int | None]:
         if output_dir:
@@ -59,55 +69,40 @@ class ModelColabCacheResolver(Resolver[ModelHandle]):
                 extra={**EXTRA_CONSOLE_BLOCK},
             )
 
-        api_client = ColabClient()
-        data = {
-            "owner": h.owner,
-            "model": h.model,
-            "framework": h.framework,
-            "variation": h.variation,
-        }
-
-        version = _get_model_version(h)
-        if version:
-            # Colab treats version as int in the request
-            data["version"] = version  # type: ignore
-
-        response = api_client.post(data, ColabClient.MODEL_MOUNT_PATH, h)
+        mount = get_mount(h)
+        if mount is None:
+            api_client = ColabClient()
+            data = {
+                "owner": h.owner,
+                "model": h.model,
+                "framework": h.framework,
+                "variation": h.variation,
+            }
 
-        if response is None:
-            no_response = "No response received or response was empty."
-            raise ValueError(no_response)
+            version = _get_model_version(h)
+            if version:
+                # Colab treats version as int in the request
+                data["version"] = version  # type: ignore
 
-        if "slug" not in response:
-            msg = "'slug' field missing from response"
-            raise BackendError(msg)
+            response = _post_mount(api_client, data, ColabClient.MODEL_MOUNT_PATH, h)
+            mount = _get_mount_from_response(h, response, version)
 
-        base_mount_path = os.getenv(COLAB_CACHE_MOUNT_FOLDER_ENV_VAR_NAME, DEFAULT_COLAB_CACHE_MOUNT_FOLDER)
-        cached_path = f"{base_mount_path}/{response['slug']}"
-
-        if not os.path.exists(cached_path):
-            # Only print this if the model is not already mounted.
-            logger.info(f"Mounting files to {cached_path}...")
-
-        while not os.path.exists(cached_path):
-            time.sleep(5)
-
-        if path:
-            cached_filepath = f"{cached_path}/{path}"
-            if not os.path.exists(cached_filepath):
-                msg = (
-                    f"'{path}' is not present in the model files. "
-                    f"You can access the other files of the attached model at '{cached_path}'"
-                )
-                raise ValueError(msg)
-            return cached_filepath, version
-        return cached_path, version
+        return _get_mounted_path(mount, path, "model"), mount.version
 
 
 class DatasetColabCacheResolver(Resolver[DatasetHandle]):
+    def is_supported_in_environment(self) -> bool:
+        return _is_colab_cache_enabled()
+
     def is_supported(self, handle: DatasetHandle, *_, **__) -> bool:  # noqa: ANN002, ANN003
-        if ColabClient.TBE_RUNTIME_ADDR_ENV_VAR_NAME not in os.environ or is_colab_cache_disabled():
+        if not _is_colab_cache_enabled():
             return False
+        if get_mount(handle) is not None:
+            # Already mounted by an earlier resolution.
+            return True
+        if not is_colab_speculative_mount_disabled():
+            # The mount request doubles as the support check, see `_post_mount`.
+            return True
 
         api_client = ColabClient()
         data = {
@@ -131,7 +126,7 @@ class DatasetColabCacheResolver(Resolver[DatasetHandle]):
         h: DatasetHandle,
         path: str | None = None,
         *,
-        force_download: bool | None = False,
+        force_download: ForceDownload = False,
         output_dir: str | None = None,
     ) -> tuple[str, int | None]:
         if output_dir:
@@ -145,49 +140,28 @@ class DatasetColabCacheResolver(Resolver[DatasetHandle]):
                 extra={**EXTRA_CONSOLE_BLOCK},
             )
 
-        api_client = ColabClient()
-        data = {
-            "owner": h.owner,
-            "dataset": h.dataset,
-        }
-
-        version = _get_dataset_version(h)
-        if version:
-            # Colab treats version as int in the request
-            data["version"] = version  # type: ignore
-
-        response = api_client.post(data, ColabClient.DATASET_MOUNT_PATH, h)
-
-        if response is None:
-            no_response = "No response received or response was empty."
-            raise ValueError(no_response)
+        mount = get_mount(h)
+        if mount is None:
+            api_client = ColabClient()
+            data = {
+                "owner": h.owner,
+                "dataset": h.dataset,
+            }
 
-        if "slug" not in response:
-            msg = "'slug' field missing from response"
-            raise BackendError(msg)
+            version = _get_dataset_version(h)
+            if version:
+                # Colab treats version as int in the request
+                data["version"] = version  # type: ignore
 
-        logger.info(f"Using Colab cache for faster access to the '{response['slug']}' dataset.")
+            response = _post_mount(api_client, data, ColabClient.DATASET_MOUNT_PATH, h)
+            mount = _get_mount_from_response(h, response, version)
+            logger.info(f"Using Colab cache for faster access to the '{mount.mount_slug}' dataset.")
 
-        base_mount_path = os.getenv(COLAB_CACHE_MOUNT_FOLDER_ENV_VAR_NAME, DEFAULT_COLAB_CACHE_MOUNT_FOLDER)
-        cached_path = f"{base_mount_path}/{response['slug']}"
+        return _get_mounted_path(mount, path, "dataset"), mount.version
 
-        if not os.path.exists(cached_path):
-            # Only print this if the dataset is not already mounted.
-            logger.info(f"Mounting files to {cached_path}...")
 
-        while not os.path.exists(cached_path):
-            time.sleep(5)
-
-        if path:
-            cached_filepath = f"{cached_path}/{path}"
-            if not os.path.exists(cached_filepath):
-                msg = (
-                    f"'{path}' is not present in the dataset files. "
-                    f"You can access the other files of the attached dataset at '{cached_path}'"
-                )
-                raise ValueError(msg)
-            return cached_filepath, version
-        return cached_path, version
+def _is_colab_cache_enabled() -> bool:
+    return ColabClient.TBE_RUNTIME_ADDR_ENV_VAR_NAME in os.environ and not is_colab_cache_disabled()
 
 
 def _get_model_version(h: ModelHandle) -> int | None:
@@ -210,3 +184,45 @@ def _get_dataset_version(h: DatasetHandle) -> int | None:
         return version_from_package_scope
 
     return None
+
+
+def _post_mount(api_client: ColabClient, data: dict, mount_path: str, h: ResourceHandle) -> dict | None:
+    try:
+        return api_client.post(data, mount_path, h)
+    except NotFoundError as e:
+        # Falls back to the next resolver, e.g. to download over HTTP.
+        msg = f"'{h}' isn't available in the Colab cache."
+        raise UnsupportedResolutionError(msg) from e
+
+
+def _get_mount_from_response(h: ResourceHandle, response: dict | None, version: int | None) -> Mount:
+    if response is None:
+        no_response = "No response received or response was empty."
+        raise ValueError(no_response)
+
+    if "slug" not in response:
+        msg = "'slug' field missing from response"
+        raise BackendError(msg)
+
+    base_mount_path = os.getenv(COLAB_CACHE_MOUNT_FOLDER_ENV_VAR_NAME, DEFAULT_COLAB_CACHE_MOUNT_FOLDER)
+    return Mount(h, base_mount_path, response["slug"], version)
+
+
+def _get_mounted_path(mount: Mount, path: str | None, kind: str) -> str:
+    cached_path = mount.path
+    if not os.path.exists(cached_path):
+        # Only print this if the datasource is not already mounted.
+        logger.info(f"Mounting files to {cached_path}...")
+
+    wait_for_mount(cached_path, timeout=get_mount_timeout())
+    remember_mount(mount)
+
+    if path:
+        cached_filepath = f"{cached_path}/{path}"
+        if not os.path.exists(cached_filepath):
+            msg = (
+                f"'{path}' is not present in the {kind} files. "
+                f"You can access the other files of the attached {kind} at '{cached_path}'"
+            )
+            raise ValueError(msg)
+    return staging.stage(mount.base_mount_path, mount.mount_slug, path, mount.version)
@@ -3,6 +3,7 @@ import logging
 from kagglehub import registry
 from kagglehub.handle import parse_competition_handle
 from kagglehub.logger import EXTRA_CONSOLE_BLOCK
+from kagglehub.resolver import ForceDownload
 
 logger = logging.getLogger(__name__)
 
@@ -11,15 +12,16 @@ def competition_download(
     handle: str,
     path: str | None = None,
     *,
-    force_download: bool | None = False,
+    force_download: ForceDownload = False,
     output_dir: str | None = None,
 ) -> str:
     """Download competition dataset
     Args:
         handle: (string) the competition name
         path: (string) Optional path to a file within a competition dataset
-        force_download: (bool) Optional flag to force download a competition dataset, even if it's cached or already
-            in output_dir.
+        force_download: (bool | "revalidate") Optional flag to force download a competition dataset, even if it's
+            cached or already in output_dir. With "revalidate", only the files that are missing or don't match are
+            downloaded again.
         output_dir: (string) Optional output directory for direct download, bypassing the default cache.
     Returns:
         A string requesting the path to the requested competition files.
@@ -0,0 +1,125 @@
+"""Compressed-at-rest storage of the text files of cache entries (see `KAGGLEHUB_CACHE_COMPRESSION`).
+
+Each compressible file is replaced by a compressed copy with the codec's suffix appended to its name, e.g.
+`train.csv` is stored as `train.csv.gz`. Readers open them with `open_file`, which decompresses on the fly.
+"""
+
+import gzip
+import importlib
+import logging
+import os
+import shutil
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any
+
+GZIP_SUFFIX = ".gz"
+ZSTD_SUFFIX = ".zst"
+SUFFIXES_BY_CODEC = {"gzip": GZIP_SUFFIX, "zstd": ZSTD_SUFFIX}
+COMPRESSIBLE_EXTENSIONS = (".csv", ".tsv", ".json", ".jsonl", ".txt", ".xml")
+
+# Level 6 is ~3x faster than gzip's default (9) for a slightly larger file.
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+COPY_BUFFER_SIZE = 1024 * 1024  # 1 MiB
+
+logger = logging.getLogger(__name__)
+
+
+def is_compressible(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in COMPRESSIBLE_EXTENSIONS
+
+
+def is_compressed(path: str) -> bool:
+    """Whether the file is a compressed copy of a text file, based on its name."""
+    original_path, suffix = os.path.splitext(path)
+    return suffix in SUFFIXES_BY_CODEC.values() and is_compressible(original_path)
+
+
+def get_original_path(path: str) -> str:
+    """Returns the path of the file before it was compressed, e.g. `train.csv` for `train.csv.gz`."""
+    return os.path.splitext(path)[0] if is_compressed(path) else path
+
+
+def find(path: str) -> str | None:
+    """Returns the path the file or folder is stored at, as is or compressed, or None if it doesn't exist."""
+    if os.path.exists(path):
+        return path
+    if not is_compressible(path):
+        return None
+    for suffix in SUFFIXES_BY_CODEC.values():
+        if os.path.exists(path + suffix):
+            return path + suffix
+    return None
+
+
+def compress_entry(path: str, codec: str, max_workers: int | None = None) -> str:
+    """Compresses the text files of a cache entry (a file or a folder) in place.
+
+    Files are compressed in parallel: zlib and zstd release the GIL while compressing.
+
+    Returns:
+        The path of the entry, which changes if it's a single file.
+    """
+    codec = _get_available_codec(codec)
+    if not os.path.isdir(path):
+        return compress_file(path, codec) if is_compressible(path) else path
+
+    files = [
+        os.path.join(dirpath, filename)
+        for dirpath, _, filenames in os.walk(path)
+        for filename in filenames
+        if is_compressible(filename)
+    ]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(lambda file_path: compress_file(file_path, codec), files))
+    return path
+
+
+def compress_file(path: str, codec: str) -> str:
+    """Replaces the file by a compressed copy and returns the copy's path."""
+    compressed_path = path + SUFFIXES_BY_CODEC[codec]
+    # Write to a temporary file so an interrupted compression never leaves a truncated file behind.
+    tmp_path = f"{compressed_path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(path, "rb") as src, _open_writer(tmp_path, codec) as dst:
+            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+        os.replace(tmp_path, compressed_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    os.remove(path)
+    return compressed_path
+
+
+def open_file(path: str) -> IO[bytes]:
+    """Opens a file for reading in binary mode, decompressing it on the fly if it's compressed."""
+    if not is_compressed(path):
+        return open(path, "rb")
+    if path.endswith(GZIP_SUFFIX):
+        return gzip.open(path, "rb")  # type: ignore[return-value]
+    zstandard = _import_zstandard()
+    if zstandard is None:
+        msg = f"Reading '{path}' requires the 'zstandard' package. Install it with `pip install kagglehub[zstd]`."
+        raise ImportError(msg)
+    return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+
+
+def _open_writer(path: str, codec: str) -> IO[bytes]:
+    if codec == "gzip":
+        return gzip.open(path, "wb", compresslevel=GZIP_LEVEL)  # type: ignore[return-value]
+    return _import_zstandard().ZstdCompressor(level=ZSTD_LEVEL).stream_writer(open(path, "wb"), closefd=True)
+
+
+def _get_available_codec(codec: str) -> str:
+    if codec == "zstd" and _import_zstandard() is None:
+        logger.warning("The 'zstandard' package is not installed, compressing with gzip instead of zstd.")
+        return "gzip"
+    return codec
+
+
+def _import_zstandard() -> Any:  # noqa: ANN401
+    try:
+        return importlib.import_module("zstandard")
+    except ImportError:
+        return None
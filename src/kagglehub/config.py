@@ -27,7 +27,29 @@ CREDENTIALS_FOLDER_ENV_VAR_NAME = "KAGGLE_CONFIG_DIR"
 LOG_VERBOSITY_ENV_VAR_NAME = "KAGGLEHUB_VERBOSITY"
 DISABLE_KAGGLE_CACHE_ENV_VAR_NAME = "DISABLE_KAGGLE_CACHE"
 DISABLE_COLAB_CACHE_ENV_VAR_NAME = "DISABLE_COLAB_CACHE"
+DISABLE_COLAB_SPECULATIVE_MOUNT_ENV_VAR_NAME = "KAGGLEHUB_DISABLE_COLAB_SPECULATIVE_MOUNT"
+DISABLE_SPECULATIVE_DOWNLOAD_ENV_VAR_NAME = "KAGGLEHUB_DISABLE_SPECULATIVE_DOWNLOAD"
 TBE_RUNTIME_ADDR_ENV_VAR_NAME = "TBE_RUNTIME_ADDR"
+CACHE_LOCK_TIMEOUT_ENV_VAR_NAME = "KAGGLEHUB_CACHE_LOCK_TIMEOUT"
+CACHE_TIERS_ENV_VAR_NAME = "KAGGLEHUB_CACHE_TIERS"
+CACHE_TIER_EVICTION_GRACE_PERIOD_ENV_VAR_NAME = "KAGGLEHUB_CACHE_TIER_EVICTION_GRACE_PERIOD"
+PROXY_URL_ENV_VAR_NAME = "KAGGLEHUB_PROXY_URL"
+DISABLE_CACHE_MANIFEST_ENV_VAR_NAME = "KAGGLEHUB_DISABLE_CACHE_MANIFEST"
+CACHE_COMPRESSION_ENV_VAR_NAME = "KAGGLEHUB_CACHE_COMPRESSION"
+KEEP_ARCHIVES_ENV_VAR_NAME = "KAGGLEHUB_KEEP_ARCHIVES"
+OUTPUT_DIR_LINK_MODE_ENV_VAR_NAME = "KAGGLEHUB_OUTPUT_DIR_LINK_MODE"
+OUTPUT_DIR_POPULATE_CACHE_ENV_VAR_NAME = "KAGGLEHUB_OUTPUT_DIR_POPULATE_CACHE"
+MOUNT_STAGING_DIR_ENV_VAR_NAME = "KAGGLEHUB_MOUNT_STAGING_DIR"
+MOUNT_TIMEOUT_ENV_VAR_NAME = "KAGGLEHUB_MOUNT_TIMEOUT"
+SUPPORT_CACHE_TTL_ENV_VAR_NAME = "KAGGLEHUB_SUPPORT_CACHE_TTL"
+MIRROR_URL_ENV_VAR_NAME = "KAGGLEHUB_MIRROR_URL"
+MIRROR_REGION_ENV_VAR_NAME = "KAGGLEHUB_MIRROR_REGION"
+AWS_ACCESS_KEY_ID_ENV_VAR_NAME = "AWS_ACCESS_KEY_ID"
+AWS_SECRET_ACCESS_KEY_ENV_VAR_NAME = "AWS_SECRET_ACCESS_KEY"
+AWS_SESSION_TOKEN_ENV_VAR_NAME = "AWS_SESSION_TOKEN"
+AWS_REGION_ENV_VAR_NAME = "AWS_REGION"
+API_RATE_LIMIT_ENV_VAR_NAME = "KAGGLEHUB_API_RATE_LIMIT"
+API_MAX_RETRIES_ENV_VAR_NAME = "KAGGLEHUB_API_MAX_RETRIES"
 
 CREDENTIALS_JSON_USERNAME = "username"
 CREDENTIALS_JSON_KEY = "key"
@@ -46,6 +68,14 @@ LOG_LEVELS_MAP = {
     "critical": logging.CRITICAL,
 }
 TRUTHY_VALUES = ["true", "1", "t"]
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+CACHE_COMPRESSION_CODECS = ("gzip", "zstd")
+OUTPUT_DIR_LINK_MODES = ("copy", "hardlink", "symlink", "off")
+DEFAULT_OUTPUT_DIR_LINK_MODE = "copy"
+DEFAULT_SUPPORT_CACHE_TTL = 300  # seconds
+DEFAULT_CACHE_TIER_EVICTION_GRACE_PERIOD = 60  # seconds
+DEFAULT_MIRROR_REGION = "us-east-1"
+DEFAULT_API_MAX_RETRIES = 5
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +87,12 @@ class KaggleApiCredentials:
     api_key: str | None = None
 
 
+@dataclass(frozen=True)
+class CacheTier:
+    path: str
+    max_size: int | None = None  # in bytes, unbounded if None
+
+
 def get_cache_folder() -> str:
     if CACHE_FOLDER_ENV_VAR_NAME in os.environ:
         return os.environ[CACHE_FOLDER_ENV_VAR_NAME]
@@ -116,14 +152,198 @@ def get_log_verbosity() -> int:
     return DEFAULT_LOG_LEVEL
 
 
+def get_cache_tiers() -> list[CacheTier]:
+    """Returns the fast cache tiers checked before the default cache folder, fastest first.
+
+    Tiers are set with `KAGGLEHUB_CACHE_TIERS` as a list of folders separated by `os.pathsep`. Each folder can be
+    followed by `=<size>` (e.g. `/mnt/nvme/kagglehub=50G`) to bound its size. Least recently used entries are evicted
+    from a tier when promoting a new entry would make it exceed its size, unless they were used within the grace
+    period returned by `get_cache_tier_eviction_grace_period`.
+    """
+    value = os.environ.get(CACHE_TIERS_ENV_VAR_NAME)
+    if not value:
+        return []
+
+    tiers = []
+    for tier_str in value.split(os.pathsep):
+        if not tier_str.strip():
+            continue
+        path, _, size_str = tier_str.strip().partition("=")
+        max_size = None
+        if size_str:
+            max_size = parse_size(size_str)
+            if max_size is None:
+                logger.warning(
+                    f"Invalid size for cache tier '{path}' set with {CACHE_TIERS_ENV_VAR_NAME}, ignoring it."
+                )
+        tiers.append(CacheTier(path=os.path.normpath(os.path.expanduser(path)), max_size=max_size))
+    return tiers
+
+
+def parse_size(size_str: str) -> int | None:
+    """Parses a size in bytes with an optional binary unit suffix: e.g. `1024`, `512M`, `50GB` or `2TiB`."""
+    normalized = size_str.strip().upper().removesuffix("B").removesuffix("I")
+    unit = normalized[-1] if normalized and normalized[-1] in SIZE_UNITS else ""
+    number = normalized.removesuffix(unit).strip()
+    try:
+        return int(float(number) * SIZE_UNITS[unit])
+    except ValueError:
+        return None
+
+
+def get_cache_tier_eviction_grace_period() -> float:
+    """Returns how many seconds an entry of a cache tier is kept after it was last used, even when the tier is full.
+
+    Paths returned from a tier are only safe to read for that long after they were returned: set
+    `KAGGLEHUB_CACHE_TIER_EVICTION_GRACE_PERIOD` above the time it takes to read a resource.
+    """
+    grace_period = _get_env_var_seconds(CACHE_TIER_EVICTION_GRACE_PERIOD_ENV_VAR_NAME)
+    return DEFAULT_CACHE_TIER_EVICTION_GRACE_PERIOD if grace_period is None else grace_period
+
+
+def get_cache_lock_timeout() -> float | None:
+    """Returns how many seconds to wait for another process downloading the same resource, or None to wait forever."""
+    return _get_env_var_seconds(CACHE_LOCK_TIMEOUT_ENV_VAR_NAME)
+
+
+def get_mount_timeout() -> float | None:
+    """Returns how many seconds to wait for an attached datasource to be mounted, or None to wait forever."""
+    return _get_env_var_seconds(MOUNT_TIMEOUT_ENV_VAR_NAME)
+
+
+def get_support_cache_ttl() -> float:
+    """Returns how many seconds a resolver's decision to support a given handle is reused for."""
+    ttl = _get_env_var_seconds(SUPPORT_CACHE_TTL_ENV_VAR_NAME)
+    return DEFAULT_SUPPORT_CACHE_TTL if ttl is None else ttl
+
+
+def get_api_rate_limit() -> float | None:
+    """Returns the maximum number of Kaggle API requests per second the process sends, or None if unlimited."""
+    value = os.environ.get(API_RATE_LIMIT_ENV_VAR_NAME)
+    if not value:
+        return None
+    try:
+        rate = float(value)
+    except ValueError:
+        logger.warning(f"Invalid rate set with {API_RATE_LIMIT_ENV_VAR_NAME}={value}, ignoring it.")
+        return None
+    return rate if rate > 0 else None
+
+
+def get_api_max_retries() -> int:
+    """Returns how many times a failed Kaggle API request is retried."""
+    value = os.environ.get(API_MAX_RETRIES_ENV_VAR_NAME)
+    if not value:
+        return DEFAULT_API_MAX_RETRIES
+    try:
+        return max(0, int(value))
+    except ValueError:
+        logger.warning(f"Invalid number of retries set with {API_MAX_RETRIES_ENV_VAR_NAME}={value}, ignoring it.")
+        return DEFAULT_API_MAX_RETRIES
+
+
+def get_mirror_url() -> str | None:
+    """Returns the URL of the S3-compatible bucket (and optional prefix) mirroring Kaggle resources, if any.
+
+    The URL uses path-style addressing, e.g. `http://minio:9000/kaggle-mirror/prefix`.
+    """
+    mirror_url = os.environ.get(MIRROR_URL_ENV_VAR_NAME)
+    return mirror_url.rstrip("/") if mirror_url else None
+
+
+def get_mirror_region() -> str:
+    return (
+        os.environ.get(MIRROR_REGION_ENV_VAR_NAME) or os.environ.get(AWS_REGION_ENV_VAR_NAME) or DEFAULT_MIRROR_REGION
+    )
+
+
+def get_mirror_credentials() -> tuple[str, str, str | None] | None:
+    """Returns the (access key id, secret access key, session token) to sign mirror requests with, if set."""
+    access_key_id = os.environ.get(AWS_ACCESS_KEY_ID_ENV_VAR_NAME)
+    secret_access_key = os.environ.get(AWS_SECRET_ACCESS_KEY_ENV_VAR_NAME)
+    if not access_key_id or not secret_access_key:
+        return None
+    return access_key_id, secret_access_key, os.environ.get(AWS_SESSION_TOKEN_ENV_VAR_NAME)
+
+
+def get_proxy_url() -> str | None:
+    """Returns the URL of the `kagglehub serve` caching proxy to route Kaggle API calls through, if any."""
+    proxy_url = os.environ.get(PROXY_URL_ENV_VAR_NAME)
+    return proxy_url.rstrip("/") if proxy_url else None
+
+
+def get_cache_compression() -> str | None:
+    """Returns the codec text files are compressed with in the cache (`gzip` or `zstd`), or None to store them as is."""
+    value = os.environ.get(CACHE_COMPRESSION_ENV_VAR_NAME)
+    if not value:
+        return None
+    codec = value.strip().lower()
+    if codec not in CACHE_COMPRESSION_CODECS:
+        logger.warning(
+            f"Invalid codec set with {CACHE_COMPRESSION_ENV_VAR_NAME}={value}, expected one of "
+            f"{CACHE_COMPRESSION_CODECS}. Files won't be compressed."
+        )
+        return None
+    return codec
+
+
+def get_output_dir_link_mode() -> str | None:
+    """Returns how output_dir downloads are materialized from the default cache, or None to always download them.
+
+    See `kagglehub.materialize` for the modes.
+    """
+    value = os.environ.get(OUTPUT_DIR_LINK_MODE_ENV_VAR_NAME)
+    mode = value.strip().lower() if value else DEFAULT_OUTPUT_DIR_LINK_MODE
+    if mode not in OUTPUT_DIR_LINK_MODES:
+        logger.warning(
+            f"Invalid mode set with {OUTPUT_DIR_LINK_MODE_ENV_VAR_NAME}={value}, expected one of "
+            f"{OUTPUT_DIR_LINK_MODES}. Using '{DEFAULT_OUTPUT_DIR_LINK_MODE}'."
+        )
+        mode = DEFAULT_OUTPUT_DIR_LINK_MODE
+    return None if mode == "off" else mode
+
+
+def is_output_dir_populate_cache_enabled() -> bool:
+    """Whether output_dir downloads missing from the default cache are downloaded to it first, then materialized."""
+    return _is_env_var_truthy(OUTPUT_DIR_POPULATE_CACHE_ENV_VAR_NAME)
+
+
+def get_mount_staging_dir() -> str | None:
+    """Returns the local folder Kaggle and Colab mounted datasources are staged to, or None to use the mounts as is.
+
+    See `kagglehub.staging`.
+    """
+    value = os.environ.get(MOUNT_STAGING_DIR_ENV_VAR_NAME)
+    if not value or not value.strip():
+        return None
+    return os.path.normpath(os.path.expanduser(value.strip()))
+
+
 def is_colab_cache_disabled() -> bool:
     return _is_env_var_truthy(DISABLE_COLAB_CACHE_ENV_VAR_NAME)
 
 
+def is_colab_speculative_mount_disabled() -> bool:
+    return _is_env_var_truthy(DISABLE_COLAB_SPECULATIVE_MOUNT_ENV_VAR_NAME)
+
+
+def is_speculative_download_disabled() -> bool:
+    return _is_env_var_truthy(DISABLE_SPECULATIVE_DOWNLOAD_ENV_VAR_NAME)
+
+
 def is_kaggle_cache_disabled() -> bool:
     return _is_env_var_truthy(DISABLE_KAGGLE_CACHE_ENV_VAR_NAME)
 
 
+def is_cache_manifest_disabled() -> bool:
+    return _is_env_var_truthy(DISABLE_CACHE_MANIFEST_ENV_VAR_NAME)
+
+
+def is_keep_archives_enabled() -> bool:
+    """Whether zip archives of resources are kept as cache entries instead of being extracted."""
+    return _is_env_var_truthy(KEEP_ARCHIVES_ENV_VAR_NAME)
+
+
 def _get_kaggle_credentials_file() -> str:
     return os.path.join(_get_kaggle_credentials_folder(), CREDENTIALS_FILENAME)
 
@@ -138,6 +358,18 @@ def _is_env_var_truthy(env_var_name: str) -> bool:
     return env_var_name in os.environ and os.environ[env_var_name].lower() in TRUTHY_VALUES
 
 
+def _get_env_var_seconds(env_var_name: str) -> float | None:
+    value = os.environ.get(env_var_name)
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        logger.warning(f"Invalid number of seconds set with {env_var_name}={value}, ignoring it.")
+        return None
+    return seconds if seconds >= 0 else None
+
+
 def set_kaggle_credentials(username: str, api_key: str) -> None:
     stripped_username = username.strip()
     stripped_api_key = api_key.strip()
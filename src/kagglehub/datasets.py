@@ -10,6 +10,7 @@ from kagglehub.datasets_helpers import create_dataset_or_version
 from kagglehub.gcs_upload import normalize_patterns, upload_files_and_directories
 from kagglehub.handle import parse_dataset_handle
 from kagglehub.logger import EXTRA_CONSOLE_BLOCK
+from kagglehub.resolver import ForceDownload
 
 logger = logging.getLogger(__name__)
 
@@ -35,15 +36,17 @@ def dataset_download(
     handle: str,
     path: str | None = None,
     *,
-    force_download: bool | None = False,
+    force_download: ForceDownload = False,
     output_dir: str | None = None,
 ) -> str:
     """Download dataset files
     Args:
         handle: (string) the dataset handle
         path: (string) Optional path to a file within a dataset
-        force_download: (bool) Optional flag to force download a dataset, even if it's cached or already in output_dir.
-        output_dir: (string) Optional output directory for direct download, bypassing the default cache.
+        force_download: (bool | "revalidate") Optional flag to force download a dataset, even if it's cached or already
+            in output_dir. With "revalidate", only the files that are missing or don't match are downloaded again.
+        output_dir: (string) Optional output directory for direct download, bypassing the default cache. Copied
+            from the default cache if it already holds the resource (see `KAGGLEHUB_OUTPUT_DIR_LINK_MODE`).
     Returns:
         A string requesting the path to the requested dataset files.
     """
@@ -1,7 +1,9 @@
 import functools
-import inspect
 import logging
+import sys
+from collections.abc import Iterator
 from importlib import metadata  # type: ignore
+from types import FrameType
 
 KAGGLE_NOTEBOOK_ENV_VAR_NAME = "KAGGLE_KERNEL_RUN_TYPE"
 KAGGLE_DATA_PROXY_URL_ENV_VAR_NAME = "KAGGLE_DATA_PROXY_URL"
@@ -44,17 +46,24 @@ def search_lib_in_call_stack(lib_name: str) -> str | None:
     Returns:
         str: A formatted string f"{lib_name}/{lib_version}" if found, otherwise None.
     """
-    for frame_info in inspect.stack():
-        module = inspect.getmodule(frame_info.frame)
-        if module and hasattr(module, "__name__"):
-            module_name = module.__name__
-        else:
-            module_name = None
-
-        if module_name is not None and module_name.startswith(lib_name):
+    for frame in iter_call_stack():
+        module_name = frame.f_globals.get("__name__")
+        if isinstance(module_name, str) and module_name.startswith(lib_name):
             try:
                 lib_version = metadata.version(lib_name)
                 return f"{lib_name}/{lib_version}"
             except metadata.PackageNotFoundError:
                 continue
     return None
+
+
+def iter_call_stack() -> Iterator[FrameType]:
+    """Yields the frames of the call stack, from the caller outwards.
+
+    Unlike `inspect.stack()`, doesn't read the source files of the frames nor look up their modules, so it is cheap
+    enough to run on every call.
+    """
+    frame: FrameType | None = sys._getframe(1)
+    while frame is not None:
+        yield frame
+        frame = frame.f_back
@@ -36,6 +36,15 @@ class NotFoundError(Exception):
     pass
 
 
+class UnsupportedResolutionError(Exception):
+    """Raised by a resolver finding out, while resolving, that it doesn't support the handle.
+
+    The registry then falls back to the next supported resolver, as if `is_supported` had returned False.
+    """
+
+    pass
+
+
 class DataCorruptionError(Exception):
     pass
 
@@ -61,6 +70,18 @@ class UserCancelledError(Exception):
     pass
 
 
+class CacheLockTimeoutError(TimeoutError):
+    """Raised when waiting on another process holding a cache entry lock takes longer than the configured timeout."""
+
+    pass
+
+
+class MountTimeoutError(TimeoutError):
+    """Raised when waiting for an attached datasource to be mounted takes longer than the configured timeout."""
+
+    pass
+
+
 def handle_call(fn: Callable[[], R], resource_handle: ResourceHandle | None = None) -> R:
     """Handle errors for handler NOT returning 200 status code on failure."""
     try:
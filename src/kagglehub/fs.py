@@ -0,0 +1,278 @@
+"""fsspec filesystem for the files of Kaggle datasets and models: `kaggle://datasets/owner/dataset/versions/3/file`.
+
+Files are read with ranged requests on their signed URLs, through a block cache, so readers that only need parts of a
+file (e.g. the footer and some row groups of a parquet file) don't download it all.
+"""
+
+# WARNING: This module is intended to be imported only at runtime. It requires the `fsspec` optional dependency
+# (`pip install kagglehub[fsspec]`) and is registered as the `kaggle://` protocol with an `fsspec.specs` entry point.
+
+import threading
+from typing import Any
+from urllib.parse import urlparse
+
+import requests
+from fsspec.spec import AbstractBufferedFile, AbstractFileSystem
+
+from kagglehub import compression, registry, stats
+from kagglehub.clients import DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT, build_kaggle_client
+from kagglehub.exceptions import handle_call
+from kagglehub.handle import DatasetHandle, ModelHandle, parse_dataset_handle, parse_model_handle
+from kagglehub.http_resolver import (
+    build_dataset_download_request,
+    build_model_download_request,
+    get_current_version,
+    list_dataset_file_sizes,
+    list_model_file_sizes,
+)
+from kagglehub.signed_urls import forget_signed_url, get_signed_url, remember_signed_url
+
+PROTOCOL = "kaggle"
+DATASETS_PREFIX = "datasets"
+MODELS_PREFIX = "models"
+VERSIONS_PART = "versions"
+DEFAULT_BLOCK_SIZE = 8 * 1024 * 1024  # 8 MiB
+DEFAULT_CACHE_TYPE = "blockcache"
+NUM_DATASET_HANDLE_PARTS = 3  # datasets/owner/dataset
+NUM_MODEL_HANDLE_PARTS = 5  # models/owner/model/framework/variation
+
+
+class KaggleFileSystem(AbstractFileSystem):
+    """Read-only filesystem of the files of Kaggle datasets and models.
+
+    Paths are `datasets/<owner>/<dataset>[/versions/<version>]/<file>` and
+    `models/<owner>/<model>/<framework>/<variation>[/versions/<version>]/<file>`. Unversioned paths are read at the
+    latest version, resolved once per filesystem instance.
+
+    Args:
+        block_size: (int) Size of the ranges requested from the signed URLs.
+        cache_type: (string) fsspec cache of the blocks read from each file, e.g. `blockcache` (in memory, LRU) or
+            `mmap` (on disk, in a temporary file). Chain with `filecache::` or `blockcache::` URLs to keep a persistent
+            copy on disk.
+        cache_options: (dict) Optional options of the cache, e.g. `{"maxblocks": 64}` for `blockcache`.
+    """
+
+    protocol = PROTOCOL
+    root_marker = ""
+
+    def __init__(
+        self,
+        *,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        cache_type: str = DEFAULT_CACHE_TYPE,
+        cache_options: dict | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        super().__init__(**kwargs)
+        self.block_size = block_size
+        self.cache_type = cache_type
+        self.cache_options = cache_options
+        self._lock = threading.Lock()
+        self._versions: dict[DatasetHandle | ModelHandle, DatasetHandle | ModelHandle] = {}
+        self._files: dict[DatasetHandle | ModelHandle, dict[str, int]] = {}
+
+    def ls(self, path: str, detail: bool = True, **_: Any) -> list:  # noqa: FBT001, FBT002, ANN401
+        path = self._strip_protocol(path)
+        h, file_path = self._parse(path)
+        files = self._list_files(h)
+        if file_path in files:
+            entries = [self._file_entry(path, files[file_path])]
+            return entries if detail else [path]
+
+        prefix = f"{file_path}/" if file_path else ""
+        children: dict[str, dict] = {}
+        for name, size in files.items():
+            if not name.startswith(prefix):
+                continue
+            child, sep, _rest = name[len(prefix) :].partition("/")
+            child_path = f"{path}/{child}"
+            children[child_path] = self._directory_entry(child_path) if sep else self._file_entry(child_path, size)
+        if not children:
+            raise FileNotFoundError(path)
+        return list(children.values()) if detail else sorted(children)
+
+    def info(self, path: str, **_: Any) -> dict:  # noqa: ANN401
+        path = self._strip_protocol(path)
+        h, file_path = self._parse(path)
+        files = self._list_files(h)
+        if file_path in files:
+            return self._file_entry(path, files[file_path])
+        if not file_path or any(name.startswith(f"{file_path}/") for name in files):
+            return self._directory_entry(path)
+        raise FileNotFoundError(path)
+
+    def _open(
+        self,
+        path: str,
+        mode: str = "rb",
+        block_size: int | None = None,
+        autocommit: bool = True,  # noqa: FBT001, FBT002, ARG002
+        cache_options: dict | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        if mode != "rb":
+            msg = f"{PROTOCOL}:// files are read-only, can't open '{path}' with mode '{mode}'."
+            raise NotImplementedError(msg)
+        path = self._strip_protocol(path)
+        h, file_path = self._parse(path)
+        if not file_path:
+            raise IsADirectoryError(path)
+        size = self.info(path)["size"]
+
+        signed_url = self._sign(h, file_path)
+        if signed_url is None:
+            # Not readable by ranges (e.g. served zipped): download the file to the cache and read it from there.
+            return compression.open_file(_download(h, file_path))
+        return KaggleFile(
+            self,
+            path,
+            h,
+            file_path,
+            signed_url,
+            size=size,
+            block_size=block_size or self.block_size,
+            cache_type=kwargs.get("cache_type", self.cache_type),
+            cache_options=cache_options if cache_options is not None else self.cache_options,
+        )
+
+    def _parse(self, path: str) -> tuple[DatasetHandle | ModelHandle, str]:
+        """Splits a path into the handle (pinned to a version) and the path of the file within the resource."""
+        parts = [part for part in path.split("/") if part]
+        if parts and parts[0] == DATASETS_PREFIX:
+            num_handle_parts = NUM_DATASET_HANDLE_PARTS
+        elif parts and parts[0] == MODELS_PREFIX:
+            num_handle_parts = NUM_MODEL_HANDLE_PARTS
+        else:
+            msg = f"Invalid {PROTOCOL}:// path '{path}', it must start with '{DATASETS_PREFIX}/' or '{MODELS_PREFIX}/'."
+            raise ValueError(msg)
+        if len(parts) < num_handle_parts:
+            msg = f"Invalid {PROTOCOL}:// path '{path}', missing parts of the handle."
+            raise ValueError(msg)
+
+        handle = "/".join(parts[1:num_handle_parts])
+        file_parts = parts[num_handle_parts:]
+        version = None
+        if len(file_parts) >= 2 and file_parts[0] == VERSIONS_PART and file_parts[1].isdigit():  # noqa: PLR2004
+            version = file_parts[1]
+            file_parts = file_parts[2:]
+        h: DatasetHandle | ModelHandle
+        if parts[0] == DATASETS_PREFIX:
+            h = parse_dataset_handle(f"{handle}/{VERSIONS_PART}/{version}" if version else handle)
+        else:
+            h = parse_model_handle(f"{handle}/{version}" if version else handle)
+        return self._pin_version(h), "/".join(file_parts)
+
+    def _pin_version(self, h: DatasetHandle | ModelHandle) -> DatasetHandle | ModelHandle:
+        if h.is_versioned():
+            return h
+        with self._lock:
+            if h in self._versions:
+                return self._versions[h]
+        with build_kaggle_client() as api_client:
+            versioned_handle = h.with_version(get_current_version(api_client, h))
+        with self._lock:
+            return self._versions.setdefault(h, versioned_handle)
+
+    def _list_files(self, h: DatasetHandle | ModelHandle) -> dict[str, int]:
+        with self._lock:
+            if h in self._files:
+                return self._files[h]
+        with build_kaggle_client() as api_client:
+            if isinstance(h, DatasetHandle):
+                files = list_dataset_file_sizes(api_client, h)
+            else:
+                files = list_model_file_sizes(api_client, h)
+        with self._lock:
+            return self._files.setdefault(h, files)
+
+    def _sign(self, h: DatasetHandle | ModelHandle, file_path: str) -> str | None:
+        """Returns the signed URL of the file, or None if it can't be read by ranges.
+
+        The URL remembered for the file (see `signed_urls`) is used while it's valid, otherwise a download request is
+        sent only to learn where it redirects to: kagglesdk streams download responses, so the connection to storage is
+        closed once its headers are read and the body is never downloaded.
+        """
+        signed_url = get_signed_url(h, file_path)
+        if signed_url is None:
+            with build_kaggle_client() as api_client:
+                if isinstance(h, DatasetHandle):
+                    dataset_request = build_dataset_download_request(h, file_path)
+                    response = handle_call(
+                        lambda: api_client.datasets.dataset_api_client.download_dataset(dataset_request), h
+                    )
+                else:
+                    model_request = build_model_download_request(h, file_path)
+                    response = handle_call(
+                        lambda: api_client.models.model_api_client.download_model_instance_version(model_request), h
+                    )
+            with response:
+                if not response.history:
+                    # Served directly by the API, no signed URL.
+                    return None
+                signed_url = response.url
+            remember_signed_url(h, file_path, signed_url)
+        if urlparse(signed_url).path.endswith(f"{file_path.rsplit('/', 1)[-1]}.zip"):
+            # Served zipped, see `download_file`.
+            return None
+        return signed_url
+
+    @staticmethod
+    def _file_entry(path: str, size: int) -> dict:
+        return {"name": path, "size": size, "type": "file"}
+
+    @staticmethod
+    def _directory_entry(path: str) -> dict:
+        return {"name": path, "size": 0, "type": "directory"}
+
+
+class KaggleFile(AbstractBufferedFile):
+    """File of a Kaggle resource, read by ranges from its signed URL. The URL is signed again if it expires."""
+
+    def __init__(
+        self,
+        fs: KaggleFileSystem,
+        path: str,
+        h: DatasetHandle | ModelHandle,
+        file_path: str,
+        signed_url: str,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        self._handle = h
+        self._file_path = file_path
+        self._signed_url = signed_url
+        super().__init__(fs, path, mode="rb", **kwargs)
+
+    def _fetch_range(self, start: int, end: int) -> bytes:
+        if start >= end:
+            return b""
+        response = self._get_range(start, end)
+        if response.status_code == requests.codes.forbidden:
+            # The signed URL expired.
+            forget_signed_url(self._handle, self._file_path)
+            signed_url = self.fs._sign(self._handle, self._file_path)
+            if signed_url is None:
+                response.raise_for_status()
+            self._signed_url = signed_url
+            response = self._get_range(start, end)
+        response.raise_for_status()
+        # Servers ignoring the Range header send the whole file.
+        content = (
+            response.content if response.status_code == requests.codes.partial_content else response.content[start:end]
+        )
+        stats.record_download(self._handle, len(content))
+        return content
+
+    def _get_range(self, start: int, end: int) -> requests.Response:
+        return requests.get(
+            self._signed_url,
+            headers={"Range": f"bytes={start}-{end - 1}"},
+            timeout=(DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT),
+        )
+
+
+def _download(h: DatasetHandle | ModelHandle, file_path: str) -> str:
+    if isinstance(h, DatasetHandle):
+        path, _ = registry.dataset_resolver(h, file_path)
+    else:
+        path, _ = registry.model_resolver(h, file_path)
+    return path
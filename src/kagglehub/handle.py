@@ -26,6 +26,10 @@ class ResourceHandle:
         """Returns URL to the resource detail page."""
         pass
 
+    def is_versioned(self) -> bool:
+        """Returns whether the handle is pinned to a version. Resources without versions (e.g. competitions) aren't."""
+        return False
+
 
 @dataclass(frozen=True)
 class ModelHandle(ResourceHandle):
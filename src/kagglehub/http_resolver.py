@@ -3,10 +3,19 @@ import os
 import shutil
 import tarfile
 import zipfile
+from collections.abc import Callable, Generator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TypeVar
 
 import requests
 from kagglesdk.competitions.types.competition_api_service import ApiDownloadDataFileRequest, ApiDownloadDataFilesRequest
-from kagglesdk.datasets.types.dataset_api_service import ApiDownloadDatasetRequest, ApiGetDatasetRequest
+from kagglesdk.datasets.types.dataset_api_service import (
+    ApiDownloadDatasetRequest,
+    ApiGetDatasetRequest,
+    ApiListDatasetFilesRequest,
+)
 from kagglesdk.kaggle_client import KaggleClient
 from kagglesdk.kernels.types.kernels_api_service import ApiDownloadKernelOutputRequest, ApiGetKernelRequest
 from kagglesdk.models.types.model_api_service import (
@@ -14,20 +23,41 @@ from kagglesdk.models.types.model_api_service import (
     ApiGetModelInstanceRequest,
     ApiListModelInstanceVersionFilesRequest,
 )
+from tqdm.auto import tqdm
 from tqdm.contrib.concurrent import thread_map
 
-from kagglehub.cache import Cache
-from kagglehub.clients import build_kaggle_client, download_file
-from kagglehub.config import get_kaggle_credentials
-from kagglehub.exceptions import UnauthenticatedError, handle_call
+from kagglehub import archives, compression, manifest, materialize, scrub, stats
+from kagglehub.cache import Cache, find_stored_path, get_cached_path
+from kagglehub.clients import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    build_kaggle_client,
+    download_file,
+    is_cached_copy_current,
+)
+from kagglehub.config import (
+    get_kaggle_credentials,
+    get_output_dir_link_mode,
+    is_output_dir_populate_cache_enabled,
+    is_speculative_download_disabled,
+)
+from kagglehub.exceptions import KaggleApiHTTPError, UnauthenticatedError, handle_call
 from kagglehub.handle import CompetitionHandle, DatasetHandle, ModelHandle, NotebookHandle, ResourceHandle
+from kagglehub.manifest import SIZE_FIELD
 from kagglehub.packages import PackageScope
-from kagglehub.resolver import Resolver
+from kagglehub.resolver import REVALIDATE, ForceDownload, Resolver
+from kagglehub.signed_urls import forget_signed_url, get_signed_url, remember_signed_url
 
 MAX_NUM_FILES_DIRECT_DOWNLOAD = 25
 
+H = TypeVar("H", DatasetHandle, NotebookHandle)
+
 logger = logging.getLogger(__name__)
 
+# thread_map() removes the tqdm lock on exit when it had to create it, which breaks concurrent thread_map() calls
+# (e.g. models downloaded in parallel by `cache_warmup`). Creating it upfront makes thread_map() leave it alone.
+tqdm.get_lock()
+
 
 class CompetitionHttpResolver(Resolver[CompetitionHandle]):
     def is_supported(self, *_, **__) -> bool:  # noqa: ANN002, ANN003
@@ -39,72 +69,88 @@ class CompetitionHttpResolver(Resolver[CompetitionHandle]):
         h: CompetitionHandle,
         path: str | None = None,
         *,
-        force_download: bool | None = False,
+        force_download: ForceDownload = False,
         output_dir: str | None = None,
     ) -> tuple[str, int | None]:
         with build_kaggle_client() as api_client:
             cache = Cache(override_dir=output_dir)
-            cached_path = cache.load_from_cache(h, path)
-            if cached_path and force_download:
-                cache.delete_from_cache(h, path)
-                cached_path = None
-
-            if not get_kaggle_credentials():
-                if cached_path:
+            if force_download == REVALIDATE:
+                revalidated_path = _revalidate(self, api_client, cache, h, path, output_dir=output_dir)
+                if revalidated_path:
+                    return revalidated_path, None
+                force_download = True
+            if not force_download:
+                # The lock is only needed to download: check the cached copy without it first.
+                cached_path = cache.load_from_cache(h, path)
+                if cached_path and _is_cached_competition_copy_current(api_client, h, path, cached_path):
+                    stats.record_hit(h)
                     return cached_path, None
-                raise UnauthenticatedError()
+            with cache.lock(h, path):
+                cached_path = cache.load_from_cache(h, path)
+                if cached_path and force_download:
+                    cache.delete_from_cache(h, path)
+                    cached_path = None
 
-            out_path = cache.get_path(h, path)
+                if not get_kaggle_credentials():
+                    if cached_path:
+                        stats.record_hit(h)
+                        return cached_path, None
+                    raise UnauthenticatedError()
 
-            if output_dir:
-                _prepare_output_dir(output_dir, path, force_download=bool(force_download))
-            if path:
-                # For single file downloads.
-                os.makedirs(os.path.dirname(out_path), exist_ok=True)
+                out_path = cache.get_path(h, path)
 
-                try:
-                    r = _build_competition_download_file_request(h, path)
-                    response = handle_call(
-                        lambda: api_client.competitions.competition_api_client.download_data_file(r), h
-                    )
-                    download_needed = download_file(
-                        response, out_path, h, cached_path, extract_auto_compressed_file=True
-                    )
-                except requests.exceptions.ConnectionError:
-                    if cached_path:
+                if output_dir:
+                    _prepare_output_dir(output_dir, path, force_download=bool(force_download))
+                if path:
+                    # For single file downloads.
+                    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+
+                    try:
+                        r = _build_competition_download_file_request(h, path)
+                        response = handle_call(
+                            lambda: api_client.competitions.competition_api_client.download_data_file(r), h
+                        )
+                        download_needed = download_file(
+                            response, out_path, h, cached_path, extract_auto_compressed_file=True
+                        )
+                    except requests.exceptions.ConnectionError:
+                        if cached_path:
+                            stats.record_hit(h)
+                            return cached_path, None
+                        raise
+
+                    if not download_needed and cached_path:
+                        stats.record_hit(h)
                         return cached_path, None
-                    raise
+                else:
+                    # Download, extract, then delete the archive.
+                    r = _build_competition_download_files_request(h)
+                    archive_path = cache.get_archive_path(h)
+                    os.makedirs(os.path.dirname(archive_path), exist_ok=True)
 
-                if not download_needed and cached_path:
-                    return cached_path, None
-            else:
-                # Download, extract, then delete the archive.
-                r = _build_competition_download_files_request(h)
-                archive_path = cache.get_archive_path(h)
-                os.makedirs(os.path.dirname(archive_path), exist_ok=True)
-
-                try:
-                    response = handle_call(
-                        lambda: api_client.competitions.competition_api_client.download_data_files(r), h
-                    )
-                    download_needed = download_file(response, archive_path, h, cached_path)
-                except requests.exceptions.ConnectionError:
-                    if cached_path:
+                    try:
+                        response = handle_call(
+                            lambda: api_client.competitions.competition_api_client.download_data_files(r), h
+                        )
+                        download_needed = download_file(response, archive_path, h, cached_path)
+                    except requests.exceptions.ConnectionError:
+                        if cached_path:
+                            if os.path.exists(archive_path):
+                                os.remove(archive_path)
+                            stats.record_hit(h)
+                            return cached_path, None
+                        raise
+
+                    if not download_needed and cached_path:
                         if os.path.exists(archive_path):
                             os.remove(archive_path)
+                        stats.record_hit(h)
                         return cached_path, None
-                    raise
-
-                if not download_needed and cached_path:
-                    if os.path.exists(archive_path):
-                        os.remove(archive_path)
-                    return cached_path, None
 
-                _extract_archive(archive_path, out_path)
-                os.remove(archive_path)
+                    _store_archive(cache, archive_path, out_path)
 
-            cache.mark_as_complete(h, path)
-            return out_path, None
+                stats.record_miss(h)
+                return cache.mark_as_complete(h, path), None
 
 
 class DatasetHttpResolver(Resolver[DatasetHandle]):
@@ -112,54 +158,93 @@ class DatasetHttpResolver(Resolver[DatasetHandle]):
         # Downloading files over HTTP is supported in all environments for all handles / paths.
         return True
 
+    def _resolve_from_cache(
+        self, h: DatasetHandle, path: str | None = None, *, output_dir: str | None = None
+    ) -> tuple[str, int | None] | None:
+        return _load_versioned_from_cache(h, path, output_dir)
+
     def _resolve(
         self,
         h: DatasetHandle,
         path: str | None = None,
         *,
-        force_download: bool | None = False,
+        force_download: ForceDownload = False,
         output_dir: str | None = None,
     ) -> tuple[str, int | None]:
-        with build_kaggle_client() as api_client:
+        with (
+            build_kaggle_client() as api_client,
+            _speculate_download(
+                h, path, _send_latest_dataset_download_request, force_download=force_download, output_dir=output_dir
+            ) as speculative_download,
+        ):
             if not h.is_versioned():
-                h = h.with_version(_get_current_version(api_client, h))
+                h = h.with_version(get_current_version(api_client, h))
 
             cache = Cache(override_dir=output_dir)
+            if force_download == REVALIDATE:
+                revalidated_path = _revalidate(self, api_client, cache, h, path, output_dir=output_dir)
+                if revalidated_path:
+                    return revalidated_path, h.version
+                force_download = True
             dataset_path = cache.load_from_cache(h, path)
             if dataset_path and not force_download:
+                stats.record_hit(h)
                 return dataset_path, h.version  # Already cached
-            elif dataset_path and force_download:
-                cache.delete_from_cache(h, path)
-
-            if output_dir:
-                _prepare_output_dir(output_dir, path, force_download=bool(force_download))
-
-            r = _build_dataset_download_request(h, path)
-            out_path = cache.get_path(h, path)
-
-            # Create the intermediary directories
-            if path:
-                # Downloading a single file.
-                os.makedirs(os.path.dirname(out_path), exist_ok=True)
-                response = handle_call(lambda: api_client.datasets.dataset_api_client.download_dataset(r), h)
-                download_file(response, out_path, h, extract_auto_compressed_file=True)
-            else:
-                # TODO(b/345800027) Implement parallel download when < 25 files in databundle.
-                # Downloading the full archived bundle.
-                archive_path = cache.get_archive_path(h)
-                os.makedirs(os.path.dirname(archive_path), exist_ok=True)
-
-                # First, we download the archive.
-                response = handle_call(lambda: api_client.datasets.dataset_api_client.download_dataset(r), h)
-                download_file(response, archive_path, h)
+            with cache.lock(h, path):
+                # Another process may have downloaded it while we were waiting for the lock.
+                dataset_path = cache.load_from_cache(h, path)
+                if dataset_path and not force_download:
+                    stats.record_hit(h)
+                    return dataset_path, h.version
+                if dataset_path and force_download:
+                    cache.delete_from_cache(h, path)
+
+                if output_dir:
+                    _prepare_output_dir(output_dir, path, force_download=bool(force_download))
+                    materialized_path = _materialize_from_default_cache(
+                        self, cache, h, path, force_download=bool(force_download)
+                    )
+                    if materialized_path:
+                        return materialized_path, h.version
+
+                if path and not force_download:
+                    extracted_path = _extract_from_cached_archive(cache, h, path)
+                    if extracted_path:
+                        return extracted_path, h.version
+
+                r = build_dataset_download_request(h, path)
+                out_path = cache.get_path(h, path)
+
+                # Create the intermediary directories
+                if path:
+                    # Downloading a single file.
+                    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+                    _download_with_speculation(
+                        speculative_download,
+                        h,
+                        lambda: api_client.datasets.dataset_api_client.download_dataset(r),
+                        lambda response: download_file(response, out_path, h, extract_auto_compressed_file=True),
+                        out_path,
+                    )
+                else:
+                    # TODO(b/345800027) Implement parallel download when < 25 files in databundle.
+                    # Downloading the full archived bundle.
+                    archive_path = cache.get_archive_path(h)
+                    os.makedirs(os.path.dirname(archive_path), exist_ok=True)
 
-                _extract_archive(archive_path, out_path)
+                    # First, we download the archive.
+                    _download_with_speculation(
+                        speculative_download,
+                        h,
+                        lambda: api_client.datasets.dataset_api_client.download_dataset(r),
+                        lambda response: download_file(response, archive_path, h),
+                        archive_path,
+                    )
 
-                # Delete the archive
-                os.remove(archive_path)
+                    _store_archive(cache, archive_path, out_path)
 
-            cache.mark_as_complete(h, path)
-            return out_path, h.version
+                stats.record_miss(h)
+                return cache.mark_as_complete(h, path), h.version
 
 
 class ModelHttpResolver(Resolver[ModelHandle]):
@@ -167,76 +252,97 @@ class ModelHttpResolver(Resolver[ModelHandle]):
         # Downloading files over HTTP is supported in all environments for all handles / path.
         return True
 
+    def _resolve_from_cache(
+        self, h: ModelHandle, path: str | None = None, *, output_dir: str | None = None
+    ) -> tuple[str, int | None] | None:
+        return _load_versioned_from_cache(h, path, output_dir)
+
     def _resolve(
         self,
         h: ModelHandle,
         path: str | None = None,
         *,
-        force_download: bool | None = False,
+        force_download: ForceDownload = False,
         output_dir: str | None = None,
     ) -> tuple[str, int | None]:
         with build_kaggle_client() as api_client:
             if not h.is_versioned():
-                h = h.with_version(_get_current_version(api_client, h))
+                h = h.with_version(get_current_version(api_client, h))
 
             cache = Cache(override_dir=output_dir)
+            if force_download == REVALIDATE:
+                revalidated_path = _revalidate(self, api_client, cache, h, path, output_dir=output_dir)
+                if revalidated_path:
+                    return revalidated_path, h.version
+                force_download = True
             model_path = cache.load_from_cache(h, path)
             if model_path and not force_download:
+                stats.record_hit(h)
                 return model_path, h.version  # Already cached
-            if output_dir:
-                _prepare_output_dir(output_dir, path, force_download=bool(force_download))
-            elif model_path and force_download:
-                cache.delete_from_cache(h, path)
-
-            r = _build_model_download_request(h, path)
-            out_path = cache.get_path(h, path)
-
-            # Create the intermediary directories
-            if path:
-                # Downloading a single file.
-                os.makedirs(os.path.dirname(out_path), exist_ok=True)
-                response = handle_call(lambda: api_client.models.model_api_client.download_model_instance_version(r), h)
-                download_file(response, out_path, h, extract_auto_compressed_file=True)
-            else:
-                # List the files and decide how to download them:
-                # - <= 25 files: Download files in parallel
-                # > 25 files: Download the archive and uncompress
-                files, has_more = _list_model_files(api_client, h)
-                if has_more:
-                    # Downloading the full archived bundle.
-                    archive_path = cache.get_archive_path(h)
-                    os.makedirs(os.path.dirname(archive_path), exist_ok=True)
-
-                    # First, we download the archive.
-                    response = handle_call(
-                        lambda: api_client.models.model_api_client.download_model_instance_version(r), h
+            with cache.lock(h, path):
+                # Another process may have downloaded it while we were waiting for the lock.
+                model_path = cache.load_from_cache(h, path)
+                if model_path and not force_download:
+                    stats.record_hit(h)
+                    return model_path, h.version
+                if output_dir:
+                    _prepare_output_dir(output_dir, path, force_download=bool(force_download))
+                    materialized_path = _materialize_from_default_cache(
+                        self, cache, h, path, force_download=bool(force_download)
                     )
-                    download_file(response, archive_path, h)
-
-                    _extract_archive(archive_path, out_path)
-
-                    # Delete the archive
-                    os.remove(archive_path)
+                    if materialized_path:
+                        return materialized_path, h.version
+                elif model_path and force_download:
+                    cache.delete_from_cache(h, path)
+
+                if path and not force_download:
+                    extracted_path = _extract_from_cached_archive(cache, h, path)
+                    if extracted_path:
+                        return extracted_path, h.version
+
+                r = build_model_download_request(h, path)
+                out_path = cache.get_path(h, path)
+
+                # Create the intermediary directories
+                if path:
+                    # Downloading a single file.
+                    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+                    response = _send_model_file_download_request(api_client, h, path)
+                    download_file(response, out_path, h, extract_auto_compressed_file=True)
                 else:
-                    # Download files individually in parallel
-                    def _inner_download_file(file: str) -> None:
-                        file_out_path = os.path.join(out_path, file)
-                        os.makedirs(os.path.dirname(file_out_path), exist_ok=True)
-                        r = _build_model_download_request(h, file)
+                    # List the files and decide how to download them:
+                    # - <= 25 files: Download files in parallel
+                    # > 25 files: Download the archive and uncompress
+                    files, has_more = _list_model_files(api_client, h)
+                    if has_more:
+                        # Downloading the full archived bundle.
+                        archive_path = cache.get_archive_path(h)
+                        os.makedirs(os.path.dirname(archive_path), exist_ok=True)
+
+                        # First, we download the archive.
                         response = handle_call(
                             lambda: api_client.models.model_api_client.download_model_instance_version(r), h
                         )
-                        download_file(response, file_out_path, h)
-
-                    thread_map(
-                        _inner_download_file,
-                        files,
-                        desc=f"Downloading {len(files)} files",
-                        max_workers=8,  # Never use more than 8 threads in parallel to download files.
-                    )
+                        download_file(response, archive_path, h)
+
+                        _store_archive(cache, archive_path, out_path)
+                    else:
+                        # Download files individually in parallel
+                        def _inner_download_file(file: str) -> None:
+                            file_out_path = os.path.join(out_path, file)
+                            os.makedirs(os.path.dirname(file_out_path), exist_ok=True)
+                            response = _send_model_file_download_request(api_client, h, file)
+                            download_file(response, file_out_path, h)
+
+                        thread_map(
+                            _inner_download_file,
+                            files,
+                            desc=f"Downloading {len(files)} files",
+                            max_workers=8,  # Never use more than 8 threads in parallel to download files.
+                        )
 
-            cache.mark_as_complete(h, path)
-            return out_path, h.version
+                stats.record_miss(h)
+                return cache.mark_as_complete(h, path), h.version
 
 
 class NotebookOutputHttpResolver(Resolver[NotebookHandle]):
@@ -244,51 +350,233 @@ class NotebookOutputHttpResolver(Resolver[NotebookHandle]):
         # Downloading files over HTTP is supported in all environments for all handles / paths.
         return True
 
+    def _resolve_from_cache(
+        self, h: NotebookHandle, path: str | None = None, *, output_dir: str | None = None
+    ) -> tuple[str, int | None] | None:
+        return _load_versioned_from_cache(h, path, output_dir)
+
     def _resolve(
         self,
         h: NotebookHandle,
         path: str | None = None,
         *,
-        force_download: bool | None = False,
+        force_download: ForceDownload = False,
         output_dir: str | None = None,
     ) -> tuple[str, int | None]:
-        with build_kaggle_client() as api_client:
+        with (
+            build_kaggle_client() as api_client,
+            _speculate_download(
+                h, path, _send_latest_notebook_download_request, force_download=force_download, output_dir=output_dir
+            ) as speculative_download,
+        ):
             if not h.is_versioned():
-                h = h.with_version(_get_current_version(api_client, h))
+                h = h.with_version(get_current_version(api_client, h))
             cache = Cache(override_dir=output_dir)
+            if force_download == REVALIDATE:
+                revalidated_path = _revalidate(self, api_client, cache, h, path, output_dir=output_dir)
+                if revalidated_path:
+                    return revalidated_path, h.version
+                force_download = True
             notebook_path = cache.load_from_cache(h, path)
             if notebook_path and not force_download:
+                stats.record_hit(h)
                 return notebook_path, h.version  # Already cached
-            if output_dir:
-                _prepare_output_dir(output_dir, path, force_download=bool(force_download))
-            elif notebook_path and force_download:
-                cache.delete_from_cache(h, path)
+            with cache.lock(h, path):
+                # Another process may have downloaded it while we were waiting for the lock.
+                notebook_path = cache.load_from_cache(h, path)
+                if notebook_path and not force_download:
+                    stats.record_hit(h)
+                    return notebook_path, h.version
+                if output_dir:
+                    _prepare_output_dir(output_dir, path, force_download=bool(force_download))
+                    materialized_path = _materialize_from_default_cache(
+                        self, cache, h, path, force_download=bool(force_download)
+                    )
+                    if materialized_path:
+                        return materialized_path, h.version
+                elif notebook_path and force_download:
+                    cache.delete_from_cache(h, path)
+
+                if path and not force_download:
+                    extracted_path = _extract_from_cached_archive(cache, h, path)
+                    if extracted_path:
+                        return extracted_path, h.version
+
+                r = _build_notebook_download_request(h, path)
+                out_path = cache.get_path(h, path)
+
+                if path:
+                    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+                    _download_with_speculation(
+                        speculative_download,
+                        h,
+                        lambda: api_client.kernels.kernels_api_client.download_kernel_output(r),
+                        lambda response: download_file(response, out_path, h, extract_auto_compressed_file=True),
+                        out_path,
+                    )
+                else:
+                    # TODO(b/345800027) Implement parallel download when < 25 files in databundle.
+                    # Downloading the full archived bundle.
+                    archive_path = cache.get_archive_path(h)
+                    os.makedirs(os.path.dirname(archive_path), exist_ok=True)
+
+                    # First, we download the archive.
+                    _download_with_speculation(
+                        speculative_download,
+                        h,
+                        lambda: api_client.kernels.kernels_api_client.download_kernel_output(r),
+                        lambda response: download_file(response, archive_path, h),
+                        archive_path,
+                    )
+
+                    _store_archive(cache, archive_path, out_path)
 
-            r = _build_notebook_download_request(h, path)
-            out_path = cache.get_path(h, path)
+                stats.record_miss(h)
+                return cache.mark_as_complete(h, path), h.version
 
-            if path:
-                os.makedirs(os.path.dirname(out_path), exist_ok=True)
-                response = handle_call(lambda: api_client.kernels.kernels_api_client.download_kernel_output(r), h)
-                download_file(response, out_path, h, extract_auto_compressed_file=True)
-            else:
-                # TODO(b/345800027) Implement parallel download when < 25 files in databundle.
-                # Downloading the full archived bundle.
-                archive_path = cache.get_archive_path(h)
-                os.makedirs(os.path.dirname(archive_path), exist_ok=True)
 
-                # First, we download the archive.
-                response = handle_call(lambda: api_client.kernels.kernels_api_client.download_kernel_output(r), h)
-                download_file(response, archive_path, h)
+def _store_archive(cache: Cache, archive_path: str, out_path: str) -> None:
+    if cache.keeps_archives and zipfile.is_zipfile(archive_path):
+        # Keep the archive as the cache entry: files are read from it on demand.
+        os.makedirs(os.path.dirname(out_path), exist_ok=True)
+        os.replace(archive_path, archives.get_archive_entry_path(out_path))
+        return
+    _extract_archive(archive_path, out_path)
+    os.remove(archive_path)
 
-                _extract_archive(archive_path, out_path)
 
-                # Delete the archive
-                os.remove(archive_path)
+def _is_cached_competition_copy_current(
+    api_client: KaggleClient, h: CompetitionHandle, path: str | None, cached_path: str
+) -> bool:
+    """Whether a cached competition entry is still current, sending the download request without reading the body."""
+    if not get_kaggle_credentials():
+        # It can't be checked: the cached copy is used as is.
+        return True
+    competition_api_client = api_client.competitions.competition_api_client
+    try:
+        if path:
+            file_request = _build_competition_download_file_request(h, path)
+            response = handle_call(lambda: competition_api_client.download_data_file(file_request), h)
+        else:
+            files_request = _build_competition_download_files_request(h)
+            response = handle_call(lambda: competition_api_client.download_data_files(files_request), h)
+        with response:
+            return is_cached_copy_current(response, cached_path)
+    except requests.exceptions.ConnectionError:
+        # Offline: the cached copy is used as is.
+        return True
 
-            cache.mark_as_complete(h, path)
 
-            return out_path, h.version
+def _extract_from_cached_archive(cache: Cache, h: ResourceHandle, path: str) -> str | None:
+    """Serves a file from the archive kept as the entry of the whole resource, if any, instead of downloading it."""
+    if not cache.keeps_archives:
+        return None
+    archive_path = cache.load_from_cache(h)
+    if not archive_path or not archives.is_archive_entry(archive_path):
+        return None
+    if not archives.extract_member(archive_path, path, cache.get_path(h, path)):
+        return None
+    logger.info(f"Extracted '{path}' from the cached archive of {h}.")
+    stats.record_hit(h)
+    return cache.mark_as_complete(h, path)
+
+
+def _materialize_from_default_cache(
+    resolver: Resolver, cache: Cache, h: ResourceHandle, path: str | None, *, force_download: bool
+) -> str | None:
+    """Serves an output_dir download from the default cache, if it holds the entry, instead of downloading it.
+
+    With `KAGGLEHUB_OUTPUT_DIR_POPULATE_CACHE`, entries missing from the default cache are downloaded to it first.
+    """
+    mode = get_output_dir_link_mode()
+    if mode is None:
+        return None
+    default_cache = Cache()
+    cached_path = None if force_download else default_cache.load_from_cache(h, path)
+    if cached_path:
+        stats.record_hit(h)
+    elif is_output_dir_populate_cache_enabled():
+        # Counted as a miss by the resolver.
+        cached_path, _ = resolver._resolve(h, path, force_download=force_download)
+    if not cached_path:
+        return None
+
+    materialize.materialize(cached_path, cache.get_path(h, path), mode)
+    logger.info(f"Materialized {h} in '{cache.get_path(h, path)}' from the cache ({mode}).")
+    # Reuse the manifest of the default cache entry when the files are the same.
+    records = default_cache.get_manifest_records(h, path)
+    if archives.is_archive_entry(cached_path) or (records and any(map(compression.is_compressed, records))):
+        records = None
+    return cache.mark_as_complete(h, path, records=records)
+
+
+def _load_versioned_from_cache(
+    h: DatasetHandle | ModelHandle | NotebookHandle, path: str | None, output_dir: str | None
+) -> tuple[str, int | None] | None:
+    # Unversioned handles need a call to resolve their current version.
+    if not h.is_versioned():
+        return None
+    cached_path = Cache(override_dir=output_dir).load_from_cache(h, path)
+    if not cached_path:
+        return None
+    stats.record_hit(h)
+    return cached_path, h.version
+
+
+def _revalidate(
+    resolver: Resolver,
+    api_client: KaggleClient,
+    cache: Cache,
+    h: ResourceHandle,
+    path: str | None,
+    *,
+    output_dir: str | None,
+) -> str | None:
+    """Downloads again only the files of a cached entry that are missing, corrupted or outdated.
+
+    Files are checked against the manifest captured when they were downloaded and, for datasets and models, their
+    sizes against the remote listing. The bad files are downloaded again in parallel.
+
+    Returns:
+        The path of the entry, or None if it isn't complete or has no manifest and must be downloaded again entirely.
+    """
+    bad_files = cache.verify(h, path)
+    records = cache.get_manifest_records(h, path)
+    stored_path = find_stored_path(cache.get_path(h, path), path)
+    if bad_files is None or records is None or not stored_path:
+        return None
+
+    try:
+        remote_sizes = _list_remote_file_sizes(api_client, h)
+    except KaggleApiHTTPError as e:
+        # Checking against the manifest only is still worth it.
+        logger.debug(f"Failed to list the files of {h}, checking them against the manifest only: {e}")
+        remote_sizes = None
+    if remote_sizes and not archives.is_archive_entry(stored_path):
+        if path:
+            # Records of single files are relative to the folder containing them.
+            remote_sizes = {os.path.basename(path): remote_sizes[path]} if path in remote_sizes else {}
+        for name, size in remote_sizes.items():
+            rel_path = os.path.normpath(name)
+            if rel_path in records:
+                if size and records[rel_path][SIZE_FIELD] != size:
+                    bad_files.append(rel_path)
+            elif not any(compression.get_original_path(recorded) == rel_path for recorded in records):
+                # Compressed copies can't be compared by size, but other files are missing.
+                bad_files.append(rel_path)
+
+    bad_files = sorted(set(bad_files))
+    if bad_files:
+        logger.info(f"Downloading {len(bad_files)} missing or outdated files of {h} again...")
+        repaired = scrub.repair_entry(
+            cache, h, path, bad_files, lambda p: resolver._resolve(h, p, force_download=True, output_dir=output_dir)
+        )
+        if len(repaired) != len(bad_files):
+            msg = f"Failed to download {len(bad_files) - len(repaired)} of {len(bad_files)} files of {h} again."
+            raise RuntimeError(msg)
+    else:
+        stats.record_hit(h)
+    return cache.load_from_cache(h, path)
 
 
 def _extract_archive(archive_path: str, out_path: str) -> None:
@@ -301,12 +589,28 @@ def _extract_archive(archive_path: str, out_path: str) -> None:
             f.extractall(out_path)
     elif zipfile.is_zipfile(archive_path):
         with zipfile.ZipFile(archive_path, "r") as f:
-            f.extractall(out_path)
+            _extract_zip(f, out_path)
     else:
         msg = "Unsupported archive type."
         raise ValueError(msg)
 
 
+def _extract_zip(archive: zipfile.ZipFile, out_path: str) -> None:
+    # Like `ZipFile.extractall`, but the digests of the files are computed while they're written (see `manifest`).
+    out_path = os.path.abspath(out_path)
+    for info in archive.infolist():
+        file_path = os.path.abspath(os.path.join(out_path, info.filename))
+        if os.path.commonpath([out_path, file_path]) != out_path:
+            msg = f"Invalid archive member outside of the extraction folder: '{info.filename}'."
+            raise ValueError(msg)
+        if info.is_dir():
+            os.makedirs(file_path, exist_ok=True)
+            continue
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with archive.open(info) as src:
+            manifest.write_file(src, file_path)
+
+
 def _prepare_output_dir(output_dir: str, path: str | None, *, force_download: bool) -> None:
     if path:
         target_path = os.path.join(output_dir, path)
@@ -342,7 +646,152 @@ def _clear_directory(directory: str) -> None:
             os.remove(entry_path)
 
 
-def _get_current_version(api_client: KaggleClient, h: ResourceHandle) -> int:
+@dataclass(frozen=True)
+class _SpeculativeDownload:
+    # Latest versions looked up before the request is sent and once the response is received: the response is of
+    # that version if both are the same.
+    version_before: Future[int]
+    response: Future[requests.Response]
+    version_after: Future[int]
+
+
+@contextmanager
+def _speculate_download(
+    h: H,
+    path: str | None,
+    send: Callable[[KaggleClient, H, str | None], requests.Response],
+    *,
+    force_download: ForceDownload,
+    output_dir: str | None,
+) -> Generator[_SpeculativeDownload | None, None, None]:
+    """Sends the download request of the latest version of an unversioned handle while its version is looked up.
+
+    This saves a round trip on cold downloads. The latest version is also looked up right before the request is sent
+    and once the response is received: the response is only kept if both are the version looked up by the caller (see
+    `_download_with_speculation`), as it's then the version the server served.
+    Yields None when there's nothing to overlap or the download may not be needed at all, e.g. when a version of the
+    handle is cached already.
+    """
+    if (
+        h.is_versioned()
+        or force_download
+        or output_dir
+        or is_speculative_download_disabled()
+        or PackageScope.get_version(h) is not None
+        or _is_any_version_cached(h)
+    ):
+        yield None
+        return
+
+    # The calling thread uses its own client for the version lookup: kagglesdk clients aren't thread-safe.
+    api_client = build_kaggle_client()
+    executor = ThreadPoolExecutor(max_workers=1)
+    # The single worker runs them in order: the lookups bracket the request.
+    speculative_download = _SpeculativeDownload(
+        version_before=executor.submit(get_current_version, api_client, h),
+        response=executor.submit(send, api_client, h, path),
+        version_after=executor.submit(get_current_version, api_client, h),
+    )
+    executor.shutdown(wait=False)
+    try:
+        yield speculative_download
+    finally:
+        # Don't wait for a response which wasn't used: close it once it's received.
+        speculative_download.version_after.add_done_callback(
+            lambda _: _close_speculative_download(speculative_download, api_client)
+        )
+
+
+def _is_any_version_cached(h: ResourceHandle) -> bool:
+    # Versions of datasets and notebook outputs are stored under the path of the unversioned handle.
+    return os.path.exists(get_cached_path(h))
+
+
+def _download_with_speculation(
+    speculative_download: _SpeculativeDownload | None,
+    h: DatasetHandle | NotebookHandle,
+    send: Callable[[], requests.Response],
+    download: Callable[[requests.Response], object],
+    out_path: str,
+) -> None:
+    """Downloads version `h` to `out_path`, from the speculative response if it turns out to be of that version."""
+    response = _take_speculative_response(speculative_download, h)
+    if response is not None:
+        download(response)
+        if _is_speculative_download_of(speculative_download, h):
+            return
+        logger.info(f"The latest version of '{h}' changed while downloading it, downloading version {h.version}...")
+        os.remove(out_path)
+    download(handle_call(send, h))
+
+
+def _take_speculative_response(
+    speculative_download: _SpeculativeDownload | None, h: ResourceHandle
+) -> requests.Response | None:
+    """Returns the response of the speculative download request, or None to send the request again."""
+    if speculative_download is None:
+        return None
+    try:
+        return speculative_download.response.result()
+    except Exception as e:
+        logger.debug(f"Speculative download of '{h}' failed, downloading it again: {e}")
+        return None
+
+
+def _is_speculative_download_of(
+    speculative_download: _SpeculativeDownload | None, h: DatasetHandle | NotebookHandle
+) -> bool:
+    if speculative_download is None:
+        return False
+    try:
+        return speculative_download.version_before.result() == speculative_download.version_after.result() == h.version
+    except Exception as e:
+        logger.debug(f"Checking the version of the speculative download of '{h}' failed: {e}")
+        return False
+
+
+def _close_speculative_download(speculative_download: _SpeculativeDownload, api_client: KaggleClient) -> None:
+    if not speculative_download.response.exception():
+        speculative_download.response.result().close()
+    api_client.__exit__(None, None, None)
+
+
+def _send_latest_dataset_download_request(
+    api_client: KaggleClient, h: DatasetHandle, path: str | None
+) -> requests.Response:
+    r = build_dataset_download_request(h, path, latest=True)
+    return handle_call(lambda: api_client.datasets.dataset_api_client.download_dataset(r), h)
+
+
+def _send_latest_notebook_download_request(
+    api_client: KaggleClient, h: NotebookHandle, path: str | None
+) -> requests.Response:
+    r = _build_notebook_download_request(h, path, latest=True)
+    return handle_call(lambda: api_client.kernels.kernels_api_client.download_kernel_output(r), h)
+
+
+def _send_model_file_download_request(api_client: KaggleClient, h: ModelHandle, path: str) -> requests.Response:
+    """Sends the download request of a model file, straight to storage if its signed URL is remembered."""
+    signed_url = get_signed_url(h, path)
+    if signed_url:
+        try:
+            response = requests.get(signed_url, stream=True, timeout=(DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT))
+            if response.ok:
+                return response
+            response.close()
+            logger.debug(f"Signed URL of '{path}' of {h} rejected ({response.status_code}), going through the API.")
+        except requests.RequestException as e:
+            logger.debug(f"Signed URL of '{path}' of {h} failed, going through the API: {e}")
+        forget_signed_url(h, path)
+
+    r = build_model_download_request(h, path)
+    response = handle_call(lambda: api_client.models.model_api_client.download_model_instance_version(r), h)
+    remember_signed_url(h, path, response.url)
+    return response
+
+
+def get_current_version(api_client: KaggleClient, h: ResourceHandle) -> int:
+    """Returns the latest version of the resource, or the one pinned by the package in scope if any."""
     # Check if there's a Package in scope which has stored a version number used when it was created.
     version_from_package_scope = PackageScope.get_version(h)
     if version_from_package_scope is not None:
@@ -389,7 +838,54 @@ def _list_model_files(api_client: KaggleClient, h: ModelHandle) -> tuple[list[st
     return (files, has_more)
 
 
-def _build_model_download_request(h: ModelHandle, path: str | None) -> str:
+def _list_remote_file_sizes(api_client: KaggleClient, h: ResourceHandle) -> dict[str, int] | None:
+    """Returns the size of each file of the resource, or None if the resource can't be listed."""
+    if isinstance(h, DatasetHandle):
+        return list_dataset_file_sizes(api_client, h)
+    if isinstance(h, ModelHandle):
+        return list_model_file_sizes(api_client, h)
+    return None
+
+
+def list_dataset_file_sizes(api_client: KaggleClient, h: DatasetHandle) -> dict[str, int]:
+    """Returns the size of each file of the versioned dataset, by path."""
+    sizes: dict[str, int] = {}
+    page_token = None
+    while True:
+        r = ApiListDatasetFilesRequest()
+        r.owner_slug = h.owner
+        r.dataset_slug = h.dataset
+        r.dataset_version_number = h.version
+        if page_token:
+            r.page_token = page_token
+        response = handle_call(lambda: api_client.datasets.dataset_api_client.list_dataset_files(r), h)  # noqa: B023
+        for f in response.dataset_files:
+            sizes[f.name] = f.total_bytes
+        page_token = response.next_page_token
+        if not page_token:
+            return sizes
+
+
+def list_model_file_sizes(api_client: KaggleClient, h: ModelHandle) -> dict[str, int]:
+    """Returns the size of each file of the versioned model instance, by path."""
+    sizes: dict[str, int] = {}
+    page_token = None
+    while True:
+        r = _build_list_model_instance_version_files_request(h)
+        if page_token:
+            r.page_token = page_token
+        response = handle_call(
+            lambda: api_client.models.model_api_client.list_model_instance_version_files(r), h  # noqa: B023
+        )
+        for f in response.files:
+            sizes[f.name] = f.size
+        page_token = response.next_page_token
+        if not page_token:
+            return sizes
+
+
+def build_model_download_request(h: ModelHandle, path: str | None) -> ApiDownloadModelInstanceVersionRequest:
+    """Returns the request downloading the `path` file of the versioned model instance, or all its files."""
     if not h.is_versioned():
         msg = "No version provided"
         raise ValueError(msg)
@@ -421,8 +917,11 @@ def _build_list_model_instance_version_files_request(h: ModelHandle) -> ApiListM
     return r
 
 
-def _build_dataset_download_request(h: DatasetHandle, path: str | None) -> ApiDownloadDatasetRequest:
-    if not h.is_versioned():
+def build_dataset_download_request(
+    h: DatasetHandle, path: str | None, *, latest: bool = False
+) -> ApiDownloadDatasetRequest:
+    """Returns the request downloading the `path` file of the dataset, or all its files, at its version or latest."""
+    if not h.is_versioned() and not latest:
         msg = "No version provided"
         raise ValueError(msg)
 
@@ -435,8 +934,10 @@ def _build_dataset_download_request(h: DatasetHandle, path: str | None) -> ApiDo
     return r
 
 
-def _build_notebook_download_request(h: NotebookHandle, path: str | None) -> ApiDownloadKernelOutputRequest:
-    if not h.is_versioned():
+def _build_notebook_download_request(
+    h: NotebookHandle, path: str | None, *, latest: bool = False
+) -> ApiDownloadKernelOutputRequest:
+    if not h.is_versioned() and not latest:
         msg = "No version provided"
         raise ValueError(msg)
 
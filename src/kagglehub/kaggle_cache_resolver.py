@@ -1,19 +1,22 @@
 import logging
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor
 
 from kagglesdk.kaggle_env import is_in_kaggle_notebook
 
+from kagglehub import staging
 from kagglehub.clients import (
     DEFAULT_CONNECT_TIMEOUT,
     KaggleJwtClient,
 )
-from kagglehub.config import is_kaggle_cache_disabled
+from kagglehub.config import get_mount_timeout, is_kaggle_cache_disabled
 from kagglehub.exceptions import BackendError
-from kagglehub.handle import CompetitionHandle, DatasetHandle, ModelHandle, NotebookHandle
+from kagglehub.handle import CompetitionHandle, DatasetHandle, ModelHandle, NotebookHandle, ResourceHandle
 from kagglehub.logger import EXTRA_CONSOLE_BLOCK
+from kagglehub.mounts import Mount, get_mount, remember_mount, wait_for_mount
 from kagglehub.packages import PackageScope
-from kagglehub.resolver import Resolver
+from kagglehub.resolver import ForceDownload, Resolver
+from kagglehub.tracker import register_datasource_access
 
 KAGGLE_CACHE_MOUNT_FOLDER_ENV_VAR_NAME = "KAGGLE_CACHE_MOUNT_FOLDER"
 ATTACH_DATASOURCE_REQUEST_NAME = "AttachDatasourceUsingJwtRequest"
@@ -25,6 +28,8 @@ ATTACH_DATASOURCE_READ_TIMEOUT = 30  # seconds
 #   kagglehub, and have AttachDatasourceUsingJwt return the actual mount path.
 DEFAULT_KAGGLE_CACHE_MOUNT_FOLDER = "/kaggle/input"
 
+DEFAULT_ATTACH_MAX_WORKERS = 8
+
 
 logger = logging.getLogger(__name__)
 
@@ -37,12 +42,15 @@ class CompetitionKaggleCacheResolver(Resolver[CompetitionHandle]):
             return True
         return False
 
+    def is_supported_in_environment(self) -> bool:
+        return self.is_supported()
+
     def _resolve(
         self,
         h: CompetitionHandle,
         path: str | None = None,
         *,
-        force_download: bool | None = False,
+        force_download: ForceDownload = False,
         output_dir: str | None = None,
     ) -> tuple[str, int | None]:
         if output_dir:
@@ -50,55 +58,20 @@ class CompetitionKaggleCacheResolver(Resolver[CompetitionHandle]):
                 "Ignoring `output_dir` argument when running inside the Kaggle notebook environment.",
                 extra={**EXTRA_CONSOLE_BLOCK},
             )
-        client = KaggleJwtClient()
         if force_download:
             logger.info(
                 "Ignoring `force_download` argument when running inside the Kaggle notebook environment.",
                 extra={**EXTRA_CONSOLE_BLOCK},
             )
+        mount = get_mount(h) or self.attach(h)
+        return _get_mounted_path(mount, path, "competition"), mount.version
 
+    def attach(self, h: CompetitionHandle) -> Mount:
+        """Sends the request attaching the competition to the notebook, without waiting for it to be mounted."""
         competition_ref = {
             "CompetitionSlug": h.competition,
         }
-        result = client.post(
-            ATTACH_DATASOURCE_REQUEST_NAME,
-            {
-                "competitionRef": competition_ref,
-            },
-            timeout=(DEFAULT_CONNECT_TIMEOUT, ATTACH_DATASOURCE_READ_TIMEOUT),
-        )
-
-        if "mountSlug" not in result:
-            msg = "'result.mountSlug' field missing from response"
-            raise BackendError(msg)
-
-        base_mount_path = os.getenv(KAGGLE_CACHE_MOUNT_FOLDER_ENV_VAR_NAME, DEFAULT_KAGGLE_CACHE_MOUNT_FOLDER)
-        cached_path = f"{base_mount_path}/{result['mountSlug']}"
-        if not os.path.exists(cached_path):
-            # Only print this if the competition is not already mounted.
-            logger.info(f"Mounting files to {cached_path}...")
-        elif path:
-            logger.info(
-                f"Attaching '{path}' from competition '{h}' to your Kaggle notebook...",
-                extra={**EXTRA_CONSOLE_BLOCK},
-            )
-        else:
-            logger.info(
-                f"Attaching competition '{h}' to your Kaggle notebook...",
-                extra={**EXTRA_CONSOLE_BLOCK},
-            )
-        while not os.path.exists(cached_path):
-            time.sleep(5)
-        if path:
-            cached_filepath = f"{cached_path}/{path}"
-            if not os.path.exists(cached_filepath):
-                msg = (
-                    f"'{path}' is not present in the competition files."
-                    f"You can acces the other files othe attached competition at '{cached_path}'"
-                )
-                raise ValueError(msg)
-            return cached_filepath, None
-        return cached_path, None
+        return _attach(KaggleJwtClient(), {"competitionRef": competition_ref}, h, has_version=False)
 
 
 class DatasetKaggleCacheResolver(Resolver[DatasetHandle]):
@@ -111,12 +84,15 @@ class DatasetKaggleCacheResolver(Resolver[DatasetHandle]):
 
         return False
 
+    def is_supported_in_environment(self) -> bool:
+        return self.is_supported()
+
     def _resolve(
         self,
         h: DatasetHandle,
         path: str | None = None,
         *,
-        force_download: bool | None = False,
+        force_download: ForceDownload = False,
         output_dir: str | None = None,
     ) -> tuple[str, int | None]:
         if output_dir:
@@ -129,7 +105,11 @@ class DatasetKaggleCacheResolver(Resolver[DatasetHandle]):
                 "Ignoring `force_download` argument when running inside the Kaggle notebook environment.",
                 extra={**EXTRA_CONSOLE_BLOCK},
             )
-        client = KaggleJwtClient()
+        mount = get_mount(h) or self.attach(h)
+        return _get_mounted_path(mount, path, "dataset"), mount.version
+
+    def attach(self, h: DatasetHandle) -> Mount:
+        """Sends the request attaching the dataset to the notebook, without waiting for it to be mounted."""
         dataset_ref = {
             "OwnerSlug": h.owner,
             "DatasetSlug": h.dataset,
@@ -142,48 +122,7 @@ class DatasetKaggleCacheResolver(Resolver[DatasetHandle]):
             if version_from_package_scope is not None:
                 dataset_ref["VersionNumber"] = str(version_from_package_scope)
 
-        result = client.post(
-            ATTACH_DATASOURCE_REQUEST_NAME,
-            {
-                "datasetRef": dataset_ref,
-            },
-            timeout=(DEFAULT_CONNECT_TIMEOUT, ATTACH_DATASOURCE_READ_TIMEOUT),
-        )
-        if "mountSlug" not in result:
-            msg = "'result.mountSlug' field missing from response"
-            raise BackendError(msg)
-
-        base_mount_path = os.getenv(KAGGLE_CACHE_MOUNT_FOLDER_ENV_VAR_NAME, DEFAULT_KAGGLE_CACHE_MOUNT_FOLDER)
-        cached_path = f"{base_mount_path}/{result['mountSlug']}"
-        version = result.get("versionNumber")  # None if missing
-
-        if not os.path.exists(cached_path):
-            # Only print this if the dataset is not already mounted.
-            logger.info(f"Mounting files to {cached_path}...")
-        elif path:
-            logger.info(
-                f"Attaching '{path}' from dataset '{h}' to your Kaggle notebook...",
-                extra={**EXTRA_CONSOLE_BLOCK},
-            )
-        else:
-            logger.info(
-                f"Attaching dataset '{h}' to your Kaggle notebook...",
-                extra={**EXTRA_CONSOLE_BLOCK},
-            )
-
-        while not os.path.exists(cached_path):
-            time.sleep(5)
-
-        if path:
-            cached_filepath = f"{cached_path}/{path}"
-            if not os.path.exists(cached_filepath):
-                msg = (
-                    f"'{path}' is not present in the dataset files."
-                    f"You can acces the other files othe attached dataset at '{cached_path}'"
-                )
-                raise ValueError(msg)
-            return cached_filepath, version
-        return cached_path, version
+        return _attach(KaggleJwtClient(), {"datasetRef": dataset_ref}, h)
 
 
 class ModelKaggleCacheResolver(Resolver[ModelHandle]):
@@ -196,12 +135,15 @@ class ModelKaggleCacheResolver(Resolver[ModelHandle]):
 
         return False
 
+    def is_supported_in_environment(self) -> bool:
+        return self.is_supported()
+
     def _resolve(
         self,
         h: ModelHandle,
         path: str | None = None,
         *,
-        force_download: bool | None = False,
+        force_download: ForceDownload = False,
         output_dir: str | None = None,
     ) -> tuple[str, int | None]:
         if output_dir:
@@ -214,7 +156,11 @@ class ModelKaggleCacheResolver(Resolver[ModelHandle]):
                 "Ignoring `force_download` argument when running inside the Kaggle notebook environment.",
                 extra={**EXTRA_CONSOLE_BLOCK},
             )
-        client = KaggleJwtClient()
+        mount = get_mount(h) or self.attach(h)
+        return _get_mounted_path(mount, path, "model"), mount.version
+
+    def attach(self, h: ModelHandle) -> Mount:
+        """Sends the request attaching the model to the notebook, without waiting for it to be mounted."""
         model_ref = {
             "OwnerSlug": h.owner,
             "ModelSlug": h.model,
@@ -229,48 +175,7 @@ class ModelKaggleCacheResolver(Resolver[ModelHandle]):
             if version_from_package_scope is not None:
                 model_ref["VersionNumber"] = str(version_from_package_scope)
 
-        result = client.post(
-            ATTACH_DATASOURCE_REQUEST_NAME,
-            {
-                "modelRef": model_ref,
-            },
-            timeout=(DEFAULT_CONNECT_TIMEOUT, ATTACH_DATASOURCE_READ_TIMEOUT),
-        )
-        if "mountSlug" not in result:
-            msg = "'result.mountSlug' field missing from response"
-            raise BackendError(msg)
-
-        base_mount_path = os.getenv(KAGGLE_CACHE_MOUNT_FOLDER_ENV_VAR_NAME, DEFAULT_KAGGLE_CACHE_MOUNT_FOLDER)
-        cached_path = f"{base_mount_path}/{result['mountSlug']}"
-        version = result.get("versionNumber")  # None if missing
-
-        if not os.path.exists(cached_path):
-            # Only print this if the model is not already mounted.
-            logger.info(f"Mounting files to {cached_path}...")
-        elif path:
-            logger.info(
-                f"Attaching '{path}' from model '{h}' to your Kaggle notebook...",
-                extra={**EXTRA_CONSOLE_BLOCK},
-            )
-        else:
-            logger.info(
-                f"Attaching model '{h}' to your Kaggle notebook...",
-                extra={**EXTRA_CONSOLE_BLOCK},
-            )
-
-        while not os.path.exists(cached_path):
-            time.sleep(5)
-
-        if path:
-            cached_filepath = f"{cached_path}/{path}"
-            if not os.path.exists(cached_filepath):
-                msg = (
-                    f"'{path}' is not present in the model files. "
-                    f"You can access the other files of the attached model at '{cached_path}'"
-                )
-                raise ValueError(msg)
-            return cached_filepath, version
-        return cached_path, version
+        return _attach(KaggleJwtClient(), {"modelRef": model_ref}, h)
 
 
 class NotebookOutputKaggleCacheResolver(Resolver[NotebookHandle]):
@@ -283,12 +188,15 @@ class NotebookOutputKaggleCacheResolver(Resolver[NotebookHandle]):
 
         return False
 
+    def is_supported_in_environment(self) -> bool:
+        return self.is_supported()
+
     def _resolve(
         self,
         h: NotebookHandle,
         path: str | None = None,
         *,
-        force_download: bool | None = False,
+        force_download: ForceDownload = False,
         output_dir: str | None = None,
     ) -> tuple[str, int | None]:
         if output_dir:
@@ -301,7 +209,11 @@ class NotebookOutputKaggleCacheResolver(Resolver[NotebookHandle]):
                 "Ignoring `force_download` argument when running inside the Kaggle notebook environment.",
                 extra={**EXTRA_CONSOLE_BLOCK},
             )
-        client = KaggleJwtClient()
+        mount = get_mount(h) or self.attach(h)
+        return _get_mounted_path(mount, path, "notebook output"), mount.version
+
+    def attach(self, h: NotebookHandle) -> Mount:
+        """Sends the request attaching the notebook output to the notebook, without waiting for it to be mounted."""
         kernel_ref = {
             "OwnerSlug": h.owner,
             "KernelSlug": h.notebook,
@@ -314,46 +226,99 @@ class NotebookOutputKaggleCacheResolver(Resolver[NotebookHandle]):
             if version_from_package_scope is not None:
                 kernel_ref["VersionNumber"] = str(version_from_package_scope)
 
-        result = client.post(
-            ATTACH_DATASOURCE_REQUEST_NAME,
-            {
-                "kernelRef": kernel_ref,
-            },
-            timeout=(DEFAULT_CONNECT_TIMEOUT, ATTACH_DATASOURCE_READ_TIMEOUT),
+        return _attach(KaggleJwtClient(), {"kernelRef": kernel_ref}, h)
+
+
+def attach_datasources(
+    handles: list[ResourceHandle], *, max_workers: int = DEFAULT_ATTACH_MAX_WORKERS
+) -> dict[ResourceHandle, str]:
+    """Attaches several datasources to the notebook at once.
+
+    All the attach requests are sent first, concurrently, and the mounts are then waited for together: the time to
+    attach N datasources is that of the slowest one rather than the sum of all of them.
+
+    Args:
+        handles: (list[ResourceHandle]) The datasources to attach.
+        max_workers: (int) Maximum number of concurrent requests (and of mounts waited for).
+
+    Returns:
+        A dictionary mapping each handle to the path of its mounted (or staged) files.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        mounts = list(executor.map(_attach_datasource, handles))
+        kinds = [_get_kind(h) for h in handles]
+        paths = list(executor.map(lambda mount, kind: _get_mounted_path(mount, None, kind), mounts, kinds))
+
+    for mount in mounts:
+        register_datasource_access(mount.handle, mount.version)
+    return dict(zip(handles, paths, strict=True))
+
+
+def _attach_datasource(h: ResourceHandle) -> Mount:
+    mount = get_mount(h)
+    if mount is not None:
+        return mount
+    if isinstance(h, ModelHandle):
+        return ModelKaggleCacheResolver().attach(h)
+    if isinstance(h, DatasetHandle):
+        return DatasetKaggleCacheResolver().attach(h)
+    if isinstance(h, CompetitionHandle):
+        return CompetitionKaggleCacheResolver().attach(h)
+    if isinstance(h, NotebookHandle):
+        return NotebookOutputKaggleCacheResolver().attach(h)
+    msg = f"Invalid ResourceHandle type {h}"
+    raise ValueError(msg)
+
+
+def _get_kind(h: ResourceHandle) -> str:
+    if isinstance(h, ModelHandle):
+        return "model"
+    if isinstance(h, DatasetHandle):
+        return "dataset"
+    if isinstance(h, CompetitionHandle):
+        return "competition"
+    return "notebook output"
+
+
+def _attach(client: KaggleJwtClient, data: dict, h: ResourceHandle, *, has_version: bool = True) -> Mount:
+    result = client.post(
+        ATTACH_DATASOURCE_REQUEST_NAME,
+        data,
+        timeout=(DEFAULT_CONNECT_TIMEOUT, ATTACH_DATASOURCE_READ_TIMEOUT),
+    )
+
+    if "mountSlug" not in result:
+        msg = "'result.mountSlug' field missing from response"
+        raise BackendError(msg)
+
+    base_mount_path = os.getenv(KAGGLE_CACHE_MOUNT_FOLDER_ENV_VAR_NAME, DEFAULT_KAGGLE_CACHE_MOUNT_FOLDER)
+    version = result.get("versionNumber") if has_version else None  # None if missing
+    return Mount(h, base_mount_path, result["mountSlug"], version)
+
+
+def _get_mounted_path(mount: Mount, path: str | None, kind: str) -> str:
+    cached_path = mount.path
+    if not os.path.exists(cached_path):
+        # Only print this if the datasource is not already mounted.
+        logger.info(f"Mounting files to {cached_path}...")
+    elif path:
+        logger.info(
+            f"Attaching '{path}' from {kind} '{mount.handle}' to your Kaggle notebook...",
+            extra={**EXTRA_CONSOLE_BLOCK},
         )
-
-        if "mountSlug" not in result:
-            msg = "'result.mountSlug' field missing from response"
-            raise BackendError(msg)
-
-        base_mount_path = os.getenv(KAGGLE_CACHE_MOUNT_FOLDER_ENV_VAR_NAME, DEFAULT_KAGGLE_CACHE_MOUNT_FOLDER)
-        cached_path = f"{base_mount_path}/{result['mountSlug']}"
-        version = result.get("versionNumber")  # None if missing
-
-        if not os.path.exists(cached_path):
-            # Only print this if the notebook output is not already mounted.
-            logger.info(f"Mounting files to {cached_path}...")
-        elif path:
-            logger.info(
-                f"Attaching '{path}' from Notebook '{h}' to your Kaggle notebook...",
-                extra={**EXTRA_CONSOLE_BLOCK},
-            )
-        else:
-            logger.info(
-                f"Attaching model '{h}' to your Kaggle notebook...",
-                extra={**EXTRA_CONSOLE_BLOCK},
+    else:
+        logger.info(
+            f"Attaching {kind} '{mount.handle}' to your Kaggle notebook...",
+            extra={**EXTRA_CONSOLE_BLOCK},
+        )
+    wait_for_mount(cached_path, timeout=get_mount_timeout())
+    remember_mount(mount)
+    if path:
+        cached_filepath = f"{cached_path}/{path}"
+        if not os.path.exists(cached_filepath):
+            msg = (
+                f"'{path}' is not present in the {kind} files. "
+                f"You can access the other files of the attached {kind} at '{cached_path}'"
             )
-
-        while not os.path.exists(cached_path):
-            time.sleep(5)
-
-        if path:
-            cached_filepath = f"{cached_path}/{path}"
-            if not os.path.exists(cached_filepath):
-                msg = (
-                    f"'{path}' is not present in the notebook output files."
-                    f"You can access the other files of the attached notebook at '{cached_path}'"
-                )
-                raise ValueError(msg)
-            return cached_filepath, version
-        return cached_path, version
+            raise ValueError(msg)
+    return staging.stage(mount.base_mount_path, mount.mount_slug, path, mount.version)
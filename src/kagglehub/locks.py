@@ -0,0 +1,220 @@
+"""Advisory cross-process locks for cache entries.
+
+A lock is a small file created atomically (O_CREAT | O_EXCL) next to the cache entry it protects. The owner writes its
+host name and pid into the file and keeps refreshing its mtime while the lock is held. Other processes wait for the file
+to disappear. A lock is considered stale, and gets broken, when its owner process is no longer running on this host or
+when its heartbeat stopped for longer than `LOCK_STALE_AFTER` seconds (e.g. the owner ran on another node of a shared
+NFS cache and died). The heartbeat is considered stopped when the lock mtime doesn't change for `LOCK_STALE_AFTER`
+seconds of the waiter's own clock: the mtime is never compared with the local time, as NFS clients and servers drift.
+"""
+
+import json
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+import uuid
+from types import TracebackType
+
+from kagglehub.exceptions import CacheLockTimeoutError
+
+LOCK_HEARTBEAT_INTERVAL = 10  # seconds
+LOCK_STALE_AFTER = 120  # seconds
+LOCK_POLL_INTERVAL = 0.25  # seconds
+LOCK_WAIT_LOG_INTERVAL = 30  # seconds
+
+LOCK_PID_FIELD = "pid"
+LOCK_HOST_FIELD = "host"
+LOCK_TOKEN_FIELD = "token"
+
+logger = logging.getLogger(__name__)
+
+
+class CacheLock:
+    """Advisory lock held while a cache entry is being downloaded.
+
+    Args:
+        lock_path: (string) Path of the lock file.
+        description: (string) Human readable name of the locked resource, used in log messages.
+        timeout: (float) Optional number of seconds to wait for the lock. Waits forever if None.
+        watch_path: (string) Optional path of the file being downloaded by the owner, used to report progress.
+    """
+
+    def __init__(
+        self,
+        lock_path: str,
+        description: str,
+        *,
+        timeout: float | None = None,
+        watch_path: str | None = None,
+    ) -> None:
+        self.lock_path = lock_path
+        self._description = description
+        self._timeout = timeout
+        self._watch_path = watch_path
+        self._token = uuid.uuid4().hex
+        self._stop_heartbeat = threading.Event()
+        self._heartbeat_thread: threading.Thread | None = None
+
+    def acquire(self) -> None:
+        os.makedirs(os.path.dirname(self.lock_path), exist_ok=True)
+        start = time.monotonic()
+        last_log = start
+        waited = False
+        heartbeat = _HeartbeatWatch()
+        while not self._try_create():
+            owner = _read_lock_info(self.lock_path)
+            if _is_stale(self.lock_path, owner, heartbeat):
+                logger.info(f"Breaking stale lock for {self._description} held by {_format_owner(owner)}.")
+                _break_lock(self.lock_path, owner)
+                continue
+
+            now = time.monotonic()
+            if not waited or now - last_log >= LOCK_WAIT_LOG_INTERVAL:
+                logger.info(
+                    f"Waiting for {_format_owner(owner)} to finish downloading {self._description}..."
+                    f"{self._progress()}"
+                )
+                waited = True
+                last_log = now
+            if self._timeout is not None and now - start >= self._timeout:
+                msg = (
+                    f"Timed out after {self._timeout}s waiting for {_format_owner(owner)} to finish downloading "
+                    f"{self._description}. Lock file: {self.lock_path}"
+                )
+                raise CacheLockTimeoutError(msg)
+            time.sleep(LOCK_POLL_INTERVAL)
+
+        if waited:
+            logger.info(f"Acquired lock for {self._description} after waiting {time.monotonic() - start:.1f}s.")
+        self._start_heartbeat()
+
+    def release(self) -> None:
+        self._stop_heartbeat.set()
+        if self._heartbeat_thread is not None:
+            self._heartbeat_thread.join()
+            self._heartbeat_thread = None
+        owner = _read_lock_info(self.lock_path)
+        # Only remove the file if we still own it: it may have been broken and re-acquired by another process.
+        if owner is not None and owner.get(LOCK_TOKEN_FIELD) == self._token:
+            _remove_if_exists(self.lock_path)
+
+    def __enter__(self) -> "CacheLock":
+        self.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.release()
+
+    def _try_create(self) -> bool:
+        try:
+            fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                {
+                    LOCK_PID_FIELD: os.getpid(),
+                    LOCK_HOST_FIELD: socket.gethostname(),
+                    LOCK_TOKEN_FIELD: self._token,
+                },
+                f,
+            )
+        return True
+
+    def _start_heartbeat(self) -> None:
+        self._stop_heartbeat.clear()
+
+        def _heartbeat() -> None:
+            while not self._stop_heartbeat.wait(LOCK_HEARTBEAT_INTERVAL):
+                try:
+                    os.utime(self.lock_path)
+                except OSError:
+                    return
+
+        self._heartbeat_thread = threading.Thread(target=_heartbeat, name="kagglehub-lock-heartbeat", daemon=True)
+        self._heartbeat_thread.start()
+
+    def _progress(self) -> str:
+        if self._watch_path and os.path.isfile(self._watch_path):
+            return f" ({os.path.getsize(self._watch_path)} bytes downloaded so far)"
+        return ""
+
+
+def _read_lock_info(lock_path: str) -> dict | None:
+    try:
+        with open(lock_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        # Either the lock was just released or its owner is still writing it.
+        return None
+
+
+class _HeartbeatWatch:
+    """Tracks how long the mtime of a lock file has been unchanged, measured with the local monotonic clock."""
+
+    def __init__(self) -> None:
+        self._last_seen: tuple[float, str | None] | None = None
+        self._unchanged_since = 0.0
+
+    def stalled_for(self, mtime: float, token: str | None) -> float:
+        now = time.monotonic()
+        if self._last_seen != (mtime, token):
+            self._last_seen = (mtime, token)
+            self._unchanged_since = now
+        return now - self._unchanged_since
+
+
+def _is_stale(lock_path: str, owner: dict | None, heartbeat: _HeartbeatWatch) -> bool:
+    try:
+        mtime = os.path.getmtime(lock_path)
+    except OSError:
+        return False
+    token = owner.get(LOCK_TOKEN_FIELD) if owner is not None else None
+    if heartbeat.stalled_for(mtime, token) > LOCK_STALE_AFTER:
+        return True
+    if owner is None or owner.get(LOCK_HOST_FIELD) != socket.gethostname():
+        return False
+    return not _is_process_alive(owner.get(LOCK_PID_FIELD))
+
+
+def _is_process_alive(pid: int | None) -> bool:
+    if not isinstance(pid, int):
+        return True
+    if sys.platform == "win32":
+        # os.kill() terminates the target process on Windows, rely on the heartbeat instead.
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # The process exists but belongs to another user.
+        return True
+    return True
+
+
+def _break_lock(lock_path: str, owner: dict | None) -> None:
+    # Make sure the lock wasn't re-acquired by someone else since we read it.
+    if _read_lock_info(lock_path) == owner:
+        _remove_if_exists(lock_path)
+
+
+def _remove_if_exists(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _format_owner(owner: dict | None) -> str:
+    if owner is None:
+        return "another process"
+    return f"process {owner.get(LOCK_PID_FIELD)} on {owner.get(LOCK_HOST_FIELD)}"
@@ -0,0 +1,187 @@
+"""Manifests listing the size and digest of the files of cache entries.
+
+A manifest is captured when an entry is marked as complete, i.e. after its files were downloaded and extracted, and is
+used later on to detect files that got corrupted, truncated or edited. The digests of the files kagglehub writes are
+computed while they're written (see `record_digest` and `write_file`), so the files aren't read back to build the
+manifest: only files written otherwise, e.g. extracted from tar archives, are hashed then.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any
+
+from kagglehub.handle import ResourceHandle
+from kagglehub.integrity import to_b64_digest
+from kagglehub.tracker import HANDLE_TYPE_NAMES, HANDLE_TYPE_PARSERS
+
+MANIFEST_FORMAT_VERSION = 1
+# Large sequential reads keep disks busy. hashlib releases the GIL while hashing such buffers, so files are hashed in
+# parallel across cores by a thread pool.
+HASH_READ_SIZE = 8 * 1024 * 1024
+# Digests of files written but not yet recorded in a manifest, e.g. archives deleted once extracted, are forgotten past
+# this number.
+MAX_KNOWN_DIGESTS = 10_000
+
+FORMAT_VERSION_FIELD = "format_version"
+TYPE_FIELD = "type"
+REF_FIELD = "ref"
+PATH_FIELD = "path"
+FILES_FIELD = "files"
+SIZE_FIELD = "size"
+MD5_FIELD = "md5"
+
+# Maps the path of each file relative to the entry's folder to its size and MD5 digest.
+FileRecords = dict[str, dict[str, Any]]
+
+# Absolute path -> (size, modification time in ns, MD5 digest) of the files written by this process.
+_known_digests: dict[str, tuple[int, int, str]] = {}
+_known_digests_lock = threading.Lock()
+
+
+def build(full_path: str, max_workers: int | None = None) -> FileRecords:
+    """Records the size and digest of all the files of the entry at `full_path`, a file or a folder.
+
+    Records are relative to the entry's folder, or to the folder containing the entry if it is a single file.
+    """
+    files = _list_files(full_path)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        digests = executor.map(_get_digest, files.values())
+        return {
+            rel_path: {SIZE_FIELD: os.path.getsize(file_path), MD5_FIELD: digest}
+            for (rel_path, file_path), digest in zip(files.items(), digests, strict=True)
+        }
+
+
+def verify(base_path: str, records: FileRecords, max_workers: int | None = None) -> list[str]:
+    """Checks files against the given records, relative to `base_path`.
+
+    Returns:
+        The sorted relative paths of the files that are missing or whose size or digest don't match.
+    """
+    bad_files = []
+    to_hash = {}
+    for rel_path, record in records.items():
+        file_path = os.path.join(base_path, rel_path)
+        try:
+            size = os.path.getsize(file_path)
+        except OSError:
+            bad_files.append(rel_path)
+            continue
+        if size != record[SIZE_FIELD]:
+            # No need to read the file.
+            bad_files.append(rel_path)
+        else:
+            to_hash[rel_path] = file_path
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for (rel_path, _), digest in zip(to_hash.items(), executor.map(_try_hash_file, to_hash.values()), strict=True):
+            if digest != records[rel_path][MD5_FIELD]:
+                bad_files.append(rel_path)
+    return sorted(bad_files)
+
+
+def update(base_path: str, records: FileRecords, rel_paths: list[str]) -> FileRecords:
+    """Returns the records with the given files hashed again, e.g. after they were downloaded again."""
+    updated = dict(records)
+    for rel_path in rel_paths:
+        file_path = os.path.join(base_path, rel_path)
+        updated[rel_path] = {SIZE_FIELD: os.path.getsize(file_path), MD5_FIELD: hash_file(file_path)}
+    return updated
+
+
+def write(manifest_path: str, handle: ResourceHandle, path: str | None, records: FileRecords) -> None:
+    data = {
+        FORMAT_VERSION_FIELD: MANIFEST_FORMAT_VERSION,
+        TYPE_FIELD: HANDLE_TYPE_NAMES[type(handle)],
+        REF_FIELD: str(handle),
+        PATH_FIELD: path,
+        FILES_FIELD: records,
+    }
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, manifest_path)
+
+
+def read(manifest_path: str) -> tuple[ResourceHandle, str | None, FileRecords] | None:
+    """Returns the handle, path and file records stored in the manifest, or None if it is missing or unsupported."""
+    try:
+        with open(manifest_path) as f:
+            return loads(f.read())
+    except OSError:
+        return None
+
+
+def loads(content: str | bytes) -> tuple[ResourceHandle, str | None, FileRecords] | None:
+    """Returns the handle, path and file records of a serialized manifest, or None if it is invalid or unsupported."""
+    try:
+        data = json.loads(content)
+    except ValueError:
+        return None
+    if not isinstance(data, dict) or data.get(FORMAT_VERSION_FIELD) != MANIFEST_FORMAT_VERSION:
+        return None
+    handle = HANDLE_TYPE_PARSERS[data[TYPE_FIELD]](data[REF_FIELD])
+    return handle, data[PATH_FIELD], data[FILES_FIELD]
+
+
+def record_digest(file_path: str, digest: str) -> None:
+    """Remembers the digest of a file that was just written, computed while writing it."""
+    stat = os.stat(file_path)
+    with _known_digests_lock:
+        _known_digests.pop(os.path.abspath(file_path), None)
+        _known_digests[os.path.abspath(file_path)] = (stat.st_size, stat.st_mtime_ns, digest)
+        if len(_known_digests) > MAX_KNOWN_DIGESTS:
+            # Forget the oldest one.
+            del _known_digests[next(iter(_known_digests))]
+
+
+def write_file(src: IO[bytes], file_path: str) -> None:
+    """Writes the contents of `src` to `file_path` and records their digest."""
+    hash_object = hashlib.md5()
+    with open(file_path, "wb") as f:
+        while chunk := src.read(HASH_READ_SIZE):
+            f.write(chunk)
+            hash_object.update(chunk)
+    record_digest(file_path, to_b64_digest(hash_object))
+
+
+def hash_file(file_path: str) -> str:
+    hash_object = hashlib.md5()
+    with open(file_path, "rb", buffering=0) as f:
+        while chunk := f.read(HASH_READ_SIZE):
+            hash_object.update(chunk)
+    return to_b64_digest(hash_object)
+
+
+def _get_digest(file_path: str) -> str:
+    with _known_digests_lock:
+        known_digest = _known_digests.pop(os.path.abspath(file_path), None)
+    if known_digest is not None:
+        size, mtime_ns, digest = known_digest
+        stat = os.stat(file_path)
+        # The file wasn't modified since it was written.
+        if (stat.st_size, stat.st_mtime_ns) == (size, mtime_ns):
+            return digest
+    return hash_file(file_path)
+
+
+def _try_hash_file(file_path: str) -> str | None:
+    try:
+        return hash_file(file_path)
+    except OSError:
+        return None
+
+
+def _list_files(full_path: str) -> dict[str, str]:
+    if os.path.isfile(full_path):
+        return {os.path.basename(full_path): full_path}
+    files = {}
+    for dirpath, _, filenames in os.walk(full_path):
+        for filename in filenames:
+            file_path = os.path.join(dirpath, filename)
+            files[os.path.relpath(file_path, full_path)] = file_path
+    return files
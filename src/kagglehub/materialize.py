@@ -0,0 +1,119 @@
+"""Materialization of default cache entries into an output_dir (see `KAGGLEHUB_OUTPUT_DIR_LINK_MODE`).
+
+Downloads to an output_dir are satisfied from the default cache when it holds the requested entry, instead of
+downloading it again. The modes are:
+- `copy` (default): clones the files (reflink) on filesystems supporting it (e.g. Btrfs, XFS), copies them within the
+  kernel with `copy_file_range` otherwise, and falls back to a regular copy.
+- `hardlink`: links the files to the cache, falling back to a copy across filesystems. Editing a file in the
+  output_dir edits it in the cache too.
+- `symlink`: links the files to the cache. The output_dir breaks if the cache entry is deleted.
+- `off`: always downloads.
+
+Compressed files (see `KAGGLEHUB_CACHE_COMPRESSION`) are always decompressed, and archive-backed entries (see
+`KAGGLEHUB_KEEP_ARCHIVES`) extracted.
+"""
+
+import logging
+import os
+import shutil
+import sys
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO
+
+from kagglehub import archives, compression
+
+# From linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+COPY_BUFFER_SIZE = 1024 * 1024  # 1 MiB
+
+logger = logging.getLogger(__name__)
+
+
+def materialize(src_path: str, dst_path: str, mode: str, max_workers: int | None = None) -> None:
+    """Materializes the cache entry at `src_path`, a file, a folder or an archive, at `dst_path`.
+
+    The files of a folder are materialized in parallel, by up to `max_workers` threads.
+    """
+    if archives.is_archive_entry(src_path):
+        with zipfile.ZipFile(src_path) as archive:
+            archive.extractall(dst_path)
+        return
+    if not os.path.isdir(src_path):
+        materialize_file(src_path, dst_path, mode)
+        return
+
+    rel_paths = [
+        os.path.relpath(os.path.join(dirpath, filename), src_path)
+        for dirpath, _, filenames in os.walk(src_path)
+        for filename in filenames
+    ]
+    os.makedirs(dst_path, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(
+            executor.map(
+                lambda rel_path: materialize_file(
+                    os.path.join(src_path, rel_path),
+                    os.path.join(dst_path, compression.get_original_path(rel_path)),
+                    mode,
+                ),
+                rel_paths,
+            )
+        )
+
+
+def materialize_file(src_path: str, dst_path: str, mode: str) -> None:
+    os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+    if compression.is_compressed(src_path):
+        with compression.open_file(src_path) as src, open(dst_path, "wb") as dst:
+            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+        return
+    if mode == "symlink":
+        os.symlink(os.path.abspath(src_path), dst_path)
+        return
+    if mode == "hardlink":
+        try:
+            os.link(src_path, dst_path)
+            return
+        except OSError as e:
+            # e.g. the output_dir is on another filesystem.
+            logger.debug(f"Failed to hardlink '{src_path}', copying it instead: {e}")
+    copy_file(src_path, dst_path)
+
+
+def copy_file(src_path: str, dst_path: str) -> None:
+    """Copies a file, sharing its blocks (reflink) if the filesystem supports it."""
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        if not _clone(src, dst) and not _copy_file_range(src, dst):
+            # Continues from where `copy_file_range` stopped, if it failed midway.
+            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+    shutil.copymode(src_path, dst_path)
+
+
+def _clone(src: IO[bytes], dst: IO[bytes]) -> bool:
+    if sys.platform != "linux":
+        return False
+    import fcntl  # noqa: PLC0415 - not available on Windows
+
+    try:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    except OSError:
+        # Not supported by the filesystem, or across filesystems.
+        return False
+    return True
+
+
+def _copy_file_range(src: IO[bytes], dst: IO[bytes]) -> bool:
+    if not hasattr(os, "copy_file_range"):
+        return False
+    remaining = os.fstat(src.fileno()).st_size
+    try:
+        while remaining > 0:
+            num_bytes = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+            if num_bytes == 0:
+                break
+            remaining -= num_bytes
+    except OSError:
+        # Both file positions moved past the bytes copied so far.
+        return False
+    return True
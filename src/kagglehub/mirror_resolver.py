@@ -0,0 +1,360 @@
+"""Resolvers serving resources from an S3-compatible bucket mirroring Kaggle (see `KAGGLEHUB_MIRROR_URL`).
+
+The bucket mirrors the layout of the kagglehub cache folder, e.g. `<prefix>/datasets/<owner>/<dataset>/versions/<n>/`,
+so a warm cache can be synced to it as is. Only versioned handles are served from the mirror: unversioned handles, and
+resources (or files) missing from the mirror, are resolved by the next resolvers, e.g. over HTTP from Kaggle.
+
+Entries are only served along with the manifest written when they were completed in the synced cache (see
+`kagglehub.manifest`): entries without one, e.g. partially synced, aren't served, and downloaded files are checked
+against it.
+
+Requests are signed with AWS Signature Version 4 when `AWS_ACCESS_KEY_ID` and `AWS_SECRET_ACCESS_KEY` are set, and
+anonymous otherwise. Files are downloaded to the cache with parallel ranged reads of up to `MULTIPART_CHUNK_SIZE` bytes.
+"""
+
+import hashlib
+import hmac
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import TypeVar
+from urllib.parse import quote, urlsplit
+from xml.etree import ElementTree as ET
+
+import requests
+from tqdm.auto import tqdm
+
+from kagglehub import manifest, stats
+from kagglehub.cache import Cache, get_cached_path
+from kagglehub.clients import DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT
+from kagglehub.config import get_cache_folder, get_mirror_credentials, get_mirror_region, get_mirror_url
+from kagglehub.exceptions import DataCorruptionError, UnsupportedResolutionError
+from kagglehub.handle import DatasetHandle, ModelHandle, NotebookHandle
+from kagglehub.resolver import ForceDownload, Resolver
+
+MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MiB
+MIRROR_MAX_WORKERS = 8
+EMPTY_PAYLOAD_SHA256 = hashlib.sha256(b"").hexdigest()
+SIGNING_ALGORITHM = "AWS4-HMAC-SHA256"
+
+T = TypeVar("T", ModelHandle, DatasetHandle, NotebookHandle)
+
+logger = logging.getLogger(__name__)
+
+
+class MirrorClient:
+    """Client for the two S3 API calls the mirror needs: ListObjectsV2 and ranged GetObject."""
+
+    def __init__(self, mirror_url: str, region: str, credentials: tuple[str, str, str | None] | None = None) -> None:
+        parsed = urlsplit(mirror_url)
+        self._endpoint = f"{parsed.scheme}://{parsed.netloc}"
+        self._bucket, _, prefix = parsed.path.strip("/").partition("/")
+        self.prefix = prefix.strip("/")
+        self._region = region
+        self._credentials = credentials
+        self._session = requests.Session()
+
+    def list_objects(self, prefix: str, *, max_keys: int | None = None) -> dict[str, int]:
+        """Returns the size of the objects under the `prefix` folder, keyed by their path relative to it.
+
+        Args:
+            prefix: (string) The folder to list, relative to the mirror's prefix.
+            max_keys: (int) Optional maximum number of objects to list. Lists all the objects if None.
+        """
+        folder = "/".join(part for part in (self.prefix, prefix) if part) + "/"
+        params = {"list-type": "2", "prefix": folder}
+        if max_keys is not None:
+            params["max-keys"] = str(max_keys)
+        sizes: dict[str, int] = {}
+        while True:
+            root = ET.fromstring(self._get(f"/{self._bucket}", params).content)  # noqa: S314 - trusted mirror
+            for contents in root.findall("{*}Contents"):
+                key = contents.findtext("{*}Key", "")
+                if not key.endswith("/"):  # Skip folder markers.
+                    sizes[key.removeprefix(folder)] = int(contents.findtext("{*}Size", "0"))
+            if root.findtext("{*}IsTruncated") != "true" or (max_keys is not None and len(sizes) >= max_keys):
+                return sizes
+            params["continuation-token"] = root.findtext("{*}NextContinuationToken", "")
+
+    def read(self, path: str) -> bytes:
+        """Returns the content of the object at `path`, relative to the mirror's prefix."""
+        return self._get(self._get_object_path(path)).content
+
+    def read_range(self, path: str, start: int, end: int) -> bytes:
+        """Returns the bytes [start, end) of the object at `path`, relative to the mirror's prefix."""
+        return self._get(self._get_object_path(path), headers={"Range": f"bytes={start}-{end - 1}"}).content
+
+    def _get_object_path(self, path: str) -> str:
+        key = "/".join(part for part in (self.prefix, path) if part)
+        return f"/{self._bucket}/{key}"
+
+    def _get(
+        self, path: str, params: dict[str, str] | None = None, headers: dict[str, str] | None = None
+    ) -> requests.Response:
+        url = f"{self._endpoint}{quote(path, safe='/-_.~')}"
+        if params:
+            url += "?" + "&".join(f"{_quote(k)}={_quote(v)}" for k, v in sorted(params.items()))
+        headers = headers or {}
+        if self._credentials:
+            headers = sign(
+                "GET", url, headers, credentials=self._credentials, region=self._region, now=datetime.now(timezone.utc)
+            )
+        response = self._session.get(url, headers=headers, timeout=(DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT))
+        response.raise_for_status()
+        return response
+
+
+def sign(
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    *,
+    credentials: tuple[str, str, str | None],
+    region: str,
+    now: datetime,
+) -> dict[str, str]:
+    """Returns the headers of a request without payload, signed with AWS Signature Version 4 for S3.
+
+    Args:
+        method: (string) The HTTP method.
+        url: (string) The URL, with its path and query string already URI-encoded.
+        headers: (dict) The headers to sign along with the host and the `x-amz-*` ones.
+        credentials: (tuple) The (access key id, secret access key, session token) to sign with.
+        region: (string) The region of the bucket.
+        now: (datetime) The time of the request, in UTC.
+
+    Returns:
+        The given headers, with the `x-amz-*` and `Authorization` ones added.
+    """
+    access_key_id, secret_access_key, session_token = credentials
+    parsed = urlsplit(url)
+    amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+    date = amz_date[:8]
+    signed_headers = {**headers, "x-amz-content-sha256": EMPTY_PAYLOAD_SHA256, "x-amz-date": amz_date}
+    if session_token:
+        signed_headers["x-amz-security-token"] = session_token
+
+    canonical_headers = {name.lower(): " ".join(value.split()) for name, value in signed_headers.items()}
+    canonical_headers["host"] = parsed.netloc
+    signed_header_names = ";".join(sorted(canonical_headers))
+    query_params = [param if "=" in param else f"{param}=" for param in parsed.query.split("&") if param]
+    canonical_request = "\n".join(
+        [
+            method,
+            parsed.path or "/",
+            "&".join(sorted(query_params)),
+            "".join(f"{name}:{value}\n" for name, value in sorted(canonical_headers.items())),
+            signed_header_names,
+            EMPTY_PAYLOAD_SHA256,
+        ]
+    )
+    scope = f"{date}/{region}/s3/aws4_request"
+    string_to_sign = "\n".join(
+        [SIGNING_ALGORITHM, amz_date, scope, hashlib.sha256(canonical_request.encode()).hexdigest()]
+    )
+
+    signing_key = f"AWS4{secret_access_key}".encode()
+    for scope_part in (date, region, "s3", "aws4_request"):
+        signing_key = hmac.new(signing_key, scope_part.encode(), hashlib.sha256).digest()
+    signature = hmac.new(signing_key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+    signed_headers["Authorization"] = (
+        f"{SIGNING_ALGORITHM} Credential={access_key_id}/{scope}, SignedHeaders={signed_header_names}, "
+        f"Signature={signature}"
+    )
+    return signed_headers
+
+
+class _MirrorResolver(Resolver[T]):
+    def is_supported_in_environment(self) -> bool:
+        return get_mirror_url() is not None
+
+    def _resolve_from_cache(
+        self, h: T, path: str | None = None, *, output_dir: str | None = None
+    ) -> tuple[str, int | None] | None:
+        # Only versioned handles are served from the mirror, into the same cache as the HTTP resolvers.
+        if not h.is_versioned():
+            return None
+        cached_path = Cache(override_dir=output_dir).load_from_cache(h, path)
+        if not cached_path:
+            return None
+        stats.record_hit(h)
+        return cached_path, h.version
+
+    def is_supported(self, handle: T, *_, **__) -> bool:  # noqa: ANN002, ANN003
+        if not self.is_supported_in_environment() or not handle.is_versioned():
+            return False
+        try:
+            return bool(_build_client().list_objects(_get_entry_folder(handle), max_keys=1))
+        except Exception as e:
+            # Whatever the failure (network, credentials, unexpected listing), the handle is resolved elsewhere.
+            logger.warning(f"Failed to reach the mirror, skipping it: {e}")
+            return False
+
+    def _resolve(
+        self,
+        h: T,
+        path: str | None = None,
+        *,
+        force_download: ForceDownload = False,
+        output_dir: str | None = None,
+    ) -> tuple[str, int | None]:
+        cache = Cache(override_dir=output_dir)
+        cached_path = cache.load_from_cache(h, path)
+        if cached_path and not force_download:
+            stats.record_hit(h)
+            return cached_path, h.version  # Already cached
+        with cache.lock(h, path):
+            # Another process may have downloaded it while we were waiting for the lock.
+            cached_path = cache.load_from_cache(h, path)
+            if cached_path and not force_download:
+                stats.record_hit(h)
+                return cached_path, h.version
+
+            client = _build_client()
+            entry_folder = _get_entry_folder(h)
+            sizes = client.list_objects(entry_folder)
+            if path and path not in sizes:
+                msg = f"'{path}' isn't in the mirror of '{h}'."
+                raise UnsupportedResolutionError(msg)
+            if not sizes:
+                msg = f"'{h}' isn't in the mirror."
+                raise UnsupportedResolutionError(msg)
+            records = _read_records(client, h, path)
+            if records is None or any(sizes.get(rel_path) != r[manifest.SIZE_FIELD] for rel_path, r in records.items()):
+                msg = f"'{h}' isn't completely in the mirror."
+                raise UnsupportedResolutionError(msg)
+
+            if cached_path:
+                cache.delete_from_cache(h, path)
+            out_path = cache.get_path(h, path)
+            if path:
+                files = [(f"{entry_folder}/{path}", out_path, sizes[path])]
+                # Records of single files are relative to the folder containing them.
+                records = {os.path.basename(path): records[path]}
+            else:
+                files = [
+                    (f"{entry_folder}/{rel_path}", _get_target_path(out_path, rel_path), sizes[rel_path])
+                    for rel_path in records
+                ]
+            try:
+                _download(client, files)
+            except (requests.RequestException, DataCorruptionError) as e:
+                cache.delete_from_cache(h, path)
+                msg = f"Failed to download '{h}' from the mirror: {e}"
+                raise UnsupportedResolutionError(msg) from e
+            bad_files = manifest.verify(cache.get_manifest_base_path(h, path), records)
+            if bad_files:
+                cache.delete_from_cache(h, path)
+                msg = f"Files of '{h}' in the mirror don't match its manifest: {', '.join(bad_files)}."
+                raise UnsupportedResolutionError(msg)
+            stats.record_miss(h)
+            return cache.mark_as_complete(h, path, records=records), h.version
+
+
+class ModelMirrorResolver(_MirrorResolver[ModelHandle]):
+    pass
+
+
+class DatasetMirrorResolver(_MirrorResolver[DatasetHandle]):
+    pass
+
+
+class NotebookOutputMirrorResolver(_MirrorResolver[NotebookHandle]):
+    pass
+
+
+def _build_client() -> MirrorClient:
+    mirror_url = get_mirror_url()
+    if mirror_url is None:
+        msg = "The mirror isn't set."
+        raise ValueError(msg)
+    return MirrorClient(mirror_url, get_mirror_region(), get_mirror_credentials())
+
+
+def _get_entry_folder(h: ModelHandle | DatasetHandle | NotebookHandle) -> str:
+    # The mirror has the layout of the cache folder.
+    return os.path.relpath(get_cached_path(h), get_cache_folder()).replace(os.path.sep, "/")
+
+
+def _read_records(
+    client: MirrorClient, h: ModelHandle | DatasetHandle | NotebookHandle, path: str | None
+) -> manifest.FileRecords | None:
+    """Returns the manifest records of the entry in the mirror, relative to its folder, or None if it has no manifest.
+
+    Files are served from the manifest of the whole resource, or from their own if the resource has none.
+    """
+    entry_manifest = _read_manifest(client, h, None)
+    if entry_manifest is not None and (path is None or path in entry_manifest):
+        return {path: entry_manifest[path]} if path else entry_manifest
+    if path is None:
+        return None
+    file_manifest = _read_manifest(client, h, path)
+    record = file_manifest.get(os.path.basename(path)) if file_manifest else None
+    return {path: record} if record else None
+
+
+def _read_manifest(
+    client: MirrorClient, h: ModelHandle | DatasetHandle | NotebookHandle, path: str | None
+) -> manifest.FileRecords | None:
+    manifest_path = os.path.relpath(Cache().get_manifest_path(h, path), get_cache_folder()).replace(os.path.sep, "/")
+    try:
+        entry_manifest = manifest.loads(client.read(manifest_path))
+    except requests.HTTPError as e:
+        if e.response is not None and e.response.status_code == 404:  # noqa: PLR2004
+            return None
+        raise
+    if entry_manifest is None:
+        return None
+    _, _, records = entry_manifest
+    return records
+
+
+def _get_target_path(out_path: str, rel_path: str) -> str:
+    target_path = os.path.abspath(os.path.join(out_path, rel_path))
+    if os.path.commonpath([os.path.abspath(out_path), target_path]) != os.path.abspath(out_path):
+        msg = f"Invalid mirror object outside of the entry's folder: '{rel_path}'."
+        raise ValueError(msg)
+    return target_path
+
+
+def _download(client: MirrorClient, files: list[tuple[str, str, int]]) -> None:
+    """Downloads the (object path, destination path, size) files, in parts read in parallel."""
+    parts: list[tuple[str, str, int, int]] = []
+    for src_path, dst_path, size in files:
+        os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+        with open(dst_path, "wb") as f:
+            f.truncate(size)
+        parts.extend(
+            (src_path, dst_path, start, min(start + MULTIPART_CHUNK_SIZE, size))
+            for start in range(0, size, MULTIPART_CHUNK_SIZE)
+        )
+
+    progress_lock = threading.Lock()
+    with tqdm(
+        total=sum(size for _, _, size in files),
+        desc=f"Downloading {len(files)} files from the mirror",
+        unit="B",
+        unit_scale=True,
+        unit_divisor=1024,
+    ) as progress_bar:
+
+        def _download_part(src_path: str, dst_path: str, start: int, end: int) -> None:
+            data = client.read_range(src_path, start, end)
+            if len(data) != end - start:
+                msg = f"Expected {end - start} bytes from '{src_path}' at offset {start}, got {len(data)}."
+                raise DataCorruptionError(msg)
+            with open(dst_path, "r+b") as f:
+                f.seek(start)
+                f.write(data)
+            with progress_lock:
+                progress_bar.update(len(data))
+
+        with ThreadPoolExecutor(max_workers=MIRROR_MAX_WORKERS) as executor:
+            list(executor.map(lambda part: _download_part(*part), parts))
+
+
+def _quote(value: str) -> str:
+    return quote(value, safe="-_.~")
@@ -7,6 +7,7 @@ from kagglehub.gcs_upload import normalize_patterns, upload_files_and_directorie
 from kagglehub.handle import parse_model_handle
 from kagglehub.logger import EXTRA_CONSOLE_BLOCK
 from kagglehub.models_helpers import create_model_if_missing, create_model_instance_or_version
+from kagglehub.resolver import ForceDownload
 from kagglehub.signing import sign_with_sigstore
 
 logger = logging.getLogger(__name__)
@@ -19,7 +20,7 @@ def model_download(
     handle: str,
     path: str | None = None,
     *,
-    force_download: bool | None = False,
+    force_download: ForceDownload = False,
     output_dir: str | None = None,
 ) -> str:
     """Download model files.
@@ -27,8 +28,10 @@ def model_download(
     Args:
         handle: (string) the model handle.
         path: (string) Optional path to a file within the model bundle.
-        force_download: (bool) Optional flag to force download a model, even if it's cached or already in output_dir.
-        output_dir: (string) Optional output directory for direct download, bypassing the default cache.
+        force_download: (bool | "revalidate") Optional flag to force download a model, even if it's cached or already
+            in output_dir. With "revalidate", only the files that are missing or don't match are downloaded again.
+        output_dir: (string) Optional output directory for direct download, bypassing the default cache. Copied
+            from the default cache if it already holds the resource (see `KAGGLEHUB_OUTPUT_DIR_LINK_MODE`).
 
     Returns:
         A string representing the path to the requested model files.
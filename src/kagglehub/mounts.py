@@ -0,0 +1,201 @@
+"""Waiting for datasources mounted by the Kaggle and Colab notebook environments.
+
+Attaching a datasource returns before its folder is mounted. Instead of polling at a fixed interval, waiters watch the
+closest existing parent of the mount folder with inotify (Linux) and check again as soon as anything is created in it.
+Checks also run on an exponential backoff, starting at `INITIAL_POLL_INTERVAL`, which is all waiters rely on where
+inotify isn't available (or can't see the change, e.g. on some network filesystems).
+
+Mounts stay for the lifetime of the notebook session: once waited for, they are remembered per process and reused by
+later resolutions of the same handle, without attaching the datasource again, as long as their folder still exists.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from types import TracebackType
+
+from kagglehub.exceptions import MountTimeoutError
+from kagglehub.handle import ResourceHandle
+
+INITIAL_POLL_INTERVAL = 0.02  # seconds
+MAX_POLL_INTERVAL = 1  # seconds
+MOUNT_WAIT_LOG_INTERVAL = 30  # seconds
+
+# From sys/inotify.h
+IN_ATTRIB = 0x00000004
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CREATE | IN_MOVED_TO | IN_ATTRIB
+EVENTS_BUFFER_SIZE = 4096
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Mount:
+    """A datasource attached to the notebook, which may not be mounted yet."""
+
+    handle: ResourceHandle
+    base_mount_path: str
+    mount_slug: str
+    version: int | None
+
+    @property
+    def path(self) -> str:
+        return f"{self.base_mount_path}/{self.mount_slug}"
+
+
+# (handle, version pinned by the Package in scope) -> mount
+_mounts: dict[tuple[ResourceHandle, int | None], Mount] = {}
+_mounts_lock = threading.Lock()
+
+
+def get_mount(h: ResourceHandle) -> Mount | None:
+    """Returns the mount remembered for `h`, if its folder still exists."""
+    key = _mount_key(h)
+    with _mounts_lock:
+        mount = _mounts.get(key)
+    if mount is None:
+        return None
+    if not os.path.isdir(mount.path):
+        # e.g. the datasource was detached from the notebook.
+        with _mounts_lock:
+            _mounts.pop(key, None)
+        return None
+    return mount
+
+
+def remember_mount(mount: Mount) -> None:
+    with _mounts_lock:
+        _mounts[_mount_key(mount.handle)] = mount
+
+
+def clear_mounts() -> None:
+    """Forget all the remembered mounts, e.g. to attach the latest version of unversioned handles again."""
+    with _mounts_lock:
+        _mounts.clear()
+
+
+def _mount_key(h: ResourceHandle) -> tuple[ResourceHandle, int | None]:
+    # Unversioned handles are attached at the version pinned by the Package in scope, if any.
+    from kagglehub.packages import PackageScope  # noqa: PLC0415 - avoid circular import
+
+    return (h, PackageScope.get_version(h))
+
+
+def wait_for_mount(path: str, *, timeout: float | None = None) -> None:
+    """Waits for `path` to exist.
+
+    Args:
+        path: (string) The folder (or file) of the mounted datasource.
+        timeout: (float) Optional number of seconds to wait. Waits forever if None.
+
+    Raises:
+        MountTimeoutError: if `path` still doesn't exist after `timeout` seconds.
+    """
+    if os.path.exists(path):
+        return
+
+    start = time.monotonic()
+    last_log = start
+    interval = INITIAL_POLL_INTERVAL
+    with _open_watcher() as watcher:
+        while not os.path.exists(path):
+            now = time.monotonic()
+            if timeout is not None and now - start >= timeout:
+                msg = f"Timed out after {timeout}s waiting for '{path}' to be mounted."
+                raise MountTimeoutError(msg)
+            if now - last_log >= MOUNT_WAIT_LOG_INTERVAL:
+                logger.info(f"Still waiting for '{path}' to be mounted after {now - start:.0f}s...")
+                last_log = now
+
+            # The closest existing parent changes as the parents of a nested mount folder are created.
+            watcher.watch(_get_closest_existing_parent(path))
+            wait_time = interval if timeout is None else min(interval, timeout - (now - start))
+            watcher.wait(max(wait_time, 0))
+            interval = min(interval * 2, MAX_POLL_INTERVAL)
+
+
+class _PollingWatcher:
+    """Watcher that only waits: changes are noticed by the next check."""
+
+    def watch(self, path: str) -> None:
+        pass
+
+    def wait(self, timeout: float) -> None:
+        time.sleep(timeout)
+
+    def __enter__(self) -> "_PollingWatcher":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        pass
+
+
+class _InotifyWatcher(_PollingWatcher):
+    """Watcher waking up as soon as an entry is created in, or moved to, one of the watched folders."""
+
+    def __init__(self) -> None:
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._watched: set[str] = set()
+
+    def watch(self, path: str) -> None:
+        if path in self._watched:
+            return
+        if self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK) < 0:
+            # e.g. out of watches: the backoff still notices the change.
+            logger.debug(f"Failed to watch '{path}': {os.strerror(ctypes.get_errno())}")
+        self._watched.add(path)
+
+    def wait(self, timeout: float) -> None:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if readable:
+            try:
+                while os.read(self._fd, EVENTS_BUFFER_SIZE):
+                    pass
+            except BlockingIOError:
+                # All the events were read.
+                pass
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        os.close(self._fd)
+
+
+def _open_watcher() -> _PollingWatcher:
+    if sys.platform != "linux":
+        return _PollingWatcher()
+    try:
+        return _InotifyWatcher()
+    except (OSError, AttributeError) as e:
+        # e.g. no inotify instances left, or a libc without inotify.
+        logger.debug(f"Failed to set up inotify, polling instead: {e}")
+        return _PollingWatcher()
+
+
+def _get_closest_existing_parent(path: str) -> str:
+    parent = os.path.dirname(os.path.abspath(path))
+    while not os.path.isdir(parent) and os.path.dirname(parent) != parent:
+        parent = os.path.dirname(parent)
+    return parent
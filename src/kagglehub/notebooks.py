@@ -3,6 +3,7 @@ import logging
 from kagglehub import registry
 from kagglehub.handle import parse_notebook_handle
 from kagglehub.logger import EXTRA_CONSOLE_BLOCK
+from kagglehub.resolver import ForceDownload
 
 logger = logging.getLogger(__name__)
 
@@ -11,7 +12,7 @@ def notebook_output_download(
     handle: str,
     path: str | None = None,
     *,
-    force_download: bool | None = False,
+    force_download: ForceDownload = False,
     output_dir: str | None = None,
 ) -> str:
     """Download notebook output files.
@@ -19,9 +20,11 @@ def notebook_output_download(
     Args:
         handle: (string) the notebook handle under https://kaggle.com/code.
         path: (string) Optional path to a file within the notebook output.
-        force_download: (bool) Optional flag to force download a notebook output, even if it's cached or already in
-            output_dir.
-        output_dir: (string) Optional output directory for direct download, bypassing the default cache.
+        force_download: (bool | "revalidate") Optional flag to force download a notebook output, even if it's cached
+            or already in output_dir. With "revalidate", only the files that are missing or don't match are downloaded
+            again.
+        output_dir: (string) Optional output directory for direct download, bypassing the default cache. Copied
+            from the default cache if it already holds the resource (see `KAGGLEHUB_OUTPUT_DIR_LINK_MODE`).
 
 
     Returns:
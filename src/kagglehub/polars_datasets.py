@@ -10,6 +10,7 @@ from typing import Any
 # list of `polars-datasets` optional dependencies in pyproject.toml.
 import polars as pl
 
+from kagglehub.compression import is_compressed, open_file
 from kagglehub.datasets import PolarsFrameType, dataset_download
 
 
@@ -113,11 +114,19 @@ def load_polars_dataset(
 
     # Now that everything has been validated, we can start downloading and processing
     filepath = dataset_download(handle, path)
+    if is_compressed(filepath) and io_frame_type is PolarsFrameType.LAZY_FRAME:
+        # The scan_* methods need a file they can read as is: read the decompressed file instead.
+        io_function, io_frame_type = SUPPORTED_READ_FUNCTIONS_BY_EXTENSION[file_extension], PolarsFrameType.DATA_FRAME
     try:
-        result = io_function(
-            *_build_args(io_function, filepath, sql_query),
-            **_build_kwargs(file_extension, polars_kwargs),
-        )
+        if is_compressed(filepath):
+            # Text files stored compressed in the cache (see KAGGLEHUB_CACHE_COMPRESSION) are decompressed on the fly.
+            with open_file(filepath) as f:
+                result = io_function(f, **_build_kwargs(file_extension, polars_kwargs))
+        else:
+            result = io_function(
+                *_build_args(io_function, filepath, sql_query),
+                **_build_kwargs(file_extension, polars_kwargs),
+            )
     except Exception as e:
         read_error_message = f"Error reading file: {e}"
         raise ValueError(read_error_message) from e
@@ -0,0 +1,484 @@
+"""Caching proxy for the subset of the Kaggle API used to download resources.
+
+Run it with `kagglehub serve` on a machine close to the clients, and point the clients to it by setting
+`KAGGLEHUB_PROXY_URL`:
+
+- Metadata calls (version lookups, file listings) are forwarded upstream with the caller's credentials. Their responses
+  are cached for a short time and identical concurrent calls are coalesced.
+- Download calls are authorized upstream with the caller's credentials, then redirected to a blob served by the proxy.
+  Blobs are keyed on the upstream object and its validators (content hash, generation, ETag or Last-Modified), which
+  are checked upstream on every call: each version of an object is fetched once into the proxy's cache folder.
+  Clients requesting a blob while it is being fetched stream it as it is being written. Objects without validators
+  are streamed through without being cached.
+- Like the storage URLs upstream redirects to, blob URLs are signed, for `BLOB_URL_TTL` seconds: only callers authorized
+  upstream can read blobs.
+
+The proxy listens on localhost by default: pass another interface to `serve` to share it with other machines.
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import os
+import re
+import secrets
+import socket
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import IO, Any
+from urllib.parse import parse_qs, quote, unquote, urlencode, urlparse
+
+import requests
+from kagglesdk.kaggle_env import KaggleEnv, get_endpoint, get_env
+
+from kagglehub.cache import PROXY_CACHE_SUBFOLDER
+from kagglehub.config import get_cache_folder
+from kagglehub.exceptions import DataCorruptionError
+from kagglehub.integrity import GCS_HASH_HEADER, get_md5_checksum_from_response, to_b64_digest
+from kagglehub.single_flight import SingleFlight
+
+DEFAULT_HOST = "127.0.0.1"
+ALL_INTERFACES = ("", "0.0.0.0")  # noqa: S104
+DEFAULT_PORT = 8080
+BLOBS_PATH_PREFIX = "/blobs/"
+BLOB_URL_TTL = 3600  # seconds
+DEFAULT_METADATA_TTL = 60  # seconds
+CHUNK_SIZE = 1048576
+DEFAULT_CONNECT_TIMEOUT = 5  # seconds
+DEFAULT_READ_TIMEOUT = 15  # seconds
+
+FORWARDED_REQUEST_HEADERS = ("Authorization", "User-Agent", "Content-Type")
+FORWARDED_RESPONSE_HEADERS = ("Content-Type", "X-Kaggle-HubVersion")
+FORWARDED_BLOB_HEADERS = ("Content-Type", "Last-Modified", GCS_HASH_HEADER)
+# Headers identifying the version of an upstream object, most specific first.
+VALIDATOR_HEADERS = (GCS_HASH_HEADER, "x-goog-generation", "ETag", "Last-Modified")
+
+_RPC_PATH_RE = re.compile(r"^(?:/api)?/v1/(?P<service>[\w.]+)/(?P<method>\w+)$")
+_BLOB_PATH_RE = re.compile(rf"^{BLOBS_PATH_PREFIX}(?P<key>[0-9a-f]{{64}})/(?P<filename>[^/]+)$")
+_RANGE_RE = re.compile(r"^bytes=(?P<start>\d+)-(?P<end>\d*)$")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _UpstreamResponse:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+class _BlobFetch:
+    """Tracks a blob being fetched from upstream, so readers can stream it while it is being written."""
+
+    def __init__(self, meta: dict[str, Any]) -> None:
+        self.meta = meta
+        self.size = 0
+        self.done = False
+        self.error: str | None = None
+        self.cond = threading.Condition()
+
+    def wait_for(self, offset: int) -> bool:
+        """Blocks until bytes past `offset` are written. Returns False if the blob is shorter than that."""
+        with self.cond:
+            while self.size <= offset and not self.done:
+                self.cond.wait()
+            if self.error is not None:
+                msg = f"Fetching blob failed: {self.error}"
+                raise OSError(msg)
+            return self.size > offset
+
+
+class BlobStore:
+    """Blobs fetched from upstream, stored in a folder and keyed by a hex digest.
+
+    A blob is complete once its `<key>.json` metadata file exists next to its data file.
+    """
+
+    def __init__(self, folder: str) -> None:
+        self._folder = folder
+        self._lock = threading.Lock()
+        self._fetches: dict[str, _BlobFetch] = {}
+        self._starting: SingleFlight[_UpstreamResponse | None] = SingleFlight()
+        os.makedirs(folder, exist_ok=True)
+
+    def has(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: str) -> tuple[dict[str, Any], _BlobFetch | None] | None:
+        """Returns the metadata of the blob and, if it is still being fetched, its fetch progress."""
+        with self._lock:
+            fetch = self._fetches.get(key)
+            if fetch is not None:
+                return fetch.meta, fetch
+        try:
+            with open(self._meta_path(key)) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return (meta, None) if os.path.exists(self._data_path(key)) else None
+
+    def fetch(
+        self, key: str, filename: str, open_response: Callable[[], requests.Response]
+    ) -> _UpstreamResponse | None:
+        """Stores blob `key` from the streaming response returned by `open_response`, unless already stored.
+
+        `open_response` is called at most once across concurrent callers for the same key. This returns as soon as the
+        response headers are received, the body is stored by a background thread.
+
+        Returns:
+            The upstream error response if the blob couldn't be fetched, None otherwise.
+        """
+        return self._starting.do(key, lambda: self._start_fetch(key, filename, open_response))
+
+    def _start_fetch(
+        self, key: str, filename: str, open_response: Callable[[], requests.Response]
+    ) -> _UpstreamResponse | None:
+        if self.has(key):
+            return None
+        response = open_response()
+        if not response.ok:
+            return _read_upstream_response(response)
+
+        content_length = response.headers.get("Content-Length")
+        meta = {
+            "filename": filename,
+            "size": int(content_length) if content_length else None,
+            "headers": {name: response.headers[name] for name in FORWARDED_BLOB_HEADERS if name in response.headers},
+        }
+        fetch = _BlobFetch(meta)
+        # Create the data file before registering the fetch so readers can open it right away.
+        f = open(self._data_path(key), "wb")
+        with self._lock:
+            self._fetches[key] = fetch
+        threading.Thread(
+            target=self._fetch, args=(key, response, f, fetch), name="kagglehub-proxy-fetch", daemon=True
+        ).start()
+        return None
+
+    def read(self, key: str, fetch: _BlobFetch | None, start: int = 0, end: int | None = None) -> Iterator[bytes]:
+        """Yields the bytes of the blob in [start, end), waiting for them if the blob is still being fetched."""
+        with open(self._data_path(key), "rb") as f:
+            f.seek(start)
+            offset = start
+            while end is None or offset < end:
+                if fetch is not None and not fetch.wait_for(offset):
+                    return
+                chunk = f.read(CHUNK_SIZE if end is None else min(CHUNK_SIZE, end - offset))
+                if not chunk:
+                    if fetch is None or fetch.done:
+                        return
+                    continue
+                offset += len(chunk)
+                yield chunk
+
+    def _fetch(self, key: str, response: requests.Response, f: IO[bytes], fetch: _BlobFetch) -> None:
+        expected_md5_hash = get_md5_checksum_from_response(response)
+        hash_object = hashlib.md5() if expected_md5_hash else None
+        try:
+            with response, f:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    f.write(chunk)
+                    f.flush()
+                    if hash_object:
+                        hash_object.update(chunk)
+                    with fetch.cond:
+                        fetch.size += len(chunk)
+                        fetch.cond.notify_all()
+            if hash_object and to_b64_digest(hash_object) != expected_md5_hash:
+                msg = f"MD5 checksum mismatch for blob {key} ({fetch.meta['filename']})."
+                raise DataCorruptionError(msg)
+
+            fetch.meta["size"] = fetch.size
+            tmp_meta_path = f"{self._meta_path(key)}.tmp"
+            with open(tmp_meta_path, "w") as meta_file:
+                json.dump(fetch.meta, meta_file)
+            os.replace(tmp_meta_path, self._meta_path(key))
+            logger.info(f"Cached {fetch.meta['filename']} ({fetch.size} bytes) as blob {key}.")
+        except Exception as e:
+            logger.warning(f"Failed to fetch {fetch.meta['filename']} as blob {key}: {e}")
+            fetch.error = str(e)
+            try:
+                os.remove(self._data_path(key))
+            except FileNotFoundError:
+                pass
+        finally:
+            with self._lock:
+                del self._fetches[key]
+            with fetch.cond:
+                fetch.done = True
+                fetch.cond.notify_all()
+
+    def _data_path(self, key: str) -> str:
+        return os.path.join(self._folder, key)
+
+    def _meta_path(self, key: str) -> str:
+        return os.path.join(self._folder, f"{key}.json")
+
+
+class ProxyServer(ThreadingHTTPServer):
+    """HTTP caching proxy for the Kaggle API.
+
+    Args:
+        server_address: (tuple) The (host, port) to listen on. Use port 0 to pick a free port. Defaults to localhost.
+        cache_dir: (string) Optional folder to store blobs in. Defaults to a subfolder of the kagglehub cache folder.
+        upstream: (string) Optional base URL of the Kaggle API. Defaults to the one of the current environment.
+        metadata_ttl: (float) Number of seconds metadata responses are cached for. Set to 0 to disable caching.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        server_address: tuple[str, int] = (DEFAULT_HOST, DEFAULT_PORT),
+        *,
+        cache_dir: str | None = None,
+        upstream: str | None = None,
+        metadata_ttl: float = DEFAULT_METADATA_TTL,
+    ) -> None:
+        super().__init__(server_address, _ProxyRequestHandler)
+        self.upstream = (upstream or _get_upstream_base_url()).rstrip("/")
+        self.blobs = BlobStore(os.path.join(cache_dir or get_cache_folder(), PROXY_CACHE_SUBFOLDER, "blobs"))
+        self.metadata_ttl = metadata_ttl
+        self._metadata_cache: dict[tuple, tuple[float, _UpstreamResponse]] = {}
+        self._metadata_lock = threading.Lock()
+        self._single_flight: SingleFlight[_UpstreamResponse] = SingleFlight()
+        # Blob URLs signed by a previous run of the proxy aren't valid anymore.
+        self._signing_key = secrets.token_bytes(32)
+
+    @property
+    def url(self) -> str:
+        """URL clients reach the proxy at. When listening on all interfaces, it uses the host name of the machine."""
+        host, port = self.server_address[:2]
+        if str(host) in ALL_INTERFACES:
+            host = socket.gethostname()
+        return f"http://{host!s}:{port}"
+
+    def sign_blob_path(self, path: str) -> str:
+        """Returns the path of a blob with a signature letting callers read it for `BLOB_URL_TTL` seconds."""
+        expires = str(int(time.time()) + BLOB_URL_TTL)
+        return f"{path}?{urlencode({'Expires': expires, 'Signature': self._get_signature(path, expires)})}"
+
+    def is_signed(self, path: str, query: str) -> bool:
+        params = parse_qs(query)
+        expires = params.get("Expires", [""])[0]
+        signature = params.get("Signature", [""])[0]
+        if not expires.isdigit() or int(expires) < time.time():
+            return False
+        return hmac.compare_digest(signature, self._get_signature(path, expires))
+
+    def _get_signature(self, path: str, expires: str) -> str:
+        return hmac.new(self._signing_key, f"{path}\n{expires}".encode(), hashlib.sha256).hexdigest()
+
+    def get_metadata(self, key: tuple, fetch: Callable[[], _UpstreamResponse]) -> _UpstreamResponse:
+        """Returns the cached upstream response for `key`, calling `fetch` once on cache miss."""
+        now = time.monotonic()
+        with self._metadata_lock:
+            entry = self._metadata_cache.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+        response = self._single_flight.do(key, fetch)
+        if response.status == 200 and self.metadata_ttl > 0:  # noqa: PLR2004
+            with self._metadata_lock:
+                self._metadata_cache = {k: v for k, v in self._metadata_cache.items() if v[0] > now}
+                self._metadata_cache[key] = (time.monotonic() + self.metadata_ttl, response)
+        return response
+
+
+class _ProxyRequestHandler(BaseHTTPRequestHandler):
+    server: ProxyServer
+
+    def do_POST(self) -> None:
+        match = _RPC_PATH_RE.match(self.path)
+        if match is None:
+            self.send_error(404)
+            return
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        rpc = f"{match['service']}/{match['method']}"
+        url = f"{self.server.upstream}/v1/{rpc}"
+        try:
+            if match["method"].startswith("Download"):
+                self._download(rpc, url, body)
+            elif match["method"].startswith(("Get", "List")):
+                # Credentials are part of the key: callers must not see resources they don't have access to.
+                key = (rpc, body, self.headers.get("Authorization"))
+                self._send(self.server.get_metadata(key, lambda: self._call_upstream(url, body)))
+            else:
+                self._send(self._call_upstream(url, body))
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Upstream call {rpc} failed: {e}")
+            self.send_error(502, explain=str(e))
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        if not self.server.is_signed(url.path, url.query):
+            self.send_error(403)
+            return
+        match = _BLOB_PATH_RE.match(url.path)
+        entry = self.server.blobs.get(match["key"]) if match else None
+        if match is None or entry is None:
+            self.send_error(404)
+            return
+        meta, fetch = entry
+
+        size = meta["size"]
+        start, end = 0, size
+        range_match = _RANGE_RE.match(self.headers.get("Range", ""))
+        if range_match and size is not None:
+            start = int(range_match["start"])
+            end = min(int(range_match["end"]) + 1, size) if range_match["end"] else size
+            if start >= size:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end - 1}/{size}")
+        else:
+            self.send_response(200)
+        for name, value in meta["headers"].items():
+            self.send_header(name, value)
+        if size is not None:
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("Content-Length", str(end - start))
+        self.end_headers()
+
+        try:
+            for chunk in self.server.blobs.read(match["key"], fetch, start, end):
+                self.wfile.write(chunk)
+        except OSError as e:
+            # The client went away or the upstream fetch failed. The client detects the truncated response.
+            logger.debug(f"Stopped serving blob {match['key']}: {e}")
+            self.close_connection = True
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002, ANN401
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+    def _download(self, rpc: str, url: str, body: bytes) -> None:
+        upstream = requests.post(
+            url,
+            data=body,
+            headers=self._forwarded_headers(),
+            allow_redirects=False,
+            stream=True,
+            timeout=(DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT),
+        )
+        if upstream.is_redirect:
+            # Signed URLs differ on every call, key the blob on the object they point to.
+            location = upstream.headers["Location"]
+            upstream.close()
+            source = location.split("?")[0].encode("utf-8")
+            filename = unquote(urlparse(location).path.split("/")[-1])
+            upstream = requests.get(location, stream=True, timeout=(DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT))
+        elif upstream.ok and "application/json" not in upstream.headers.get("Content-Type", ""):
+            # The content is served directly by the API.
+            source = rpc.encode("utf-8") + body
+            filename = rpc.rsplit("/", maxsplit=1)[-1]
+        else:
+            self._send(_read_upstream_response(upstream))
+            return
+        if not upstream.ok:
+            self._send(_read_upstream_response(upstream))
+            return
+
+        validators = [upstream.headers.get(name, "") for name in VALIDATOR_HEADERS]
+        if not any(validators):
+            # A stored blob couldn't be told apart from a newer version of the object.
+            self._relay(upstream)
+            return
+        key = hashlib.sha256(b"\n".join([source, *(v.encode("utf-8") for v in validators)])).hexdigest()
+        used = threading.Event()
+
+        def _use_upstream() -> requests.Response:
+            used.set()
+            return upstream
+
+        error = self.server.blobs.fetch(key, filename, _use_upstream)
+        if not used.is_set():
+            # The blob is already stored: only its validators were needed.
+            upstream.close()
+        if error is not None:
+            self._send(error)
+            return
+
+        self.send_response(302)
+        self.send_header("Location", self.server.sign_blob_path(f"{BLOBS_PATH_PREFIX}{key}/{quote(filename)}"))
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _relay(self, upstream: requests.Response) -> None:
+        with upstream:
+            self.send_response(upstream.status_code)
+            for name in (*FORWARDED_BLOB_HEADERS, "Content-Length"):
+                if name in upstream.headers:
+                    self.send_header(name, upstream.headers[name])
+            self.end_headers()
+            try:
+                for chunk in upstream.iter_content(CHUNK_SIZE):
+                    self.wfile.write(chunk)
+            except (OSError, requests.exceptions.RequestException) as e:
+                # The client detects the truncated response.
+                logger.debug(f"Stopped relaying {upstream.url}: {e}")
+                self.close_connection = True
+
+    def _call_upstream(self, url: str, body: bytes) -> _UpstreamResponse:
+        response = requests.post(
+            url,
+            data=body,
+            headers=self._forwarded_headers(),
+            timeout=(DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT),
+        )
+        return _read_upstream_response(response)
+
+    def _forwarded_headers(self) -> dict[str, str]:
+        return {name: self.headers[name] for name in FORWARDED_REQUEST_HEADERS if name in self.headers}
+
+    def _send(self, response: _UpstreamResponse) -> None:
+        self.send_response(response.status)
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(response.body)))
+        self.end_headers()
+        self.wfile.write(response.body)
+
+
+def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    *,
+    cache_dir: str | None = None,
+    upstream: str | None = None,
+    metadata_ttl: float = DEFAULT_METADATA_TTL,
+) -> None:
+    """Runs the caching proxy until interrupted.
+
+    Args:
+        host: (string) Interface to listen on. Use "0.0.0.0" to serve other machines.
+        port: (int) Port to listen on.
+        cache_dir: (string) Optional folder to store blobs in. Defaults to a subfolder of the kagglehub cache folder.
+        upstream: (string) Optional base URL of the Kaggle API. Defaults to the one of the current environment.
+        metadata_ttl: (float) Number of seconds metadata responses are cached for. Set to 0 to disable caching.
+    """
+    with ProxyServer((host, port), cache_dir=cache_dir, upstream=upstream, metadata_ttl=metadata_ttl) as server:
+        logger.info(f"Serving the Kaggle API on {server.url}. Set KAGGLEHUB_PROXY_URL={server.url} on clients.")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def _read_upstream_response(response: requests.Response) -> _UpstreamResponse:
+    with response:
+        headers = {name: response.headers[name] for name in FORWARDED_RESPONSE_HEADERS if name in response.headers}
+        return _UpstreamResponse(response.status_code, headers, response.content)
+
+
+def _get_upstream_base_url() -> str:
+    # Mirrors how kagglesdk builds request URLs.
+    env = get_env()
+    endpoint = get_endpoint(env)
+    return endpoint if env == KaggleEnv.PROD else f"{endpoint}/api"
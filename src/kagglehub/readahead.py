@@ -0,0 +1,164 @@
+"""Background readahead of resolved files into the page cache.
+
+The first pass over freshly mounted (e.g. `/kaggle/input`) or freshly downloaded files pays cold-read latency on every
+file. A `Prefetcher` walks the files in the order they will be read and, from a background thread, asks the kernel to
+read them ahead (`posix_fadvise(POSIX_FADV_WILLNEED)`), or reads them itself where that isn't available. It stays at
+most `max_bytes_ahead` bytes ahead of the consumer, which advances by iterating over the prefetcher.
+"""
+
+import fnmatch
+import logging
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from types import TracebackType
+
+DEFAULT_MAX_BYTES_AHEAD = 1024**3  # 1 GiB
+READ_BUFFER_SIZE = 1024 * 1024  # 1 MiB
+PREFETCH_METHODS = ("auto", "fadvise", "read")
+
+logger = logging.getLogger(__name__)
+
+
+def prefetch(
+    path: str,
+    files: Iterable[str] | str | None = None,
+    *,
+    max_bytes_ahead: int = DEFAULT_MAX_BYTES_AHEAD,
+    method: str = "auto",
+) -> "Prefetcher":
+    """Starts reading the files of a resolved path ahead of their consumer, in the background.
+
+    Args:
+        path: (string) A path returned by any of the `*_download` functions: a folder or a single file.
+        files: (Iterable[str] | string) Optional access order, as paths relative to `path`, or a glob pattern matched
+            against them (e.g. `"train/*.parquet"`). All the files, sorted, if None.
+        max_bytes_ahead: (int) Maximum number of bytes read ahead of the consumer.
+        method: (string) `fadvise` to let the kernel read the files ahead, `read` to read them from the background
+            thread, or `auto` (default) to use `fadvise` where available.
+
+    Returns:
+        A `Prefetcher` to iterate over, yielding the full path of each file in order. Stop it (or use it as a context
+        manager) to stop prefetching early.
+    """
+    if method not in PREFETCH_METHODS:
+        msg = f"Invalid prefetch method '{method}', expected one of {PREFETCH_METHODS}."
+        raise ValueError(msg)
+    if method == "auto":
+        method = "fadvise" if hasattr(os, "posix_fadvise") else "read"
+    prefetcher = Prefetcher(_list_files(path, files), max_bytes_ahead=max_bytes_ahead, method=method)
+    prefetcher.start()
+    return prefetcher
+
+
+class Prefetcher:
+    """Reads files ahead of their consumer, from a background thread, within a budget of bytes.
+
+    Iterating over the prefetcher yields the files in order: requesting a file marks the previous ones as consumed,
+    which lets the prefetcher read further ahead.
+    """
+
+    def __init__(self, file_paths: list[str], *, max_bytes_ahead: int, method: str) -> None:
+        self.file_paths = file_paths
+        self._sizes = [_get_size(file_path) for file_path in file_paths]
+        self._max_bytes_ahead = max_bytes_ahead
+        self._method = method
+        self._condition = threading.Condition()
+        self._consumed_index = 0  # Files before this index were consumed.
+        self._prefetched_index = 0  # Files before this index were prefetched.
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="kagglehub-prefetch", daemon=True)
+
+    @property
+    def prefetched_count(self) -> int:
+        """Number of files prefetched so far."""
+        with self._condition:
+            return self._prefetched_index
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops prefetching and waits for the background thread to exit."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def __iter__(self) -> Iterator[str]:
+        for index, file_path in enumerate(self.file_paths):
+            with self._condition:
+                self._consumed_index = index
+                self._condition.notify_all()
+            yield file_path
+        with self._condition:
+            self._consumed_index = len(self.file_paths)
+            self._condition.notify_all()
+
+    def __enter__(self) -> "Prefetcher":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        for index, file_path in enumerate(self.file_paths):
+            with self._condition:
+                # Always allow the file being consumed, even if it's larger than the budget on its own.
+                while not self._stopped and index > self._consumed_index and self._bytes_ahead(index) > 0:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+            try:
+                self._prefetch_file(file_path)
+            except OSError as e:
+                # Prefetching is best effort: the consumer gets the error when it reads the file, if it does.
+                logger.debug(f"Failed to prefetch '{file_path}': {e}")
+            with self._condition:
+                self._prefetched_index = index + 1
+
+    def _bytes_ahead(self, index: int) -> int:
+        """Returns by how many bytes prefetching the file at `index` would exceed the budget."""
+        ahead = sum(self._sizes[self._consumed_index : index + 1])
+        return max(ahead - self._max_bytes_ahead, 0)
+
+    def _prefetch_file(self, file_path: str) -> None:
+        if self._method == "fadvise":
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+            return
+
+        with open(file_path, "rb", buffering=0) as f:
+            while not self._stopped and f.read(READ_BUFFER_SIZE):
+                pass
+
+
+def _list_files(path: str, files: Iterable[str] | str | None) -> list[str]:
+    if not os.path.isdir(path):
+        return [path]
+    if files is not None and not isinstance(files, str):
+        return [os.path.join(path, rel_path) for rel_path in files]
+
+    rel_paths = sorted(
+        os.path.relpath(os.path.join(dirpath, filename), path)
+        for dirpath, _, filenames in os.walk(path)
+        for filename in filenames
+    )
+    if isinstance(files, str):
+        rel_paths = [rel_path for rel_path in rel_paths if fnmatch.fnmatch(rel_path.replace(os.sep, "/"), files)]
+    return [os.path.join(path, rel_path) for rel_path in rel_paths]
+
+
+def _get_size(file_path: str) -> int:
+    try:
+        return os.path.getsize(file_path)
+    except OSError:
+        return 0
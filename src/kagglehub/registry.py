@@ -1,37 +1,234 @@
-from typing import Generic, TypeVar
+import importlib.metadata
+import logging
+import os
+import threading
+import time
+from typing import Generic, TypeVar, cast
 
+from kagglehub import stats
+from kagglehub.cache import Cache
+from kagglehub.config import get_cache_folder, get_support_cache_ttl
+from kagglehub.exceptions import UnsupportedResolutionError
 from kagglehub.handle import CompetitionHandle, DatasetHandle, ModelHandle, NotebookHandle, ResourceHandle
 from kagglehub.resolver import Resolver
+from kagglehub.single_flight import SingleFlight
 
 T = TypeVar("T", bound=ResourceHandle)
 
+# (handle, path, output_dir, pinned version, cache folder)
+ResolutionKey = tuple[ResourceHandle, str | None, str | None, int | None, str]
+# (implementation, handle, path)
+SupportKey = tuple[Resolver, ResourceHandle, str | None]
+
+# Entry point group of the resolver plugins, see `load_plugins`.
+RESOLVER_PLUGINS_ENTRY_POINT_GROUP = "kagglehub.resolvers"
+
+logger = logging.getLogger(__name__)
+
 
 class MultiImplRegistry(Generic[T]):
     """Utility class to inject multiple implementations of class.
 
     Each implementation must implement __call__ and is_supported with the same set of arguments. The registered
-    implementations "is_supported" methods are called in reverse order under which they are registered. The first
-    to return true is then invoked via __call__ and the result returned.
+    implementations "is_supported" methods are called by decreasing priority, then in reverse order under which they
+    are registered. The first to return true is then invoked via __call__ and the result returned.
+
+    Concurrent calls for the same (handle, path, output_dir) share a single resolution. Completed resolutions pinned
+    to a version are memoized for the lifetime of the process, as long as the resolved path still exists and, for
+    paths in the cache, the entry is still marked as complete (e.g. it isn't being deleted or repaired). Before
+    checking which implementation is supported, versioned handles complete in a local cache are answered by
+    `Resolver.resolve_from_cache`, without building any client. Only the first implementation supported in the
+    environment is asked: e.g. in a notebook with the Kaggle cache, a copy in the local HTTP cache isn't returned
+    instead of the mounted datasource. Calls with `force_download` always resolve again.
+
+    Support decisions are cached too: `Resolver.is_supported_in_environment` is checked once per process, and
+    `Resolver.is_supported` once per (handle, path) for `KAGGLEHUB_SUPPORT_CACHE_TTL` seconds. Use `clear_supported`
+    after changing the environment. Implementations raising `UnsupportedResolutionError` while resolving are skipped
+    as if they weren't supported.
     """
 
     def __init__(self, name: str) -> None:
         self._name = name
         self._impls: list[Resolver[T]] = []
+        self._priorities: dict[Resolver[T], int] = {}
+        self._single_flight: SingleFlight[tuple[str, int | None]] = SingleFlight()
+        # Resolutions, along with the completion marker of their cache entry if any.
+        self._resolved: dict[ResolutionKey, tuple[tuple[str, int | None], str | None]] = {}
+        self._resolved_lock = threading.Lock()
+        self._supported_in_environment: dict[Resolver, bool] = {}
+        # (is supported, expiry time) per support key
+        self._supported: dict[SupportKey, tuple[bool, float]] = {}
+        self._supported_lock = threading.Lock()
 
-    def add_implementation(self, impl: Resolver[T]) -> None:
+    def add_implementation(self, impl: Resolver[T], *, priority: int = 0) -> None:
+        """Registers an implementation, tried before those with a lower `priority` (the built-in ones have 0)."""
+        self._priorities[impl] = priority
         self._impls.append(impl)
+        # Stable sort: among the same priority, the last registered is still tried first.
+        self._impls.sort(key=lambda i: self._priorities[i])
+
+    def clear_resolved(self) -> None:
+        """Forget all the memoized resolutions, e.g. to pick up new versions of unversioned handles."""
+        with self._resolved_lock:
+            self._resolved.clear()
+
+    def clear_supported(self) -> None:
+        """Forget all the cached support decisions, e.g. after enabling or disabling a resolver."""
+        with self._supported_lock:
+            self._supported_in_environment.clear()
+            self._supported.clear()
 
     def __call__(self, *args, **kwargs) -> tuple[str, int | None]:  # noqa: ANN002, ANN003
+        key = _resolution_key(*args, **kwargs)
+        if key is None:
+            return self._resolve(*args, **kwargs)
+
+        if kwargs.get("force_download"):
+            result = self._resolve(*args, **kwargs)
+        else:
+            with self._resolved_lock:
+                resolved = self._resolved.get(key)
+            if resolved is not None and _is_still_resolved(*resolved):
+                stats.record_hit(key[0])
+                return resolved[0]
+            result = self._resolve_from_cache(key) or self._single_flight.do(
+                key, lambda: self._resolve(*args, **kwargs)
+            )
+
+        if _is_version_pinned(key):
+            # Unversioned handles, and resources without versions (e.g. competitions), are checked for updates on
+            # every call.
+            marker_path = _get_completion_marker_path(key, result)
+            with self._resolved_lock:
+                self._resolved[key] = (result, marker_path)
+        return result
+
+    def _resolve_from_cache(self, key: ResolutionKey) -> tuple[str, int | None] | None:
+        handle, path, output_dir, *_ = key
+        for impl in reversed(self._impls):
+            if self._is_supported_in_environment(impl):
+                # The key's handle is the T the registry was called with.
+                return impl.resolve_from_cache(cast(T, handle), path, output_dir=output_dir)
+        return None
+
+    def _resolve(self, *args, **kwargs) -> tuple[str, int | None]:  # noqa: ANN002, ANN003
         fails = []
         for impl in reversed(self._impls):
-            if impl.is_supported(*args, **kwargs):
-                return impl(*args, **kwargs)
-            else:
-                fails.append(type(impl).__name__)
+            if self._is_supported(impl, *args, **kwargs):
+                try:
+                    return impl(*args, **kwargs)
+                except UnsupportedResolutionError as e:
+                    # The implementation resolved speculatively, without checking that it supports the handle first.
+                    logger.debug(f"{type(impl).__name__} doesn't support the handle, falling back: {e}")
+                    self._set_supported(impl, *args, supported=False, **kwargs)
+            fails.append(type(impl).__name__)
 
         msg = f"Missing implementation that supports: {self._name}(*{args!r}, **{kwargs!r}). Tried {fails!r}"
         raise RuntimeError(msg)
 
+    def _is_supported_in_environment(self, impl: Resolver[T]) -> bool:
+        with self._supported_lock:
+            supported_in_environment = self._supported_in_environment.get(impl)
+        if supported_in_environment is None:
+            supported_in_environment = impl.is_supported_in_environment()
+            with self._supported_lock:
+                self._supported_in_environment[impl] = supported_in_environment
+        return supported_in_environment
+
+    def _is_supported(self, impl: Resolver[T], *args, **kwargs) -> bool:  # noqa: ANN002, ANN003
+        if not self._is_supported_in_environment(impl):
+            return False
+
+        key = _support_key(impl, *args, **kwargs)
+        if key is None:
+            return impl.is_supported(*args, **kwargs)
+        with self._supported_lock:
+            cached = self._supported.get(key)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+        supported = impl.is_supported(*args, **kwargs)
+        self._set_supported(impl, *args, supported=supported, **kwargs)
+        return supported
+
+    def _set_supported(self, impl: Resolver[T], *args, supported: bool, **kwargs) -> None:  # noqa: ANN002, ANN003
+        key = _support_key(impl, *args, **kwargs)
+        if key is None:
+            return
+        with self._supported_lock:
+            self._supported[key] = (supported, time.monotonic() + get_support_cache_ttl())
+
+
+def _resolution_key(
+    handle: ResourceHandle | None = None,
+    path: str | None = None,
+    *,
+    output_dir: str | None = None,
+    **_,  # noqa: ANN003
+) -> ResolutionKey | None:
+    if not isinstance(handle, ResourceHandle):
+        return None
+
+    # Unversioned handles resolve to the version pinned by the Package in scope, if any.
+    from kagglehub.packages import PackageScope  # noqa: PLC0415 - avoid circular import
+
+    pinned_version = PackageScope.get_version(handle)
+    return (handle, path, output_dir, pinned_version, get_cache_folder())
+
+
+def _is_version_pinned(key: ResolutionKey) -> bool:
+    handle, _, _, pinned_version, _ = key
+    return handle.is_versioned() or pinned_version is not None
+
+
+def _get_completion_marker_path(key: ResolutionKey, result: tuple[str, int | None]) -> str | None:
+    handle, path, output_dir, *_ = key
+    resolved_path, version = result
+    if not isinstance(handle, (ModelHandle, DatasetHandle, NotebookHandle)):
+        # Other resources aren't memoized, having no versions.
+        return None
+    if not handle.is_versioned():
+        if version is None:
+            return None
+        handle = handle.with_version(version)
+    return Cache(override_dir=output_dir).get_completion_marker_path(handle, path, resolved_path)
+
+
+def _is_still_resolved(result: tuple[str, int | None], marker_path: str | None) -> bool:
+    # Paths outside of the cache (e.g. mounts) only need to exist.
+    return os.path.exists(result[0]) and (marker_path is None or os.path.exists(marker_path))
+
+
+def _support_key(
+    impl: Resolver,
+    handle: ResourceHandle | None = None,
+    path: str | None = None,
+    **_,  # noqa: ANN003
+) -> SupportKey | None:
+    if not isinstance(handle, ResourceHandle):
+        return None
+    return (impl, handle, path)
+
+
+def load_plugins() -> None:
+    """Registers the resolvers of the installed plugins.
+
+    Plugins declare an entry point in the `kagglehub.resolvers` group, pointing to a function called without arguments
+    which registers their resolvers, e.g. `registry.dataset_resolver.add_implementation(MyResolver(), priority=10)`.
+    A plugin failing to load is skipped.
+    """
+    for entry_point in importlib.metadata.entry_points(group=RESOLVER_PLUGINS_ENTRY_POINT_GROUP):
+        try:
+            register = entry_point.load()
+            register()
+        except Exception:
+            logger.warning(f"Failed to load the resolver plugin '{entry_point.name}'", exc_info=True)
+
+
+def clear_supported() -> None:
+    """Forget the cached support decisions of all the registries."""
+    for resolver in (model_resolver, dataset_resolver, competition_resolver, notebook_output_resolver):
+        resolver.clear_supported()
+
 
 model_resolver = MultiImplRegistry[ModelHandle]("ModelResolver")
 dataset_resolver = MultiImplRegistry[DatasetHandle]("DatasetResolver")
@@ -1,11 +1,15 @@
 import abc
-from typing import Generic, TypeVar
+from typing import Generic, Literal, TypeVar
 
 from kagglehub.handle import ResourceHandle
 from kagglehub.tracker import register_datasource_access
 
 T = TypeVar("T", bound=ResourceHandle)
 
+# `force_download` value to download again only the files that are missing, corrupted or outdated.
+REVALIDATE = "revalidate"
+ForceDownload = bool | Literal["revalidate"] | None
+
 
 class Resolver(Generic[T]):
     """Resolver base class: all resolvers inherit from this class."""
@@ -17,7 +21,7 @@ class Resolver(Generic[T]):
         handle: T,
         path: str | None = None,
         *,
-        force_download: bool | None = False,
+        force_download: ForceDownload = False,
         output_dir: str | None = None,
     ) -> tuple[str, int | None]:
         """Resolves a handle into a path with the requested file(s) and the resource's version number.
@@ -25,7 +29,8 @@ class Resolver(Generic[T]):
         Args:
             handle: (T) the ResourceHandle to resolve.
             path: (string) Optional path to a file within the resource.
-            force_download: (bool) Optional flag to force download, even if it's cached or already in output_dir.
+            force_download: (bool | "revalidate") Optional flag to force download, even if it's cached or already in
+                output_dir. With "revalidate", only the files that are missing or don't match are downloaded again.
             output_dir: (string) Optional output directory for direct download, bypassing the default cache.
 
         Returns:
@@ -44,13 +49,37 @@ class Resolver(Generic[T]):
 
         return path, version
 
+    def resolve_from_cache(
+        self, handle: T, path: str | None = None, *, output_dir: str | None = None
+    ) -> tuple[str, int | None] | None:
+        """Resolves a handle from the local cache only, without building any client or calling the network.
+
+        Args:
+            handle: (T) the ResourceHandle to resolve.
+            path: (string) Optional path to a file within the resource.
+            output_dir: (string) Optional output directory for direct download, bypassing the default cache.
+
+        Returns:
+            The same tuple as `__call__`, or None if the handle isn't complete in the cache.
+        """
+        result = self._resolve_from_cache(handle, path, output_dir=output_dir)
+        if result is not None:
+            register_datasource_access(handle, result[1])
+        return result
+
+    def _resolve_from_cache(
+        self, handle: T, path: str | None = None, *, output_dir: str | None = None  # noqa: ARG002
+    ) -> tuple[str, int | None] | None:
+        """Resolves a handle from the local cache only. Resolvers without a local cache always return None."""
+        return None
+
     @abc.abstractmethod
     def _resolve(
         self,
         handle: T,
         path: str | None = None,
         *,
-        force_download: bool | None = False,
+        force_download: ForceDownload = False,
         output_dir: str | None = None,
     ) -> tuple[str, int | None]:
         """Resolves a handle into a path with the requested file(s) and the resource's version number.
@@ -58,7 +87,8 @@ class Resolver(Generic[T]):
         Args:
             handle: (T) the ResourceHandle to resolve.
             path: (string) Optional path to a file within the resource.
-            force_download: (bool) Optional flag to force download, even if it's cached or already in output_dir.
+            force_download: (bool | "revalidate") Optional flag to force download, even if it's cached or already in
+                output_dir. With "revalidate", only the files that are missing or don't match are downloaded again.
             output_dir: (string) Optional output directory for direct download, bypassing the default cache.
 
         Returns:
@@ -71,3 +101,11 @@ class Resolver(Generic[T]):
     def is_supported(self, handle: T, path: str | None = None) -> bool:
         """Returns whether the current environment supports this handle/path."""
         pass
+
+    def is_supported_in_environment(self) -> bool:
+        """Returns whether the current environment supports this resolver at all, whatever the handle.
+
+        Unlike `is_supported`, the answer may only depend on the environment (e.g. environment variables), so it is
+        checked once per process: returning False skips `is_supported` altogether.
+        """
+        return True
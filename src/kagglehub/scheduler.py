@@ -0,0 +1,157 @@
+"""Scheduling of the Kaggle API calls sent by all the clients of the process (see `build_kaggle_client`).
+
+- Requests are sent at most at `KAGGLEHUB_API_RATE_LIMIT` requests per second, if set.
+- Idempotent requests (`Get*`, `List*` and `Download*`) are retried on 429 (Too Many Requests), 5xx errors and read
+  timeouts. Up to `KAGGLEHUB_API_MAX_RETRIES` retries are made, with exponential backoff and full jitter. Other
+  requests (e.g. creations and uploads) are never retried, so they can't be sent twice. Failures to connect aren't
+  retried either, so offline callers fall back to the cache right away.
+- A `Retry-After` header pauses all the requests of the process, not only the rejected one, so concurrent callers
+  don't all hit the server again at once. This applies to the rejections of non-idempotent requests too.
+- Identical metadata requests (`Get*` and `List*`) in flight at the same time are sent once and share the response.
+"""
+
+import json
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable, Hashable
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import requests
+from kagglesdk.common.types.file_download import FileDownload
+from kagglesdk.common.types.http_redirect import HttpRedirect
+from kagglesdk.kaggle_object import KaggleObject
+
+from kagglehub.config import get_api_max_retries, get_api_rate_limit
+from kagglehub.single_flight import SingleFlight
+
+HTTP_STATUS_TOO_MANY_REQUESTS = 429
+RETRYABLE_STATUS_CODES = {HTTP_STATUS_TOO_MANY_REQUESTS, 500, 502, 503, 504}
+IDEMPOTENT_REQUEST_PREFIXES = ("Get", "List", "Download")
+METADATA_REQUEST_PREFIXES = ("Get", "List")
+INITIAL_BACKOFF = 0.5  # seconds
+MAX_BACKOFF = 30  # seconds
+MAX_RETRY_AFTER = 300  # seconds
+
+# (service name, request name, request, response type) -> response
+Call = Callable[[str, str, KaggleObject, type[KaggleObject] | None], Any]
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Token bucket shared by the callers of `acquire`, which can also be paused for everyone."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tokens: float | None = None  # Full until first used.
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+
+    def acquire(self, rate: float | None) -> None:
+        """Waits for the pause to end and, if `rate` (per second) is set, for a token."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if rate is None:
+                        return
+                    burst = max(1.0, rate)
+                    tokens = burst if self._tokens is None else self._tokens + (now - self._updated_at) * rate
+                    self._tokens = min(burst, tokens)
+                    self._updated_at = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class Scheduler:
+    def __init__(self) -> None:
+        self._rate_limiter = RateLimiter()
+        self._single_flight: SingleFlight[Any] = SingleFlight()
+
+    def wrap(self, send: Call, client_key: Hashable) -> Call:
+        """Returns `send`, the `call` method of a kagglesdk client identified by `client_key`, scheduled."""
+
+        def _call(
+            service_name: str, request_name: str, request: KaggleObject, response_type: type[KaggleObject] | None
+        ) -> Any:  # noqa: ANN401
+            if request_name.startswith(METADATA_REQUEST_PREFIXES) and response_type not in (FileDownload, HttpRedirect):
+                key = (
+                    client_key,
+                    service_name,
+                    request_name,
+                    json.dumps(request.__class__.to_dict(request), sort_keys=True),
+                )
+                return self._single_flight.do(
+                    key, lambda: self._send_with_retries(send, service_name, request_name, request, response_type)
+                )
+            return self._send_with_retries(send, service_name, request_name, request, response_type)
+
+        return _call
+
+    def _send_with_retries(
+        self,
+        send: Call,
+        service_name: str,
+        request_name: str,
+        request: KaggleObject,
+        response_type: type[KaggleObject] | None,
+    ) -> Any:  # noqa: ANN401
+        is_idempotent = request_name.startswith(IDEMPOTENT_REQUEST_PREFIXES)
+        max_retries = get_api_max_retries()
+        attempt = 0
+        while True:
+            self._rate_limiter.acquire(get_api_rate_limit())
+            try:
+                return send(service_name, request_name, request, response_type)
+            except (requests.HTTPError, requests.ReadTimeout) as e:
+                response = e.response
+                status_code = response.status_code if response is not None else None
+                retry_after = _get_retry_after(response) if response is not None else None
+                if retry_after is not None:
+                    self._rate_limiter.pause(retry_after)
+                if (
+                    not is_idempotent
+                    or attempt >= max_retries
+                    or (status_code is not None and status_code not in RETRYABLE_STATUS_CODES)
+                ):
+                    raise
+
+                if response is not None:
+                    response.close()
+                if retry_after is not None:
+                    delay = random.uniform(0, INITIAL_BACKOFF)  # noqa: S311 - jitter only
+                else:
+                    delay = random.uniform(0, min(MAX_BACKOFF, INITIAL_BACKOFF * 2**attempt))  # noqa: S311
+                attempt += 1
+                logger.info(f"{service_name}.{request_name} failed ({e}), retrying ({attempt}/{max_retries})...")
+                time.sleep(delay)
+
+
+def _get_retry_after(response: requests.Response) -> float | None:
+    """Returns the number of seconds to wait set by the `Retry-After` header of `response`, if any."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(0.0, seconds), MAX_RETRY_AFTER)
+
+
+# Shared by all the clients built with `build_kaggle_client`.
+scheduler = Scheduler()
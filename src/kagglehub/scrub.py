@@ -0,0 +1,173 @@
+import functools
+import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from kagglehub import archives, compression, manifest
+from kagglehub.cache import LOCKS_CACHE_SUBFOLDER, MANIFEST_SUFFIX, PROXY_CACHE_SUBFOLDER, Cache
+from kagglehub.config import get_cache_folder
+from kagglehub.handle import CompetitionHandle, DatasetHandle, ModelHandle, NotebookHandle, ResourceHandle
+
+# Never use more than 8 threads in parallel to download files.
+DEFAULT_REPAIR_MAX_WORKERS = 8
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScrubResult:
+    """Outcome of verifying a cache entry.
+
+    Attributes:
+        handle: The handle of the entry.
+        path: The path of the file within the resource for single file entries, None for full resources.
+        bad_files: Relative paths of the files that were missing or corrupted.
+        repaired_files: Relative paths of the bad files that were downloaded again.
+    """
+
+    handle: ResourceHandle
+    path: str | None
+    bad_files: list[str] = field(default_factory=list)
+    repaired_files: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return set(self.bad_files) <= set(self.repaired_files)
+
+
+def cache_scrub(
+    handle: ResourceHandle | None = None,
+    *,
+    repair: bool = False,
+    max_workers: int | None = None,
+) -> list[ScrubResult]:
+    """Verifies cached files against the manifests captured when they were downloaded.
+
+    Args:
+        handle: (ResourceHandle) Optional handle of the resource to verify. Verifies all the cached resources if None.
+        repair: (bool) Whether to download the missing or corrupted files again. Only the bad files are downloaded.
+        max_workers: (int) Optional maximum number of files hashed, or downloaded again, in parallel.
+
+    Returns:
+        The list of verified cache entries.
+    """
+    results = []
+    for h, path in list_cache_entries():
+        if handle is not None and not matches_handle(handle, h):
+            continue
+        bad_files = Cache().verify(h, path, max_workers=max_workers)
+        if bad_files is None:
+            continue
+        result = ScrubResult(h, path, bad_files)
+        if bad_files:
+            logger.warning(f"Found {len(bad_files)} missing or corrupted files in '{h}' {path or ''}: {bad_files}")
+            if repair:
+                result.repaired_files = repair_entry(
+                    Cache(), h, path, bad_files, functools.partial(_resolve, h), max_workers=max_workers
+                )
+        results.append(result)
+    return results
+
+
+def list_cache_entries() -> list[tuple[ResourceHandle, str | None]]:
+    """Lists the (handle, path) of the cache entries that have a manifest."""
+    cache_folder = get_cache_folder()
+    entries = []
+    for dirpath, dirnames, filenames in os.walk(cache_folder):
+        if dirpath == cache_folder:
+            dirnames[:] = [d for d in dirnames if d not in (LOCKS_CACHE_SUBFOLDER, PROXY_CACHE_SUBFOLDER)]
+        for filename in filenames:
+            if not filename.endswith(MANIFEST_SUFFIX):
+                continue
+            entry_manifest = manifest.read(os.path.join(dirpath, filename))
+            if entry_manifest is not None:
+                h, path, _ = entry_manifest
+                entries.append((h, path))
+    return entries
+
+
+def repair_entry(
+    cache: Cache,
+    h: ResourceHandle,
+    path: str | None,
+    bad_files: list[str],
+    resolve: Callable[[str | None], object],
+    *,
+    max_workers: int | None = None,
+) -> list[str]:
+    """Downloads the bad files of a cache entry again, in parallel.
+
+    Args:
+        cache: (Cache) The cache holding the entry.
+        h: (ResourceHandle) The handle of the entry.
+        path: (string) The path of the file within the resource for single file entries, None for full resources.
+        bad_files: (list[str]) Relative paths of the bad files, as returned by `Cache.verify`.
+        resolve: Downloads a file of the resource again, or the whole resource if None.
+        max_workers: (int) Optional maximum number of files downloaded in parallel.
+
+    Returns:
+        The relative paths of the files that were downloaded again.
+    """
+    base_path = cache.get_manifest_base_path(h, path)
+    files_in_resource: dict[str, str | None] = {}
+    for rel_path in bad_files:
+        # Bad files can't be resumed: remove them first.
+        file_path = os.path.join(base_path, rel_path)
+        if os.path.isfile(file_path):
+            os.remove(file_path)
+        if path:
+            files_in_resource[rel_path] = path
+        elif rel_path == os.path.basename(archives.get_archive_entry_path(cache.get_path(h))):
+            # The archive kept as the entry of the whole resource.
+            files_in_resource[rel_path] = None
+        else:
+            # Compressed files of a bundle are downloaded again under their original name, and compressed again.
+            files_in_resource[rel_path] = compression.get_original_path(rel_path)
+
+    def _repair_file(rel_path: str) -> bool:
+        file_in_resource = files_in_resource[rel_path]
+        try:
+            resolve(file_in_resource)
+        except Exception as e:
+            logger.error(f"Failed to download '{file_in_resource or rel_path}' of '{h}' again: {e}")
+            return False
+        logger.info(f"Downloaded '{file_in_resource or rel_path}' of '{h}' again.")
+        return True
+
+    with ThreadPoolExecutor(max_workers=max_workers or DEFAULT_REPAIR_MAX_WORKERS) as executor:
+        repaired = [
+            rel_path for rel_path, ok in zip(bad_files, executor.map(_repair_file, bad_files), strict=True) if ok
+        ]
+
+    if repaired and not path:
+        cache.update_manifest(h, path, repaired)
+    return repaired
+
+
+def _resolve(h: ResourceHandle, path: str | None) -> None:
+    # Repairs must go through the HTTP resolvers: mounts and mirrors don't download into the default cache, and mounts
+    # ignore `force_download`.
+    from kagglehub import http_resolver  # noqa: PLC0415 - avoid circular import
+
+    if isinstance(h, ModelHandle):
+        http_resolver.ModelHttpResolver()._resolve(h, path, force_download=True)
+    elif isinstance(h, DatasetHandle):
+        http_resolver.DatasetHttpResolver()._resolve(h, path, force_download=True)
+    elif isinstance(h, CompetitionHandle):
+        http_resolver.CompetitionHttpResolver()._resolve(h, path, force_download=True)
+    elif isinstance(h, NotebookHandle):
+        http_resolver.NotebookOutputHttpResolver()._resolve(h, path, force_download=True)
+    else:
+        msg = f"Invalid ResourceHandle type {h}"
+        raise ValueError(msg)
+
+
+def matches_handle(requested: ResourceHandle, cached: ResourceHandle) -> bool:
+    """Whether a cache entry's handle matches the requested one. An unversioned handle matches all the versions."""
+    if requested == cached:
+        return True
+    if isinstance(requested, (ModelHandle, DatasetHandle, NotebookHandle)) and not requested.is_versioned():
+        return isinstance(cached, type(requested)) and cached.with_version(0) == requested.with_version(0)
+    return False
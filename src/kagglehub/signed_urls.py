@@ -0,0 +1,72 @@
+"""Signed storage URLs the Kaggle API redirects file downloads to, remembered per process.
+
+Downloading a file goes through the Kaggle API, which redirects to a signed Google Cloud Storage URL valid for a limited
+time. Remembering that URL per (handle, file) lets later downloads of the same file, e.g. retries or revalidations, go
+to storage directly and skip the API round trip. A URL is used until `EXPIRY_MARGIN` seconds before it expires, and
+forgotten as soon as storage rejects it.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlsplit
+
+from kagglehub.handle import ResourceHandle
+
+# Don't start a download with a URL about to expire.
+EXPIRY_MARGIN = 60  # seconds
+
+# (handle, path) -> (signed URL, expiry as a UNIX timestamp)
+_signed_urls: dict[tuple[ResourceHandle, str | None], tuple[str, float]] = {}
+_signed_urls_lock = threading.Lock()
+
+
+def get_signed_url(h: ResourceHandle, path: str | None) -> str | None:
+    """Returns the signed URL remembered for the `path` file of `h`, if it's still valid."""
+    with _signed_urls_lock:
+        signed_url = _signed_urls.get((h, path))
+        if signed_url is None:
+            return None
+        url, expiry = signed_url
+        if time.time() + EXPIRY_MARGIN >= expiry:
+            del _signed_urls[(h, path)]
+            return None
+        return url
+
+
+def remember_signed_url(h: ResourceHandle, path: str | None, url: str) -> None:
+    """Remembers the URL the download of the `path` file of `h` was redirected to, if it's signed with an expiry."""
+    expiry = get_expiry(url)
+    if expiry is None:
+        return
+    with _signed_urls_lock:
+        _signed_urls[(h, path)] = (url, expiry)
+
+
+def forget_signed_url(h: ResourceHandle, path: str | None) -> None:
+    with _signed_urls_lock:
+        _signed_urls.pop((h, path), None)
+
+
+def clear_signed_urls() -> None:
+    """Forget all the remembered signed URLs."""
+    with _signed_urls_lock:
+        _signed_urls.clear()
+
+
+def get_expiry(url: str) -> float | None:
+    """Returns when a signed URL expires, as a UNIX timestamp, or None if it isn't signed with an expiry.
+
+    Supports V4 signatures (`X-Goog-Date` and `X-Goog-Expires`) and V2 ones (`Expires`), see
+    https://cloud.google.com/storage/docs/access-control/signed-urls.
+    """
+    query = parse_qs(urlsplit(url).query)
+    try:
+        if "X-Goog-Date" in query and "X-Goog-Expires" in query:
+            signed_at = datetime.strptime(query["X-Goog-Date"][0], "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+            return signed_at.timestamp() + int(query["X-Goog-Expires"][0])
+        if "Expires" in query:
+            return float(query["Expires"][0])
+    except ValueError:
+        return None
+    return None
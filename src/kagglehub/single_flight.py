@@ -0,0 +1,41 @@
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import Generic, TypeVar
+
+R = TypeVar("R")
+
+
+class SingleFlight(Generic[R]):
+    """Deduplicates concurrent calls sharing the same key.
+
+    The first caller for a given key runs the function. Callers arriving while it is still running wait for it and get
+    the same result (or exception) instead of running the function again. Nothing is kept once the call completes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._in_flight: dict[Hashable, Future[R]] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], R]) -> R:
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if future is None:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
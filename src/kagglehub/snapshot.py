@@ -0,0 +1,246 @@
+"""Snapshots of cache entries, to ship a warm cache to other nodes, images or volumes.
+
+A snapshot is a tar stream (optionally gzipped) of the entries' files, manifests and completion markers, relative to
+the cache folder. Its first member is an index of the entries. The completion markers of an entry come after its files,
+and are only written once all the files are, so an interrupted import never leaves an entry that looks complete.
+"""
+
+import io
+import json
+import logging
+import os
+import sys
+import tarfile
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, Any
+
+from kagglehub.cache import Cache, find_stored_path
+from kagglehub.config import get_cache_folder
+from kagglehub.handle import ResourceHandle
+from kagglehub.scrub import list_cache_entries, matches_handle
+from kagglehub.tracker import HANDLE_TYPE_NAMES, HANDLE_TYPE_PARSERS
+
+SNAPSHOT_FORMAT_VERSION = 1
+INDEX_MEMBER_NAME = "kagglehub-snapshot.json"
+STDIO_PATH = "-"
+GZIP_EXTENSIONS = (".tar.gz", ".tgz")
+DEFAULT_MAX_WORKERS = 8
+# Smaller files are read from the stream into memory and written by the thread pool. Larger ones are written in turn.
+MAX_BUFFERED_FILE_SIZE = 8 * 1024 * 1024  # 8 MiB
+COPY_BUFFER_SIZE = 1024 * 1024  # 1 MiB
+
+FORMAT_VERSION_FIELD = "format_version"
+ENTRIES_FIELD = "entries"
+TYPE_FIELD = "type"
+REF_FIELD = "ref"
+PATH_FIELD = "path"
+FILES_FIELD = "files"
+MANIFEST_FIELD = "manifest"
+MARKER_FIELD = "marker"
+
+CacheEntry = tuple[ResourceHandle, str | None]
+
+logger = logging.getLogger(__name__)
+
+
+def cache_export(destination: str | IO[bytes], handles: list[ResourceHandle] | None = None) -> list[CacheEntry]:
+    """Writes the complete entries of the default cache folder to a snapshot.
+
+    Only entries downloaded with a manifest are exported (see `KAGGLEHUB_DISABLE_CACHE_MANIFEST`).
+
+    Args:
+        destination: (string | IO[bytes]) Path of the snapshot to write, gzipped if it ends with `.tar.gz` or `.tgz`,
+            `-` for stdout, or a binary file object.
+        handles: (list[ResourceHandle]) Optional handles of the resources to export. An unversioned handle exports
+            all the cached versions. Exports all the cached resources if None.
+
+    Returns:
+        The (handle, path) of the exported entries. The path is the file within the resource for single file entries.
+    """
+    cache = Cache()
+    cache_folder = get_cache_folder()
+    index_entries: list[dict[str, Any]] = []
+    exported = []
+    for h, path in list_cache_entries():
+        if handles is not None and not any(matches_handle(requested, h) for requested in handles):
+            continue
+        marker_path = cache._get_completion_marker_filepath(h, path)
+        stored_path = find_stored_path(cache.get_path(h, path), path)
+        if not os.path.exists(marker_path) or not stored_path:
+            continue
+        index_entries.append(
+            {
+                TYPE_FIELD: HANDLE_TYPE_NAMES[type(h)],
+                REF_FIELD: str(h),
+                PATH_FIELD: path,
+                FILES_FIELD: [_to_member_name(file_path, cache_folder) for file_path in _list_files(stored_path)],
+                MANIFEST_FIELD: _to_member_name(cache.get_manifest_path(h, path), cache_folder),
+                MARKER_FIELD: _to_member_name(marker_path, cache_folder),
+            }
+        )
+        exported.append((h, path))
+
+    with _open_tar(destination, "w") as tar:
+        index = json.dumps({FORMAT_VERSION_FIELD: SNAPSHOT_FORMAT_VERSION, ENTRIES_FIELD: index_entries}).encode()
+        _add_bytes(tar, INDEX_MEMBER_NAME, index)
+        added: set[str] = set()
+        for entry in index_entries:
+            # Single file entries may be part of a full resource entry as well.
+            for name in [*entry[FILES_FIELD], entry[MANIFEST_FIELD], entry[MARKER_FIELD]]:
+                if name not in added:
+                    tar.add(os.path.join(cache_folder, name), arcname=name, recursive=False)
+                    added.add(name)
+
+    logger.info(f"Exported {len(exported)} cache entries.")
+    return exported
+
+
+def cache_import(source: str | IO[bytes], *, max_workers: int = DEFAULT_MAX_WORKERS) -> list[CacheEntry]:
+    """Unpacks a snapshot written by `cache_export` into the default cache folder.
+
+    The snapshot is read as a stream, and its files are written by a pool of threads. Entries already complete in the
+    cache are left as is.
+
+    Args:
+        source: (string | IO[bytes]) Path of the snapshot, `-` for stdin, or a binary file object.
+        max_workers: (int) Maximum number of files written in parallel.
+
+    Returns:
+        The (handle, path) of the imported entries.
+    """
+    cache = Cache()
+    cache_folder = os.path.abspath(get_cache_folder())
+    with _open_tar(source, "r") as tar:
+        index = _read_index(tar, source)
+        imported = []
+        skipped_names: set[str] = set()
+        marker_names: set[str] = set()
+        for entry in index[ENTRIES_FIELD]:
+            h = HANDLE_TYPE_PARSERS[entry[TYPE_FIELD]](entry[REF_FIELD])
+            if os.path.exists(cache._get_completion_marker_filepath(h, entry[PATH_FIELD])):
+                logger.info(f"Skipping '{h}' {entry[PATH_FIELD] or ''}, already in the cache.")
+                skipped_names.update([*entry[FILES_FIELD], entry[MANIFEST_FIELD], entry[MARKER_FIELD]])
+                continue
+            marker_names.add(entry[MARKER_FIELD])
+            imported.append((h, entry[PATH_FIELD]))
+        # Files shared with an imported entry must be written anyway.
+        for entry in index[ENTRIES_FIELD]:
+            if entry[MARKER_FIELD] in marker_names:
+                skipped_names.difference_update([*entry[FILES_FIELD], entry[MANIFEST_FIELD]])
+
+        markers: list[tuple[tarfile.TarInfo, bytes]] = []
+        with _ThrottledExecutor(max_workers) as executor:
+            for member in tar:
+                if member.name == INDEX_MEMBER_NAME or member.name in skipped_names or not member.isfile():
+                    continue
+                fileobj = tar.extractfile(member)
+                if fileobj is None:
+                    continue
+                if member.name in marker_names:
+                    markers.append((member, fileobj.read()))
+                elif member.size <= MAX_BUFFERED_FILE_SIZE:
+                    executor.submit(_write_file, _get_target_path(cache_folder, member.name), member, fileobj.read())
+                else:
+                    _write_file(_get_target_path(cache_folder, member.name), member, fileobj)
+
+        # All the files are written: the entries can be marked as complete.
+        for member, content in markers:
+            _write_file(_get_target_path(cache_folder, member.name), member, content)
+
+    logger.info(f"Imported {len(imported)} cache entries.")
+    return imported
+
+
+class _ThrottledExecutor:
+    """Thread pool bounding the number of pending tasks, so the files buffered in memory are bounded too."""
+
+    def __init__(self, max_workers: int) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._slots = threading.BoundedSemaphore(2 * max_workers)
+        self._futures: list[Future] = []
+
+    def submit(self, fn: Any, *args: Any) -> None:  # noqa: ANN401
+        self._slots.acquire()
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+
+    def __enter__(self) -> "_ThrottledExecutor":
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *_: object) -> None:
+        self._executor.shutdown(wait=True)
+        if exc_type is None:
+            for future in self._futures:
+                # Raises the first failure, if any.
+                future.result()
+
+
+def _open_tar(target: str | IO[bytes], mode: str) -> tarfile.TarFile:
+    # Stream modes (`|`): snapshots can be piped, e.g. through ssh, and are never seeked.
+    if isinstance(target, str) and target != STDIO_PATH:
+        if mode == "r":
+            return tarfile.open(target, "r|*")
+        return tarfile.open(target, "w|gz" if target.endswith(GZIP_EXTENSIONS) else "w|")
+    if isinstance(target, str):
+        target = sys.stdin.buffer if mode == "r" else sys.stdout.buffer
+    return tarfile.open(fileobj=target, mode="r|*" if mode == "r" else "w|")
+
+
+def _read_index(tar: tarfile.TarFile, source: str | IO[bytes]) -> dict:
+    member = tar.next()
+    fileobj = tar.extractfile(member) if member is not None and member.name == INDEX_MEMBER_NAME else None
+    if fileobj is None:
+        msg = f"'{source}' is not a kagglehub cache snapshot."
+        raise ValueError(msg)
+    index = json.load(fileobj)
+    if index.get(FORMAT_VERSION_FIELD) != SNAPSHOT_FORMAT_VERSION:
+        msg = f"Unsupported cache snapshot format version: {index.get(FORMAT_VERSION_FIELD)}."
+        raise ValueError(msg)
+    return index
+
+
+def _add_bytes(tar: tarfile.TarFile, name: str, content: bytes) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(content)
+    tar.addfile(info, io.BytesIO(content))
+
+
+def _write_file(target_path: str, member: tarfile.TarInfo, content: bytes | IO[bytes]) -> None:
+    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+    # Write to a temporary file so an interrupted import never leaves a truncated file behind.
+    tmp_path = f"{target_path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            if isinstance(content, bytes):
+                f.write(content)
+            else:
+                while chunk := content.read(COPY_BUFFER_SIZE):
+                    f.write(chunk)
+        # Keep the modification times: e.g. competition files are checked against the remote ones.
+        os.utime(tmp_path, (member.mtime, member.mtime))
+        os.replace(tmp_path, target_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _get_target_path(cache_folder: str, name: str) -> str:
+    target_path = os.path.abspath(os.path.join(cache_folder, name))
+    if os.path.commonpath([cache_folder, target_path]) != cache_folder:
+        msg = f"Invalid cache snapshot member outside of the cache folder: '{name}'."
+        raise ValueError(msg)
+    return target_path
+
+
+def _list_files(path: str) -> list[str]:
+    if not os.path.isdir(path):
+        return [path]
+    return [os.path.join(dirpath, filename) for dirpath, _, filenames in os.walk(path) for filename in filenames]
+
+
+def _to_member_name(path: str, cache_folder: str) -> str:
+    # Tar members always use forward slashes.
+    return os.path.relpath(path, cache_folder).replace(os.sep, "/")
@@ -0,0 +1,134 @@
+"""Staging of mounted datasources to local disk (see `KAGGLEHUB_MOUNT_STAGING_DIR`).
+
+In Kaggle and Colab notebooks, datasources are mounted from a network filesystem (e.g. `/kaggle/input`), where random
+small reads are much slower than on local disk. When a staging folder is set, the mounted datasource (or the requested
+file) is copied there, in parallel, on first access, and the local copy is returned instead of the mounted path.
+
+Staged copies mirror the mount layout: `<staging folder>/<mount slug>/...`. A copy is only reused once its completion
+marker, kept under `<staging folder>/.complete`, exists and records the same version: an interrupted staging is started
+over. When the mounted version isn't known, the marker records the identity of the mounted path instead (device, inode,
+mtime and size), which changes when another version is mounted.
+"""
+
+import logging
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from tqdm.auto import tqdm
+
+from kagglehub import materialize
+from kagglehub.config import get_mount_staging_dir
+from kagglehub.locks import CacheLock
+
+STAGING_MAX_WORKERS = 8
+COMPLETION_MARKER_FOLDER = ".complete"
+LOCKS_FOLDER = ".locks"
+BUNDLE_MARKER_NAME = "bundle.complete"
+
+logger = logging.getLogger(__name__)
+
+
+def stage(mount_folder: str, mount_slug: str, path: str | None, version: int | None) -> str:
+    """Returns the local copy of a mounted datasource, or of one of its files, staging it first if needed.
+
+    Args:
+        mount_folder: (string) The folder the datasources are mounted under, e.g. `/kaggle/input`.
+        mount_slug: (string) The folder of the datasource within `mount_folder`.
+        path: (string) Optional path to a file within the datasource.
+        version: (int) Version of the mounted datasource, if known. Copies of other versions are staged again.
+
+    Returns:
+        The path of the local copy, or the mounted path as is if staging is disabled.
+    """
+    mounted_datasource_path = f"{mount_folder}/{mount_slug}"
+    mounted_path = f"{mounted_datasource_path}/{path}" if path else mounted_datasource_path
+    staging_dir = get_mount_staging_dir()
+    if staging_dir is None:
+        return mounted_path
+
+    staged_datasource_path = os.path.join(staging_dir, mount_slug)
+    staged_path = os.path.join(staged_datasource_path, path) if path else staged_datasource_path
+    # Files of a datasource staged as a whole are reused as is.
+    if _is_staged(staging_dir, mount_slug, None, mounted_datasource_path, version) or (
+        path and _is_staged(staging_dir, mount_slug, path, mounted_path, version)
+    ):
+        return staged_path
+
+    with CacheLock(os.path.join(staging_dir, LOCKS_FOLDER, f"{mount_slug}.lock"), f"staging of '{mounted_path}'"):
+        # Another process may have staged it while we were waiting for the lock.
+        if _is_staged(staging_dir, mount_slug, path, mounted_path, version):
+            return staged_path
+        marker_path = _get_marker_path(staging_dir, mount_slug, path)
+        # Staging the whole datasource replaces the files staged on their own.
+        _remove(marker_path if path else os.path.dirname(marker_path))
+        _remove(staged_path)  # Partial copy of an interrupted staging, or copy of another version.
+        # Identify the mounted path before copying it, so a version mounted in the meantime is staged again.
+        mount_identity = _get_mount_identity(mounted_path)
+        _copy(mounted_path, staged_path)
+        os.makedirs(os.path.dirname(marker_path), exist_ok=True)
+        with open(marker_path, "w") as f:
+            f.write(f"{'' if version is None else version}\n{mount_identity}")
+    return staged_path
+
+
+def _is_staged(staging_dir: str, mount_slug: str, path: str | None, mounted_path: str, version: int | None) -> bool:
+    try:
+        with open(_get_marker_path(staging_dir, mount_slug, path)) as f:
+            staged_version, _, staged_mount_identity = f.read().partition("\n")
+    except FileNotFoundError:
+        return False
+    if version is not None:
+        return staged_version == str(version)
+    try:
+        return staged_mount_identity == _get_mount_identity(mounted_path)
+    except FileNotFoundError:
+        return False
+
+
+def _get_mount_identity(mounted_path: str) -> str:
+    stat = os.stat(mounted_path)
+    return f"{stat.st_dev}:{stat.st_ino}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _get_marker_path(staging_dir: str, mount_slug: str, path: str | None) -> str:
+    marker_base = os.path.join(staging_dir, COMPLETION_MARKER_FOLDER, mount_slug)
+    if path:
+        return os.path.join(marker_base, f"{path}.complete")
+    return os.path.join(marker_base, BUNDLE_MARKER_NAME)
+
+
+def _copy(mounted_path: str, staged_path: str) -> None:
+    if os.path.isdir(mounted_path):
+        rel_paths = [
+            os.path.relpath(os.path.join(dirpath, filename), mounted_path)
+            for dirpath, _, filenames in os.walk(mounted_path)
+            for filename in filenames
+        ]
+        files = [(os.path.join(mounted_path, rel_path), os.path.join(staged_path, rel_path)) for rel_path in rel_paths]
+    else:
+        files = [(mounted_path, staged_path)]
+    sizes = {src_path: os.path.getsize(src_path) for src_path, _ in files}
+    logger.info(f"Staging {len(files)} files from {mounted_path} to {staged_path}...")
+
+    progress_lock = threading.Lock()
+    with tqdm(
+        total=sum(sizes.values()), desc=f"Staging {len(files)} files", unit="B", unit_scale=True, unit_divisor=1024
+    ) as progress_bar:
+
+        def _copy_file(src_path: str, dst_path: str) -> None:
+            os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+            materialize.copy_file(src_path, dst_path)
+            with progress_lock:
+                progress_bar.update(sizes[src_path])
+
+        with ThreadPoolExecutor(max_workers=STAGING_MAX_WORKERS) as executor:
+            list(executor.map(lambda file: _copy_file(*file), files))
+
+
+def _remove(path: str) -> None:
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    elif os.path.exists(path):
+        os.remove(path)
@@ -0,0 +1,154 @@
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from kagglehub import cache_tiers
+from kagglehub.config import get_cache_folder, get_cache_tiers
+from kagglehub.handle import ResourceHandle
+
+
+@dataclass
+class HandleStats:
+    """Cache counters of a resource, since the process started.
+
+    Attributes:
+        hits: Number of lookups that found the resource (or one of its files) in the cache.
+        misses: Number of times the resource (or one of its files) had to be downloaded.
+        bytes_downloaded: Number of bytes downloaded for the resource.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    bytes_downloaded: int = 0
+
+    @property
+    def hit_rate(self) -> float | None:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+
+@dataclass
+class CacheStats(HandleStats):
+    """Cache counters of the process, in total and for each resource."""
+
+    handles: dict[ResourceHandle, HandleStats] = field(default_factory=dict)
+
+
+@dataclass
+class CacheEntryUsage:
+    """Disk usage of a cache entry.
+
+    Attributes:
+        handle: The handle of the entry.
+        path: The path of the file within the resource for single file entries, None for full resources.
+        size: Size of the entry's files in bytes.
+        num_files: Number of files in the entry.
+        last_access: Last time the entry was downloaded or loaded from the cache.
+    """
+
+    handle: ResourceHandle
+    path: str | None
+    size: int
+    num_files: int
+    last_access: datetime
+
+
+_lock = threading.Lock()
+_stats = CacheStats()
+
+
+def record_hit(handle: ResourceHandle) -> None:
+    with _lock:
+        _stats.hits += 1
+        _get_handle_stats(handle).hits += 1
+
+
+def record_miss(handle: ResourceHandle) -> None:
+    with _lock:
+        _stats.misses += 1
+        _get_handle_stats(handle).misses += 1
+
+
+def record_download(handle: ResourceHandle, num_bytes: int) -> None:
+    with _lock:
+        _stats.bytes_downloaded += num_bytes
+        _get_handle_stats(handle).bytes_downloaded += num_bytes
+
+
+def cache_stats() -> CacheStats:
+    """Returns a snapshot of the cache hit / miss and download counters of the current process."""
+    with _lock:
+        return CacheStats(
+            _stats.hits,
+            _stats.misses,
+            _stats.bytes_downloaded,
+            {h: HandleStats(s.hits, s.misses, s.bytes_downloaded) for h, s in _stats.handles.items()},
+        )
+
+
+def reset_cache_stats() -> None:
+    global _stats  # noqa: PLW0603
+    with _lock:
+        _stats = CacheStats()
+
+
+def cache_usage(handle: ResourceHandle | None = None) -> list[CacheEntryUsage]:
+    """Reports the disk usage of the entries of the default cache folder, largest first.
+
+    Only entries downloaded with a manifest are listed (see `KAGGLEHUB_DISABLE_CACHE_MANIFEST`). Copies in the cache
+    tiers aren't included in the size, but count as an access.
+
+    Args:
+        handle: (ResourceHandle) Optional handle of the resource to report. Reports all the cached resources if None.
+    """
+    from kagglehub.cache import Cache, find_stored_path  # noqa: PLC0415 - avoid circular import
+    from kagglehub.scrub import list_cache_entries, matches_handle  # noqa: PLC0415 - avoid circular import
+
+    cache = Cache()
+    cache_folder = get_cache_folder()
+    tiers = get_cache_tiers()
+    usages = []
+    for h, path in list_cache_entries():
+        if handle is not None and not matches_handle(handle, h):
+            continue
+        full_path = find_stored_path(cache.get_path(h, path), path)
+        if not full_path:
+            continue
+        marker_path = cache._get_completion_marker_filepath(h, path)
+        marker_paths = [marker_path] + [cache_tiers.rebase(marker_path, cache_folder, tier.path) for tier in tiers]
+        size, num_files = _get_disk_usage(full_path)
+        usages.append(CacheEntryUsage(h, path, size, num_files, _get_last_access(marker_paths)))
+    return sorted(usages, key=lambda usage: usage.size, reverse=True)
+
+
+def _get_handle_stats(handle: ResourceHandle) -> HandleStats:
+    # Must be called with the lock held.
+    if handle not in _stats.handles:
+        _stats.handles[handle] = HandleStats()
+    return _stats.handles[handle]
+
+
+def _get_disk_usage(path: str) -> tuple[int, int]:
+    if not os.path.isdir(path):
+        return os.path.getsize(path), 1
+    size = 0
+    num_files = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                size += os.path.getsize(os.path.join(dirpath, filename))
+            except OSError:
+                continue
+            num_files += 1
+    return size, num_files
+
+
+def _get_last_access(marker_paths: list[str]) -> datetime:
+    mtimes = []
+    for marker_path in marker_paths:
+        try:
+            mtimes.append(os.path.getmtime(marker_path))
+        except OSError:
+            continue
+    return datetime.fromtimestamp(max(mtimes, default=0), tz=timezone.utc)
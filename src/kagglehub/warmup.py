@@ -0,0 +1,122 @@
+import logging
+import os
+import pathlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from kagglesdk.kaggle_env import is_in_kaggle_notebook
+
+from kagglehub import registry, tracker
+from kagglehub.cache import (
+    COMPETITIONS_CACHE_SUBFOLDER,
+    DATASETS_CACHE_SUBFOLDER,
+    MODELS_CACHE_SUBFOLDER,
+    NOTEBOOKS_CACHE_SUBFOLDER,
+)
+from kagglehub.config import is_kaggle_cache_disabled
+from kagglehub.handle import CompetitionHandle, DatasetHandle, ModelHandle, NotebookHandle, ResourceHandle
+from kagglehub.kaggle_cache_resolver import attach_datasources
+from kagglehub.resolver import ForceDownload
+
+DEFAULT_MAX_WORKERS = 8
+
+logger = logging.getLogger(__name__)
+
+
+def cache_warmup(
+    filepath: str | pathlib.Path,
+    *,
+    output_dir: str | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    force_download: ForceDownload = False,
+) -> dict[ResourceHandle, str]:
+    """Downloads all the datasources listed in a tracker file, e.g. to prefetch them when building an image.
+
+    The file is the one written by `kagglehub.tracker.write_file`. Datasources are downloaded concurrently, at the
+    version recorded in the file. In a Kaggle notebook, they are all attached at once and their mounts waited for
+    together.
+
+    Args:
+        filepath: (str | pathlib.Path) Path of the yaml file listing the datasources.
+        output_dir: (string) Optional folder to download the datasources to, each in its own subfolder. Downloads to
+            the cache if None.
+        max_workers: (int) Maximum number of datasources downloaded in parallel.
+        force_download: (bool | "revalidate") Optional flag to force download of the datasources, even if they are
+            cached. With "revalidate", only the files that are missing or don't match are downloaded again.
+
+    Returns:
+        A dictionary mapping each (versioned) handle to the path of its downloaded files.
+    """
+    handles = _get_handles_to_warmup(tracker.read_file(filepath))
+    logger.info(f"Warming up the cache with {len(handles)} datasources...")
+
+    if is_in_kaggle_notebook() and not is_kaggle_cache_disabled():
+        # `output_dir` and `force_download` don't apply to mounted datasources.
+        paths = attach_datasources(handles, max_workers=max_workers)
+        logger.info(f"Attached {len(paths)} datasources.")
+        return paths
+
+    paths = {}
+    failures: dict[ResourceHandle, Exception] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                _download,
+                h,
+                output_dir=_get_output_dir(output_dir, h) if output_dir else None,
+                force_download=force_download,
+            ): h
+            for h in handles
+        }
+        for future in as_completed(futures):
+            h = futures[future]
+            try:
+                paths[h] = future.result()
+            except Exception as e:
+                logger.error(f"Failed to download {h}: {e}")
+                failures[h] = e
+
+    if failures:
+        failed_handle, first_failure = next(iter(failures.items()))
+        msg = f"Failed to download {len(failures)} of {len(handles)} datasources, first failure: {failed_handle}"
+        raise RuntimeError(msg) from first_failure
+
+    logger.info(f"Downloaded {len(paths)} datasources.")
+    return paths
+
+
+def _get_handles_to_warmup(datasources: tracker.VersionedDatasources) -> list[ResourceHandle]:
+    handles: list[ResourceHandle] = []
+    for h, version in datasources.items():
+        # Pin the version recorded in the file so the same files are downloaded, even if a new version was released.
+        if isinstance(h, (ModelHandle, DatasetHandle, NotebookHandle)) and not h.is_versioned() and version:
+            h = h.with_version(version)  # noqa: PLW2901
+        if h not in handles:
+            handles.append(h)
+    return handles
+
+
+def _download(h: ResourceHandle, *, output_dir: str | None, force_download: ForceDownload) -> str:
+    if isinstance(h, ModelHandle):
+        path, _ = registry.model_resolver(h, force_download=force_download, output_dir=output_dir)
+    elif isinstance(h, DatasetHandle):
+        path, _ = registry.dataset_resolver(h, force_download=force_download, output_dir=output_dir)
+    elif isinstance(h, CompetitionHandle):
+        path, _ = registry.competition_resolver(h, force_download=force_download, output_dir=output_dir)
+    elif isinstance(h, NotebookHandle):
+        path, _ = registry.notebook_output_resolver(h, force_download=force_download, output_dir=output_dir)
+    else:
+        msg = f"Invalid ResourceHandle type {h}"
+        raise ValueError(msg)
+    return path
+
+
+def _get_output_dir(output_dir: str, h: ResourceHandle) -> str:
+    if isinstance(h, ModelHandle):
+        subfolder = MODELS_CACHE_SUBFOLDER
+    elif isinstance(h, DatasetHandle):
+        subfolder = DATASETS_CACHE_SUBFOLDER
+    elif isinstance(h, CompetitionHandle):
+        subfolder = COMPETITIONS_CACHE_SUBFOLDER
+    else:
+        subfolder = NOTEBOOKS_CACHE_SUBFOLDER
+    return os.path.join(output_dir, subfolder, *str(h).split("/"))
@@ -1,12 +1,18 @@
 import unittest
 
 from kagglehub.config import clear_kaggle_credentials
+from kagglehub.mounts import clear_mounts
+from kagglehub.registry import clear_supported
+from kagglehub.signed_urls import clear_signed_urls
 
 
 class BaseTestCase(unittest.TestCase):
     def setUp(self) -> None:
         # Reset the global variable before each test
         clear_kaggle_credentials()
+        clear_mounts()
+        clear_supported()
+        clear_signed_urls()
 
     def tearDown(self) -> None:
         # Reset the global variable after each test
@@ -34,6 +34,8 @@ def error(e: Exception):  # noqa: ANN201
 @app.route(ColabClient.IS_MODEL_SUPPORTED_PATH, methods=["POST"])
 def models_is_supported() -> ResponseReturnValue:
     data = request.get_json()
+    if data["owner"] == "unsupported":
+        return "", 404
     version = LATEST_MODEL_VERSION
     if "version" in data:
         version = data["version"]
@@ -49,6 +51,8 @@ def models_is_supported() -> ResponseReturnValue:
 @app.route(ColabClient.MODEL_MOUNT_PATH, methods=["POST"])
 def models_mount() -> ResponseReturnValue:
     data = request.get_json()
+    if data["owner"] == "unsupported":
+        return "", 404
     version = LATEST_MODEL_VERSION
     if "version" in data:
         version = data["version"]
@@ -69,6 +73,8 @@ def models_mount() -> ResponseReturnValue:
 @app.route(ColabClient.IS_DATASET_SUPPORTED_PATH, methods=["POST"])
 def datasets_is_supported() -> ResponseReturnValue:
     data = request.get_json()
+    if data["owner"] == "unsupported":
+        return "", 404
     version = LATEST_DATASET_VERSION
     if "version" in data:
         version = data["version"]
@@ -82,6 +88,8 @@ def datasets_is_supported() -> ResponseReturnValue:
 @app.route(ColabClient.DATASET_MOUNT_PATH, methods=["POST"])
 def datasets_mount() -> ResponseReturnValue:
     data = request.get_json()
+    if data["owner"] == "unsupported":
+        return "", 404
     version = LATEST_DATASET_VERSION
     if "version" in data:
         version = data["version"]
@@ -0,0 +1,83 @@
+import os
+import time
+
+from flask import Flask, jsonify, request, send_file
+from flask.typing import ResponseReturnValue
+from kagglesdk.datasets.types.dataset_api_service import (
+    ApiDataset,
+    ApiDownloadDatasetRequest,
+    ApiGetDatasetRequest,
+    ApiListDatasetFilesRequest,
+)
+
+from tests.utils import AUTO_COMPRESSED_FILE_NAME, add_mock_gcs_route, get_gcs_redirect_response, get_test_file_path
+
+app = Flask(__name__)
+add_mock_gcs_route(app)
+
+RANGED_GCS_BASE_PATH = "/mock-ranged-gcs-bucket"
+SIGNED_URL_LIFETIME = 3600  # seconds
+PAGE_SIZE = 2
+# Files of the dataset, and the test files served for them.
+FILES = {
+    "shapes.parquet": "shapes.parquet",
+    AUTO_COMPRESSED_FILE_NAME: AUTO_COMPRESSED_FILE_NAME,
+    "sub/foo.txt": "foo.txt",
+}
+
+
+@app.route("/", methods=["HEAD"])
+def head() -> ResponseReturnValue:
+    return "", 200
+
+
+@app.route("/api/v1/datasets.DatasetApiService/GetDataset", methods=["POST"])
+def dataset_get() -> ResponseReturnValue:
+    r = ApiGetDatasetRequest.from_dict(request.get_json())
+    dataset = ApiDataset()
+    dataset.owner_name = r.owner_slug
+    dataset.title = r.dataset_slug
+    dataset.current_version_number = 2
+    return dataset.to_json(), 200
+
+
+@app.route("/api/v1/datasets.DatasetApiService/ListDatasetFiles", methods=["POST"])
+def dataset_list_files() -> ResponseReturnValue:
+    r = ApiListDatasetFilesRequest.from_dict(request.get_json())
+    start = int(r.page_token or 0)
+    names = list(FILES)[start : start + PAGE_SIZE]
+    data = {
+        "datasetFiles": [
+            {"name": name, "totalBytes": os.path.getsize(get_test_file_path(FILES[name]))} for name in names
+        ],
+        "nextPageToken": str(start + PAGE_SIZE) if start + PAGE_SIZE < len(FILES) else "",
+    }
+    return jsonify(data), 200
+
+
+@app.route("/api/v1/datasets.DatasetApiService/DownloadDataset", methods=["POST"])
+def dataset_download() -> ResponseReturnValue:
+    r = ApiDownloadDatasetRequest.from_dict(request.get_json())
+    if r.file_name == AUTO_COMPRESSED_FILE_NAME:
+        # Served zipped: not readable by ranges.
+        return get_gcs_redirect_response(f"{AUTO_COMPRESSED_FILE_NAME}.zip")
+    return (
+        "",
+        302,
+        {
+            "Location": f"{request.host_url.rstrip('/')}{RANGED_GCS_BASE_PATH}/{FILES[r.file_name]}"
+            f"?Expires={int(time.time()) + SIGNED_URL_LIFETIME}&Signature=sig"
+        },
+    )
+
+
+@app.route(f"{RANGED_GCS_BASE_PATH}/<file_name>", methods=["GET"])
+def ranged_gcs_download(file_name: str) -> ResponseReturnValue:
+    # Supports the Range header, like GCS.
+    return send_file(get_test_file_path(file_name), conditional=True)
+
+
+@app.errorhandler(404)
+def error(e: Exception):  # noqa: ANN201
+    data = {"message": "Some response data", "error": str(e)}
+    return jsonify(data), 404
@@ -1,9 +1,11 @@
 import hashlib
+import itertools
 import os
 from collections.abc import Generator
+from datetime import datetime, timezone
 from typing import Any
 
-from flask import Flask, Response, jsonify, request
+from flask import Flask, Response, jsonify, redirect, request
 from flask.typing import ResponseReturnValue
 from kagglesdk.models.types.model_api_service import (
     ApiDownloadModelInstanceVersionRequest,
@@ -21,6 +23,13 @@ app = Flask(__name__)
 INVALID_ARCHIVE_HANDLE = "metaresearch/llama-2/pyTorch/bad-archive-variation/1"
 ZIP_ARCHIVE_HANDLE = "testorg/testmodel/jax/zip/3"
 TOO_MANY_FILES_FOR_PARALLEL_DOWNLOAD_HANDLE = "testorg/testmodel/jax/too-many-files/1"
+# Files of this handle are downloaded from signed URLs, like from Google Cloud Storage.
+SIGNED_URL_HANDLE = "testorg/testmodel/jax/signed-url/1"
+SIGNED_URL_EXPIRES = 3600  # seconds
+
+_signatures = itertools.count()
+# Signatures of the signed URLs rejected by the mock storage.
+revoked_signatures: set[str] = set()
 
 # See https://cloud.google.com/storage/docs/xml-api/reference-headers#xgooghash
 GCS_HASH_HEADER = "x-goog-hash"
@@ -46,6 +55,13 @@ def model_download_instance_version() -> ResponseReturnValue:
     r = ApiDownloadModelInstanceVersionRequest.from_dict(request.get_json())
     handle = f"{r.owner_slug}/{r.model_slug}/{enum_to_str(r.framework)}/{r.instance_slug}/{r.version_number}"
 
+    if r.path and handle == SIGNED_URL_HANDLE:
+        signed_at = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        return redirect(
+            f"/mock-signed-storage/{r.path}?X-Goog-Date={signed_at}&X-Goog-Expires={SIGNED_URL_EXPIRES}"
+            f"&X-Goog-Signature={next(_signatures)}"
+        )
+
     if r.path:
         test_file_path = get_test_file_path(r.path)
 
@@ -90,6 +106,18 @@ def model_download_instance_version() -> ResponseReturnValue:
         return resp, 200
 
 
+@app.route("/mock-signed-storage/<file_name>", methods=["GET"])
+def signed_storage_download(file_name: str) -> ResponseReturnValue:
+    if request.args["X-Goog-Signature"] in revoked_signatures:
+        return "<Error><Code>ExpiredToken</Code></Error>", 403
+    with open(get_test_file_path(file_name), "rb") as f:
+        return f.read(), 200
+
+
+def revoke_signed_urls() -> None:
+    revoked_signatures.update(str(i) for i in range(next(_signatures)))
+
+
 @app.route("/api/v1/models.ModelApiService/ListModelInstanceVersionFiles", methods=["POST"])
 def model_list_files() -> ResponseReturnValue:
     r = ApiListModelInstanceVersionFilesRequest.from_dict(request.get_json())
@@ -54,7 +54,8 @@ def notebook_output_download() -> ResponseReturnValue:
 
     # First, determine if we're fetching a file or the whole notebook output
     if r.kernel_slug == "package-test":
-        test_file_name = f"package-v{r.version_number}.zip"
+        # Without a version number, the latest version is downloaded.
+        test_file_name = f"package-v{r.version_number or 2}.zip"
     elif r.file_path:
         # This mimics behavior for our file downloads, where users request a file, but
         # receive a zipped version of the file from GCS.
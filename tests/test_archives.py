@@ -0,0 +1,105 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import kagglehub
+from kagglehub import archives
+from kagglehub.cache import Cache
+from kagglehub.config import KEEP_ARCHIVES_ENV_VAR_NAME
+from kagglehub.handle import parse_dataset_handle
+from tests.fixtures import BaseTestCase
+
+from .server_stubs import dataset_download_stub as stub
+from .server_stubs import serv
+from .utils import create_test_cache
+
+VERSIONED_DATASET_HANDLE = "sarahjeffreson/featured-spotify-artiststracks-with-metadata/versions/2"
+TEST_FILEPATH = "foo.txt"
+# Content of foo.txt in the archive served by the stub, which differs from the file served on its own.
+ARCHIVED_TEST_FILE_CONTENT = "foo\n"
+
+
+class TestArchiveBackedCache(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = serv.start_server(stub.app)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.env_patch = mock.patch.dict(os.environ, {KEEP_ARCHIVES_ENV_VAR_NAME: "true"})
+        self.env_patch.start()
+
+    def tearDown(self) -> None:
+        self.env_patch.stop()
+        super().tearDown()
+
+    def test_archive_kept_as_entry(self) -> None:
+        with create_test_cache():
+            dataset_path = kagglehub.dataset_download(VERSIONED_DATASET_HANDLE)
+
+            self.assertTrue(dataset_path.endswith(archives.ARCHIVE_SUFFIX))
+            self.assertTrue(os.path.isfile(dataset_path))
+            root = kagglehub.open_archive(dataset_path)
+            self.assertEqual([TEST_FILEPATH], [p.name for p in root.iterdir()])
+            self.assertEqual(ARCHIVED_TEST_FILE_CONTENT, root.joinpath(TEST_FILEPATH).read_text())
+
+            # Cache hit.
+            self.assertEqual(dataset_path, Cache().load_from_cache(parse_dataset_handle(VERSIONED_DATASET_HANDLE)))
+
+    def test_file_extracted_from_archive(self) -> None:
+        with create_test_cache():
+            kagglehub.dataset_download(VERSIONED_DATASET_HANDLE)
+
+            file_path = kagglehub.dataset_download(VERSIONED_DATASET_HANDLE, path=TEST_FILEPATH)
+
+            with open(file_path) as f:
+                self.assertEqual(ARCHIVED_TEST_FILE_CONTENT, f.read())
+            self.assertEqual(
+                file_path, Cache().load_from_cache(parse_dataset_handle(VERSIONED_DATASET_HANDLE), TEST_FILEPATH)
+            )
+            # The archive is still the entry of the whole resource.
+            self.assertTrue(kagglehub.dataset_download(VERSIONED_DATASET_HANDLE).endswith(archives.ARCHIVE_SUFFIX))
+
+    def test_missing_member_downloaded(self) -> None:
+        with create_test_cache():
+            kagglehub.dataset_download(VERSIONED_DATASET_HANDLE)
+
+            file_path = kagglehub.dataset_download(VERSIONED_DATASET_HANDLE, path="shapes.csv")
+
+            self.assertTrue(os.path.isfile(file_path))
+
+    def test_delete_archive_entry(self) -> None:
+        with create_test_cache():
+            dataset_path = kagglehub.dataset_download(VERSIONED_DATASET_HANDLE)
+
+            Cache().delete_from_cache(parse_dataset_handle(VERSIONED_DATASET_HANDLE))
+
+            self.assertFalse(os.path.exists(dataset_path))
+
+    def test_scrub_repairs_archive(self) -> None:
+        with create_test_cache():
+            dataset_path = kagglehub.dataset_download(VERSIONED_DATASET_HANDLE)
+            self.assertEqual([], kagglehub.cache_scrub()[0].bad_files)
+            os.truncate(dataset_path, 1)
+
+            results = kagglehub.cache_scrub(repair=True)
+
+            self.assertEqual([os.path.basename(dataset_path)], results[0].repaired_files)
+            self.assertEqual(
+                ARCHIVED_TEST_FILE_CONTENT, kagglehub.open_archive(dataset_path).joinpath(TEST_FILEPATH).read_text()
+            )
+
+    def test_output_dir_extracted(self) -> None:
+        with TemporaryDirectory() as d:
+            self.assertEqual(d, kagglehub.dataset_download(VERSIONED_DATASET_HANDLE, output_dir=d))
+
+            self.assertIn(TEST_FILEPATH, os.listdir(d))
+
+    def test_open_archive_rejects_folders(self) -> None:
+        with TemporaryDirectory() as d:
+            with self.assertRaises(ValueError):
+                kagglehub.open_archive(d)
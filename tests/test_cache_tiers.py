@@ -0,0 +1,231 @@
+import os
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from kagglehub import cache_tiers
+from kagglehub.cache import Cache
+from kagglehub.config import CACHE_TIER_EVICTION_GRACE_PERIOD_ENV_VAR_NAME, CACHE_TIERS_ENV_VAR_NAME, CacheTier
+from kagglehub.handle import ModelHandle
+from tests.fixtures import BaseTestCase
+
+from .utils import create_test_cache
+
+TEST_MODEL_HANDLE = ModelHandle(
+    owner="google",
+    model="bert",
+    framework="tensorFlow2",
+    variation="answer-equivalence-bem",
+    version=2,
+)
+TEST_MODEL_SUBDIR = os.path.join("models", "google", "bert", "tensorFlow2", "answer-equivalence-bem", "2")
+TEST_FILEPATH = "foo.txt"
+
+
+def _wait_until(condition: Callable[[], bool], timeout: float = 5) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+@contextmanager
+def _create_test_tier(size: str | None = None) -> Generator[str, None, None]:
+    with TemporaryDirectory() as d:
+        tier = f"{d}={size}" if size else d
+        with mock.patch.dict(os.environ, {CACHE_TIERS_ENV_VAR_NAME: tier}):
+            yield d
+
+
+def _add_to_cache(cache: Cache, path: str, content: str = "hello") -> str:
+    full_path = cache.get_path(TEST_MODEL_HANDLE, path)
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    Path(full_path).write_text(content)
+    cache.mark_as_complete(TEST_MODEL_HANDLE, path)
+    return full_path
+
+
+class TestCacheTiers(BaseTestCase):
+    def test_hit_in_default_cache_is_promoted(self) -> None:
+        with create_test_cache() as cache_dir, _create_test_tier() as tier_dir:
+            full_path = os.path.join(cache_dir, TEST_MODEL_SUBDIR, TEST_FILEPATH)
+            os.makedirs(os.path.dirname(full_path))
+            Path(full_path).write_text("hello")
+            # Mark as complete in the default cache only.
+            with mock.patch.dict(os.environ, {CACHE_TIERS_ENV_VAR_NAME: ""}):
+                Cache().mark_as_complete(TEST_MODEL_HANDLE, TEST_FILEPATH)
+
+            self.assertEqual(full_path, Cache().load_from_cache(TEST_MODEL_HANDLE, TEST_FILEPATH))
+
+            tier_path = os.path.join(tier_dir, TEST_MODEL_SUBDIR, TEST_FILEPATH)
+            self.assertTrue(_wait_until(lambda: Cache().load_from_cache(TEST_MODEL_HANDLE, TEST_FILEPATH) == tier_path))
+            self.assertEqual("hello", Path(tier_path).read_text())
+
+    def test_new_download_is_written_to_default_cache_and_promoted(self) -> None:
+        with create_test_cache() as cache_dir, _create_test_tier() as tier_dir:
+            full_path = _add_to_cache(Cache(), TEST_FILEPATH)
+
+            self.assertTrue(full_path.startswith(cache_dir))
+            tier_path = os.path.join(tier_dir, TEST_MODEL_SUBDIR, TEST_FILEPATH)
+            self.assertTrue(_wait_until(lambda: Cache().load_from_cache(TEST_MODEL_HANDLE, TEST_FILEPATH) == tier_path))
+
+    def test_bundle_is_promoted(self) -> None:
+        with create_test_cache(), _create_test_tier() as tier_dir:
+            cache = Cache()
+            _add_to_cache(cache, os.path.join("variables", "variables.txt"))
+            cache.mark_as_complete(TEST_MODEL_HANDLE)
+
+            tier_path = os.path.join(tier_dir, TEST_MODEL_SUBDIR)
+            self.assertTrue(_wait_until(lambda: Cache().load_from_cache(TEST_MODEL_HANDLE) == tier_path))
+            self.assertEqual(["variables.txt"], os.listdir(os.path.join(tier_path, "variables")))
+
+    def test_delete_from_cache_deletes_tier_copies(self) -> None:
+        with create_test_cache(), _create_test_tier() as tier_dir:
+            _add_to_cache(Cache(), TEST_FILEPATH)
+            tier_path = os.path.join(tier_dir, TEST_MODEL_SUBDIR, TEST_FILEPATH)
+            self.assertTrue(_wait_until(lambda: Cache().load_from_cache(TEST_MODEL_HANDLE, TEST_FILEPATH) == tier_path))
+
+            Cache().delete_from_cache(TEST_MODEL_HANDLE, TEST_FILEPATH)
+
+            self.assertIsNone(Cache().load_from_cache(TEST_MODEL_HANDLE, TEST_FILEPATH))
+            self.assertFalse(os.path.exists(tier_path))
+            # Empty folders are removed up until the tier folder.
+            self.assertEqual([], os.listdir(tier_dir))
+
+    def test_override_dir_ignores_tiers(self) -> None:
+        with create_test_cache(), _create_test_tier() as tier_dir:
+            with TemporaryDirectory() as output_dir:
+                _add_to_cache(Cache(override_dir=output_dir), TEST_FILEPATH)
+                time.sleep(0.2)
+                self.assertEqual([], os.listdir(tier_dir))
+
+
+class TestTierEviction(BaseTestCase):
+    def test_least_recently_used_entries_are_evicted(self) -> None:
+        with TemporaryDirectory() as src_dir, TemporaryDirectory() as tier_dir:
+            tier = CacheTier(tier_dir, max_size=25)
+            for i, name in enumerate(["a", "b", "c"]):
+                src_path = os.path.join(src_dir, name)
+                Path(src_path).write_text("0123456789")
+                cache_tiers.promote(
+                    src_path, tier, os.path.join(tier_dir, name), os.path.join(tier_dir, f"{name}.complete")
+                )
+                # Make the access order deterministic, then access "a" again: "b" is the least recently used.
+                os.utime(os.path.join(tier_dir, f"{name}.complete"), (i, i))
+                if name == "b":
+                    cache_tiers.touch(os.path.join(tier_dir, "a.complete"))
+
+            self.assertEqual(
+                sorted(["a", "a.complete", "c", "c.complete"]),
+                sorted(os.listdir(tier_dir)),
+            )
+
+    def test_recently_used_entries_are_not_evicted(self) -> None:
+        with TemporaryDirectory() as src_dir, TemporaryDirectory() as tier_dir:
+            tier = CacheTier(tier_dir, max_size=15)
+            for name in ["a", "b"]:
+                src_path = os.path.join(src_dir, name)
+                Path(src_path).write_text("0123456789")
+                cache_tiers.promote(
+                    src_path, tier, os.path.join(tier_dir, name), os.path.join(tier_dir, f"{name}.complete")
+                )
+
+            # "a" was just returned to a caller: it's kept even though the tier is full.
+            self.assertEqual(sorted(["a", "a.complete", "b", "b.complete"]), sorted(os.listdir(tier_dir)))
+
+    def test_recently_used_entries_are_evicted_after_grace_period(self) -> None:
+        with (
+            TemporaryDirectory() as src_dir,
+            TemporaryDirectory() as tier_dir,
+            mock.patch.dict(os.environ, {CACHE_TIER_EVICTION_GRACE_PERIOD_ENV_VAR_NAME: "0"}),
+        ):
+            tier = CacheTier(tier_dir, max_size=15)
+            for name in ["a", "b"]:
+                src_path = os.path.join(src_dir, name)
+                Path(src_path).write_text("0123456789")
+                cache_tiers.promote(
+                    src_path, tier, os.path.join(tier_dir, name), os.path.join(tier_dir, f"{name}.complete")
+                )
+
+            self.assertEqual(sorted(["b", "b.complete"]), sorted(os.listdir(tier_dir)))
+
+    def test_stale_promotions_are_removed(self) -> None:
+        with TemporaryDirectory() as tier_dir:
+            tier = CacheTier(tier_dir, max_size=100)
+            stale_path = os.path.join(tier_dir, "models", f"a.promote-{'0' * 32}")
+            os.makedirs(stale_path)
+            Path(stale_path, "foo.txt").write_text("0123456789")
+            in_progress_path = os.path.join(tier_dir, f"b.promote-{'1' * 32}")
+            Path(in_progress_path).write_text("0123456789")
+            os.utime(in_progress_path, (0, 0))
+
+            # Copies keep the mtime of their source: only the one written to recently is kept.
+            with mock.patch.object(
+                cache_tiers, "_get_last_change", side_effect=lambda p: 0 if p == stale_path else time.time()
+            ):
+                cache_tiers.evict(tier)
+
+            self.assertFalse(os.path.exists(stale_path))
+            self.assertTrue(os.path.exists(in_progress_path))
+
+    def test_files_of_entries_are_not_taken_for_markers(self) -> None:
+        with TemporaryDirectory() as src_dir, TemporaryDirectory() as tier_dir:
+            tier = CacheTier(tier_dir, max_size=100)
+            bundle_path = os.path.join(src_dir, "bundle")
+            os.makedirs(bundle_path)
+            # Files named like markers, one with content that could be taken for a marker's.
+            Path(bundle_path, "a.complete").write_text("bundle\n1")
+            Path(bundle_path, "b.complete").write_text("not a marker")
+            cache_tiers.promote(bundle_path, tier, os.path.join(tier_dir, "bundle"), f"{tier_dir}/bundle.complete")
+            Path(tier_dir, "c.complete").write_text("../outside\n1")
+
+            self.assertEqual(
+                [(os.path.join(tier_dir, "bundle"), 20)],
+                [(entry.data_path, entry.size) for entry in cache_tiers.list_tier_entries(tier)],
+            )
+
+    def test_entry_size_is_recorded_in_marker(self) -> None:
+        with TemporaryDirectory() as src_dir, TemporaryDirectory() as tier_dir:
+            tier = CacheTier(tier_dir, max_size=100)
+            src_path = os.path.join(src_dir, "a")
+            Path(src_path).write_text("0123456789")
+            cache_tiers.promote(src_path, tier, os.path.join(tier_dir, "a"), os.path.join(tier_dir, "a.complete"))
+
+            with mock.patch.object(cache_tiers, "get_size", side_effect=AssertionError):
+                self.assertEqual([10], [entry.size for entry in cache_tiers.list_tier_entries(tier)])
+
+    def test_bundle_promotion_stops_tracking_its_files(self) -> None:
+        with TemporaryDirectory() as src_dir, TemporaryDirectory() as tier_dir:
+            tier = CacheTier(tier_dir, max_size=100)
+            bundle_path = os.path.join(src_dir, "bundle")
+            os.makedirs(bundle_path)
+            Path(bundle_path, "a").write_text("0123456789")
+            cache_tiers.promote(
+                os.path.join(bundle_path, "a"),
+                tier,
+                os.path.join(tier_dir, "bundle", "a"),
+                os.path.join(tier_dir, "a.complete"),
+            )
+
+            cache_tiers.promote(bundle_path, tier, os.path.join(tier_dir, "bundle"), f"{tier_dir}/bundle.complete")
+
+            self.assertEqual(
+                [os.path.join(tier_dir, "bundle")],
+                [entry.data_path for entry in cache_tiers.list_tier_entries(tier)],
+            )
+
+    def test_entry_larger_than_tier_is_not_promoted(self) -> None:
+        with TemporaryDirectory() as src_dir, TemporaryDirectory() as tier_dir:
+            src_path = os.path.join(src_dir, "big")
+            Path(src_path).write_text("0123456789")
+
+            cache_tiers.promote(
+                src_path, CacheTier(tier_dir, max_size=5), os.path.join(tier_dir, "big"), f"{tier_dir}/big.complete"
+            )
+
+            self.assertEqual([], os.listdir(tier_dir))
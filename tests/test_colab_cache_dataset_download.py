@@ -4,7 +4,12 @@ from unittest import mock
 import requests
 
 import kagglehub
-from kagglehub.config import DISABLE_COLAB_CACHE_ENV_VAR_NAME, TBE_RUNTIME_ADDR_ENV_VAR_NAME
+from kagglehub.clients import ColabClient
+from kagglehub.config import (
+    DISABLE_COLAB_CACHE_ENV_VAR_NAME,
+    DISABLE_COLAB_SPECULATIVE_MOUNT_ENV_VAR_NAME,
+    TBE_RUNTIME_ADDR_ENV_VAR_NAME,
+)
 from tests.fixtures import BaseTestCase
 
 from .server_stubs import colab_stub as stub
@@ -16,6 +21,7 @@ UNVERSIONED_DATASET_HANDLE = "sarahjeffreson/featured-spotify-artiststracks-with
 TEST_FILEPATH = "foo.txt"
 TEST_CONTENTS = "foo\n"
 UNAVAILABLE_DATASET_HANDLE = "unavailable/dataset/versions/1"
+UNSUPPORTED_DATASET_HANDLE = "unsupported/dataset/versions/1"
 
 
 class TestColabCacheDatasetDownload(BaseTestCase):
@@ -63,6 +69,48 @@ class TestColabCacheDatasetDownload(BaseTestCase):
             with self.assertRaises(ValueError):
                 kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE, "missing.txt")
 
+    def test_dataset_download_reuses_mount(self) -> None:
+        with stub.create_env():
+            dataset_path = kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE)
+
+            with mock.patch.object(ColabClient, "post", autospec=True, side_effect=ColabClient.post) as post:
+                dataset_file_path = kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE, TEST_FILEPATH)
+                kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE)
+
+            # Neither the support check nor the mount request are sent again.
+            post.assert_not_called()
+            self.assertEqual(os.path.join(dataset_path, TEST_FILEPATH), dataset_file_path)
+
+    def test_dataset_download_sends_mount_request_only(self) -> None:
+        with stub.create_env():
+            with mock.patch.object(ColabClient, "post", autospec=True, side_effect=ColabClient.post) as post:
+                kagglehub.dataset_download(VERSIONED_DATASET_HANDLE)
+
+            self.assertEqual(1, post.call_count)
+            self.assertEqual(ColabClient.DATASET_MOUNT_PATH, post.call_args.args[2])
+
+    def test_dataset_download_checks_support_first_when_speculative_mount_disabled(self) -> None:
+        with stub.create_env(), mock.patch.dict(os.environ, {DISABLE_COLAB_SPECULATIVE_MOUNT_ENV_VAR_NAME: "true"}):
+            with mock.patch.object(ColabClient, "post", autospec=True, side_effect=ColabClient.post) as post:
+                kagglehub.dataset_download(VERSIONED_DATASET_HANDLE)
+
+            self.assertEqual(
+                [ColabClient.IS_DATASET_SUPPORTED_PATH, ColabClient.DATASET_MOUNT_PATH],
+                [call.args[2] for call in post.call_args_list],
+            )
+
+    def test_unsupported_dataset_falls_back_to_http_resolver(self) -> None:
+        with create_test_cache(), stub.create_env():
+            with mock.patch.object(ColabClient, "post", autospec=True, side_effect=ColabClient.post) as post:
+                # Assert that a ConnectionError is set (uses HTTP server which is not set)
+                with self.assertRaises(requests.exceptions.ConnectionError):
+                    kagglehub.dataset_download(UNSUPPORTED_DATASET_HANDLE)
+                # The decision is remembered: the Colab cache isn't tried again.
+                with self.assertRaises(requests.exceptions.ConnectionError):
+                    kagglehub.dataset_download(UNSUPPORTED_DATASET_HANDLE)
+
+            self.assertEqual(1, post.call_count)
+
     def test_colab_resolver_skipped_when_disable_colab_cache_env_var_name(self) -> None:
         with create_test_cache():  # falls back to http resolver, make sure to use a test cache.
             with mock.patch.dict(os.environ, {DISABLE_COLAB_CACHE_ENV_VAR_NAME: "true"}):
@@ -0,0 +1,137 @@
+import gzip
+import os
+import zipfile
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import kagglehub
+from kagglehub import compression
+from kagglehub.cache import Cache
+from kagglehub.config import CACHE_COMPRESSION_ENV_VAR_NAME
+from kagglehub.handle import parse_dataset_handle
+from tests.fixtures import BaseTestCase
+
+from .server_stubs import dataset_download_stub as stub
+from .server_stubs import serv
+from .utils import create_test_cache, get_test_file_path
+
+VERSIONED_DATASET_HANDLE = "sarahjeffreson/featured-spotify-artiststracks-with-metadata/versions/2"
+TEST_FILEPATH = "foo.txt"
+
+
+class TestCompression(BaseTestCase):
+    def test_compress_file(self) -> None:
+        with TemporaryDirectory() as d:
+            path = os.path.join(d, "data.csv")
+            with open(path, "wb") as f:
+                f.write(b"a,b\n1,2\n" * 1000)
+
+            compressed_path = compression.compress_file(path, "gzip")
+
+            self.assertEqual(path + ".gz", compressed_path)
+            self.assertFalse(os.path.exists(path))
+            with open(compressed_path, "rb") as f:
+                self.assertEqual(b"a,b\n1,2\n" * 1000, gzip.decompress(f.read()))
+            with compression.open_file(compressed_path) as f:
+                self.assertEqual(b"a,b\n1,2\n" * 1000, f.read())
+
+    def test_compress_entry_skips_binary_files(self) -> None:
+        with TemporaryDirectory() as d:
+            for name in ["data.csv", os.path.join("sub", "data.jsonl"), "model.bin"]:
+                os.makedirs(os.path.dirname(os.path.join(d, name)), exist_ok=True)
+                with open(os.path.join(d, name), "wb") as f:
+                    f.write(b"content")
+
+            self.assertEqual(d, compression.compress_entry(d, "gzip"))
+
+            self.assertEqual(["data.csv.gz", "model.bin", "sub"], sorted(os.listdir(d)))
+            self.assertEqual(["data.jsonl.gz"], os.listdir(os.path.join(d, "sub")))
+
+    def test_find(self) -> None:
+        with TemporaryDirectory() as d:
+            path = os.path.join(d, "data.csv")
+            self.assertIsNone(compression.find(path))
+            open(path + ".gz", "wb").close()
+            self.assertEqual(path + ".gz", compression.find(path))
+            open(path, "wb").close()
+            self.assertEqual(path, compression.find(path))
+
+    def test_get_original_path(self) -> None:
+        self.assertEqual("train.csv", compression.get_original_path("train.csv.gz"))
+        self.assertEqual("train.csv", compression.get_original_path("train.csv.zst"))
+        # Files compressed upstream are left alone.
+        self.assertEqual("archive.tar.gz", compression.get_original_path("archive.tar.gz"))
+
+
+class TestCompressedCache(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = serv.start_server(stub.app)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.env_patch = mock.patch.dict(os.environ, {CACHE_COMPRESSION_ENV_VAR_NAME: "gzip"})
+        self.env_patch.start()
+
+    def tearDown(self) -> None:
+        self.env_patch.stop()
+        super().tearDown()
+
+    def _assert_matches_test_file(self, compressed_path: str, *, from_archive: bool = False) -> None:
+        if from_archive:
+            with zipfile.ZipFile(get_test_file_path(f"{TEST_FILEPATH}.zip")) as archive:
+                expected = archive.read(TEST_FILEPATH)
+        else:
+            with open(get_test_file_path(TEST_FILEPATH), "rb") as f:
+                expected = f.read()
+        with compression.open_file(compressed_path) as f:
+            self.assertEqual(expected, f.read())
+
+    def test_dataset_download_compressed(self) -> None:
+        with create_test_cache():
+            dataset_path = kagglehub.dataset_download(VERSIONED_DATASET_HANDLE)
+
+            self.assertEqual([f"{TEST_FILEPATH}.gz"], os.listdir(dataset_path))
+            self._assert_matches_test_file(os.path.join(dataset_path, f"{TEST_FILEPATH}.gz"), from_archive=True)
+
+    def test_file_download_compressed_and_cached(self) -> None:
+        with create_test_cache():
+            file_path = kagglehub.dataset_download(VERSIONED_DATASET_HANDLE, path=TEST_FILEPATH)
+
+            self.assertTrue(file_path.endswith(f"{TEST_FILEPATH}.gz"))
+            self._assert_matches_test_file(file_path)
+            h = parse_dataset_handle(VERSIONED_DATASET_HANDLE)
+            self.assertEqual(file_path, Cache().load_from_cache(h, TEST_FILEPATH))
+            self.assertEqual([], Cache().verify(h, TEST_FILEPATH))
+
+    def test_delete_compressed_file(self) -> None:
+        with create_test_cache():
+            file_path = kagglehub.dataset_download(VERSIONED_DATASET_HANDLE, path=TEST_FILEPATH)
+
+            Cache().delete_from_cache(parse_dataset_handle(VERSIONED_DATASET_HANDLE), TEST_FILEPATH)
+
+            self.assertFalse(os.path.exists(file_path))
+
+    def test_scrub_repairs_compressed_bundle_file(self) -> None:
+        with create_test_cache():
+            dataset_path = kagglehub.dataset_download(VERSIONED_DATASET_HANDLE)
+            compressed_path = os.path.join(dataset_path, f"{TEST_FILEPATH}.gz")
+            os.truncate(compressed_path, 1)
+
+            results = kagglehub.cache_scrub(repair=True)
+
+            self.assertEqual([f"{TEST_FILEPATH}.gz"], results[0].repaired_files)
+            # Downloaded again on its own, not from the archive.
+            self._assert_matches_test_file(compressed_path)
+            self.assertTrue(all(not result.bad_files for result in kagglehub.cache_scrub()))
+
+    def test_output_dir_not_compressed(self) -> None:
+        with TemporaryDirectory() as d:
+            kagglehub.dataset_download(VERSIONED_DATASET_HANDLE, output_dir=d)
+
+            self.assertIn(TEST_FILEPATH, os.listdir(d))
+            self.assertNotIn(f"{TEST_FILEPATH}.gz", os.listdir(d))
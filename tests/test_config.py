@@ -5,20 +5,42 @@ from tempfile import TemporaryDirectory
 from unittest import mock
 
 from kagglehub.config import (
+    API_MAX_RETRIES_ENV_VAR_NAME,
+    API_RATE_LIMIT_ENV_VAR_NAME,
+    CACHE_COMPRESSION_ENV_VAR_NAME,
     CACHE_FOLDER_ENV_VAR_NAME,
+    CACHE_TIERS_ENV_VAR_NAME,
     CREDENTIALS_FILENAME,
     CREDENTIALS_FOLDER_ENV_VAR_NAME,
+    DEFAULT_API_MAX_RETRIES,
     DEFAULT_CACHE_FOLDER,
+    DEFAULT_SUPPORT_CACHE_TTL,
     DISABLE_KAGGLE_CACHE_ENV_VAR_NAME,
+    KEEP_ARCHIVES_ENV_VAR_NAME,
     KEY_ENV_VAR_NAME,
     LOG_VERBOSITY_ENV_VAR_NAME,
+    MOUNT_STAGING_DIR_ENV_VAR_NAME,
+    MOUNT_TIMEOUT_ENV_VAR_NAME,
+    OUTPUT_DIR_LINK_MODE_ENV_VAR_NAME,
+    SUPPORT_CACHE_TTL_ENV_VAR_NAME,
     USERNAME_ENV_VAR_NAME,
+    CacheTier,
     clear_kaggle_credentials,
+    get_api_max_retries,
+    get_api_rate_limit,
+    get_cache_compression,
     get_cache_folder,
+    get_cache_tiers,
     get_kaggle_credentials,
     get_log_verbosity,
+    get_mount_staging_dir,
+    get_mount_timeout,
+    get_output_dir_link_mode,
+    get_support_cache_ttl,
     is_colab_cache_disabled,
     is_kaggle_cache_disabled,
+    is_keep_archives_enabled,
+    parse_size,
     set_kaggle_api_token,
     set_kaggle_credentials,
 )
@@ -33,6 +55,89 @@ class TestConfig(BaseTestCase):
     def test_get_cache_folder_environment_var_override(self) -> None:
         self.assertEqual("/test_cache", get_cache_folder())
 
+    def test_get_cache_tiers_default(self) -> None:
+        self.assertEqual([], get_cache_tiers())
+
+    def test_get_cache_tiers_environment_var_override(self) -> None:
+        tiers = os.pathsep.join(["/mnt/ram/kagglehub=512M", "/mnt/nvme/kagglehub/=50GB", "/mnt/ssd/kagglehub"])
+        with mock.patch.dict(os.environ, {CACHE_TIERS_ENV_VAR_NAME: tiers}):
+            self.assertEqual(
+                [
+                    CacheTier("/mnt/ram/kagglehub", 512 * 1024**2),
+                    CacheTier("/mnt/nvme/kagglehub", 50 * 1024**3),
+                    CacheTier("/mnt/ssd/kagglehub", None),
+                ],
+                get_cache_tiers(),
+            )
+
+    def test_get_cache_compression_default(self) -> None:
+        self.assertIsNone(get_cache_compression())
+
+    def test_get_cache_compression_environment_var_override(self) -> None:
+        with mock.patch.dict(os.environ, {CACHE_COMPRESSION_ENV_VAR_NAME: "ZSTD"}):
+            self.assertEqual("zstd", get_cache_compression())
+
+    def test_get_cache_compression_invalid_codec(self) -> None:
+        with mock.patch.dict(os.environ, {CACHE_COMPRESSION_ENV_VAR_NAME: "bzip2"}):
+            self.assertIsNone(get_cache_compression())
+
+    def test_is_keep_archives_enabled(self) -> None:
+        self.assertFalse(is_keep_archives_enabled())
+        with mock.patch.dict(os.environ, {KEEP_ARCHIVES_ENV_VAR_NAME: "true"}):
+            self.assertTrue(is_keep_archives_enabled())
+
+    def test_get_output_dir_link_mode(self) -> None:
+        self.assertEqual("copy", get_output_dir_link_mode())
+        with mock.patch.dict(os.environ, {OUTPUT_DIR_LINK_MODE_ENV_VAR_NAME: "Hardlink"}):
+            self.assertEqual("hardlink", get_output_dir_link_mode())
+        with mock.patch.dict(os.environ, {OUTPUT_DIR_LINK_MODE_ENV_VAR_NAME: "off"}):
+            self.assertIsNone(get_output_dir_link_mode())
+
+    def test_get_output_dir_link_mode_invalid_mode(self) -> None:
+        with mock.patch.dict(os.environ, {OUTPUT_DIR_LINK_MODE_ENV_VAR_NAME: "teleport"}):
+            self.assertEqual("copy", get_output_dir_link_mode())
+
+    def test_get_mount_staging_dir(self) -> None:
+        self.assertIsNone(get_mount_staging_dir())
+        with mock.patch.dict(os.environ, {MOUNT_STAGING_DIR_ENV_VAR_NAME: "/local_disk/staging/"}):
+            self.assertEqual("/local_disk/staging", get_mount_staging_dir())
+        with mock.patch.dict(os.environ, {MOUNT_STAGING_DIR_ENV_VAR_NAME: " "}):
+            self.assertIsNone(get_mount_staging_dir())
+
+    def test_get_mount_timeout(self) -> None:
+        self.assertIsNone(get_mount_timeout())
+        with mock.patch.dict(os.environ, {MOUNT_TIMEOUT_ENV_VAR_NAME: "90"}):
+            self.assertEqual(90, get_mount_timeout())
+
+    def test_get_support_cache_ttl(self) -> None:
+        self.assertEqual(DEFAULT_SUPPORT_CACHE_TTL, get_support_cache_ttl())
+        with mock.patch.dict(os.environ, {SUPPORT_CACHE_TTL_ENV_VAR_NAME: "0"}):
+            self.assertEqual(0, get_support_cache_ttl())
+        with mock.patch.dict(os.environ, {SUPPORT_CACHE_TTL_ENV_VAR_NAME: "soon"}):
+            self.assertEqual(DEFAULT_SUPPORT_CACHE_TTL, get_support_cache_ttl())
+
+    def test_get_api_rate_limit(self) -> None:
+        self.assertIsNone(get_api_rate_limit())
+        with mock.patch.dict(os.environ, {API_RATE_LIMIT_ENV_VAR_NAME: "2.5"}):
+            self.assertEqual(2.5, get_api_rate_limit())
+        for value in ("0", "fast"):
+            with mock.patch.dict(os.environ, {API_RATE_LIMIT_ENV_VAR_NAME: value}):
+                self.assertIsNone(get_api_rate_limit())
+
+    def test_get_api_max_retries(self) -> None:
+        self.assertEqual(DEFAULT_API_MAX_RETRIES, get_api_max_retries())
+        with mock.patch.dict(os.environ, {API_MAX_RETRIES_ENV_VAR_NAME: "0"}):
+            self.assertEqual(0, get_api_max_retries())
+        with mock.patch.dict(os.environ, {API_MAX_RETRIES_ENV_VAR_NAME: "many"}):
+            self.assertEqual(DEFAULT_API_MAX_RETRIES, get_api_max_retries())
+
+    def test_parse_size(self) -> None:
+        self.assertEqual(1024, parse_size("1024"))
+        self.assertEqual(10 * 1024, parse_size("10KB"))
+        self.assertEqual(int(1.5 * 1024**3), parse_size("1.5g"))
+        self.assertEqual(2 * 1024**4, parse_size("2TiB"))
+        self.assertIsNone(parse_size("lots"))
+
     def test_get_kaggle_credentials_not_set_returns_none(self) -> None:
         self.assertEqual(None, get_kaggle_credentials())
 
@@ -2,9 +2,11 @@ import io
 import logging
 import os
 from typing import Any
+from unittest import mock
 
 import polars as pl
 
+from kagglehub.config import CACHE_COMPRESSION_ENV_VAR_NAME
 from kagglehub.datasets import KaggleDatasetAdapter, PolarsFrameType, dataset_load, logger
 from tests.fixtures import BaseTestCase
 
@@ -250,6 +252,12 @@ class TestLoadPandasDataset(BaseTestCase):
         with create_test_cache():
             self._load_pandas_sqlite_dataset_and_assert_loaded()
 
+    def test_pandas_compressed_cache_succeeds(self) -> None:
+        test_cases = [("csv", {}), ("tsv", {}), ("xml", {"parser": "etree"}), ("json", {}), ("jsonl", {})]
+        for test_case in test_cases:
+            with create_test_cache(), mock.patch.dict(os.environ, {CACHE_COMPRESSION_ENV_VAR_NAME: "gzip"}):
+                self._load_pandas_simple_dataset_and_assert_loaded(test_case[0], test_case[1])
+
 
 class TestLoadPolarsDataset(BaseTestCase):
     @classmethod
@@ -404,6 +412,12 @@ class TestLoadPolarsDataset(BaseTestCase):
         with create_test_cache():
             self._load_polars_sqlite_dataset_and_assert_loaded()
 
+    def test_polars_compressed_cache_succeeds(self) -> None:
+        for test_case in ["csv", "tsv", "json", "jsonl"]:
+            with create_test_cache(), mock.patch.dict(os.environ, {CACHE_COMPRESSION_ENV_VAR_NAME: "gzip"}):
+                self._load_polars_simple_dataset_and_assert_loaded(test_case, PolarsFrameType.LAZY_FRAME)
+                self._load_polars_simple_dataset_and_assert_loaded(test_case, PolarsFrameType.DATA_FRAME)
+
     def test_polars_columns_subset_succeeds(self) -> None:
         with create_test_cache():
             self._load_polars_columns_subset_and_assert_loaded()
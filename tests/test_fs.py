@@ -0,0 +1,126 @@
+from typing import Any
+from unittest import mock
+
+import fsspec
+import pandas as pd
+from kagglesdk.kaggle_http_client import KaggleHttpClient
+
+from kagglehub.fs import KaggleFileSystem
+from kagglehub.handle import parse_dataset_handle
+from kagglehub.stats import cache_stats, reset_cache_stats
+from tests.fixtures import BaseTestCase
+
+from .server_stubs import fs_stub as stub
+from .server_stubs import serv
+from .utils import create_test_cache, get_test_file_path
+
+# The entry point is only registered once the package is installed.
+fsspec.register_implementation("kaggle", KaggleFileSystem, clobber=True)
+
+DATASET_PATH = "datasets/owner/dataset"
+VERSIONED_DATASET_PATH = "datasets/owner/dataset/versions/2"
+VERSIONED_DATASET_HANDLE = "owner/dataset/versions/2"
+
+
+class TestKaggleFileSystem(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = serv.start_server(stub.app)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def setUp(self) -> None:
+        super().setUp()
+        KaggleFileSystem.clear_instance_cache()
+        reset_cache_stats()
+
+    def test_ls(self) -> None:
+        fs = KaggleFileSystem()
+
+        self.assertEqual(
+            [f"{VERSIONED_DATASET_PATH}/shapes.csv", f"{VERSIONED_DATASET_PATH}/shapes.parquet"],
+            sorted(fs.ls(VERSIONED_DATASET_PATH, detail=False))[:2],
+        )
+        self.assertEqual(
+            {"name": f"{VERSIONED_DATASET_PATH}/sub", "size": 0, "type": "directory"},
+            fs.ls(VERSIONED_DATASET_PATH)[-1],
+        )
+        self.assertEqual(
+            [f"{VERSIONED_DATASET_PATH}/sub/foo.txt"], fs.ls(f"{VERSIONED_DATASET_PATH}/sub", detail=False)
+        )
+
+    def test_ls_unversioned_uses_latest_version(self) -> None:
+        fs = KaggleFileSystem()
+
+        self.assertEqual([f"{DATASET_PATH}/sub/foo.txt"], fs.ls(f"kaggle://{DATASET_PATH}/sub", detail=False))
+
+    def test_info(self) -> None:
+        fs = KaggleFileSystem()
+
+        info = fs.info(f"{VERSIONED_DATASET_PATH}/shapes.parquet")
+
+        self.assertEqual("file", info["type"])
+        self.assertEqual(3661, info["size"])
+        self.assertEqual("directory", fs.info(f"{VERSIONED_DATASET_PATH}/sub")["type"])
+        with self.assertRaises(FileNotFoundError):
+            fs.info(f"{VERSIONED_DATASET_PATH}/missing.csv")
+
+    def test_invalid_path_raises(self) -> None:
+        fs = KaggleFileSystem()
+
+        with self.assertRaises(ValueError):
+            fs.ls("competitions/titanic")
+        with self.assertRaises(ValueError):
+            fs.ls("datasets/owner")
+
+    def test_ranged_read(self) -> None:
+        fs = KaggleFileSystem(block_size=16)
+
+        with fs.open(f"{VERSIONED_DATASET_PATH}/shapes.parquet") as f:
+            f.seek(100)
+            content = f.read(10)
+
+        with open(get_test_file_path("shapes.parquet"), "rb") as f:
+            f.seek(100)
+            self.assertEqual(f.read(10), content)
+        # Only the blocks containing the range were fetched.
+        bytes_downloaded = cache_stats().handles[parse_dataset_handle(VERSIONED_DATASET_HANDLE)].bytes_downloaded
+        self.assertLessEqual(bytes_downloaded, 32)
+
+    def test_signed_url_reused_across_opens(self) -> None:
+        call = KaggleHttpClient.call
+        requests_names = []
+
+        def _call(self: KaggleHttpClient, *args: Any) -> Any:  # noqa: ANN401
+            # (service name, request name, request, response type)
+            requests_names.append(args[1])
+            return call(self, *args)
+
+        fs = KaggleFileSystem(block_size=16)
+        with mock.patch.object(KaggleHttpClient, "call", _call):
+            for _ in range(2):
+                with fs.open(f"{VERSIONED_DATASET_PATH}/shapes.parquet") as f:
+                    f.read(10)
+
+        self.assertEqual(1, requests_names.count("DownloadDataset"))
+
+    def test_read_parquet_with_pandas(self) -> None:
+        df = pd.read_parquet(f"kaggle://{VERSIONED_DATASET_PATH}/shapes.parquet")
+
+        pd.testing.assert_frame_equal(pd.read_parquet(get_test_file_path("shapes.parquet")), df)
+
+    def test_read_zipped_file_falls_back_to_download(self) -> None:
+        with create_test_cache():
+            with fsspec.open(f"kaggle://{VERSIONED_DATASET_PATH}/shapes.csv", "rb") as f:
+                content = f.read()
+
+        with open(get_test_file_path("shapes.csv"), "rb") as f:
+            self.assertEqual(f.read(), content)
+
+    def test_write_not_supported(self) -> None:
+        fs = KaggleFileSystem()
+
+        with self.assertRaises(NotImplementedError):
+            fs.open(f"{VERSIONED_DATASET_PATH}/new.csv", "wb")
@@ -1,11 +1,12 @@
 import os
 from datetime import datetime, timezone
 from tempfile import TemporaryDirectory
+from unittest import mock
 
 import requests
 
 import kagglehub
-from kagglehub.cache import COMPETITIONS_CACHE_SUBFOLDER, get_cached_archive_path
+from kagglehub.cache import COMPETITIONS_CACHE_SUBFOLDER, Cache, get_cached_archive_path
 from kagglehub.handle import parse_competition_handle
 from tests.fixtures import BaseTestCase
 
@@ -131,6 +132,15 @@ class TestHttpCompetitionDownload(BaseTestCase):
             self.assertEqual(os.path.join(d, EXPECTED_COMPETITION_SUBDIR), path)
             self.assertGreater(new_date, old_date)
 
+    def test_current_cached_competition_download_takes_no_lock(self) -> None:
+        with create_test_cache() as d:
+            kagglehub.competition_download(COMPETITION_HANDLE)
+
+            with mock.patch.object(Cache, "lock", side_effect=AssertionError):
+                path = kagglehub.competition_download(COMPETITION_HANDLE)
+
+            self.assertEqual(os.path.join(d, EXPECTED_COMPETITION_SUBDIR), path)
+
     def test_competition_download_with_path(self) -> None:
         with create_test_cache() as d:
             self._download_test_file_and_assert_downloaded(d, COMPETITION_HANDLE)
@@ -1,8 +1,14 @@
 import os
+import threading
 from tempfile import TemporaryDirectory
+from unittest import mock
+
+from kagglesdk.datasets.services.dataset_api_service import DatasetApiClient
 
 import kagglehub
-from kagglehub.cache import DATASETS_CACHE_SUBFOLDER, get_cached_archive_path
+from kagglehub import registry
+from kagglehub.cache import DATASETS_CACHE_SUBFOLDER, Cache, get_cached_archive_path
+from kagglehub.config import DISABLE_SPECULATIVE_DOWNLOAD_ENV_VAR_NAME
 from kagglehub.handle import parse_dataset_handle
 from tests.fixtures import BaseTestCase
 
@@ -15,6 +21,7 @@ VERSIONED_DATASET_HANDLE = "sarahjeffreson/featured-spotify-artiststracks-with-m
 UNVERSIONED_DATASET_HANDLE = "sarahjeffreson/featured-spotify-artiststracks-with-metadata"
 TEST_FILEPATH = "foo.txt"
 TEST_CONTENTS = "foo"
+CACHE_HIT_CALLS = 20
 AUTO_COMPRESSED_CONTENTS = """"shape","degrees","sides","color","date"
 "square",360,4,"blue","2024-12-17"
 "circle",360,,"red","2023-08-01"
@@ -198,3 +205,156 @@ class TestHttpDatasetDownload(BaseTestCase):
             # Download a single file first
             kagglehub.dataset_download(dataset_handle, path=TEST_FILEPATH)
             self._download_dataset_and_assert_downloaded(d, dataset_handle, EXPECTED_DATASET_SUBDIR)
+
+
+class TestHttpDatasetDownloadCacheHit(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = serv.start_server(stub.app)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def setUp(self) -> None:
+        super().setUp()
+        # Resolve from the cache on disk, not from the resolutions memoized by previous tests.
+        registry.dataset_resolver.clear_resolved()
+
+    def test_cached_versioned_download_builds_no_client(self) -> None:
+        with create_test_cache():
+            dataset_path = kagglehub.dataset_download(VERSIONED_DATASET_HANDLE)
+            registry.dataset_resolver.clear_resolved()
+
+            with mock.patch("kagglehub.http_resolver.build_kaggle_client", side_effect=AssertionError):
+                self.assertEqual(dataset_path, kagglehub.dataset_download(VERSIONED_DATASET_HANDLE))
+
+    def test_cached_unversioned_download_resolves_version(self) -> None:
+        with create_test_cache():
+            kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE)
+            registry.dataset_resolver.clear_resolved()
+
+            with mock.patch("kagglehub.http_resolver.build_kaggle_client", side_effect=AssertionError):
+                with self.assertRaises(AssertionError):
+                    kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE)
+
+    def test_memoized_download_not_returned_once_incomplete(self) -> None:
+        with create_test_cache():
+            dataset_path = kagglehub.dataset_download(VERSIONED_DATASET_HANDLE)
+            # e.g. the entry is being deleted or repaired.
+            Cache().mark_as_incomplete(parse_dataset_handle(VERSIONED_DATASET_HANDLE))
+            self.assertTrue(os.path.exists(dataset_path))
+
+            with mock.patch("kagglehub.http_resolver.download_file", side_effect=ValueError("downloaded again")):
+                with self.assertRaisesRegex(ValueError, "downloaded again"):
+                    kagglehub.dataset_download(VERSIONED_DATASET_HANDLE)
+
+    def test_repeated_cached_versioned_downloads_send_no_request(self) -> None:
+        with create_test_cache():
+            file_path = kagglehub.dataset_download(VERSIONED_DATASET_HANDLE, path=TEST_FILEPATH)
+
+            with (
+                mock.patch("kagglehub.http_resolver.build_kaggle_client", side_effect=AssertionError),
+                mock.patch("requests.Session.send", side_effect=AssertionError),
+            ):
+                for _ in range(CACHE_HIT_CALLS):
+                    registry.dataset_resolver.clear_resolved()
+                    self.assertEqual(
+                        file_path, kagglehub.dataset_download(VERSIONED_DATASET_HANDLE, path=TEST_FILEPATH)
+                    )
+
+
+class TestHttpDatasetSpeculativeDownload(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = serv.start_server(stub.app)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def _download_and_get_requested_versions(self, handle: str, **kwargs) -> list[int]:  # noqa: ANN003
+        with mock.patch.object(
+            DatasetApiClient, "download_dataset", autospec=True, side_effect=DatasetApiClient.download_dataset
+        ) as download_dataset:
+            kagglehub.dataset_download(handle, **kwargs)
+        return [call.args[1].dataset_version_number for call in download_dataset.call_args_list]
+
+    def test_unversioned_download_uses_speculative_request(self) -> None:
+        with create_test_cache() as d:
+            versions = self._download_and_get_requested_versions(UNVERSIONED_DATASET_HANDLE)
+
+            # The latest version (no version number) was downloaded while its number was looked up, and stored under
+            # that number.
+            self.assertEqual([0], versions)
+            self.assertEqual(["foo.txt"], os.listdir(os.path.join(d, EXPECTED_DATASET_SUBDIR)))
+
+    def test_unversioned_file_download_uses_speculative_request(self) -> None:
+        with create_test_cache() as d:
+            versions = self._download_and_get_requested_versions(UNVERSIONED_DATASET_HANDLE, path=TEST_FILEPATH)
+
+            self.assertEqual([0], versions)
+            with open(os.path.join(d, EXPECTED_DATASET_SUBPATH, TEST_FILEPATH)) as f:
+                self.assertEqual(TEST_CONTENTS, f.read())
+
+    def test_speculative_download_dropped_when_cached(self) -> None:
+        with create_test_cache():
+            dataset_path = kagglehub.dataset_download(VERSIONED_DATASET_HANDLE)
+            registry.dataset_resolver.clear_resolved()
+
+            with mock.patch("kagglehub.http_resolver.download_file", side_effect=AssertionError):
+                self.assertEqual(dataset_path, kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE))
+
+    def test_speculative_download_failure_downloads_again(self) -> None:
+        with (
+            create_test_cache() as d,
+            mock.patch("kagglehub.http_resolver._send_latest_dataset_download_request", side_effect=ValueError),
+        ):
+            versions = self._download_and_get_requested_versions(UNVERSIONED_DATASET_HANDLE)
+
+            self.assertEqual([2], versions)
+            self.assertEqual(["foo.txt"], os.listdir(os.path.join(d, EXPECTED_DATASET_SUBDIR)))
+
+    def test_speculative_download_of_other_version_downloads_again(self) -> None:
+        def _get_current_version(*_) -> int:  # noqa: ANN002
+            # A new version is published after the caller looked it up.
+            return 2 if threading.current_thread() is threading.main_thread() else 3
+
+        with (
+            create_test_cache() as d,
+            mock.patch("kagglehub.http_resolver.get_current_version", side_effect=_get_current_version),
+        ):
+            versions = self._download_and_get_requested_versions(UNVERSIONED_DATASET_HANDLE)
+
+            self.assertEqual([0, 2], versions)
+            self.assertEqual(["foo.txt"], os.listdir(os.path.join(d, EXPECTED_DATASET_SUBDIR)))
+
+    def test_version_published_during_speculative_download_downloads_again(self) -> None:
+        worker_versions = iter([2, 3])
+
+        def _get_current_version(*_) -> int:  # noqa: ANN002
+            # The speculative request is served version 2, then version 3 is published before the caller looks it up.
+            return 3 if threading.current_thread() is threading.main_thread() else next(worker_versions)
+
+        with (
+            create_test_cache() as d,
+            mock.patch("kagglehub.http_resolver.get_current_version", side_effect=_get_current_version),
+        ):
+            versions = self._download_and_get_requested_versions(UNVERSIONED_DATASET_HANDLE)
+
+            self.assertEqual([0, 3], versions)
+            self.assertEqual(["foo.txt"], os.listdir(os.path.join(d, os.path.dirname(EXPECTED_DATASET_SUBDIR), "3")))
+
+    def test_no_speculative_download_when_other_version_cached(self) -> None:
+        with create_test_cache():
+            kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE, path=TEST_FILEPATH)
+
+            self.assertEqual([2], self._download_and_get_requested_versions(UNVERSIONED_DATASET_HANDLE))
+
+    def test_speculative_download_disabled(self) -> None:
+        with create_test_cache(), mock.patch.dict(os.environ, {DISABLE_SPECULATIVE_DOWNLOAD_ENV_VAR_NAME: "true"}):
+            self.assertEqual([2], self._download_and_get_requested_versions(UNVERSIONED_DATASET_HANDLE))
+
+    def test_versioned_download_not_speculative(self) -> None:
+        with create_test_cache():
+            self.assertEqual([2], self._download_and_get_requested_versions(VERSIONED_DATASET_HANDLE))
@@ -1,5 +1,8 @@
 import os
 from tempfile import TemporaryDirectory
+from unittest import mock
+
+from kagglesdk.kernels.services.kernels_api_service import KernelsApiClient
 
 import kagglehub
 from kagglehub.cache import NOTEBOOKS_CACHE_SUBFOLDER, get_cached_archive_path
@@ -157,3 +160,19 @@ class TestHttpNotebookOutputDownload(BaseTestCase):
             self.assertEqual(dest_file, notebook_path)
             with open(notebook_path) as notebook_file:
                 self.assertEqual(TEST_CONTENTS, notebook_file.read())
+
+    def test_unversioned_notebook_output_download_uses_speculative_request(self) -> None:
+        with (
+            create_test_cache() as d,
+            mock.patch.object(
+                KernelsApiClient,
+                "download_kernel_output",
+                autospec=True,
+                side_effect=KernelsApiClient.download_kernel_output,
+            ) as download_kernel_output,
+        ):
+            self._download_notebook_output_and_assert_downloaded(
+                d, UNVERSIONED_NOTEBOOK_OUTPUT_HANDLE, EXPECTED_NOTEBOOK_SUBDIR
+            )
+
+            self.assertEqual([0], [call.args[1].version_number for call in download_kernel_output.call_args_list])
@@ -1,4 +1,6 @@
 import os
+import types
+from collections.abc import Callable
 from tempfile import TemporaryDirectory
 from unittest.mock import MagicMock, patch
 
@@ -16,6 +18,16 @@ from .server_stubs import serv
 DUMMY_HANDLE = DatasetHandle("dummy", "dataset")
 
 
+def _call(fn: Callable[[], str]) -> str:
+    return fn()
+
+
+def _call_from_module(module_name: str, fn: Callable[[], str]) -> str:
+    """Calls `fn` from a frame that looks like it belongs to the `module_name` module."""
+    caller = types.FunctionType(_call.__code__, {"__name__": module_name})
+    return caller(fn)
+
+
 class TestKaggleClient(BaseTestCase):
     @classmethod
     def setUpClass(cls):
@@ -113,55 +125,25 @@ class TestKaggleClient(BaseTestCase):
         )
 
     @patch("importlib.metadata.version")
-    @patch("inspect.ismodule")
-    @patch("inspect.stack")
-    def test_get_user_agent_keras_nlp(
-        self, mock_stack: MagicMock, mock_is_module: MagicMock, mock_version: MagicMock
-    ) -> None:
-        # Mock the call stack and version information.
-        mock_stack.return_value = [
-            MagicMock(frame=MagicMock(__name__="kagglehub.clients")),
-            MagicMock(frame=MagicMock(__name__="kagglehub.models_helpers")),
-            MagicMock(frame=MagicMock(__name__="kagglehub.models")),
-            MagicMock(frame=MagicMock(__name__="keras_nlp.src.utils.preset_utils")),
-            MagicMock(frame=MagicMock(None)),
-        ]
-        mock_is_module.return_value = True
+    def test_get_user_agent_keras_nlp(self, mock_version: MagicMock) -> None:
         mock_version.return_value = "0.15.0"
-        self.assertEqual(get_user_agent(), f"kagglehub/{kagglehub.__version__} keras_nlp/0.15.0")
+        self.assertEqual(
+            _call_from_module("keras_nlp.src.utils.preset_utils", get_user_agent),
+            f"kagglehub/{kagglehub.__version__} keras_nlp/0.15.0",
+        )
 
     @patch("importlib.metadata.version")
-    @patch("inspect.ismodule")
-    @patch("inspect.stack")
-    def test_get_user_agent_keras_hub(
-        self, mock_stack: MagicMock, mock_is_module: MagicMock, mock_version: MagicMock
-    ) -> None:
-        # Mock the call stack and version information.
-        mock_stack.return_value = [
-            MagicMock(frame=MagicMock(__name__="kagglehub.clients")),
-            MagicMock(frame=MagicMock(__name__="kagglehub.models_helpers")),
-            MagicMock(frame=MagicMock(__name__="kagglehub.models")),
-            MagicMock(frame=MagicMock(__name__="keras_hub.src.utils.preset_utils")),
-            MagicMock(frame=MagicMock(None)),
-        ]
-        mock_is_module.return_value = True
+    def test_get_user_agent_keras_hub(self, mock_version: MagicMock) -> None:
         mock_version.return_value = "0.17.0"
-        self.assertEqual(get_user_agent(), f"kagglehub/{kagglehub.__version__} keras_hub/0.17.0")
+        self.assertEqual(
+            _call_from_module("keras_hub.src.utils.preset_utils", get_user_agent),
+            f"kagglehub/{kagglehub.__version__} keras_hub/0.17.0",
+        )
 
     @patch("importlib.metadata.version")
-    @patch("inspect.ismodule")
-    @patch("inspect.stack")
-    def test_get_user_agent_torch_tune(
-        self, mock_stack: MagicMock, mock_is_module: MagicMock, mock_version: MagicMock
-    ) -> None:
-        # Mock the call stack and version information.
-        mock_stack.return_value = [
-            MagicMock(frame=MagicMock(__name__="kagglehub.clients")),
-            MagicMock(frame=MagicMock(__name__="kagglehub.models_helpers")),
-            MagicMock(frame=MagicMock(__name__="kagglehub.models")),
-            MagicMock(frame=MagicMock(__name__="torchtune.src.utils.preset_utils")),
-            MagicMock(frame=MagicMock(None)),
-        ]
-        mock_is_module.return_value = True
+    def test_get_user_agent_torch_tune(self, mock_version: MagicMock) -> None:
         mock_version.return_value = "0.18.0"
-        self.assertEqual(get_user_agent(), f"kagglehub/{kagglehub.__version__} torchtune/0.18.0")
+        self.assertEqual(
+            _call_from_module("torchtune.src.utils.preset_utils", get_user_agent),
+            f"kagglehub/{kagglehub.__version__} torchtune/0.18.0",
+        )
@@ -0,0 +1,90 @@
+import os
+import threading
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+from unittest import mock
+
+import yaml
+
+import kagglehub
+from kagglehub import tracker
+from kagglehub.clients import KaggleJwtClient
+from kagglehub.env import KAGGLE_DATA_PROXY_URL_ENV_VAR_NAME
+from kagglehub.handle import parse_dataset_handle, parse_model_handle
+from kagglehub.kaggle_cache_resolver import attach_datasources
+from kagglehub.tracker import FORMAT_VERSION
+from tests.fixtures import BaseTestCase
+
+from .server_stubs import jwt_stub as stub
+from .server_stubs import serv
+
+VERSIONED_DATASET_HANDLE = "sarahjeffreson/featured-spotify-artiststracks-with-metadata/versions/1"
+VERSIONED_MODEL_HANDLE = "metaresearch/llama-2/pyTorch/13b/1"
+
+
+class TestKaggleCacheAttachDatasources(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = serv.start_server(stub.app, KAGGLE_DATA_PROXY_URL_ENV_VAR_NAME, "http://localhost:7778")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def setUp(self) -> None:
+        super().setUp()
+        tracker._accessed_datasources = {}
+
+    def test_attach_datasources_returns_mounted_paths(self) -> None:
+        handles = [parse_dataset_handle(VERSIONED_DATASET_HANDLE), parse_model_handle(VERSIONED_MODEL_HANDLE)]
+        with stub.create_env():
+            paths = attach_datasources(handles)
+
+            self.assertEqual(set(handles), set(paths.keys()))
+            self.assertEqual(["foo.txt"], os.listdir(paths[handles[0]]))
+            self.assertEqual(["config.json"], os.listdir(paths[handles[1]]))
+            self.assertEqual(set(handles), set(tracker._accessed_datasources.keys()))
+
+    def test_attach_requests_sent_concurrently(self) -> None:
+        handles = [parse_dataset_handle(VERSIONED_DATASET_HANDLE), parse_model_handle(VERSIONED_MODEL_HANDLE)]
+        # Each request only goes through once all of them were sent.
+        barrier = threading.Barrier(len(handles), timeout=5)
+        post = KaggleJwtClient.post
+
+        def _post(self: KaggleJwtClient, *args: Any, **kwargs: Any) -> dict:  # noqa: ANN401
+            barrier.wait()
+            return post(self, *args, **kwargs)
+
+        with stub.create_env(), mock.patch.object(KaggleJwtClient, "post", _post):
+            paths = attach_datasources(handles)
+
+        self.assertEqual(len(handles), len(paths))
+
+    def test_warmup_attaches_datasources(self) -> None:
+        with stub.create_env(), TemporaryDirectory() as d:
+            tracker_path = str(Path(d) / "requirements.yaml")
+            with open(tracker_path, "w") as f:
+                yaml.dump(
+                    {
+                        "format_version": FORMAT_VERSION,
+                        "datasources": [
+                            {"type": "Dataset", "ref": VERSIONED_DATASET_HANDLE, "version": 1},
+                            {"type": "Model", "ref": VERSIONED_MODEL_HANDLE, "version": 1},
+                        ],
+                    },
+                    f,
+                )
+
+            paths = kagglehub.cache_warmup(tracker_path)
+
+            mount_folder = os.environ[stub.KAGGLE_CACHE_MOUNT_FOLDER_ENV_VAR_NAME]
+            self.assertEqual(
+                {
+                    parse_dataset_handle(
+                        VERSIONED_DATASET_HANDLE
+                    ): f"{mount_folder}/featured-spotify-artiststracks-with-metadata",
+                    parse_model_handle(VERSIONED_MODEL_HANDLE): f"{mount_folder}/llama-2/pyTorch/13b/1",
+                },
+                paths,
+            )
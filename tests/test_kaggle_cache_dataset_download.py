@@ -1,10 +1,12 @@
 import os
+import shutil
 from tempfile import TemporaryDirectory
 from unittest import mock
 
 import requests
 
 import kagglehub
+from kagglehub.clients import KaggleJwtClient
 from kagglehub.config import DISABLE_KAGGLE_CACHE_ENV_VAR_NAME
 from kagglehub.env import KAGGLE_DATA_PROXY_URL_ENV_VAR_NAME
 from tests.fixtures import BaseTestCase
@@ -62,6 +64,26 @@ class TestKaggleCacheDatasetDownload(BaseTestCase):
             with self.assertRaises(ValueError):
                 kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE, "missing.txt")
 
+    def test_dataset_download_reuses_mount(self) -> None:
+        with stub.create_env():
+            with mock.patch.object(KaggleJwtClient, "post", autospec=True, side_effect=KaggleJwtClient.post) as post:
+                dataset_path = kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE)
+                dataset_file_path = kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE, "bar.csv")
+
+            self.assertEqual(1, post.call_count)
+            self.assertEqual(os.path.join(dataset_path, "bar.csv"), dataset_file_path)
+
+    def test_dataset_download_attaches_again_when_unmounted(self) -> None:
+        with stub.create_env():
+            dataset_path = kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE)
+            shutil.rmtree(dataset_path)
+
+            with mock.patch.object(KaggleJwtClient, "post", autospec=True, side_effect=KaggleJwtClient.post) as post:
+                dataset_file_path = kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE, "bar.csv")
+
+            self.assertEqual(1, post.call_count)
+            self.assertTrue(os.path.isfile(dataset_file_path))
+
     def test_kaggle_resolver_skipped(self) -> None:
         with create_test_cache():  # falls back to http resolver, make sure to use a test cache.
             with mock.patch.dict(os.environ, {DISABLE_KAGGLE_CACHE_ENV_VAR_NAME: "true"}):
@@ -0,0 +1,168 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from kagglehub import locks
+from kagglehub.cache import Cache
+from kagglehub.config import CACHE_LOCK_TIMEOUT_ENV_VAR_NAME
+from kagglehub.exceptions import CacheLockTimeoutError
+from kagglehub.handle import ModelHandle
+from kagglehub.locks import CacheLock
+from tests.fixtures import BaseTestCase
+
+from .utils import create_test_cache
+
+TEST_MODEL_HANDLE = ModelHandle(
+    owner="google",
+    model="bert",
+    framework="tensorFlow2",
+    variation="answer-equivalence-bem",
+    version=2,
+)
+
+
+def _write_lock_file(lock_path: str, pid: int, host: str) -> None:
+    with open(lock_path, "w") as f:
+        json.dump({"pid": pid, "host": host, "token": "someone-else"}, f)
+
+
+def _get_dead_pid() -> int:
+    p = subprocess.Popen([sys.executable, "-c", "pass"])
+    p.wait()
+    return p.pid
+
+
+class TestCacheLock(BaseTestCase):
+    def test_acquire_and_release(self) -> None:
+        with TemporaryDirectory() as d:
+            lock_path = os.path.join(d, "entry.lock")
+            with CacheLock(lock_path, "test"):
+                self.assertTrue(os.path.exists(lock_path))
+            self.assertFalse(os.path.exists(lock_path))
+
+    def test_waiter_blocks_until_release(self) -> None:
+        with TemporaryDirectory() as d:
+            lock_path = os.path.join(d, "entry.lock")
+            holder = CacheLock(lock_path, "test")
+            holder.acquire()
+            acquired = threading.Event()
+
+            def _wait_for_lock() -> None:
+                with CacheLock(lock_path, "test", timeout=5):
+                    acquired.set()
+
+            waiter = threading.Thread(target=_wait_for_lock)
+            waiter.start()
+            time.sleep(0.5)
+            self.assertFalse(acquired.is_set())
+
+            holder.release()
+            waiter.join(timeout=5)
+            self.assertTrue(acquired.is_set())
+
+    def test_timeout_raises(self) -> None:
+        with TemporaryDirectory() as d:
+            lock_path = os.path.join(d, "entry.lock")
+            _write_lock_file(lock_path, pid=1, host="some-other-host")
+
+            with self.assertRaises(CacheLockTimeoutError):
+                CacheLock(lock_path, "test", timeout=0.3).acquire()
+
+            # The lock of the other process must be left untouched.
+            self.assertTrue(os.path.exists(lock_path))
+
+    def test_lock_from_dead_process_is_broken(self) -> None:
+        with TemporaryDirectory() as d:
+            lock_path = os.path.join(d, "entry.lock")
+            _write_lock_file(lock_path, pid=_get_dead_pid(), host=socket.gethostname())
+
+            with CacheLock(lock_path, "test", timeout=1):
+                pass
+
+            self.assertFalse(os.path.exists(lock_path))
+
+    def test_lock_without_heartbeat_is_broken(self) -> None:
+        with TemporaryDirectory() as d:
+            lock_path = os.path.join(d, "entry.lock")
+            _write_lock_file(lock_path, pid=1, host="some-other-host")
+
+            with mock.patch.object(locks, "LOCK_STALE_AFTER", 0.5):
+                with CacheLock(lock_path, "test", timeout=5):
+                    pass
+
+            self.assertFalse(os.path.exists(lock_path))
+
+    def test_lock_with_old_mtime_and_live_heartbeat_is_not_broken(self) -> None:
+        # The owner's clock (or the NFS server's) may be far behind ours: only the heartbeat progress matters.
+        with TemporaryDirectory() as d:
+            lock_path = os.path.join(d, "entry.lock")
+            _write_lock_file(lock_path, pid=1, host="some-other-host")
+            old_time = time.time() - 10 * locks.LOCK_STALE_AFTER
+            os.utime(lock_path, (old_time, old_time))
+            stop = threading.Event()
+
+            def _heartbeat() -> None:
+                beat = old_time
+                while not stop.wait(0.1):
+                    beat += 1
+                    os.utime(lock_path, (beat, beat))
+
+            thread = threading.Thread(target=_heartbeat)
+            thread.start()
+            try:
+                with mock.patch.object(locks, "LOCK_STALE_AFTER", 0.5):
+                    with self.assertRaises(CacheLockTimeoutError):
+                        CacheLock(lock_path, "test", timeout=1.5).acquire()
+            finally:
+                stop.set()
+                thread.join()
+
+            self.assertTrue(os.path.exists(lock_path))
+
+    def test_release_does_not_remove_lock_acquired_by_someone_else(self) -> None:
+        with TemporaryDirectory() as d:
+            lock_path = os.path.join(d, "entry.lock")
+            lock = CacheLock(lock_path, "test")
+            lock.acquire()
+            # Simulate the lock being broken then re-acquired by another process.
+            _write_lock_file(lock_path, pid=1, host="some-other-host")
+
+            lock.release()
+
+            self.assertTrue(os.path.exists(lock_path))
+
+
+class TestCacheEntryLock(BaseTestCase):
+    def test_lock_path_next_to_completion_marker(self) -> None:
+        with create_test_cache() as d:
+            lock_path = Cache().get_lock_path(TEST_MODEL_HANDLE)
+            self.assertEqual(
+                os.path.join(d, "models", "google", "bert", "tensorFlow2", "answer-equivalence-bem", "2.lock"),
+                lock_path,
+            )
+
+    def test_override_dir_lock_path_outside_output_dir(self) -> None:
+        with create_test_cache() as d:
+            with TemporaryDirectory() as output_dir:
+                lock_path = Cache(override_dir=output_dir).get_lock_path(TEST_MODEL_HANDLE)
+                self.assertTrue(lock_path.startswith(d))
+
+                with Cache(override_dir=output_dir).lock(TEST_MODEL_HANDLE):
+                    self.assertEqual([], os.listdir(output_dir))
+
+    def test_lock_timeout_from_env(self) -> None:
+        with create_test_cache():
+            lock_path = Cache().get_lock_path(TEST_MODEL_HANDLE)
+            os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+            _write_lock_file(lock_path, pid=1, host="some-other-host")
+
+            with mock.patch.dict(os.environ, {CACHE_LOCK_TIMEOUT_ENV_VAR_NAME: "0.2"}):
+                with self.assertRaises(CacheLockTimeoutError):
+                    with Cache().lock(TEST_MODEL_HANDLE):
+                        pass
@@ -0,0 +1,146 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import kagglehub
+from kagglehub import materialize
+from kagglehub.cache import Cache
+from kagglehub.config import (
+    CACHE_COMPRESSION_ENV_VAR_NAME,
+    OUTPUT_DIR_LINK_MODE_ENV_VAR_NAME,
+    OUTPUT_DIR_POPULATE_CACHE_ENV_VAR_NAME,
+)
+from kagglehub.handle import parse_dataset_handle
+from kagglehub.stats import cache_stats, reset_cache_stats
+from tests.fixtures import BaseTestCase
+
+from .server_stubs import dataset_download_stub as stub
+from .server_stubs import serv
+from .utils import create_test_cache
+
+VERSIONED_DATASET_HANDLE = "sarahjeffreson/featured-spotify-artiststracks-with-metadata/versions/2"
+TEST_FILEPATH = "foo.txt"
+TEST_CONTENTS = "foo"
+# Content of foo.txt in the archive served by the stub, which differs from the file served on its own.
+ARCHIVED_TEST_CONTENTS = "foo\n"
+
+
+class TestOutputDirMaterialization(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = serv.start_server(stub.app)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def setUp(self) -> None:
+        super().setUp()
+        reset_cache_stats()
+
+    def _download_to_output_dir(self, dest: str, path: str | None = None) -> str:
+        return kagglehub.dataset_download(VERSIONED_DATASET_HANDLE, path=path, output_dir=dest)
+
+    def test_output_dir_copied_from_cache(self) -> None:
+        with create_test_cache(), TemporaryDirectory() as dest:
+            cached_path = kagglehub.dataset_download(VERSIONED_DATASET_HANDLE)
+
+            output_path = self._download_to_output_dir(dest)
+
+            self.assertEqual(dest, output_path)
+            self.assertEqual(1, cache_stats().misses)  # Not downloaded again.
+            with open(os.path.join(output_path, TEST_FILEPATH)) as f:
+                self.assertEqual(ARCHIVED_TEST_CONTENTS, f.read())
+            self.assertNotEqual(
+                os.stat(os.path.join(cached_path, TEST_FILEPATH)).st_ino,
+                os.stat(os.path.join(output_path, TEST_FILEPATH)).st_ino,
+            )
+            # The output_dir is complete: later calls don't materialize it again.
+            self.assertEqual(
+                output_path, Cache(override_dir=dest).load_from_cache(parse_dataset_handle(VERSIONED_DATASET_HANDLE))
+            )
+
+    def test_output_dir_file_copied_from_cache(self) -> None:
+        with create_test_cache(), TemporaryDirectory() as dest:
+            kagglehub.dataset_download(VERSIONED_DATASET_HANDLE, path=TEST_FILEPATH)
+
+            output_path = self._download_to_output_dir(dest, TEST_FILEPATH)
+
+            self.assertEqual(os.path.join(dest, TEST_FILEPATH), output_path)
+            self.assertEqual(1, cache_stats().misses)
+            with open(output_path) as f:
+                self.assertEqual(TEST_CONTENTS, f.read())
+
+    def test_output_dir_hardlinked_from_cache(self) -> None:
+        with create_test_cache(), TemporaryDirectory() as dest:
+            with mock.patch.dict(os.environ, {OUTPUT_DIR_LINK_MODE_ENV_VAR_NAME: "hardlink"}):
+                cached_path = kagglehub.dataset_download(VERSIONED_DATASET_HANDLE)
+
+                output_path = self._download_to_output_dir(dest)
+
+            self.assertEqual(
+                os.stat(os.path.join(cached_path, TEST_FILEPATH)).st_ino,
+                os.stat(os.path.join(output_path, TEST_FILEPATH)).st_ino,
+            )
+
+    def test_output_dir_symlinked_from_cache(self) -> None:
+        with create_test_cache(), TemporaryDirectory() as dest:
+            with mock.patch.dict(os.environ, {OUTPUT_DIR_LINK_MODE_ENV_VAR_NAME: "symlink"}):
+                cached_path = kagglehub.dataset_download(VERSIONED_DATASET_HANDLE)
+
+                output_path = self._download_to_output_dir(dest)
+
+            self.assertEqual(
+                os.path.join(cached_path, TEST_FILEPATH), os.readlink(os.path.join(output_path, TEST_FILEPATH))
+            )
+
+    def test_output_dir_downloaded_when_off(self) -> None:
+        with create_test_cache(), TemporaryDirectory() as dest:
+            with mock.patch.dict(os.environ, {OUTPUT_DIR_LINK_MODE_ENV_VAR_NAME: "off"}):
+                kagglehub.dataset_download(VERSIONED_DATASET_HANDLE)
+
+                self._download_to_output_dir(dest)
+
+            self.assertEqual(2, cache_stats().misses)
+
+    def test_output_dir_populates_cache(self) -> None:
+        with create_test_cache(), TemporaryDirectory() as dest:
+            with mock.patch.dict(os.environ, {OUTPUT_DIR_POPULATE_CACHE_ENV_VAR_NAME: "true"}):
+                output_path = self._download_to_output_dir(dest)
+
+            self.assertEqual(dest, output_path)
+            self.assertTrue(os.path.isfile(os.path.join(output_path, TEST_FILEPATH)))
+            self.assertIsNotNone(Cache().load_from_cache(parse_dataset_handle(VERSIONED_DATASET_HANDLE)))
+
+    def test_output_dir_decompressed_from_compressed_cache(self) -> None:
+        with create_test_cache(), TemporaryDirectory() as dest:
+            with mock.patch.dict(os.environ, {CACHE_COMPRESSION_ENV_VAR_NAME: "gzip"}):
+                kagglehub.dataset_download(VERSIONED_DATASET_HANDLE)
+
+                output_path = self._download_to_output_dir(dest)
+
+            self.assertEqual([TEST_FILEPATH], [f for f in os.listdir(output_path) if not f.startswith(".")])
+            with open(os.path.join(output_path, TEST_FILEPATH)) as f:
+                self.assertEqual(ARCHIVED_TEST_CONTENTS, f.read())
+            # The manifest of the output_dir matches its (decompressed) files.
+            self.assertEqual([], Cache(override_dir=dest).verify(parse_dataset_handle(VERSIONED_DATASET_HANDLE)))
+
+
+class TestCopyFile(BaseTestCase):
+    def test_copy_file(self) -> None:
+        with TemporaryDirectory() as d:
+            src_path = os.path.join(d, "src.bin")
+            dst_path = os.path.join(d, "dst.bin")
+            content = os.urandom(3 * materialize.COPY_BUFFER_SIZE + 1)
+            with open(src_path, "wb") as f:
+                f.write(content)
+
+            materialize.copy_file(src_path, dst_path)
+            with open(dst_path, "r+b") as f:
+                self.assertEqual(content, f.read())
+                f.seek(0)
+                f.write(b"x")
+
+            # The copy is independent of the source, even if their blocks are shared.
+            with open(src_path, "rb") as f:
+                self.assertEqual(content, f.read())
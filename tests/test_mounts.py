@@ -0,0 +1,81 @@
+import os
+import sys
+import threading
+import time
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from kagglehub import mounts
+from kagglehub.exceptions import MountTimeoutError
+from tests.fixtures import BaseTestCase
+
+MOUNT_DELAY = 0.2  # seconds
+# Well below the previous fixed 5s polling interval.
+MAX_WAIT = 1.5  # seconds
+
+
+def _create_later(path: str, delay: float = MOUNT_DELAY) -> threading.Thread:
+    def _create() -> None:
+        time.sleep(delay)
+        os.makedirs(path)
+
+    thread = threading.Thread(target=_create)
+    thread.start()
+    return thread
+
+
+class TestWaitForMount(BaseTestCase):
+    def _assert_waits_until_created(self, path: str) -> None:
+        thread = _create_later(path)
+        start = time.monotonic()
+
+        mounts.wait_for_mount(path, timeout=10)
+
+        self.assertLess(time.monotonic() - start, MAX_WAIT)
+        self.assertTrue(os.path.exists(path))
+        thread.join()
+
+    def test_existing_mount_returns_immediately(self) -> None:
+        with TemporaryDirectory() as d:
+            with mock.patch.object(mounts, "_open_watcher", side_effect=AssertionError):
+                mounts.wait_for_mount(d)
+
+    def test_waits_for_mount(self) -> None:
+        with TemporaryDirectory() as d:
+            self._assert_waits_until_created(os.path.join(d, "dataset"))
+
+    def test_waits_for_nested_mount(self) -> None:
+        with TemporaryDirectory() as d:
+            self._assert_waits_until_created(os.path.join(d, "model", "keras", "variation", "1"))
+
+    def test_waits_for_mount_with_polling(self) -> None:
+        with TemporaryDirectory() as d:
+            with mock.patch.object(mounts, "_open_watcher", return_value=mounts._PollingWatcher()):
+                self._assert_waits_until_created(os.path.join(d, "dataset"))
+
+    def test_uses_inotify_on_linux(self) -> None:
+        if sys.platform != "linux":
+            self.skipTest("inotify is only available on Linux.")
+        with mounts._open_watcher() as watcher:
+            self.assertIsInstance(watcher, mounts._InotifyWatcher)
+
+    def test_inotify_wakes_up_before_poll_interval(self) -> None:
+        if sys.platform != "linux":
+            self.skipTest("inotify is only available on Linux.")
+        with TemporaryDirectory() as d, mounts._open_watcher() as watcher:
+            watcher.watch(d)
+            thread = _create_later(os.path.join(d, "dataset"))
+            start = time.monotonic()
+
+            watcher.wait(10)
+
+            self.assertLess(time.monotonic() - start, MAX_WAIT)
+            thread.join()
+
+    def test_timeout_raises(self) -> None:
+        with TemporaryDirectory() as d:
+            start = time.monotonic()
+            with self.assertRaises(MountTimeoutError):
+                mounts.wait_for_mount(os.path.join(d, "dataset"), timeout=0.1)
+
+            self.assertLess(time.monotonic() - start, MAX_WAIT)
@@ -0,0 +1,198 @@
+import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import TemporaryDirectory
+from typing import Any
+from unittest import mock
+
+import requests
+from kagglesdk.kaggle_client import KaggleClient
+from kagglesdk.kaggle_http_client import KaggleHttpClient
+
+import kagglehub
+from kagglehub import proxy
+from kagglehub.cache import PROXY_CACHE_SUBFOLDER
+from kagglehub.clients import build_kaggle_client
+from kagglehub.config import PROXY_URL_ENV_VAR_NAME
+from kagglehub.exceptions import KaggleEnvironmentError
+from kagglehub.integrity import GCS_HASH_HEADER
+from kagglehub.proxy import BlobStore, ProxyServer
+from tests.fixtures import BaseTestCase
+
+from .server_stubs import dataset_download_stub as stub
+from .server_stubs import serv
+from .utils import create_test_cache, get_test_file_path
+
+VERSIONED_DATASET_HANDLE = "sarahjeffreson/featured-spotify-artiststracks-with-metadata/versions/2"
+UNVERSIONED_DATASET_HANDLE = "sarahjeffreson/featured-spotify-artiststracks-with-metadata"
+TEST_FILEPATH = "foo.txt"
+
+
+class TestProxy(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = serv.start_server(stub.app)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.proxy_cache_dir = TemporaryDirectory()
+        self.proxy = ProxyServer(("127.0.0.1", 0), cache_dir=self.proxy_cache_dir.name)
+        self.proxy_thread = threading.Thread(target=self.proxy.serve_forever)
+        self.proxy_thread.start()
+        self.env_patch = mock.patch.dict(os.environ, {PROXY_URL_ENV_VAR_NAME: self.proxy.url})
+        self.env_patch.start()
+
+    def tearDown(self) -> None:
+        self.env_patch.stop()
+        self.proxy.shutdown()
+        self.proxy_thread.join()
+        self.proxy.server_close()
+        self.proxy_cache_dir.cleanup()
+        super().tearDown()
+
+    def _list_blobs(self) -> list[str]:
+        blobs_dir = os.path.join(self.proxy_cache_dir.name, PROXY_CACHE_SUBFOLDER, "blobs")
+        return [name for name in os.listdir(blobs_dir) if not name.endswith(".json")]
+
+    def test_client_routed_through_proxy(self) -> None:
+        self.assertEqual(self.proxy.url, build_kaggle_client().http_client()._endpoint)
+
+    def test_download_through_proxy(self) -> None:
+        with create_test_cache():
+            dataset_path = kagglehub.dataset_download(VERSIONED_DATASET_HANDLE)
+
+            self.assertEqual(["foo.txt"], os.listdir(dataset_path))
+
+    def test_file_download_through_proxy(self) -> None:
+        with create_test_cache():
+            file_path = kagglehub.dataset_download(VERSIONED_DATASET_HANDLE, path=TEST_FILEPATH)
+
+            with open(file_path) as f, open(get_test_file_path(TEST_FILEPATH)) as expected:
+                self.assertEqual(expected.read(), f.read())
+
+    def test_blob_fetched_once_for_concurrent_clients(self) -> None:
+        with mock.patch.object(BlobStore, "_fetch", autospec=True, side_effect=BlobStore._fetch) as mock_fetch:
+            with TemporaryDirectory() as d:
+                output_dirs = [os.path.join(d, str(i)) for i in range(4)]
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    paths = list(
+                        executor.map(
+                            lambda output_dir: kagglehub.dataset_download(
+                                VERSIONED_DATASET_HANDLE, path=TEST_FILEPATH, output_dir=output_dir
+                            ),
+                            output_dirs,
+                        )
+                    )
+
+                for path in paths:
+                    with open(path) as f, open(get_test_file_path(TEST_FILEPATH)) as expected:
+                        self.assertEqual(expected.read(), f.read())
+        self.assertEqual(1, mock_fetch.call_count)
+        self.assertEqual(1, len(self._list_blobs()))
+
+    def test_new_version_of_blob_fetched_again(self) -> None:
+        get = requests.get
+        etags = iter(['"1"', '"1"', '"2"'])
+
+        def _get(url: str, **_: Any) -> requests.Response:  # noqa: ANN401
+            response = get(url, stream=True, timeout=5)
+            # The content hash would change too, drop it.
+            del response.headers[GCS_HASH_HEADER]
+            response.headers["ETag"] = next(etags)
+            return response
+
+        with mock.patch.object(proxy.requests, "get", side_effect=_get):
+            for _ in range(3):
+                with create_test_cache():
+                    kagglehub.dataset_download(VERSIONED_DATASET_HANDLE, path=TEST_FILEPATH)
+
+        self.assertEqual(2, len(self._list_blobs()))
+
+    def test_blob_without_validators_not_cached(self) -> None:
+        get = requests.get
+
+        def _get(url: str, **_: Any) -> requests.Response:  # noqa: ANN401
+            response = get(url, stream=True, timeout=5)
+            del response.headers[GCS_HASH_HEADER]
+            return response
+
+        with create_test_cache(), mock.patch.object(proxy.requests, "get", side_effect=_get):
+            file_path = kagglehub.dataset_download(VERSIONED_DATASET_HANDLE, path=TEST_FILEPATH)
+
+            with open(file_path) as f, open(get_test_file_path(TEST_FILEPATH)) as expected:
+                self.assertEqual(expected.read(), f.read())
+        self.assertEqual([], self._list_blobs())
+
+    def test_metadata_cached(self) -> None:
+        with mock.patch.object(proxy.requests, "post", wraps=requests.post) as mock_post:
+            for _ in range(2):
+                with create_test_cache():
+                    kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE)
+
+        get_dataset_calls = [c for c in mock_post.call_args_list if c.args[0].endswith("/GetDataset")]
+        self.assertEqual(1, len(get_dataset_calls))
+
+    def test_blob_range_request(self) -> None:
+        with create_test_cache():
+            kagglehub.dataset_download(VERSIONED_DATASET_HANDLE, path=TEST_FILEPATH)
+        with open(get_test_file_path(TEST_FILEPATH), "rb") as f:
+            expected = f.read()
+        key = self._list_blobs()[0]
+
+        response = requests.get(
+            self.proxy.url + self.proxy.sign_blob_path(f"{proxy.BLOBS_PATH_PREFIX}{key}/{TEST_FILEPATH}"),
+            headers={"Range": "bytes=1-"},
+            timeout=5,
+        )
+
+        self.assertEqual(206, response.status_code)
+        self.assertEqual(expected[1:], response.content)
+        self.assertEqual(f"bytes 1-{len(expected) - 1}/{len(expected)}", response.headers["Content-Range"])
+
+    def test_unknown_blob_not_found(self) -> None:
+        response = requests.get(
+            self.proxy.url + self.proxy.sign_blob_path(f"{proxy.BLOBS_PATH_PREFIX}{'0' * 64}/foo.txt"), timeout=5
+        )
+
+        self.assertEqual(404, response.status_code)
+
+    def test_unsigned_blob_url_forbidden(self) -> None:
+        with create_test_cache():
+            kagglehub.dataset_download(VERSIONED_DATASET_HANDLE, path=TEST_FILEPATH)
+        key = self._list_blobs()[0]
+        path = f"{proxy.BLOBS_PATH_PREFIX}{key}/{TEST_FILEPATH}"
+
+        self.assertEqual(403, requests.get(f"{self.proxy.url}{path}", timeout=5).status_code)
+        with mock.patch.object(proxy, "BLOB_URL_TTL", -1):
+            expired_url = self.proxy.url + self.proxy.sign_blob_path(path)
+        self.assertEqual(403, requests.get(expired_url, timeout=5).status_code)
+        tampered_url = self.proxy.url + self.proxy.sign_blob_path(path).replace(key, "0" * 64)
+        self.assertEqual(403, requests.get(tampered_url, timeout=5).status_code)
+
+    def test_proxy_url_requires_supported_kagglesdk(self) -> None:
+        with mock.patch.object(KaggleHttpClient, "__init__", autospec=True, side_effect=lambda *_, **__: None):
+            with self.assertRaises(KaggleEnvironmentError):
+                build_kaggle_client()
+
+    def test_proxy_url_set_with_kagglesdk_endpoint_override(self) -> None:
+        endpoints = []
+
+        class _KaggleClient(KaggleClient):
+            def __init__(self, *args: Any, endpoint: str | None = None, **kwargs: Any) -> None:  # noqa: ANN401
+                super().__init__(*args, **kwargs)
+                endpoints.append(endpoint)
+
+        with mock.patch("kagglehub.clients.KaggleClient", _KaggleClient):
+            client = build_kaggle_client()
+
+        self.assertEqual([self.proxy.url], endpoints)
+        self.assertNotEqual(self.proxy.url, client.http_client()._endpoint)
+
+    def test_url_reachable_when_listening_on_all_interfaces(self) -> None:
+        with ProxyServer(("0.0.0.0", 0), cache_dir=self.proxy_cache_dir.name) as server:  # noqa: S104
+            self.assertEqual(f"http://{socket.gethostname()}:{server.server_address[1]}", server.url)
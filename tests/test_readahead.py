@@ -0,0 +1,100 @@
+import os
+import time
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import kagglehub
+from kagglehub import readahead
+from tests.fixtures import BaseTestCase
+
+FILE_SIZE = 100
+TIMEOUT = 5  # seconds
+
+
+def _create_files(d: str, rel_paths: list[str]) -> None:
+    for rel_path in rel_paths:
+        os.makedirs(os.path.dirname(os.path.join(d, rel_path)), exist_ok=True)
+        with open(os.path.join(d, rel_path), "wb") as f:
+            f.write(os.urandom(FILE_SIZE))
+
+
+def _wait_for_prefetched_count(prefetcher: readahead.Prefetcher, count: int) -> None:
+    deadline = time.monotonic() + TIMEOUT
+    while prefetcher.prefetched_count < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestPrefetch(BaseTestCase):
+    def test_prefetch_yields_all_files_sorted(self) -> None:
+        with TemporaryDirectory() as d:
+            _create_files(d, ["b.bin", "a.bin", os.path.join("sub", "c.bin")])
+
+            with kagglehub.prefetch(d) as prefetcher:
+                file_paths = list(prefetcher)
+                _wait_for_prefetched_count(prefetcher, 3)
+
+                self.assertEqual(3, prefetcher.prefetched_count)
+
+        self.assertEqual([os.path.join(d, p) for p in ["a.bin", "b.bin", os.path.join("sub", "c.bin")]], file_paths)
+
+    def test_prefetch_glob_pattern(self) -> None:
+        with TemporaryDirectory() as d:
+            _create_files(d, ["a.bin", "b.txt", os.path.join("sub", "c.bin")])
+
+            with kagglehub.prefetch(d, "sub/*.bin") as prefetcher:
+                self.assertEqual([os.path.join(d, "sub", "c.bin")], list(prefetcher))
+
+    def test_prefetch_access_order(self) -> None:
+        with TemporaryDirectory() as d:
+            _create_files(d, ["a.bin", "b.bin"])
+
+            with kagglehub.prefetch(d, ["b.bin", "a.bin"], method="read") as prefetcher:
+                self.assertEqual([os.path.join(d, "b.bin"), os.path.join(d, "a.bin")], list(prefetcher))
+
+    def test_prefetch_single_file(self) -> None:
+        with TemporaryDirectory() as d:
+            _create_files(d, ["a.bin"])
+
+            with kagglehub.prefetch(os.path.join(d, "a.bin")) as prefetcher:
+                self.assertEqual([os.path.join(d, "a.bin")], list(prefetcher))
+
+    def test_prefetch_stays_within_budget(self) -> None:
+        with TemporaryDirectory() as d:
+            _create_files(d, ["a.bin", "b.bin", "c.bin"])
+
+            with kagglehub.prefetch(d, max_bytes_ahead=FILE_SIZE + FILE_SIZE // 2) as prefetcher:
+                _wait_for_prefetched_count(prefetcher, 1)
+                time.sleep(0.1)
+                # The second file would put the prefetcher 200 bytes ahead of the consumer.
+                self.assertEqual(1, prefetcher.prefetched_count)
+
+                files = iter(prefetcher)
+                next(files)
+                next(files)  # The first file is consumed.
+                _wait_for_prefetched_count(prefetcher, 2)
+
+                self.assertEqual(2, prefetcher.prefetched_count)
+
+    def test_prefetch_uses_fadvise(self) -> None:
+        if not hasattr(os, "posix_fadvise"):
+            self.skipTest("posix_fadvise is not available on this platform.")
+        with TemporaryDirectory() as d:
+            _create_files(d, ["a.bin"])
+
+            with mock.patch("os.posix_fadvise") as fadvise:
+                with kagglehub.prefetch(d) as prefetcher:
+                    _wait_for_prefetched_count(prefetcher, 1)
+
+            fadvise.assert_called_once_with(mock.ANY, 0, 0, os.POSIX_FADV_WILLNEED)
+
+    def test_prefetch_missing_file_ignored(self) -> None:
+        with TemporaryDirectory() as d:
+            with kagglehub.prefetch(d, ["missing.bin"]) as prefetcher:
+                _wait_for_prefetched_count(prefetcher, 1)
+
+                self.assertEqual(1, prefetcher.prefetched_count)
+
+    def test_prefetch_invalid_method_raises(self) -> None:
+        with TemporaryDirectory() as d:
+            with self.assertRaises(ValueError):
+                kagglehub.prefetch(d, method="mmap")
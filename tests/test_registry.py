@@ -1,7 +1,13 @@
+import os
+import threading
 from collections.abc import Callable
+from tempfile import TemporaryDirectory
 from typing import Any
+from unittest import mock
 
 from kagglehub import registry
+from kagglehub.config import SUPPORT_CACHE_TTL_ENV_VAR_NAME
+from kagglehub.exceptions import UnsupportedResolutionError
 from kagglehub.handle import ResourceHandle
 from kagglehub.resolver import Resolver
 from tests.fixtures import BaseTestCase
@@ -14,6 +20,11 @@ class FakeHandle(ResourceHandle):
         raise NotImplementedError()
 
 
+class VersionedFakeHandle(FakeHandle):
+    def is_versioned(self) -> bool:
+        return True
+
+
 class FakeImpl(Resolver[FakeHandle]):
     def __init__(
         self,
@@ -35,6 +46,11 @@ def fail_fn(*_, **__) -> tuple[str, int | None]:  # noqa: ANN002, ANN003
     raise AssertionError(msg)
 
 
+def fail_is_supported_fn(*_, **__) -> bool:  # noqa: ANN002, ANN003
+    msg = "fail_is_supported_fn should not be called"
+    raise AssertionError(msg)
+
+
 class RegistryTest(BaseTestCase):
     def test_calls_only_supported(self) -> None:
         r = registry.MultiImplRegistry[FakeHandle]("test")
@@ -59,3 +75,206 @@ class RegistryTest(BaseTestCase):
         r.add_implementation(FakeImpl(lambda *_, **__: False, fail_fn))
 
         self.assertRaisesRegex(RuntimeError, r"Missing implementation", r, SOME_VALUE)
+
+    def test_concurrent_identical_calls_share_one_resolution(self) -> None:
+        r = registry.MultiImplRegistry[FakeHandle]("test")
+        release = threading.Event()
+        calls = []
+
+        def resolve_fn(*_, **__) -> tuple[str, int | None]:  # noqa: ANN002, ANN003
+            calls.append(1)
+            release.wait(timeout=5)
+            return SOME_VALUE
+
+        r.add_implementation(FakeImpl(lambda *_, **__: True, resolve_fn))
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(r(FakeHandle(), "foo.txt"))) for _ in range(8)]
+        for t in threads:
+            t.start()
+        # Give all the threads a chance to join the in-flight resolution.
+        threading.Event().wait(0.2)
+        release.set()
+        for t in threads:
+            t.join(timeout=5)
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual([SOME_VALUE] * 8, results)
+
+    def test_completed_resolution_is_memoized(self) -> None:
+        with TemporaryDirectory() as d:
+            r = registry.MultiImplRegistry[FakeHandle]("test")
+            calls = []
+
+            def resolve_fn(*_, **__) -> tuple[str, int | None]:  # noqa: ANN002, ANN003
+                calls.append(1)
+                return d, 1
+
+            r.add_implementation(FakeImpl(lambda *_, **__: True, resolve_fn))
+
+            self.assertEqual((d, 1), r(VersionedFakeHandle()))
+            self.assertEqual((d, 1), r(VersionedFakeHandle()))
+            self.assertEqual(1, len(calls))
+
+            # Different path or output_dir are resolved separately.
+            r(VersionedFakeHandle(), "foo.txt")
+            r(VersionedFakeHandle(), output_dir=d)
+            self.assertEqual(3, len(calls))
+
+            # force_download always resolves again.
+            r(VersionedFakeHandle(), force_download=True)
+            self.assertEqual(4, len(calls))
+
+            r.clear_resolved()
+            r(VersionedFakeHandle())
+            self.assertEqual(5, len(calls))
+
+    def test_memoized_resolution_ignored_when_path_deleted(self) -> None:
+        r = registry.MultiImplRegistry[FakeHandle]("test")
+        calls = []
+
+        def resolve_fn(*_, **__) -> tuple[str, int | None]:  # noqa: ANN002, ANN003
+            calls.append(1)
+            return "/some/missing/path", 1
+
+        r.add_implementation(FakeImpl(lambda *_, **__: True, resolve_fn))
+
+        r(VersionedFakeHandle())
+        r(VersionedFakeHandle())
+
+        self.assertEqual(2, len(calls))
+
+    def test_unversioned_resolution_not_memoized(self) -> None:
+        with TemporaryDirectory() as d:
+            r = registry.MultiImplRegistry[FakeHandle]("test")
+            calls = []
+
+            def resolve_fn(*_, **__) -> tuple[str, int | None]:  # noqa: ANN002, ANN003
+                calls.append(1)
+                return d, None
+
+            r.add_implementation(FakeImpl(lambda *_, **__: True, resolve_fn))
+
+            r(FakeHandle())
+            r(FakeHandle())
+
+            self.assertEqual(2, len(calls))
+
+    def test_unversioned_handle_resolves_again(self) -> None:
+        with TemporaryDirectory() as d:
+            r = registry.MultiImplRegistry[FakeHandle]("test")
+            calls = []
+
+            def resolve_fn(*_, **__) -> tuple[str, int | None]:  # noqa: ANN002, ANN003
+                calls.append(1)
+                # Unversioned handles resolve to the current version.
+                return d, len(calls)
+
+            r.add_implementation(FakeImpl(lambda *_, **__: True, resolve_fn))
+
+            self.assertEqual((d, 1), r(FakeHandle()))
+            self.assertEqual((d, 2), r(FakeHandle()))
+
+    def test_failed_resolution_is_shared_and_not_memoized(self) -> None:
+        r = registry.MultiImplRegistry[FakeHandle]("test")
+        r.add_implementation(FakeImpl(lambda *_, **__: True, fail_fn))
+
+        self.assertRaises(AssertionError, r, FakeHandle())
+        self.assertRaises(AssertionError, r, FakeHandle())
+
+    def test_support_decision_is_cached(self) -> None:
+        r = registry.MultiImplRegistry[FakeHandle]("test")
+        checks = []
+
+        def is_supported_fn(*_, **__) -> bool:  # noqa: ANN002, ANN003
+            checks.append(1)
+            return True
+
+        r.add_implementation(FakeImpl(is_supported_fn, lambda *_, **__: ("test", None)))
+
+        r(FakeHandle())
+        r(FakeHandle())
+        self.assertEqual(1, len(checks))
+
+        r(FakeHandle(), "foo.txt")
+        self.assertEqual(2, len(checks))
+
+        r.clear_supported()
+        r(FakeHandle())
+        self.assertEqual(3, len(checks))
+
+    def test_support_decision_expires(self) -> None:
+        r = registry.MultiImplRegistry[FakeHandle]("test")
+        checks = []
+
+        def is_supported_fn(*_, **__) -> bool:  # noqa: ANN002, ANN003
+            checks.append(1)
+            return True
+
+        r.add_implementation(FakeImpl(is_supported_fn, lambda *_, **__: ("test", None)))
+
+        with mock.patch.dict(os.environ, {SUPPORT_CACHE_TTL_ENV_VAR_NAME: "0"}):
+            r(FakeHandle())
+            r(FakeHandle())
+
+        self.assertEqual(2, len(checks))
+
+    def test_unsupported_environment_skips_is_supported(self) -> None:
+        class UnsupportedEnvironmentImpl(FakeImpl):
+            def is_supported_in_environment(self) -> bool:
+                return False
+
+        r = registry.MultiImplRegistry[FakeHandle]("test")
+        r.add_implementation(FakeImpl(lambda *_, **__: True, lambda *_, **__: SOME_VALUE))
+        r.add_implementation(UnsupportedEnvironmentImpl(fail_is_supported_fn, fail_fn))
+
+        self.assertEqual(SOME_VALUE, r(FakeHandle()))
+
+    def test_falls_back_when_resolution_unsupported(self) -> None:
+        def unsupported_fn(*_, **__) -> tuple[str, int | None]:  # noqa: ANN002, ANN003
+            msg = "not available"
+            raise UnsupportedResolutionError(msg)
+
+        r = registry.MultiImplRegistry[FakeHandle]("test")
+        r.add_implementation(FakeImpl(lambda *_, **__: True, lambda *_, **__: SOME_VALUE))
+        r.add_implementation(FakeImpl(lambda *_, **__: True, unsupported_fn))
+
+        self.assertEqual(SOME_VALUE, r(FakeHandle()))
+
+    def test_higher_priority_tried_first(self) -> None:
+        r = registry.MultiImplRegistry[FakeHandle]("test")
+        r.add_implementation(FakeImpl(lambda *_, **__: True, lambda *_, **__: SOME_VALUE), priority=10)
+        r.add_implementation(FakeImpl(lambda *_, **__: True, fail_fn))
+
+        self.assertEqual(SOME_VALUE, r(FakeHandle()))
+
+    def test_load_plugins(self) -> None:
+        registered = []
+        entry_point = mock.Mock()
+        entry_point.load.return_value = lambda: registered.append(1)
+        broken_entry_point = mock.Mock()
+        broken_entry_point.load.side_effect = ImportError("missing dependency")
+
+        with mock.patch("importlib.metadata.entry_points", return_value=[broken_entry_point, entry_point]) as m:
+            registry.load_plugins()
+
+        m.assert_called_once_with(group=registry.RESOLVER_PLUGINS_ENTRY_POINT_GROUP)
+        self.assertEqual([1], registered)
+
+    def test_cache_of_first_supported_implementation_answers(self) -> None:
+        class CachedImpl(FakeImpl):
+            def _resolve_from_cache(self, *_, **__) -> tuple[str, int | None] | None:  # noqa: ANN002, ANN003
+                return "cached", 1
+
+        class UnsupportedEnvironmentImpl(FakeImpl):
+            def is_supported_in_environment(self) -> bool:
+                return False
+
+        r = registry.MultiImplRegistry[FakeHandle]("test")
+        r.add_implementation(CachedImpl(fail_is_supported_fn, fail_fn))
+        r.add_implementation(UnsupportedEnvironmentImpl(fail_is_supported_fn, fail_fn))
+        self.assertEqual(("cached", 1), r(VersionedFakeHandle()))
+
+        # e.g. a mounted datasource takes precedence over a copy in the local HTTP cache.
+        r.add_implementation(FakeImpl(lambda *_, **__: True, lambda *_, **__: SOME_VALUE))
+        self.assertEqual(SOME_VALUE, r(VersionedFakeHandle(), "foo.txt"))
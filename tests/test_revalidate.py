@@ -0,0 +1,119 @@
+import os
+from unittest import mock
+
+import kagglehub
+from kagglehub.cache import Cache
+from kagglehub.handle import parse_dataset_handle, parse_model_handle
+from kagglehub.stats import cache_stats, reset_cache_stats
+from tests.fixtures import BaseTestCase
+
+from .server_stubs import dataset_download_stub as dataset_stub
+from .server_stubs import model_download_stub as stub
+from .server_stubs import serv
+from .utils import create_test_cache, get_test_file_path
+
+VERSIONED_MODEL_HANDLE = "metaresearch/llama-2/pyTorch/13b/1"
+VERSIONED_DATASET_HANDLE = "sarahjeffreson/featured-spotify-artiststracks-with-metadata/versions/2"
+CONFIG_FILEPATH = "config.json"
+MODEL_FILEPATH = "model.keras"
+
+
+class TestModelRevalidate(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = serv.start_server(stub.app)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def setUp(self) -> None:
+        super().setUp()
+        reset_cache_stats()
+
+    def _assert_same_content(self, model_path: str, path: str) -> None:
+        with open(os.path.join(model_path, path), "rb") as f, open(get_test_file_path(path), "rb") as expected:
+            self.assertEqual(expected.read(), f.read())
+
+    def test_revalidate_downloads_corrupted_file_only(self) -> None:
+        with create_test_cache():
+            model_path = kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+            with open(os.path.join(model_path, CONFIG_FILEPATH), "w") as f:
+                f.write("corrupted")
+            untouched_stat = os.stat(os.path.join(model_path, MODEL_FILEPATH))
+
+            revalidated_path = kagglehub.model_download(VERSIONED_MODEL_HANDLE, force_download="revalidate")
+
+            self.assertEqual(model_path, revalidated_path)
+            self._assert_same_content(model_path, CONFIG_FILEPATH)
+            stat = os.stat(os.path.join(model_path, MODEL_FILEPATH))
+            self.assertEqual(untouched_stat.st_ino, stat.st_ino)
+            self.assertEqual(untouched_stat.st_mtime_ns, stat.st_mtime_ns)
+            self.assertEqual([], Cache().verify(parse_model_handle(VERSIONED_MODEL_HANDLE)))
+
+    def test_revalidate_downloads_missing_file(self) -> None:
+        with create_test_cache():
+            model_path = kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+            os.remove(os.path.join(model_path, MODEL_FILEPATH))
+
+            kagglehub.model_download(VERSIONED_MODEL_HANDLE, force_download="revalidate")
+
+            self._assert_same_content(model_path, MODEL_FILEPATH)
+
+    def test_revalidate_intact_entry_not_downloaded(self) -> None:
+        with create_test_cache():
+            model_path = kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+            misses = cache_stats().misses
+
+            revalidated_path = kagglehub.model_download(VERSIONED_MODEL_HANDLE, force_download="revalidate")
+
+            self.assertEqual(model_path, revalidated_path)
+            self.assertEqual(misses, cache_stats().misses)
+
+    def test_revalidate_not_cached_downloads(self) -> None:
+        with create_test_cache():
+            model_path = kagglehub.model_download(VERSIONED_MODEL_HANDLE, force_download="revalidate")
+
+            self._assert_same_content(model_path, CONFIG_FILEPATH)
+            self.assertIsNotNone(Cache().load_from_cache(parse_model_handle(VERSIONED_MODEL_HANDLE)))
+
+    def test_revalidate_downloads_file_outdated_by_remote_size(self) -> None:
+        with create_test_cache():
+            model_path = kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+            misses = cache_stats().misses
+            remote_sizes = {
+                CONFIG_FILEPATH: os.path.getsize(get_test_file_path(CONFIG_FILEPATH)) + 1,
+                MODEL_FILEPATH: os.path.getsize(get_test_file_path(MODEL_FILEPATH)),
+            }
+
+            with mock.patch("kagglehub.http_resolver.list_model_file_sizes", return_value=remote_sizes):
+                kagglehub.model_download(VERSIONED_MODEL_HANDLE, force_download="revalidate")
+
+            self.assertEqual(misses + 1, cache_stats().misses)
+            self._assert_same_content(model_path, CONFIG_FILEPATH)
+
+
+class TestDatasetRevalidate(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = serv.start_server(dataset_stub.app)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def test_revalidate_file_without_remote_listing(self) -> None:
+        with create_test_cache():
+            # The stub can't list the files of the dataset: the file is checked against the manifest only.
+            file_path = kagglehub.dataset_download(VERSIONED_DATASET_HANDLE, path="foo.txt")
+            with open(file_path, "w") as f:
+                f.write("corrupted")
+
+            revalidated_path = kagglehub.dataset_download(
+                VERSIONED_DATASET_HANDLE, path="foo.txt", force_download="revalidate"
+            )
+
+            self.assertEqual(file_path, revalidated_path)
+            with open(file_path) as f:
+                self.assertEqual("foo", f.read())
+            self.assertEqual([], Cache().verify(parse_dataset_handle(VERSIONED_DATASET_HANDLE), "foo.txt"))
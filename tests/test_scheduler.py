@@ -0,0 +1,222 @@
+import io
+import os
+import threading
+import time
+from typing import Any
+from unittest import mock
+
+import requests
+from kagglesdk.common.types.file_download import FileDownload
+from kagglesdk.datasets.types.dataset_api_service import ApiDataset, ApiGetDatasetRequest
+from kagglesdk.kaggle_http_client import KaggleHttpClient
+
+import kagglehub
+from kagglehub import scheduler
+from kagglehub.clients import build_kaggle_client
+from kagglehub.config import (
+    API_MAX_RETRIES_ENV_VAR_NAME,
+    API_RATE_LIMIT_ENV_VAR_NAME,
+    DISABLE_SPECULATIVE_DOWNLOAD_ENV_VAR_NAME,
+)
+from kagglehub.scheduler import Scheduler, _get_retry_after
+from tests.fixtures import BaseTestCase
+
+from .server_stubs import dataset_download_stub as stub
+from .server_stubs import serv
+from .utils import create_test_cache
+
+UNVERSIONED_DATASET_HANDLE = "sarahjeffreson/featured-spotify-artiststracks-with-metadata"
+
+
+def _http_error(status_code: int, headers: dict[str, str] | None = None) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.raw = io.BytesIO()
+    return requests.HTTPError(f"{status_code} Error", response=response)
+
+
+def _get_dataset_request(dataset_slug: str = "dataset") -> ApiGetDatasetRequest:
+    r = ApiGetDatasetRequest()
+    r.owner_slug = "owner"
+    r.dataset_slug = dataset_slug
+    return r
+
+
+class FakeSend:
+    """Fake `call` method of a kagglesdk client, failing with the given errors before succeeding."""
+
+    def __init__(self, *errors: Exception) -> None:
+        self._errors = list(errors)
+        self.calls: list[str] = []
+
+    def __call__(self, *args: object) -> str:
+        # (service name, request name, request, response type)
+        self.calls.append(str(args[1]))
+        if self._errors:
+            raise self._errors.pop(0)
+        return "response"
+
+
+class TestScheduler(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        patcher = mock.patch.object(scheduler, "INITIAL_BACKOFF", 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_idempotent_call_retried_on_server_error(self) -> None:
+        send = FakeSend(_http_error(503), _http_error(500))
+        call = Scheduler().wrap(send, "client")
+
+        self.assertEqual("response", call("datasets", "GetDataset", _get_dataset_request(), ApiDataset))
+        self.assertEqual(3, len(send.calls))
+
+    def test_non_idempotent_call_not_retried_on_server_error(self) -> None:
+        call = Scheduler().wrap(FakeSend(_http_error(503)), "client")
+
+        with self.assertRaises(requests.HTTPError):
+            call("datasets", "CreateDataset", _get_dataset_request(), ApiDataset)
+
+    def test_non_idempotent_call_not_retried_when_rate_limited(self) -> None:
+        send = FakeSend(_http_error(429))
+        call = Scheduler().wrap(send, "client")
+
+        with self.assertRaises(requests.HTTPError):
+            call("datasets", "CreateDataset", _get_dataset_request(), ApiDataset)
+        self.assertEqual(1, len(send.calls))
+
+    def test_non_idempotent_call_rejection_pauses_all_calls(self) -> None:
+        s = Scheduler()
+        call = s.wrap(FakeSend(_http_error(429, {"Retry-After": "0.2"})), "client")
+        other_call = s.wrap(FakeSend(), "other-client")
+
+        start = time.monotonic()
+        with self.assertRaises(requests.HTTPError):
+            call("datasets", "CreateDataset", _get_dataset_request(), ApiDataset)
+        other_call("datasets", "GetDataset", _get_dataset_request(), ApiDataset)
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+    def test_client_error_not_retried(self) -> None:
+        send = FakeSend(_http_error(404))
+        call = Scheduler().wrap(send, "client")
+
+        with self.assertRaises(requests.HTTPError):
+            call("datasets", "GetDataset", _get_dataset_request(), ApiDataset)
+        self.assertEqual(1, len(send.calls))
+
+    def test_gives_up_after_max_retries(self) -> None:
+        send = FakeSend(*(_http_error(503) for _ in range(3)))
+        call = Scheduler().wrap(send, "client")
+
+        with mock.patch.dict(os.environ, {API_MAX_RETRIES_ENV_VAR_NAME: "2"}):
+            with self.assertRaises(requests.HTTPError):
+                call("datasets", "GetDataset", _get_dataset_request(), ApiDataset)
+        self.assertEqual(3, len(send.calls))
+
+    def test_retry_after_pauses_all_calls(self) -> None:
+        s = Scheduler()
+        call = s.wrap(FakeSend(_http_error(429, {"Retry-After": "0.2"})), "client")
+        other_call = s.wrap(FakeSend(), "other-client")
+
+        start = time.monotonic()
+        call("datasets", "GetDataset", _get_dataset_request(), ApiDataset)
+        other_call("datasets", "GetDataset", _get_dataset_request(), ApiDataset)
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+    def test_rate_limit(self) -> None:
+        send = FakeSend()
+        call = Scheduler().wrap(send, "client")
+
+        with mock.patch.dict(os.environ, {API_RATE_LIMIT_ENV_VAR_NAME: "20"}):
+            start = time.monotonic()
+            for _ in range(30):
+                call("datasets", "DownloadDataset", _get_dataset_request(), FileDownload)
+
+        # The first 20 calls are a burst, the next 10 are sent at 20 per second.
+        self.assertGreaterEqual(time.monotonic() - start, 0.45)
+
+    def test_identical_metadata_calls_coalesced(self) -> None:
+        sent = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def _send(*args) -> str:  # noqa: ANN002
+            calls.append(args)
+            sent.set()
+            release.wait(timeout=5)
+            return "response"
+
+        call = Scheduler().wrap(_send, "client")
+        results = []
+
+        def _call(dataset_slug: str) -> None:
+            results.append(call("datasets", "GetDataset", _get_dataset_request(dataset_slug), ApiDataset))
+
+        threads = [threading.Thread(target=_call, args=("dataset",))]
+        threads[0].start()
+        sent.wait(timeout=5)
+        threads += [threading.Thread(target=_call, args=(slug,)) for slug in ("dataset", "other-dataset")]
+        for thread in threads[1:]:
+            thread.start()
+        # Give the other threads the time to join the call in flight.
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(["response"] * 3, results)
+        # The call for the other dataset isn't coalesced.
+        self.assertEqual(2, len(calls))
+
+    def test_get_retry_after(self) -> None:
+        self.assertEqual(3, _get_retry_after(_http_error(429, {"Retry-After": "3"}).response))
+        self.assertEqual(
+            0, _get_retry_after(_http_error(429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}).response)
+        )
+        self.assertEqual(
+            scheduler.MAX_RETRY_AFTER, _get_retry_after(_http_error(429, {"Retry-After": "100000"}).response)
+        )
+        self.assertIsNone(_get_retry_after(_http_error(429, {"Retry-After": "soon"}).response))
+        self.assertIsNone(_get_retry_after(_http_error(429).response))
+
+
+class TestKaggleClientScheduling(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = serv.start_server(stub.app)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def test_rate_limited_version_lookup_retried(self) -> None:
+        call = KaggleHttpClient.call
+        requests_names = []
+
+        def _call(self: KaggleHttpClient, *args: Any) -> Any:  # noqa: ANN401
+            # (service name, request name, request, response type)
+            requests_names.append(args[1])
+            if requests_names.count("GetDataset") == 1:
+                raise _http_error(429, {"Retry-After": "0"})
+            return call(self, *args)
+
+        # The speculative download looks the version up on its own, so only count the lookup made by the caller.
+        with (
+            create_test_cache(),
+            mock.patch.dict(os.environ, {DISABLE_SPECULATIVE_DOWNLOAD_ENV_VAR_NAME: "true"}),
+            mock.patch.object(KaggleHttpClient, "call", _call),
+        ):
+            kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE)
+
+        self.assertEqual(2, requests_names.count("GetDataset"))
+
+    def test_client_without_call_not_scheduled(self) -> None:
+        with (
+            mock.patch.object(KaggleHttpClient, "call", None),
+            mock.patch.object(scheduler.scheduler, "wrap", side_effect=AssertionError),
+        ):
+            # The calls are sent as is.
+            self.assertIsNone(build_kaggle_client().http_client().call)
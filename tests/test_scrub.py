@@ -0,0 +1,160 @@
+import io
+import os
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import kagglehub
+from kagglehub import cli, manifest
+from kagglehub.cache import MANIFEST_SUFFIX, Cache
+from kagglehub.config import DISABLE_CACHE_MANIFEST_ENV_VAR_NAME
+from kagglehub.handle import parse_model_handle
+from kagglehub.kaggle_cache_resolver import ModelKaggleCacheResolver
+from kagglehub.registry import clear_supported
+from tests.fixtures import BaseTestCase
+
+from .server_stubs import model_download_stub as stub
+from .server_stubs import serv
+from .utils import create_test_cache, get_test_file_path
+
+VERSIONED_MODEL_HANDLE = "metaresearch/llama-2/pyTorch/13b/1"
+UNVERSIONED_MODEL_HANDLE = "metaresearch/llama-2/pyTorch/13b"
+TEST_FILEPATH = "config.json"
+
+
+def _corrupt(path: str) -> None:
+    with open(path, "r+b") as f:
+        first_byte = f.read(1)
+        f.seek(0)
+        f.write(bytes([first_byte[0] ^ 0xFF]))
+
+
+class TestCacheScrub(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = serv.start_server(stub.app)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def _assert_matches_test_file(self, path: str) -> None:
+        with open(path, "rb") as f, open(get_test_file_path(os.path.basename(path)), "rb") as expected:
+            self.assertEqual(expected.read(), f.read())
+
+    def test_manifest_written_on_download(self) -> None:
+        with create_test_cache():
+            model_path = kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+
+            self.assertTrue(os.path.isfile(model_path + MANIFEST_SUFFIX))
+            self.assertEqual([], Cache().verify(parse_model_handle(VERSIONED_MODEL_HANDLE)))
+
+    def test_manifest_built_without_reading_files_back(self) -> None:
+        with create_test_cache():
+            with mock.patch("kagglehub.manifest.hash_file", side_effect=AssertionError):
+                kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+                kagglehub.model_download(VERSIONED_MODEL_HANDLE, path=TEST_FILEPATH)
+
+            self.assertEqual([], Cache().verify(parse_model_handle(VERSIONED_MODEL_HANDLE)))
+            self.assertEqual([], Cache().verify(parse_model_handle(VERSIONED_MODEL_HANDLE), TEST_FILEPATH))
+
+    def test_manifest_records_files_edited_after_written(self) -> None:
+        with TemporaryDirectory() as d:
+            file_path = os.path.join(d, TEST_FILEPATH)
+            manifest.write_file(io.BytesIO(b"foo"), file_path)
+            with open(file_path, "ab") as f:
+                f.write(b"bar")
+
+            records = manifest.build(d)
+
+            self.assertEqual(
+                {TEST_FILEPATH: {manifest.SIZE_FIELD: 6, manifest.MD5_FIELD: manifest.hash_file(file_path)}}, records
+            )
+
+    def test_manifest_not_written_when_disabled(self) -> None:
+        with create_test_cache(), mock.patch.dict(os.environ, {DISABLE_CACHE_MANIFEST_ENV_VAR_NAME: "true"}):
+            model_path = kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+
+            self.assertFalse(os.path.exists(model_path + MANIFEST_SUFFIX))
+            self.assertIsNone(Cache().verify(parse_model_handle(VERSIONED_MODEL_HANDLE)))
+            self.assertEqual([], kagglehub.cache_scrub())
+
+    def test_scrub_clean_cache(self) -> None:
+        with create_test_cache():
+            kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+            kagglehub.model_download(VERSIONED_MODEL_HANDLE, path=TEST_FILEPATH)
+
+            results = kagglehub.cache_scrub()
+
+            self.assertEqual(2, len(results))
+            self.assertTrue(all(result.ok and not result.bad_files for result in results))
+
+    def test_scrub_detects_corrupted_and_missing_files(self) -> None:
+        with create_test_cache():
+            model_path = kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+            _corrupt(os.path.join(model_path, "config.json"))
+            os.remove(os.path.join(model_path, "model.keras"))
+
+            results = kagglehub.cache_scrub()
+
+            self.assertEqual(1, len(results))
+            self.assertEqual(["config.json", "model.keras"], results[0].bad_files)
+            self.assertFalse(results[0].ok)
+
+    def test_scrub_detects_truncated_file(self) -> None:
+        with create_test_cache():
+            file_path = kagglehub.model_download(VERSIONED_MODEL_HANDLE, path=TEST_FILEPATH)
+            os.truncate(file_path, 1)
+
+            results = kagglehub.cache_scrub()
+
+            self.assertEqual([TEST_FILEPATH], results[0].bad_files)
+            self.assertEqual(TEST_FILEPATH, results[0].path)
+
+    def test_scrub_repairs_bad_files(self) -> None:
+        with create_test_cache():
+            model_path = kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+            file_path = kagglehub.model_download(VERSIONED_MODEL_HANDLE, path=TEST_FILEPATH)
+            _corrupt(os.path.join(model_path, "model.keras"))
+            os.truncate(file_path, 1)
+
+            results = kagglehub.cache_scrub(repair=True)
+
+            self.assertTrue(all(result.ok for result in results))
+            self._assert_matches_test_file(os.path.join(model_path, "model.keras"))
+            self._assert_matches_test_file(file_path)
+            self.assertTrue(all(not result.bad_files for result in kagglehub.cache_scrub()))
+
+    def test_scrub_repairs_bad_files_with_mount_available(self) -> None:
+        with create_test_cache():
+            model_path = kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+            _corrupt(os.path.join(model_path, "model.keras"))
+
+            # A mount ignores `force_download` and doesn't write to the cache: it must not take the repair.
+            with (
+                mock.patch.object(ModelKaggleCacheResolver, "is_supported_in_environment", return_value=True),
+                mock.patch.object(ModelKaggleCacheResolver, "is_supported", return_value=True),
+                mock.patch.object(ModelKaggleCacheResolver, "_resolve", return_value=("/kaggle/input/model", 1)),
+            ):
+                clear_supported()
+                results = kagglehub.cache_scrub(repair=True)
+
+            self.assertTrue(all(result.ok for result in results))
+            self._assert_matches_test_file(os.path.join(model_path, "model.keras"))
+            self.assertTrue(all(not result.bad_files for result in kagglehub.cache_scrub()))
+
+    def test_scrub_filtered_by_unversioned_handle(self) -> None:
+        with create_test_cache():
+            kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+
+            self.assertEqual(1, len(kagglehub.cache_scrub(parse_model_handle(UNVERSIONED_MODEL_HANDLE))))
+            self.assertEqual(0, len(kagglehub.cache_scrub(parse_model_handle(f"{UNVERSIONED_MODEL_HANDLE}/2"))))
+
+    def test_cli_cache_verify(self) -> None:
+        with create_test_cache():
+            model_path = kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+            self.assertEqual(0, cli.main(["cache", "verify"]))
+
+            _corrupt(os.path.join(model_path, "config.json"))
+            self.assertEqual(1, cli.main(["cache", "verify"]))
+            self.assertEqual(0, cli.main(["cache", "verify", "--repair"]))
+            self.assertEqual(0, cli.main(["cache", "verify"]))
@@ -0,0 +1,99 @@
+import os
+import time
+from datetime import datetime, timezone
+from unittest import mock
+
+from kagglesdk.models.services.model_api_service import ModelApiClient
+
+import kagglehub
+from kagglehub import signed_urls
+from kagglehub.handle import parse_model_handle
+from kagglehub.signed_urls import get_expiry, get_signed_url, remember_signed_url
+from tests.fixtures import BaseTestCase
+
+from .server_stubs import model_download_stub as stub
+from .server_stubs import serv
+from .utils import create_test_cache, get_test_file_path
+
+TEST_FILEPATH = "config.json"
+SIGNED_AT = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+class TestSignedUrls(BaseTestCase):
+    def test_get_expiry_v4(self) -> None:
+        url = "https://storage.googleapis.com/bucket/file?X-Goog-Date=20240102T030405Z&X-Goog-Expires=600&X-Goog-Signature=a"
+
+        self.assertEqual(SIGNED_AT.timestamp() + 600, get_expiry(url))
+
+    def test_get_expiry_v2(self) -> None:
+        self.assertEqual(1704164645, get_expiry("https://storage.googleapis.com/bucket/file?Expires=1704164645"))
+
+    def test_get_expiry_unsigned(self) -> None:
+        self.assertIsNone(get_expiry("https://www.kaggle.com/api/v1/models/download"))
+        self.assertIsNone(get_expiry("https://storage.googleapis.com/bucket/file?X-Goog-Date=bad&X-Goog-Expires=600"))
+
+    def test_url_forgotten_before_expiry(self) -> None:
+        h = parse_model_handle(stub.SIGNED_URL_HANDLE)
+        url = f"https://storage.googleapis.com/bucket/file?Expires={int(time.time()) + 600}"
+        remember_signed_url(h, TEST_FILEPATH, url)
+
+        self.assertEqual(url, get_signed_url(h, TEST_FILEPATH))
+        with mock.patch.object(signed_urls, "EXPIRY_MARGIN", 600):
+            self.assertIsNone(get_signed_url(h, TEST_FILEPATH))
+
+    def test_unsigned_url_not_remembered(self) -> None:
+        h = parse_model_handle(stub.SIGNED_URL_HANDLE)
+        remember_signed_url(h, TEST_FILEPATH, "https://www.kaggle.com/api/v1/models/download")
+
+        self.assertIsNone(get_signed_url(h, TEST_FILEPATH))
+
+
+class TestModelSignedUrlDownload(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = serv.start_server(stub.app)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def _download_and_count_api_calls(self, **kwargs) -> int:  # noqa: ANN003
+        with mock.patch.object(
+            ModelApiClient,
+            "download_model_instance_version",
+            autospec=True,
+            side_effect=ModelApiClient.download_model_instance_version,
+        ) as download_model_instance_version:
+            file_path = kagglehub.model_download(stub.SIGNED_URL_HANDLE, TEST_FILEPATH, **kwargs)
+
+        with open(file_path) as f, open(get_test_file_path(TEST_FILEPATH)) as expected:
+            self.assertEqual(expected.read(), f.read())
+        return download_model_instance_version.call_count
+
+    def test_download_again_skips_api(self) -> None:
+        with create_test_cache():
+            self.assertEqual(1, self._download_and_count_api_calls())
+
+            self.assertEqual(0, self._download_and_count_api_calls(force_download=True))
+
+    def test_rejected_url_falls_back_to_api(self) -> None:
+        with create_test_cache():
+            self._download_and_count_api_calls()
+            stub.revoke_signed_urls()
+
+            self.assertEqual(1, self._download_and_count_api_calls(force_download=True))
+            # The new signed URL is remembered.
+            self.assertEqual(0, self._download_and_count_api_calls(force_download=True))
+
+    def test_url_about_to_expire_not_used(self) -> None:
+        with create_test_cache(), mock.patch.object(stub, "SIGNED_URL_EXPIRES", signed_urls.EXPIRY_MARGIN):
+            self._download_and_count_api_calls()
+
+            self.assertEqual(1, self._download_and_count_api_calls(force_download=True))
+
+    def test_revalidate_uses_signed_url(self) -> None:
+        with create_test_cache():
+            file_path = kagglehub.model_download(stub.SIGNED_URL_HANDLE, TEST_FILEPATH)
+            os.remove(file_path)
+
+            self.assertEqual(0, self._download_and_count_api_calls(force_download="revalidate"))
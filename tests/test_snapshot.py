@@ -0,0 +1,147 @@
+import io
+import json
+import os
+import tarfile
+from contextlib import redirect_stderr, redirect_stdout
+from tempfile import TemporaryDirectory
+
+import kagglehub
+from kagglehub import cli, snapshot
+from kagglehub.cache import Cache
+from kagglehub.handle import parse_model_handle
+from kagglehub.stats import cache_stats, reset_cache_stats
+from tests.fixtures import BaseTestCase
+
+from .server_stubs import model_download_stub as stub
+from .server_stubs import serv
+from .utils import create_test_cache
+
+VERSIONED_MODEL_HANDLE = "metaresearch/llama-2/pyTorch/13b/1"
+OTHER_MODEL_HANDLE = "metaresearch/llama-2/pyTorch/7b/1"
+TEST_FILEPATH = "config.json"
+
+
+class TestCacheSnapshot(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = serv.start_server(stub.app)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def setUp(self) -> None:
+        super().setUp()
+        reset_cache_stats()
+
+    def test_export_import_round_trip(self) -> None:
+        with TemporaryDirectory() as d:
+            snapshot_path = os.path.join(d, "snapshot.tar")
+            with create_test_cache():
+                kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+                kagglehub.model_download(OTHER_MODEL_HANDLE, path=TEST_FILEPATH)
+
+                exported = kagglehub.cache_export(snapshot_path)
+
+            with create_test_cache():
+                imported = kagglehub.cache_import(snapshot_path)
+
+                self.assertCountEqual(exported, imported)
+                h = parse_model_handle(VERSIONED_MODEL_HANDLE)
+                self.assertIsNotNone(Cache().load_from_cache(h))
+                self.assertEqual([], Cache().verify(h))
+                self.assertEqual([], Cache().verify(parse_model_handle(OTHER_MODEL_HANDLE), TEST_FILEPATH))
+                # Served from the imported cache.
+                kagglehub.model_download(OTHER_MODEL_HANDLE, path=TEST_FILEPATH)
+                self.assertEqual(2, cache_stats().misses)
+
+    def test_export_gzipped(self) -> None:
+        with TemporaryDirectory() as d:
+            snapshot_path = os.path.join(d, "snapshot.tar.gz")
+            with create_test_cache():
+                kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+                kagglehub.cache_export(snapshot_path)
+
+            with create_test_cache():
+                kagglehub.cache_import(snapshot_path)
+
+                self.assertIsNotNone(Cache().load_from_cache(parse_model_handle(VERSIONED_MODEL_HANDLE)))
+
+    def test_export_filtered_by_handle(self) -> None:
+        with create_test_cache():
+            kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+            kagglehub.model_download(OTHER_MODEL_HANDLE)
+            buffer = io.BytesIO()
+
+            exported = kagglehub.cache_export(buffer, [parse_model_handle("metaresearch/llama-2/pyTorch/7b")])
+
+        self.assertEqual([(parse_model_handle(OTHER_MODEL_HANDLE), None)], exported)
+        buffer.seek(0)
+        with tarfile.open(fileobj=buffer) as tar:
+            self.assertFalse(any("13b" in name for name in tar.getnames()))
+
+    def test_import_keeps_complete_entries(self) -> None:
+        with create_test_cache():
+            model_path = kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+            buffer = io.BytesIO()
+            kagglehub.cache_export(buffer)
+            with open(os.path.join(model_path, TEST_FILEPATH), "w") as f:
+                f.write("edited")
+            buffer.seek(0)
+
+            imported = kagglehub.cache_import(buffer)
+
+            self.assertEqual([], imported)
+            with open(os.path.join(model_path, TEST_FILEPATH)) as f:
+                self.assertEqual("edited", f.read())
+
+    def test_import_invalid_snapshot_raises(self) -> None:
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w") as tar:
+            tar.addfile(tarfile.TarInfo("foo.txt"), io.BytesIO())
+        buffer.seek(0)
+
+        with create_test_cache():
+            with self.assertRaises(ValueError):
+                kagglehub.cache_import(buffer)
+
+    def test_import_member_outside_of_cache_raises(self) -> None:
+        index = {
+            snapshot.FORMAT_VERSION_FIELD: snapshot.SNAPSHOT_FORMAT_VERSION,
+            snapshot.ENTRIES_FIELD: [
+                {
+                    snapshot.TYPE_FIELD: "Model",
+                    snapshot.REF_FIELD: VERSIONED_MODEL_HANDLE,
+                    snapshot.PATH_FIELD: None,
+                    snapshot.FILES_FIELD: ["../evil.txt"],
+                    snapshot.MANIFEST_FIELD: "m.json",
+                    snapshot.MARKER_FIELD: "m.complete",
+                }
+            ],
+        }
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w") as tar:
+            snapshot._add_bytes(tar, snapshot.INDEX_MEMBER_NAME, json.dumps(index).encode())
+            snapshot._add_bytes(tar, "../evil.txt", b"evil")
+        buffer.seek(0)
+
+        with create_test_cache() as d:
+            with self.assertRaises(ValueError):
+                kagglehub.cache_import(buffer)
+            self.assertFalse(os.path.exists(os.path.join(os.path.dirname(d), "evil.txt")))
+
+    def test_cli_cache_export_import(self) -> None:
+        with TemporaryDirectory() as d:
+            snapshot_path = os.path.join(d, "snapshot.tar")
+            with create_test_cache():
+                kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+                with redirect_stderr(io.StringIO()):
+                    self.assertEqual(0, cli.main(["cache", "export", snapshot_path]))
+
+            with create_test_cache():
+                out = io.StringIO()
+                with redirect_stdout(out):
+                    self.assertEqual(0, cli.main(["cache", "import", snapshot_path, "--max-workers", "2"]))
+
+                self.assertEqual([VERSIONED_MODEL_HANDLE], out.getvalue().splitlines())
+                self.assertIsNotNone(Cache().load_from_cache(parse_model_handle(VERSIONED_MODEL_HANDLE)))
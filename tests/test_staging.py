@@ -0,0 +1,120 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import kagglehub
+from kagglehub import registry, staging
+from kagglehub.config import MOUNT_STAGING_DIR_ENV_VAR_NAME
+from kagglehub.env import KAGGLE_DATA_PROXY_URL_ENV_VAR_NAME
+from tests.fixtures import BaseTestCase
+
+from .server_stubs import jwt_stub as stub
+from .server_stubs import serv
+
+DATASET_SLUG = "featured-spotify-artiststracks-with-metadata"
+VERSIONED_DATASET_HANDLE = f"sarahjeffreson/{DATASET_SLUG}/versions/1"
+UNVERSIONED_DATASET_HANDLE = f"sarahjeffreson/{DATASET_SLUG}"
+VERSIONED_MODEL_HANDLE = "metaresearch/llama-2/pyTorch/13b/1"
+TEST_FILEPATH = "foo.txt"
+
+
+class TestMountStaging(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = serv.start_server(stub.app, KAGGLE_DATA_PROXY_URL_ENV_VAR_NAME, "http://localhost:7778")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def setUp(self) -> None:
+        super().setUp()
+        # Resolve again instead of reusing the mounted paths memoized by other tests.
+        registry.dataset_resolver.clear_resolved()
+        registry.model_resolver.clear_resolved()
+
+    def test_dataset_staged_to_local_dir(self) -> None:
+        with stub.create_env(), TemporaryDirectory() as staging_dir:
+            with mock.patch.dict(os.environ, {MOUNT_STAGING_DIR_ENV_VAR_NAME: staging_dir}):
+                dataset_path = kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE)
+
+            self.assertEqual(os.path.join(staging_dir, DATASET_SLUG), dataset_path)
+            self.assertEqual(["bar.csv", "foo.txt"], sorted(os.listdir(dataset_path)))
+
+    def test_model_staged_to_local_dir(self) -> None:
+        with stub.create_env(), TemporaryDirectory() as staging_dir:
+            with mock.patch.dict(os.environ, {MOUNT_STAGING_DIR_ENV_VAR_NAME: staging_dir}):
+                model_path = kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+
+            self.assertTrue(model_path.startswith(staging_dir))
+            self.assertIn("config.json", os.listdir(model_path))
+
+    def test_staged_dataset_reused(self) -> None:
+        with stub.create_env(), TemporaryDirectory() as staging_dir:
+            with mock.patch.dict(os.environ, {MOUNT_STAGING_DIR_ENV_VAR_NAME: staging_dir}):
+                dataset_path = kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE)
+                registry.dataset_resolver.clear_resolved()
+
+                with mock.patch.object(staging, "_copy", side_effect=AssertionError):
+                    self.assertEqual(dataset_path, kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE))
+                    # Files of a staged dataset are reused too.
+                    self.assertEqual(
+                        os.path.join(dataset_path, TEST_FILEPATH),
+                        kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE, TEST_FILEPATH),
+                    )
+
+    def test_file_staged_alone(self) -> None:
+        with stub.create_env(), TemporaryDirectory() as staging_dir:
+            with mock.patch.dict(os.environ, {MOUNT_STAGING_DIR_ENV_VAR_NAME: staging_dir}):
+                file_path = kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE, TEST_FILEPATH)
+
+            self.assertEqual(os.path.join(staging_dir, DATASET_SLUG, TEST_FILEPATH), file_path)
+            self.assertEqual([TEST_FILEPATH], os.listdir(os.path.join(staging_dir, DATASET_SLUG)))
+
+    def test_other_version_staged_again(self) -> None:
+        with stub.create_env(), TemporaryDirectory() as staging_dir:
+            with mock.patch.dict(os.environ, {MOUNT_STAGING_DIR_ENV_VAR_NAME: staging_dir}):
+                kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE)
+
+                with mock.patch.object(staging, "_copy", wraps=staging._copy) as copy:
+                    dataset_path = kagglehub.dataset_download(VERSIONED_DATASET_HANDLE)
+
+            copy.assert_called_once()
+            self.assertEqual(os.path.join(staging_dir, DATASET_SLUG), dataset_path)
+
+    def test_other_mounted_version_without_version_staged_again(self) -> None:
+        with TemporaryDirectory() as mount_folder, TemporaryDirectory() as staging_dir:
+            mounted_path = os.path.join(mount_folder, DATASET_SLUG)
+            os.makedirs(mounted_path)
+            with open(os.path.join(mounted_path, TEST_FILEPATH), "w") as f:
+                f.write("v1")
+            with mock.patch.dict(os.environ, {MOUNT_STAGING_DIR_ENV_VAR_NAME: staging_dir}):
+                staged_path = staging.stage(mount_folder, DATASET_SLUG, None, None)
+                with mock.patch.object(staging, "_copy", side_effect=AssertionError):
+                    self.assertEqual(staged_path, staging.stage(mount_folder, DATASET_SLUG, None, None))
+
+                # Another version is mounted at the same path.
+                with open(os.path.join(mounted_path, TEST_FILEPATH), "w") as f:
+                    f.write("v2")
+                os.utime(mounted_path, ns=(0, 0))
+                staging.stage(mount_folder, DATASET_SLUG, None, None)
+
+            with open(os.path.join(staged_path, TEST_FILEPATH)) as f:
+                self.assertEqual("v2", f.read())
+
+    def test_interrupted_staging_started_over(self) -> None:
+        with stub.create_env(), TemporaryDirectory() as staging_dir:
+            with mock.patch.dict(os.environ, {MOUNT_STAGING_DIR_ENV_VAR_NAME: staging_dir}):
+                with mock.patch.object(staging.materialize, "copy_file", side_effect=OSError("disk full")):
+                    with self.assertRaises(OSError):
+                        kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE)
+
+                dataset_path = kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE)
+
+            self.assertEqual(["bar.csv", "foo.txt"], sorted(os.listdir(dataset_path)))
+
+    def test_staging_disabled_returns_mounted_path(self) -> None:
+        with stub.create_env():
+            dataset_path = kagglehub.dataset_download(UNVERSIONED_DATASET_HANDLE)
+
+            self.assertTrue(dataset_path.startswith(os.environ[stub.KAGGLE_CACHE_MOUNT_FOLDER_ENV_VAR_NAME]))
@@ -0,0 +1,142 @@
+import io
+import os
+from contextlib import redirect_stdout
+
+import kagglehub
+from kagglehub import cli, registry
+from kagglehub.cache import Cache
+from kagglehub.handle import parse_model_handle
+from kagglehub.stats import reset_cache_stats
+from tests.fixtures import BaseTestCase
+
+from .server_stubs import model_download_stub as stub
+from .server_stubs import serv
+from .utils import create_test_cache, get_test_file_path
+
+VERSIONED_MODEL_HANDLE = "metaresearch/llama-2/pyTorch/13b/1"
+OTHER_MODEL_HANDLE = "metaresearch/llama-2/pyTorch/7b/1"
+TEST_FILEPATH = "config.json"
+
+
+class TestCacheStats(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = serv.start_server(stub.app)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def setUp(self) -> None:
+        super().setUp()
+        reset_cache_stats()
+
+    def test_hits_and_misses_counted(self) -> None:
+        with create_test_cache():
+            kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+            kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+            kagglehub.model_download(VERSIONED_MODEL_HANDLE, path=TEST_FILEPATH)
+
+            stats = kagglehub.cache_stats()
+
+            self.assertEqual(1, stats.hits)
+            self.assertEqual(2, stats.misses)
+            self.assertEqual(1 / 3, stats.hit_rate)
+            handle_stats = stats.handles[parse_model_handle(VERSIONED_MODEL_HANDLE)]
+            self.assertEqual(1, handle_stats.hits)
+            self.assertEqual(2, handle_stats.misses)
+
+    def test_cache_lookups_not_counted(self) -> None:
+        with create_test_cache():
+            kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+
+            Cache().load_from_cache(parse_model_handle(VERSIONED_MODEL_HANDLE))
+
+            self.assertEqual(0, kagglehub.cache_stats().hits)
+
+    def test_repaired_entry_not_counted_as_hit(self) -> None:
+        with create_test_cache():
+            model_path = kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+            with open(os.path.join(model_path, TEST_FILEPATH), "w") as f:
+                f.write("corrupted")
+
+            kagglehub.model_download(VERSIONED_MODEL_HANDLE, force_download="revalidate")
+
+            stats = kagglehub.cache_stats()
+            self.assertEqual(0, stats.hits)
+            self.assertEqual(2, stats.misses)
+
+    def test_bytes_downloaded_counted(self) -> None:
+        with create_test_cache():
+            kagglehub.model_download(VERSIONED_MODEL_HANDLE, path=TEST_FILEPATH)
+            kagglehub.model_download(VERSIONED_MODEL_HANDLE, path=TEST_FILEPATH)
+
+            stats = kagglehub.cache_stats()
+
+            expected_size = os.path.getsize(get_test_file_path(TEST_FILEPATH))
+            self.assertEqual(expected_size, stats.bytes_downloaded)
+            self.assertEqual(expected_size, stats.handles[parse_model_handle(VERSIONED_MODEL_HANDLE)].bytes_downloaded)
+
+    def test_stats_snapshot_not_updated(self) -> None:
+        with create_test_cache():
+            stats = kagglehub.cache_stats()
+            kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+
+            self.assertEqual(0, stats.misses)
+            self.assertEqual({}, stats.handles)
+            self.assertIsNone(stats.hit_rate)
+
+    def test_cache_usage(self) -> None:
+        with create_test_cache():
+            model_path = kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+            kagglehub.model_download(OTHER_MODEL_HANDLE, path=TEST_FILEPATH)
+
+            usages = kagglehub.cache_usage()
+
+            self.assertEqual(2, len(usages))
+            # Largest first.
+            self.assertEqual(parse_model_handle(VERSIONED_MODEL_HANDLE), usages[0].handle)
+            self.assertIsNone(usages[0].path)
+            self.assertEqual(2, usages[0].num_files)
+            self.assertEqual(
+                sum(os.path.getsize(os.path.join(model_path, f)) for f in os.listdir(model_path)), usages[0].size
+            )
+            self.assertEqual(TEST_FILEPATH, usages[1].path)
+            self.assertEqual(os.path.getsize(get_test_file_path(TEST_FILEPATH)), usages[1].size)
+
+    def test_cache_usage_last_access_updated_on_hit(self) -> None:
+        with create_test_cache():
+            kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+            first_access = kagglehub.cache_usage()[0].last_access
+            os.utime(
+                kagglehub.cache.Cache()._get_completion_marker_filepath(parse_model_handle(VERSIONED_MODEL_HANDLE)),
+                (0, 0),
+            )
+            # Skip the in-process memo to load the entry from the cache again.
+            registry.model_resolver.clear_resolved()
+
+            kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+
+            self.assertGreaterEqual(kagglehub.cache_usage()[0].last_access, first_access)
+
+    def test_cache_usage_filtered_by_handle(self) -> None:
+        with create_test_cache():
+            kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+            kagglehub.model_download(OTHER_MODEL_HANDLE)
+
+            usages = kagglehub.cache_usage(parse_model_handle(OTHER_MODEL_HANDLE))
+
+            self.assertEqual([parse_model_handle(OTHER_MODEL_HANDLE)], [usage.handle for usage in usages])
+
+    def test_cli_cache_stats(self) -> None:
+        with create_test_cache():
+            kagglehub.model_download(VERSIONED_MODEL_HANDLE)
+            out = io.StringIO()
+
+            with redirect_stdout(out):
+                self.assertEqual(0, cli.main(["cache", "stats"]))
+
+            lines = out.getvalue().splitlines()
+            self.assertEqual(3, len(lines))
+            self.assertTrue(lines[1].endswith(VERSIONED_MODEL_HANDLE))
+            self.assertTrue(lines[2].endswith("Total (1 entries)"))
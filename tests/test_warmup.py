@@ -0,0 +1,85 @@
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import yaml
+
+import kagglehub
+from kagglehub.handle import parse_model_handle
+from kagglehub.tracker import FORMAT_VERSION
+from tests.fixtures import BaseTestCase
+
+from .server_stubs import model_download_stub as stub
+from .server_stubs import serv
+from .utils import create_test_cache
+
+VERSIONED_MODEL_HANDLE = "metaresearch/llama-2/pyTorch/13b/1"
+UNVERSIONED_MODEL_HANDLE = "metaresearch/llama-2/pyTorch/7b"
+
+
+def _write_tracker_file(path: str, datasources: list[dict]) -> None:
+    with open(path, "w") as f:
+        yaml.dump({"format_version": FORMAT_VERSION, "datasources": datasources}, f)
+
+
+class TestCacheWarmup(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = serv.start_server(stub.app)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def _write_test_file(self, d: str) -> str:
+        path = str(Path(d) / "requirements.yaml")
+        _write_tracker_file(
+            path,
+            [
+                {"type": "Model", "ref": VERSIONED_MODEL_HANDLE, "version": 1},
+                {"type": "Model", "ref": UNVERSIONED_MODEL_HANDLE, "version": 2},
+            ],
+        )
+        return path
+
+    def test_warmup_downloads_to_cache_at_recorded_versions(self) -> None:
+        with create_test_cache() as cache_dir, TemporaryDirectory() as d:
+            paths = kagglehub.cache_warmup(self._write_test_file(d))
+
+            self.assertEqual(
+                {parse_model_handle(VERSIONED_MODEL_HANDLE), parse_model_handle(f"{UNVERSIONED_MODEL_HANDLE}/2")},
+                set(paths.keys()),
+            )
+            for path in paths.values():
+                self.assertTrue(path.startswith(cache_dir))
+                self.assertTrue(os.listdir(path))
+
+            # Later downloads are cache hits.
+            self.assertEqual(
+                paths[parse_model_handle(f"{UNVERSIONED_MODEL_HANDLE}/2")],
+                kagglehub.model_download(f"{UNVERSIONED_MODEL_HANDLE}/2"),
+            )
+
+    def test_warmup_to_output_dir(self) -> None:
+        with create_test_cache(), TemporaryDirectory() as d, TemporaryDirectory() as output_dir:
+            paths = kagglehub.cache_warmup(self._write_test_file(d), output_dir=output_dir)
+
+            self.assertEqual(
+                os.path.join(output_dir, "models", "metaresearch", "llama-2", "pyTorch", "13b", "1"),
+                paths[parse_model_handle(VERSIONED_MODEL_HANDLE)],
+            )
+            self.assertTrue(os.listdir(paths[parse_model_handle(VERSIONED_MODEL_HANDLE)]))
+
+    def test_warmup_raises_on_failure(self) -> None:
+        with create_test_cache(), TemporaryDirectory() as d:
+            path = str(Path(d) / "requirements.yaml")
+            _write_tracker_file(
+                path,
+                [
+                    {"type": "Model", "ref": VERSIONED_MODEL_HANDLE, "version": 1},
+                    {"type": "Model", "ref": "metaresearch/llama-2/pyTorch/bad-archive-variation/1", "version": 1},
+                ],
+            )
+
+            with self.assertRaises(RuntimeError):
+                kagglehub.cache_warmup(path)